@@ -0,0 +1,175 @@
+# 파이썬 표준 라이브러리
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Django의 데이터베이스 모델링 도구를 가져옵니다
+from django.db import models
+
+# Django REST Framework의 예외를 가져옵니다 (잘못된 주소록 이름 -> 400 응답)
+from rest_framework.exceptions import ValidationError
+
+
+# 주소록(테넌트) 범위 모듈
+# 여러 사용자의 주소록을 호스팅하므로 연락처/라벨 등은 주소록 키(address_book)를 가지며,
+# 현재 요청이 다루는 주소록을 contextvar에 보관합니다
+#
+# - 모델의 기본 매니저(AddressBookManager)는 현재 주소록의 행만 조회하고,
+#   새 행의 address_book 기본값도 현재 주소록입니다
+# - 주소록별 DB(샤드) 선택은 shards 모듈의 ShardRouter가 현재 주소록으로 결정합니다
+# - 요청 밖(관리 명령, 셸)에서는 기본 주소록(DEFAULT_ADDRESS_BOOK)을 사용합니다
+#
+# 요청에서 주소록 지정: X-Address-Book 헤더 또는 ?address_book= 파라미터 (없으면 기본 주소록)
+
+# 주소록을 지정하지 않았을 때 사용하는 주소록 (기존 데이터도 이 주소록에 속함)
+DEFAULT_ADDRESS_BOOK = "default"
+# 주소록 키의 최대 길이
+ADDRESS_BOOK_MAX_LENGTH = 64
+# 주소록 이름 형식 (영문/숫자로 시작, 영문/숫자/_/./- 사용)
+ADDRESS_BOOK_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]{0,63}$")
+# 요청에서 주소록을 지정하는 헤더(META 키)와 쿼리 파라미터
+ADDRESS_BOOK_HEADER = "HTTP_X_ADDRESS_BOOK"
+ADDRESS_BOOK_PARAM = "address_book"
+
+
+class AddressBookScope:
+    """
+    현재 다루는 주소록과 그 주소록의 DB 별칭
+    alias는 처음 라우팅할 때 한 번만 찾아서 보관합니다 (같은 요청의 쿼리가 같은 샤드를 보도록)
+    """
+
+    def __init__(self, name, alias=None):
+        self.name = name
+        self.alias = alias
+        # DB를 직접 지정한 범위인지 여부 (주소록 이동 중에도 쓰기 허용)
+        self.forced = alias is not None
+
+
+# 현재 주소록 범위 (요청 밖에서는 None -> 기본 주소록)
+# contextvars는 sync_to_async / async_to_sync로 실행되는 코드에도 전달됩니다
+_scope = ContextVar("contacts_address_book", default=None)
+
+
+def current_scope():
+    """
+    현재 주소록 범위 (지정하지 않았으면 None)
+    """
+    return _scope.get()
+
+
+def current_address_book():
+    """
+    현재 주소록 이름 (모델 address_book 필드의 기본값으로도 사용)
+    """
+    scope = _scope.get()
+    return DEFAULT_ADDRESS_BOOK if scope is None else scope.name
+
+
+def is_valid_address_book(name):
+    """
+    주소록 이름 형식이 올바른지 여부
+    """
+    return isinstance(name, str) and bool(ADDRESS_BOOK_PATTERN.match(name))
+
+
+@contextmanager
+def use_address_book(name, alias=None):
+    """
+    블록 안에서 name 주소록을 현재 주소록으로 사용합니다
+    alias를 지정하면 샤드 디렉터리 대신 그 DB로 라우팅합니다 (주소록 이동 명령에서 사용)
+    """
+    token = _scope.set(AddressBookScope(name, alias))
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+def activate(name):
+    """
+    현재 주소록을 name으로 바꿉니다
+    use_address_book() 블록 안에서 호출하면 블록이 끝날 때 원래 주소록으로 돌아갑니다
+    """
+    _scope.set(AddressBookScope(name))
+
+
+def resolve_address_book(request):
+    """
+    요청이 지정한 주소록 이름 (X-Address-Book 헤더 -> ?address_book= -> 기본 주소록 순)
+    형식이 잘못되었으면 ValidationError (400)
+    """
+    name = request.META.get(ADDRESS_BOOK_HEADER) or request.query_params.get(
+        ADDRESS_BOOK_PARAM
+    )
+    if not name:
+        return DEFAULT_ADDRESS_BOOK
+    name = name.strip()
+    if not is_valid_address_book(name):
+        raise ValidationError(
+            {
+                ADDRESS_BOOK_PARAM: [
+                    "주소록 이름은 영문/숫자로 시작하고 영문/숫자/_/./-만 사용할 수 있습니다 (최대 64자)."
+                ]
+            }
+        )
+    return name
+
+
+class AddressBookManager(models.Manager):
+    """
+    현재 주소록의 행만 조회하는 기본 매니저
+    관련 객체 조회(contact.labels 등)와 DRF ViewSet의 queryset도 이 매니저를 거치므로
+    다른 주소록의 행은 보이지 않습니다
+
+    Django 내부의 저장/삭제/refresh_from_db는 범위가 없는 기본(base) 매니저를 사용합니다
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().filter(address_book=current_address_book())
+
+
+class AddressBookField(models.CharField):
+    """
+    행이 속한 주소록 키 (새 행은 현재 주소록으로 채워지며 API에서 수정할 수 없음)
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("max_length", ADDRESS_BOOK_MAX_LENGTH)
+        kwargs.setdefault("default", current_address_book)
+        kwargs.setdefault("editable", False)
+        kwargs.setdefault("verbose_name", "주소록")
+        super().__init__(*args, **kwargs)
+
+
+class AddressBookMixin:
+    """
+    ViewSet이 요청의 주소록(헤더 또는 파라미터)을 현재 주소록으로 사용하도록 하는 믹스인
+    현재 주소록에 따라 조회 범위(AddressBookManager)와 DB(ShardRouter)가 정해집니다
+
+    ReplicaReadMixin보다 앞에 두어야 복제본 선택 전에 주소록의 샤드가 정해집니다
+    스트리밍 응답처럼 dispatch가 끝난 뒤 실행되는 코드는 주소록을 따로 이어받아야 합니다
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        # 요청이 끝나면 원래 주소록으로 돌아가도록 요청 전체를 범위로 감쌈
+        with use_address_book(DEFAULT_ADDRESS_BOOK):
+            return super().dispatch(request, *args, **kwargs)
+
+    def initial(self, request, *args, **kwargs):
+        # 잘못된 주소록 이름은 DRF 예외 처리로 400 응답
+        activate(resolve_address_book(request))
+        super().initial(request, *args, **kwargs)
+
+
+def scoped_iterator(iterator):
+    """
+    호출한 시점의 주소록 범위에서 이터레이터를 실행하는 이터레이터를 반환합니다
+    (StreamingHttpResponse는 뷰가 끝난 뒤 내용을 만들기 때문에 사용)
+    """
+    name = current_address_book()
+
+    def run():
+        with use_address_book(name):
+            yield from iterator
+
+    return run()
@@ -86,10 +86,10 @@ class ContactAdmin(admin.ModelAdmin):
         obj: 현재 연락처 객체 (Contact 인스턴스)
         반환값: "가족, 친구, 회사" 형태의 문자열
         """
-        # obj.labels.all(): 이 연락처와 연결된 모든 라벨들을 조회
-        # [label.name for label in ...]: 각 라벨의 이름만 추출하여 리스트 생성
+        # obj.labels.all()은 목록의 행마다 라벨 조회 쿼리를 실행하므로(N+1),
+        # 연락처 행에 저장된 라벨 스냅샷(id/name/color)에서 이름만 읽습니다 (쿼리 없음)
         # ", ".join(...): 리스트의 요소들을 쉼표와 공백으로 연결한 문자열 생성
-        return ", ".join([label.name for label in obj.labels.all()])
+        return ", ".join([label["name"] for label in obj.label_snapshot])
 
     # 관리자 페이지에서 이 메소드의 컬럼 제목을 "라벨"로 설정
     get_labels.short_description = "라벨"
@@ -16,3 +16,18 @@ class ContactsConfig(AppConfig):
     # 어플리케이션의 이름 (대상 앱의 Python 모듈 경로)
     # Django가 이 앱을 찾고 로드할 때 사용하는 경로
     name = "api.contacts"
+
+    def ready(self):
+        """
+        앱 로딩이 끝난 뒤 시그널 수신 함수들을 등록합니다
+        """
+        from django.db.models.signals import post_migrate
+
+        from . import signals  # noqa: F401
+        from .search import ensure_fulltext_index
+        from .shards import seed_id_sequences
+
+        # 마이그레이션 후 전문 검색 트리거 복구 (테이블 재생성 시 트리거가 사라지므로)
+        post_migrate.connect(ensure_fulltext_index, sender=self)
+        # 마이그레이션 후 샤드별 ID 발급 위치를 샤드의 ID 범위로 맞춤
+        post_migrate.connect(seed_id_sequences, sender=self)
@@ -0,0 +1,249 @@
+# 비동기 코드에서 동기 함수를 실행하는 도구를 가져옵니다
+from asgiref.sync import sync_to_async
+
+# Django의 예외, HTTP 응답, 클래스 기반 뷰 도구를 가져옵니다
+from django.core.exceptions import SynchronousOnlyOperation, ValidationError
+from django.http import Http404, HttpResponse
+from django.views import View
+
+# Django REST Framework의 요청 객체와 예외 처리 함수를 가져옵니다
+from rest_framework.request import Request
+from rest_framework.views import exception_handler
+
+# 현재 앱의 다른 모듈들을 가져옵니다
+from . import addressbooks  # 요청의 주소록 범위
+from . import fastlist  # values() 기반 빠른 목록 직렬화
+from . import replicas  # 안전한 조회를 읽기 복제본으로 분산
+from . import shards  # 주소록의 샤드 선택
+from .changes import CONTACTS_NAMESPACE  # 연락처 개수 캐시 네임스페이스
+from .conditional import apply_validators, not_modified  # ETag / Last-Modified
+from .models import ContactStatistics, Label
+from .pagination import apaginate_queryset  # 페이지네이션 비동기 실행
+from .registry import label_registry  # 프로세스 안에 보관한 라벨 목록
+from .renderers import FastJSONRenderer, dumps  # 빠른 JSON 인코딩
+from .serializers import LabelStatsSerializer
+from .views import ContactViewSet, LabelViewSet
+
+
+# ASGI 서버(uvicorn 등)용 비동기 조회 API 모듈
+# DRF 3.14의 ViewSet은 동기 코드이므로 ASGI에서는 요청마다 스레드를 거쳐 실행됩니다
+# 읽기 요청이 대부분인 목록/상세/라벨 목록/통계 API를 Django 비동기 뷰로 따로 제공해서
+# 요청을 기다리는 동안 스레드를 붙잡지 않고 이벤트 루프 하나에서 많은 요청을 동시에 처리합니다
+#
+# - 필터/검색/정렬/부분 필드/ETag는 기존 ViewSet의 메소드를 그대로 사용 (쿼리셋만 만들고 실행하지 않음)
+# - 개수(acount), 페이지 행(async for), 통계(aaggregate) 조회만 비동기 ORM으로 실행
+# - 응답은 JSON만 지원 (브라우저 API 화면은 동기 경로에서 제공)
+#
+# URL: /api/contacts/async/ 아래에 동기 API와 같은 경로로 등록 (urls.py)
+#   GET /api/contacts/async/                 -> 연락처 목록 (GET /api/contacts/ 와 같은 응답)
+#   GET /api/contacts/async/{id}/            -> 연락처 상세
+#   GET /api/contacts/async/statistics/      -> 연락처 통계
+#   GET /api/contacts/async/labels/          -> 라벨 목록
+#   GET /api/contacts/async/labels/stats/    -> 라벨 통계
+
+
+def json_response(data, status=200):
+    """
+    FastJSONRenderer와 같은 JSON 바이트로 응답합니다
+    """
+    return HttpResponse(dumps(data), status=status, content_type="application/json")
+
+
+async def run_without_queries(func, *args):
+    """
+    쿼리를 실행하지 않는 동기 코드(쿼리셋 생성, 직렬화)를 이벤트 루프에서 바로 실행합니다
+    라벨 레지스트리는 요청 처리 전에 aload()로 읽어 두지만, 그 사이 라벨이 바뀌어 다시 읽어야 하면
+    (SynchronousOnlyOperation) 같은 코드를 스레드에서 다시 실행합니다
+    """
+    try:
+        return func(*args)
+    except SynchronousOnlyOperation:
+        return await sync_to_async(func)(*args)
+
+
+async def aget_object_or_404(queryset, **filters):
+    """
+    DRF get_object_or_404의 비동기 버전 (잘못된 형식의 ID도 404)
+    """
+    try:
+        return await queryset.aget(**filters)
+    except (queryset.model.DoesNotExist, TypeError, ValueError, ValidationError):
+        raise Http404
+
+
+class AsyncReadView(View):
+    """
+    비동기 조회 뷰의 기반 클래스
+    viewset_class의 인스턴스를 만들어서 필터/시리얼라이저/ETag 등 기존 ViewSet 로직을 재사용하고,
+    ViewSet이 발생시키는 예외(400 잘못된 파라미터, 404 등)는 DRF와 같은 형식의 JSON으로 응답합니다
+    """
+
+    # 로직을 재사용할 ViewSet 클래스와 액션 이름
+    viewset_class = None
+    action = None
+
+    http_method_names = ["get", "head", "options"]
+
+    async def get(self, request, *args, **kwargs):
+        request = self.initialize_request(request)
+        view = self.viewset_class(
+            request=request,
+            args=args,
+            kwargs=kwargs,
+            format_kwarg=None,
+            action=self.action,
+            headers={},
+        )
+        with addressbooks.use_address_book(addressbooks.DEFAULT_ADDRESS_BOOK):
+            try:
+                # 동기 ViewSet(AddressBookMixin)과 같이 요청의 주소록을 사용하고,
+                # 주소록의 샤드는 미리 스레드에서 찾아 두어 이벤트 루프의 라우팅이 쿼리 없이 끝나도록 함
+                addressbooks.activate(addressbooks.resolve_address_book(request))
+                await sync_to_async(shards.current_alias)()
+                # 동기 ViewSet(ReplicaReadMixin)과 같이 조회를 복제본으로 보냄
+                replicas.use_replicas_for(request)
+                return await self.respond(view, request, **kwargs)
+            except Exception as exc:
+                context = {
+                    "view": view,
+                    "request": request,
+                    "args": args,
+                    "kwargs": kwargs,
+                }
+                error = exception_handler(exc, context)
+                if error is None:
+                    raise
+                return json_response(error.data, status=error.status_code)
+
+    def initialize_request(self, request):
+        """
+        DRF 요청 객체로 감쌉니다 (query_params 등 ViewSet 코드가 사용하는 속성)
+        응답 형식은 JSON으로 고정하므로 ETag도 동기 경로의 JSON 응답과 같습니다
+        """
+        request = Request(request, parsers=[], authenticators=[])
+        request.accepted_renderer = FastJSONRenderer()
+        request.accepted_media_type = FastJSONRenderer.media_type
+        return request
+
+    async def respond(self, view, request, **kwargs):
+        raise NotImplementedError
+
+
+class AsyncListView(AsyncReadView):
+    """
+    ViewSet의 list 액션과 같은 목록 응답 (ETag, 필터/검색/정렬, 페이지네이션)
+    """
+
+    action = "list"
+
+    async def respond(self, view, request, **kwargs):
+        validators = view.get_list_validators(request)
+        response = not_modified(request, validators)
+        if response is None:
+            await label_registry.aload()
+            queryset = await run_without_queries(self.get_queryset, view)
+            paginator = view.paginator
+            if paginator is None:
+                data = self.represent(view, [row async for row in queryset])
+                response = json_response(data)
+            else:
+                page = await apaginate_queryset(paginator, queryset, request, self)
+                data = await run_without_queries(self.represent, view, page)
+                response = json_response(paginator.get_paginated_response(data).data)
+        return apply_validators(response, validators)
+
+    def get_queryset(self, view):
+        return view.filter_queryset(view.get_queryset())
+
+    def represent(self, view, rows):
+        return view.get_serializer(rows, many=True).data
+
+
+class ContactListView(AsyncListView):
+    """
+    연락처 목록 (GET /api/contacts/ 와 같은 필터/검색/정렬/페이지네이션/부분 필드)
+    """
+
+    viewset_class = ContactViewSet
+    # 페이지네이션이 필터별 개수 캐시에 사용하는 네임스페이스 (ContactViewSet과 같은 캐시 공유)
+    count_cache_namespace = CONTACTS_NAMESPACE
+
+    def get_queryset(self, view):
+        queryset = super().get_queryset(view)
+        if fastlist.is_enabled():
+            queryset = fastlist.list_rows(queryset, view.get_fieldset())
+        return queryset
+
+    def represent(self, view, rows):
+        if fastlist.is_enabled():
+            return fastlist.represent(rows, view.get_fieldset())
+        return super().represent(view, rows)
+
+    async def aget_estimated_count(self):
+        """
+        ?count=estimated 요청의 추정 개수 (통계 카운터)
+        """
+        return (await ContactStatistics.aload()).total_contacts
+
+
+class LabelListView(AsyncListView):
+    """
+    라벨 목록 (GET /api/contacts/labels/ 와 같은 검색/정렬/페이지네이션)
+    """
+
+    viewset_class = LabelViewSet
+
+
+class ContactDetailView(AsyncReadView):
+    """
+    연락처 상세 (GET /api/contacts/{id}/ 와 같은 응답, ETag, 부분 필드)
+    """
+
+    viewset_class = ContactViewSet
+    action = "retrieve"
+
+    async def respond(self, view, request, pk=None, **kwargs):
+        await label_registry.aload()
+        queryset = await run_without_queries(
+            lambda: view.filter_queryset(view.get_queryset())
+        )
+        contact = await aget_object_or_404(queryset, pk=pk)
+        view.check_object_permissions(request, contact)
+
+        validators = view.get_object_validators(contact)
+        response = not_modified(request, validators)
+        if response is None:
+            data = await run_without_queries(lambda: view.get_serializer(contact).data)
+            response = json_response(data)
+        return apply_validators(response, validators)
+
+
+class ContactStatisticsView(AsyncReadView):
+    """
+    연락처 통계 (GET /api/contacts/statistics/ 와 같은 응답, ?fresh=true 지원)
+    """
+
+    viewset_class = ContactViewSet
+    action = "statistics"
+
+    async def respond(self, view, request, **kwargs):
+        if request.query_params.get("fresh", "").lower() == "true":
+            stats = await ContactStatistics.acompute()
+        else:
+            stats = (await ContactStatistics.aload()).as_dict()
+        return json_response(stats)
+
+
+class LabelStatsView(AsyncReadView):
+    """
+    라벨 통계 (GET /api/contacts/labels/stats/ 와 같은 응답)
+    """
+
+    viewset_class = LabelViewSet
+    action = "stats"
+
+    async def respond(self, view, request, **kwargs):
+        labels = [
+            label async for label in Label.objects.order_by("-contact_count", "name")
+        ]
+        return json_response(LabelStatsSerializer(labels, many=True).data)
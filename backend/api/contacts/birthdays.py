@@ -0,0 +1,87 @@
+# 날짜 계산 도구를 가져옵니다
+import calendar
+from datetime import date, timedelta
+
+# Django의 쿼리 표현식을 가져옵니다
+from django.db.models import Case, Q, Value, When
+
+
+# 생일 조회 모듈
+# 연락처의 birthday_key 컬럼(월 * 100 + 일, 예: 3월 5일 -> 305)은 인덱스가 있으므로
+# 월별 조회와 다가오는 생일 조회를 모두 인덱스 범위 검색으로 처리합니다
+
+# 다가오는 생일 조회 기간 (일)
+DEFAULT_WINDOW_DAYS = 30
+MAX_WINDOW_DAYS = 366
+
+# 2월 29일생의 생일 키 (평년에는 2월 28일에 생일을 맞는 것으로 계산)
+LEAP_DAY_KEY = 229
+
+
+def birthday_key(value):
+    """
+    날짜의 생일 키 (월 * 100 + 일)를 반환합니다
+    예: date(1990, 3, 5) -> 305, None -> None
+    """
+    if value is None:
+        return None
+    return value.month * 100 + value.day
+
+
+def month_range(month):
+    """
+    해당 월 생일 키의 (하한, 상한) 값
+    예: 3 -> (301, 331)
+    """
+    return month * 100 + 1, month * 100 + 31
+
+
+def occurrence_in(year, birthday):
+    """
+    해당 연도의 생일 날짜 (평년의 2월 29일생은 2월 28일)
+    """
+    if birthday.month == 2 and birthday.day == 29 and not calendar.isleap(year):
+        return date(year, 2, 28)
+    return birthday.replace(year=year)
+
+
+def next_birthday(birthday, today):
+    """
+    오늘(포함) 이후 처음 돌아오는 생일 날짜
+    """
+    this_year = occurrence_in(today.year, birthday)
+    if this_year >= today:
+        return this_year
+    return occurrence_in(today.year + 1, birthday)
+
+
+def window_ranges(today, days):
+    """
+    오늘부터 days일 동안 생일을 맞는 생일 키의 범위 목록 [(하한, 상한)]
+    12월 -> 1월로 넘어가면 두 범위로 나뉩니다
+    """
+    if days >= MAX_WINDOW_DAYS:
+        return [(101, 1231)]
+    last = today + timedelta(days=days - 1)
+    start, end = birthday_key(today), birthday_key(last)
+    # 평년 2월 28일로 끝나면 그날 생일을 맞는 2월 29일생도 포함
+    if (last.month, last.day) == (2, 28) and not calendar.isleap(last.year):
+        end = LEAP_DAY_KEY
+    if start <= end:
+        return [(start, end)]
+    return [(start, 1231), (101, end)]
+
+
+def upcoming(queryset, today, days):
+    """
+    오늘부터 days일 안에 생일인 연락처들을 다음 생일이 빠른 순서로 반환합니다
+    """
+    ranges = window_ranges(today, days)
+    condition = Q()
+    for low, high in ranges:
+        condition |= Q(birthday_key__range=(low, high))
+    # 올해 남은 생일(오늘 이후 키) 먼저, 그 다음 내년 초 생일
+    next_year = Case(
+        When(birthday_key__lt=birthday_key(today), then=Value(1)), default=Value(0)
+    )
+    return queryset.filter(condition).order_by(next_year, "birthday_key", "name", "id")
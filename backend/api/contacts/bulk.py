@@ -0,0 +1,350 @@
+# 같은 값으로 수정되는 항목을 묶고 라벨별 연결 수를 세기 위한 도구
+from collections import Counter, defaultdict
+
+# Django의 설정, 시간 도구를 가져옵니다
+from django.conf import settings
+from django.db.models import Count
+from django.utils import timezone
+
+# Django REST Framework의 검증 예외를 가져옵니다
+from rest_framework.exceptions import ValidationError
+
+# 현재 앱의 모듈들을 가져옵니다
+from . import changes
+from .models import Contact
+from .serializers import ContactSerializer
+from .transactions import immediate_atomic  # 시작할 때 쓰기 잠금을 잡는 트랜잭션
+
+
+# 연락처 일괄 생성/수정/삭제 처리 모듈
+# 시그널을 거치지 않는 bulk_create/bulk_update를 사용하므로
+# 통계 카운터와 캐시 버전은 changes 모듈 함수를 직접 호출해서 갱신합니다
+
+# 연락처-라벨 다대다 관계의 중간(through) 테이블 모델
+ContactLabel = Contact.labels.through
+
+
+def get_max_items():
+    """
+    요청 하나에 담을 수 있는 최대 항목 수 (settings.CONTACTS_BULK_MAX_ITEMS)
+    """
+    return getattr(settings, "CONTACTS_BULK_MAX_ITEMS", 50000)
+
+
+def get_chunk_size():
+    """
+    트랜잭션 하나로 처리할 항목 수 (settings.CONTACTS_BULK_CHUNK_SIZE)
+    """
+    return getattr(settings, "CONTACTS_BULK_CHUNK_SIZE", 500)
+
+
+def chunked(items, size):
+    """
+    목록을 size개씩 잘라서 반환합니다
+    """
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def validate_items(serializer, items):
+    """
+    시리얼라이저 인스턴스 하나로 여러 항목을 검증합니다
+    (항목마다 시리얼라이저를 만들면 라벨 선택지 조회가 반복되므로 재사용)
+    반환값: (검증된 항목 [(순번, 데이터)], 실패 결과 목록)
+    """
+    valid, failed = [], []
+    for index, item in items:
+        try:
+            valid.append((index, serializer.run_validation(item)))
+        except ValidationError as exc:
+            failed.append({"index": index, "status": "invalid", "errors": exc.detail})
+    return valid, failed
+
+
+def pop_label_ids(data):
+    """
+    검증된 데이터에서 label_ids를 분리해서 정수 목록으로 반환합니다 (없으면 None)
+    """
+    label_ids = data.pop("label_ids", None)
+    if label_ids is None:
+        return None
+    return sorted(int(label_id) for label_id in label_ids)
+
+
+def link_labels(pairs):
+    """
+    (연락처 ID, 라벨 ID) 목록을 중간 테이블에 한 번에 추가합니다
+    새로 만든 연락처나 연결을 모두 지운 연락처에만 사용하므로 모든 쌍이 새로 추가됩니다
+    반환값: {라벨 ID: 추가된 연결 수}
+    """
+    pairs = set(pairs)
+    if not pairs:
+        return {}
+    ContactLabel.objects.bulk_create(
+        [
+            ContactLabel(contact_id=contact_id, label_id=label_id)
+            for contact_id, label_id in pairs
+        ],
+        ignore_conflicts=True,
+    )
+    return Counter(label_id for _, label_id in pairs)
+
+
+def unlink_all_labels(contact_ids):
+    """
+    연락처들의 라벨 연결을 모두 삭제합니다
+    반환값: {라벨 ID: 삭제된 연결 수}
+    """
+    if not contact_ids:
+        return {}
+    links = ContactLabel.objects.filter(contact_id__in=contact_ids)
+    removed = dict(links.values_list("label_id").annotate(count=Count("*")).order_by())
+    links.delete()
+    return removed
+
+
+def create_contacts(rows, chunk_size=None):
+    """
+    검증된 연락처 데이터들을 bulk_create로 저장합니다 (청크마다 IMMEDIATE 트랜잭션 하나)
+    rows: [(순번, 검증된 데이터)] 목록
+    반환값: 항목별 결과 목록
+    """
+    results = []
+    for chunk in chunked(rows, chunk_size or get_chunk_size()):
+        label_ids = [pop_label_ids(data) for _, data in chunk]
+        contacts = [Contact(**data) for _, data in chunk]
+        with immediate_atomic():
+            Contact.objects.bulk_create(contacts)
+            linked = link_labels(
+                [
+                    (contact.id, label_id)
+                    for contact, ids in zip(contacts, label_ids)
+                    for label_id in ids or []
+                ]
+            )
+            changes.contacts_created(contacts)
+            changes.label_counts_changed(linked)
+            changes.contact_labels_changed([contact.id for contact in contacts])
+        results.extend(
+            {"index": index, "status": "created", "id": contact.id}
+            for (index, _), contact in zip(chunk, contacts)
+        )
+    return results
+
+
+def save_updates(contacts, changed, now):
+    """
+    수정된 연락처들을 저장합니다
+    같은 값으로 수정되는 연락처들은 UPDATE ... WHERE id IN (...) 한 번으로 묶고,
+    나머지만 행마다 CASE WHEN 식을 만드는 bulk_update로 저장합니다
+    contacts: 값이 반영된 Contact 객체 목록, changed: 객체별 수정 데이터 목록
+    """
+    groups = defaultdict(list)
+    for contact, data in zip(contacts, changed):
+        groups[tuple(sorted(data.items()))].append(contact)
+
+    singles, fields = [], set()
+    for key, group in groups.items():
+        # 수정하지 않은 필드도 사용하는 파생 컬럼(이름+회사 키)은 연락처마다 값이 다르므로 행별로 저장
+        if len(group) == 1 or not Contact.derives_only_from(dict(key)):
+            singles.extend(group)
+            fields.update(name for name, _ in key)
+            continue
+        # 같은 원본 값이므로 파생 컬럼 값도 같음 (첫 객체로 계산)
+        group[0].fill_derived_fields()
+        values = {
+            name: getattr(group[0], name)
+            for name in Contact.with_derived_fields(dict(key))
+        }
+        Contact.objects.filter(id__in=[contact.id for contact in group]).update(
+            updated_at=now, **values
+        )
+
+    if singles:
+        # bulk_update는 auto_now를 적용하지 않으므로 직접 설정
+        for contact in singles:
+            contact.updated_at = now
+        Contact.objects.bulk_update(singles, sorted(fields | {"updated_at"}))
+
+
+def update_contacts(rows, chunk_size=None):
+    """
+    검증된 부분 수정 데이터들을 저장합니다 (청크마다 트랜잭션 하나)
+    rows: [(순번, 연락처 ID, 검증된 데이터)] 목록
+    label_ids가 있는 항목은 라벨 연결을 해당 목록으로 교체합니다
+    반환값: 항목별 결과 목록
+    """
+    results = []
+    for chunk in chunked(rows, chunk_size or get_chunk_size()):
+        with immediate_atomic():
+            existing = Contact.objects.in_bulk(
+                [contact_id for _, contact_id, _ in chunk]
+            )
+            updated, changed, relabeled, pairs = [], [], [], []
+            for index, contact_id, data in chunk:
+                contact = existing.get(contact_id)
+                if contact is None:
+                    results.append(
+                        {"index": index, "status": "not_found", "id": contact_id}
+                    )
+                    continue
+                label_ids = pop_label_ids(data)
+                for attr, value in data.items():
+                    setattr(contact, attr, value)
+                if label_ids is not None:
+                    relabeled.append(contact_id)
+                    pairs.extend((contact_id, label_id) for label_id in label_ids)
+                updated.append(contact)
+                changed.append(data)
+                results.append({"index": index, "status": "updated", "id": contact_id})
+
+            if updated:
+                save_updates(updated, changed, timezone.now())
+                changes.contacts_updated(updated)
+            if relabeled:
+                unlinked = unlink_all_labels(relabeled)
+                deltas = Counter(link_labels(pairs))
+                deltas.subtract(unlinked)
+                changes.label_counts_changed(deltas)
+                changes.contact_labels_changed(relabeled)
+    return results
+
+
+def delete_contacts(rows, chunk_size=None):
+    """
+    연락처들을 청크 단위로 삭제합니다
+    객체마다 시그널을 보내는 QuerySet.delete() 대신 라벨 연결과 연락처를 한 번에 삭제합니다
+    rows: [(순번, 연락처 ID)] 목록
+    반환값: 항목별 결과 목록
+    """
+    results = []
+    for chunk in chunked(rows, chunk_size or get_chunk_size()):
+        with immediate_atomic():
+            existing = Contact.objects.in_bulk([contact_id for _, contact_id in chunk])
+            for index, contact_id in chunk:
+                status = "deleted" if contact_id in existing else "not_found"
+                results.append({"index": index, "status": status, "id": contact_id})
+            if existing:
+                contacts = list(existing.values())
+                unlinked = unlink_all_labels(list(existing))
+                # _raw_delete: 시그널/연쇄 삭제 수집 없이 DELETE 한 번 실행
+                queryset = Contact.objects.filter(id__in=list(existing))
+                queryset._raw_delete(queryset.db)
+                changes.contacts_deleted(contacts)
+                changes.label_counts_changed(
+                    {label_id: -count for label_id, count in unlinked.items()}
+                )
+    return results
+
+
+def parse_ids(items, key=None):
+    """
+    정수 ID 목록(key를 주면 key 필드에 ID가 있는 객체 목록)을 검증합니다
+    같은 요청 안에서 중복된 ID는 실패로 처리합니다
+    반환값: (검증된 항목 [(순번, ID, 원본)], 실패 결과 목록)
+    """
+    valid, failed, seen = [], [], set()
+    for index, item in enumerate(items):
+        raw = item.get(key) if key else item
+        if isinstance(raw, bool) or not isinstance(raw, (int, str)):
+            contact_id = None
+        else:
+            try:
+                contact_id = int(raw)
+            except ValueError:
+                contact_id = None
+        if contact_id is None:
+            failed.append(
+                {
+                    "index": index,
+                    "status": "invalid",
+                    "errors": {"id": ["정수 ID가 필요합니다."]},
+                }
+            )
+        elif contact_id in seen:
+            failed.append(
+                {
+                    "index": index,
+                    "status": "invalid",
+                    "errors": {"id": ["중복된 ID입니다."]},
+                }
+            )
+        else:
+            seen.add(contact_id)
+            valid.append((index, contact_id, item))
+    return valid, failed
+
+
+def process(payload):
+    """
+    일괄 요청 본문을 처리하고 항목별 결과를 반환합니다
+    payload: {"create": [...], "update": [{"id": 1, ...}], "delete": [1, 2]}
+    처리 순서: 생성 -> 수정 -> 삭제 (각 청크는 독립된 트랜잭션)
+    """
+    creates = list(enumerate(payload.get("create") or []))
+    updates = payload.get("update") or []
+    deletes = payload.get("delete") or []
+
+    # 생성: 전체 필드 검증 후 저장
+    valid, create_results = validate_items(ContactSerializer(), creates)
+    create_results += create_contacts(valid)
+
+    # 수정: ID 확인 -> 부분(partial) 검증 -> 저장
+    parsed, update_results = parse_ids(updates, key="id")
+    valid, failed = validate_items(
+        ContactSerializer(partial=True),
+        [
+            (index, {k: v for k, v in item.items() if k != "id"})
+            for index, _, item in parsed
+        ],
+    )
+    update_results += failed
+    ids_by_index = {index: contact_id for index, contact_id, _ in parsed}
+    update_results += update_contacts(
+        [(index, ids_by_index[index], data) for index, data in valid]
+    )
+
+    # 삭제: ID 목록만 확인 후 삭제
+    parsed, delete_results = parse_ids(deletes)
+    delete_results += delete_contacts(
+        [(index, contact_id) for index, contact_id, _ in parsed]
+    )
+
+    results = {
+        "create": sorted(create_results, key=lambda result: result["index"]),
+        "update": sorted(update_results, key=lambda result: result["index"]),
+        "delete": sorted(delete_results, key=lambda result: result["index"]),
+    }
+    summary = {"created": 0, "updated": 0, "deleted": 0, "failed": 0}
+    for items in results.values():
+        for result in items:
+            if result["status"] in summary:
+                summary[result["status"]] += 1
+            else:
+                summary["failed"] += 1
+    return {"summary": summary, "results": results}
+
+
+def count_items(payload):
+    """
+    요청 본문에 담긴 전체 항목 수를 반환합니다
+    """
+    return sum(len(payload.get(key) or []) for key in ("create", "update", "delete"))
+
+
+def payload_error(payload):
+    """
+    요청 본문 형식이 잘못되었으면 오류 메시지를 반환합니다 (정상이면 None)
+    """
+    if not isinstance(payload, dict):
+        return "요청 본문은 객체여야 합니다."
+    if not any(key in payload for key in ("create", "update", "delete")):
+        return "create, update, delete 중 하나 이상이 필요합니다."
+    for key in ("create", "update", "delete"):
+        value = payload.get(key)
+        if value is not None and not isinstance(value, list):
+            return f"{key}는 목록이어야 합니다."
+    for key in ("create", "update"):
+        if any(not isinstance(item, dict) for item in payload.get(key) or []):
+            return f"{key} 항목은 객체여야 합니다."
+    return None
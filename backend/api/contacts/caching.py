@@ -0,0 +1,114 @@
+# 파이썬 표준 라이브러리
+import hashlib
+import json
+import time
+
+# Django의 캐시와 트랜잭션 기능을 가져옵니다
+from django.core.cache import cache
+from django.db import transaction
+
+# 현재 앱의 주소록 범위 도구를 가져옵니다
+from .addressbooks import current_address_book
+
+
+# 주소록의 컬렉션(연락처, 라벨 등)별 변경 버전을 저장하는 캐시 키 형식
+VERSION_KEY = "contacts:version:{address_book}:{namespace}"
+# 주소록의 컬렉션이 마지막으로 바뀐 시각(유닉스 시간)을 저장하는 캐시 키 형식
+CHANGED_AT_KEY = "contacts:changed_at:{address_book}:{namespace}"
+# 주소록과 관계없는 전역 컬렉션(샤드 디렉터리 등)의 범위 이름 (주소록 이름으로 쓸 수 없는 값)
+GLOBAL_SCOPE = "*"
+
+
+def make_key(template, namespace, address_book=None):
+    """
+    캐시 키를 만듭니다 (address_book을 지정하지 않으면 현재 주소록)
+    주소록마다 버전이 따로 있으므로 한 주소록의 변경이 다른 주소록의 캐시를 무효화하지 않습니다
+    """
+    if address_book is None:
+        address_book = current_address_book()
+    return template.format(address_book=address_book, namespace=namespace)
+
+
+def _initial_version():
+    """
+    캐시에 버전 값이 없을 때 사용할 초기값
+    캐시가 비워진 뒤 예전 버전 번호가 다시 쓰이지 않도록 현재 시각(마이크로초)을 사용합니다
+    """
+    return time.time_ns() // 1000
+
+
+def get_version(namespace, address_book=None):
+    """
+    컬렉션의 현재 변경 버전을 반환합니다
+    버전이 바뀌면 그 버전을 키에 포함한 캐시 항목들은 자동으로 무효화됩니다
+    """
+    key = make_key(VERSION_KEY, namespace, address_book)
+    version = cache.get(key)
+    if version is None:
+        # 다른 워커가 먼저 초기화했다면 그 값을 그대로 사용
+        cache.add(key, _initial_version(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(namespace, address_book=None):
+    """
+    컬렉션의 변경 버전을 1 증가시킵니다 (cache.incr는 원자적으로 동작)
+    """
+    key = make_key(VERSION_KEY, namespace, address_book)
+    cache.set(
+        make_key(CHANGED_AT_KEY, namespace, address_book), time.time(), timeout=None
+    )
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # 키가 없으면 새 초기값으로 시작
+        cache.add(key, _initial_version(), timeout=None)
+        return cache.incr(key)
+
+
+def get_changed_at(namespace, address_book=None):
+    """
+    컬렉션이 마지막으로 바뀐 시각(유닉스 시간)을 반환합니다 (Last-Modified 헤더용)
+    캐시에 값이 없으면 언제 바뀌었는지 알 수 없으므로 현재 시각부터 시작합니다
+    """
+    key = make_key(CHANGED_AT_KEY, namespace, address_book)
+    changed_at = cache.get(key)
+    if changed_at is None:
+        cache.add(key, time.time(), timeout=None)
+        changed_at = cache.get(key)
+    return changed_at
+
+
+def bump_version_on_commit(namespace, using=None):
+    """
+    데이터 변경 시 버전을 즉시 한 번, 트랜잭션 커밋 후 한 번 더 증가시킵니다
+    커밋 전에 다른 요청이 새 버전으로 예전 데이터를 캐시해도 커밋 후 증가로 무효화됩니다
+    using을 지정하지 않으면 현재 주소록의 DB(샤드) 트랜잭션 커밋을 기다립니다
+    """
+    # shards 모듈은 모델을 가져오므로 순환 import를 피해 함수 안에서 가져옴
+    from .shards import current_alias
+
+    address_book = current_address_book()
+    bump_version(namespace, address_book)
+    transaction.on_commit(
+        lambda: bump_version(namespace, address_book), using=using or current_alias()
+    )
+
+
+def make_signature(params, ignored=()):
+    """
+    쿼리 파라미터를 정규화한 문자열 서명을 만듭니다
+    파라미터 순서나 같은 키의 값 순서가 달라도 같은 서명이 나오며, 빈 값은 무시합니다
+    params: QueryDict (request.query_params)
+    """
+    normalized = sorted(
+        (key, sorted(value for value in values if value != ""))
+        for key, values in params.lists()
+        if key not in ignored
+    )
+    normalized = [(key, values) for key, values in normalized if values]
+    if not normalized:
+        return ""
+    raw = json.dumps(normalized, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
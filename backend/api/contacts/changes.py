@@ -0,0 +1,138 @@
+# 현재 앱의 모듈들을 가져옵니다
+from . import caching
+from .models import ContactStatistics, Label, SyncTombstone, statistics_values_of
+from .registry import LABELS_NAMESPACE
+from .snapshots import label_contact_ids, refresh_label_snapshots
+
+
+# 연락처 목록 데이터의 변경 버전 이름 (개수 캐시, ETag 등의 무효화에 사용)
+CONTACTS_NAMESPACE = "contacts"
+
+# 라벨별 연락처 수의 변경 버전 이름 (라벨 목록 ETag에 사용)
+LABEL_COUNTS_NAMESPACE = "label_counts"
+
+
+# 연락처/라벨 변경 사항을 파생 데이터(통계 카운터, 라벨 스냅샷, 캐시 버전)에 반영하는 함수들
+# 개별 저장/삭제는 signals.py의 시그널 수신 함수가, 일괄 처리는 각 경로가 직접 호출합니다
+
+
+def contacts_created(contacts):
+    """
+    연락처들이 생성되었을 때 호출합니다
+    contacts: 생성된 Contact 객체 목록
+    """
+    ContactStatistics.apply_changes(
+        [
+            (None, statistics_values_of(remember_statistics(contact)))
+            for contact in contacts
+        ]
+    )
+    caching.bump_version_on_commit(CONTACTS_NAMESPACE)
+
+
+def contacts_updated(contacts, update_fields=None):
+    """
+    연락처들의 필드 값이 수정되었을 때 호출합니다
+    불러올 때 보관한 이전 값(_statistics_values)과 비교해서 바뀐 통계 값만 증감합니다
+    update_fields: save(update_fields=...)로 일부 필드만 저장한 경우 저장된 필드 이름들
+    """
+    changed = []
+    for contact in contacts:
+        stored = getattr(contact, "_statistics_values", None)
+        if stored is None:
+            continue
+        before = statistics_values_of(stored)
+        after = statistics_values_of(remember_statistics(contact, update_fields))
+        if before != after:
+            changed.append((before, after))
+    ContactStatistics.apply_changes(changed)
+    caching.bump_version_on_commit(CONTACTS_NAMESPACE)
+
+
+def contacts_deleted(contacts):
+    """
+    연락처들이 삭제되었을 때 호출합니다
+    """
+    ContactStatistics.apply_changes(
+        [
+            (
+                statistics_values_of(
+                    getattr(contact, "_statistics_values", None)
+                    or contact.statistics_field_values()
+                ),
+                None,
+            )
+            for contact in contacts
+        ]
+    )
+    # 행이 없어지므로 동기화 피드가 삭제를 알릴 수 있도록 삭제 기록을 남김
+    SyncTombstone.record(
+        SyncTombstone.KIND_CONTACT, [contact.pk for contact in contacts]
+    )
+    caching.bump_version_on_commit(CONTACTS_NAMESPACE)
+
+
+def remember_statistics(contact, update_fields=None):
+    """
+    저장된 통계 관련 필드 값을 연락처 객체에 보관하고 반환합니다 (다음 수정 때 이전 값으로 사용)
+    update_fields가 있으면 그 필드만 현재 값으로 바꾸고 나머지는 이전 값을 유지합니다
+    """
+    values = contact.statistics_field_values()
+    if update_fields is not None:
+        stored = contact._statistics_values
+        values = {
+            field: value if field in update_fields else stored[field]
+            for field, value in values.items()
+        }
+    contact._statistics_values = values
+    return values
+
+
+def contact_labels_changed(contact_ids):
+    """
+    연락처와 라벨의 연결이 추가/제거되었을 때 호출합니다
+    스냅샷을 저장하면서 수정일도 바뀌므로 동기화 피드는 연결이 바뀐 연락처를 현재 라벨 목록과 함께 다시 보냅니다
+    contact_ids: 연결이 바뀐 연락처 ID 목록
+    """
+    refresh_label_snapshots(contact_ids)
+    caching.bump_version_on_commit(CONTACTS_NAMESPACE)
+
+
+def label_counts_changed(deltas):
+    """
+    라벨별 연결된 연락처 수가 바뀌었을 때 호출합니다
+    deltas: {라벨 ID: 증감값}
+    연락처 수는 라벨 레지스트리에서 사용하지 않으므로 라벨 버전 대신 별도 버전을 바꿉니다
+    """
+    if any(deltas.values()):
+        Label.adjust_contact_counts(deltas)
+        caching.bump_version_on_commit(LABEL_COUNTS_NAMESPACE)
+
+
+def labels_created(labels):
+    """
+    라벨들이 생성되었을 때 호출합니다 (라벨 레지스트리 무효화)
+    """
+    caching.bump_version_on_commit(LABELS_NAMESPACE)
+
+
+def label_changed(label):
+    """
+    라벨의 이름/색상이 수정되었을 때 호출합니다
+    이 라벨이 연결된 연락처들의 라벨 스냅샷을 다시 계산합니다
+    """
+    refresh_label_snapshots(label_contact_ids(label.pk))
+    caching.bump_version_on_commit(CONTACTS_NAMESPACE)
+    caching.bump_version_on_commit(LABELS_NAMESPACE)
+
+
+def label_deleted(label, contact_ids):
+    """
+    라벨이 삭제되었을 때 호출합니다 (연결된 연락처-라벨 관계도 함께 삭제됨)
+    연결되어 있던 연락처들은 스냅샷과 함께 수정일이 바뀌어 동기화 피드에 다시 나타나고, 라벨은 삭제 기록을 남깁니다
+    contact_ids: 삭제 전에 이 라벨이 연결되어 있던 연락처 ID 목록
+    """
+    refresh_label_snapshots(contact_ids)
+    SyncTombstone.record(SyncTombstone.KIND_LABEL, [label.pk])
+    caching.bump_version_on_commit(CONTACTS_NAMESPACE)
+    caching.bump_version_on_commit(LABELS_NAMESPACE)
@@ -0,0 +1,125 @@
+# 파이썬 표준 라이브러리
+import hashlib
+
+# Django의 HTTP 캐시 도구들을 가져옵니다
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from rest_framework.response import Response
+
+# 현재 앱의 모듈들을 가져옵니다
+from . import caching, replicas
+from .addressbooks import current_address_book
+
+
+# 조건부 GET(ETag / Last-Modified) 모듈
+# 목록은 컬렉션 변경 버전(caching.get_version) + 정규화한 쿼리 파라미터로,
+# 상세는 객체의 수정일 등으로 검증 값을 만들고, If-None-Match / If-Modified-Since가 맞으면
+# 쿼리와 직렬화 없이 304 Not Modified로 응답합니다
+
+
+def make_etag(*parts):
+    """
+    값들로 강한(strong) ETag를 만듭니다 (예: '"3f2a..."')
+    """
+    raw = "|".join(str(part) for part in parts)
+    return '"{}"'.format(hashlib.sha1(raw.encode("utf-8")).hexdigest())
+
+
+def collection_validators(request, namespaces):
+    """
+    목록 응답의 (ETag, Last-Modified 유닉스 시간)
+    namespaces: 응답 내용에 영향을 주는 컬렉션 버전 이름들
+    같은 데이터라도 응답 형식(JSON, 브라우저 API 등)이 다르면 다른 ETag가 되도록 형식을 포함합니다
+    최신 변경을 아직 받지 못한 복제본에서 읽는 요청은 복제본의 하트비트 시각을 기준으로 만들어서,
+    복제본이 따라잡은 뒤 예전 응답이 304로 계속 재사용되지 않도록 합니다
+    버전은 주소록마다 따로 증가하므로 주소록 이름도 포함합니다
+    """
+    parts = [
+        current_address_book(),
+        request.accepted_media_type,
+        caching.make_signature(request.query_params),
+        *(caching.get_version(namespace) for namespace in namespaces),
+    ]
+    last_modified = max(caching.get_changed_at(namespace) for namespace in namespaces)
+    synced_at = replicas.stale_snapshot(last_modified)
+    if synced_at is not None:
+        parts.append(synced_at)
+        last_modified = synced_at
+    return make_etag(*parts), last_modified
+
+
+def not_modified(request, validators):
+    """
+    요청의 조건 헤더(If-None-Match / If-Modified-Since)가 검증 값과 맞으면 304 응답을, 아니면 None을 반환합니다
+    """
+    etag, last_modified = validators
+    return get_conditional_response(
+        request, etag=etag, last_modified=int(last_modified)
+    )
+
+
+def apply_validators(response, validators):
+    """
+    200/304 응답에 ETag / Last-Modified 헤더를 붙이고, 저장된 응답을 쓰기 전에 항상 다시 확인하도록 합니다
+    """
+    etag, last_modified = validators
+    if response.status_code in (200, 304):
+        response.headers["ETag"] = etag
+        response.headers["Last-Modified"] = http_date(last_modified)
+        patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+class ConditionalGetMixin:
+    """
+    ViewSet의 list/retrieve에 ETag, Last-Modified 헤더와 304 응답을 추가하는 믹스인
+    - list: get_list_validators(request)가 반환한 값으로 목록 조회 전에 비교
+    - retrieve: 객체 하나만 조회한 뒤 get_object_validators(instance)로 비교
+      (304가 아니면 조회한 객체를 그대로 직렬화하므로 다시 조회하지 않음)
+    """
+
+    # 목록 응답에 영향을 주는 컬렉션 버전 이름들
+    conditional_namespaces = ()
+
+    def get_list_validators(self, request):
+        """
+        목록 응답의 (ETag, Last-Modified 유닉스 시간)
+        """
+        return collection_validators(request, self.conditional_namespaces)
+
+    def get_object_validators(self, instance):
+        """
+        상세 응답의 (ETag, Last-Modified 유닉스 시간)
+        """
+        raise NotImplementedError
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_response(
+            request,
+            self.get_list_validators(request),
+            lambda: self.list_response(request, *args, **kwargs),
+        )
+
+    def list_response(self, request, *args, **kwargs):
+        """
+        조건이 맞지 않을 때 실제 목록 응답을 만듭니다 (ViewSet에서 바꿔 쓸 수 있음)
+        """
+        return super().list(request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        return self.conditional_response(
+            request,
+            self.get_object_validators(instance),
+            lambda: Response(self.get_serializer(instance).data),
+        )
+
+    def conditional_response(self, request, validators, render):
+        """
+        요청의 조건 헤더가 현재 검증 값과 맞으면 304를, 아니면 render()의 응답을 반환합니다
+        두 경우 모두 ETag / Last-Modified 헤더를 붙입니다
+        """
+        response = not_modified(request, validators)
+        if response is None:
+            response = render()
+        return apply_validators(response, validators)
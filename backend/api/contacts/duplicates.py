@@ -0,0 +1,320 @@
+# 블록 안의 연락처 쌍을 만들고 블록별로 묶기 위한 도구
+from collections import Counter, defaultdict
+from itertools import combinations, groupby
+
+# Django의 설정, 캐시, 집계 도구를 가져옵니다
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count
+
+# 현재 앱의 모듈들을 가져옵니다
+from . import caching, changes, replicas
+from .addressbooks import current_address_book
+from .bulk import ContactLabel, link_labels, unlink_all_labels
+from .changes import CONTACTS_NAMESPACE
+from .models import Contact
+from .transactions import immediate_atomic
+
+
+# 중복 연락처 찾기/합치기 모듈
+# 모든 연락처 쌍을 비교하면 O(n²)이므로, 연락처 저장 시 계산해 둔 블로킹 키(파생 컬럼) 값이
+# 같은 연락처끼리만 비교합니다 (GET /contacts/duplicates/)
+#
+# - 블로킹 키: 정규화 이메일(email_key), 전화번호 숫자(phone_digits), 이름+회사 키(name_key)
+# - 블록 찾기: 키마다 GROUP BY ... HAVING COUNT(*) > 1 쿼리 한 번 + 블록 연락처를 키 순서로 읽는 쿼리 한 번
+#   (키 인덱스를 사용하므로 연락처가 많아도 중복 후보가 있는 행만 읽음)
+# - 점수: 같은 키 종류별 가중치를 합쳐서 계산하고, 다른 이메일/전화번호가 있으면 낮춤
+# - 묶음: 점수가 min_score 이상인 쌍을 유니온-파인드로 이어서 중복 묶음(클러스터)으로 반환
+# - 캐시: 연락처 변경 버전(CONTACTS_NAMESPACE)별로 묶음 목록을 캐시 (연락처가 바뀌면 다시 계산)
+
+# 블로킹 키 종류: (이름, 파생 컬럼, 가중치)
+BLOCKING_KEYS = (
+    ("email", "email_key", 0.9),
+    ("phone", "phone_digits", 0.8),
+    ("name", "name_key", 0.6),
+)
+# 전화번호 블록에 사용할 최소 숫자 수 (내선번호처럼 짧은 번호는 우연히 같을 수 있음)
+MIN_PHONE_DIGITS = 7
+# 같은 종류의 다른 값(이메일/전화번호)이 있을 때 점수에 곱하는 값
+CONFLICT_PENALTY = 0.5
+# 요청 파라미터 이름
+MIN_SCORE_PARAM = "min_score"
+
+# 합칠 때 대상 연락처의 빈 값을 채우는 필드 (이름은 대상 연락처 값을 유지)
+MERGE_FIELDS = (
+    "email",
+    "phone",
+    "company",
+    "position",
+    "memo",
+    "profile_url",
+    "address",
+    "birthday",
+    "website",
+)
+
+
+class MergeError(ValueError):
+    """
+    합치기 요청이 잘못되었음 (합칠 연락처 목록 형식 오류, 없는 연락처 등)
+    """
+
+
+def get_max_block():
+    """
+    비교할 블록의 최대 크기 (settings.CONTACTS_DUPLICATE_MAX_BLOCK)
+    대표번호/공용 이메일처럼 많은 연락처가 같은 키를 가진 블록은 중복이 아닐 가능성이 높고
+    블록 안의 쌍 수가 크기의 제곱으로 늘어나므로 비교하지 않습니다
+    """
+    return getattr(settings, "CONTACTS_DUPLICATE_MAX_BLOCK", 50)
+
+
+def get_max_merge():
+    """
+    한 번에 합칠 수 있는 연락처 수 (settings.CONTACTS_DUPLICATE_MAX_MERGE)
+    """
+    return getattr(settings, "CONTACTS_DUPLICATE_MAX_MERGE", 100)
+
+
+def get_default_min_score():
+    """
+    중복으로 볼 최소 점수의 기본값 (settings.CONTACTS_DUPLICATE_MIN_SCORE)
+    """
+    return getattr(settings, "CONTACTS_DUPLICATE_MIN_SCORE", 0.6)
+
+
+def get_min_score(request):
+    """
+    중복으로 볼 최소 점수 (?min_score=, 0~1 사이, 없으면 기본값)
+    잘못된 값이면 ValueError
+    """
+    raw = request.query_params.get(MIN_SCORE_PARAM)
+    if raw is None:
+        return get_default_min_score()
+    score = float(raw)
+    if not 0 < score <= 1:
+        raise ValueError("min_score는 0보다 크고 1 이하여야 합니다.")
+    return round(score, 2)
+
+
+def read_blocks(kind, field, max_block):
+    """
+    field 값이 같은 연락처가 2개 이상 max_block개 이하인 블록들을 읽습니다
+    반환값: (키, [(연락처 ID, 이메일 키, 전화번호 숫자)]) 이터레이터 (키 순서)
+    """
+    contacts = Contact.objects.exclude(**{field: ""})
+    keys = (
+        contacts.values(field)
+        .annotate(size=Count("id"))
+        .filter(size__gt=1, size__lte=max_block)
+        .order_by()
+        .values(field)
+    )
+    rows = (
+        contacts.filter(**{f"{field}__in": keys})
+        .order_by(field, "id")
+        .values_list(field, "id", "email_key", "phone_digits")
+        .iterator(chunk_size=5000)
+    )
+    for key, members in groupby(rows, key=lambda row: row[0]):
+        if kind == "phone" and len(key) < MIN_PHONE_DIGITS:
+            continue
+        yield key, [row[1:] for row in members]
+
+
+def conflicts(first, second, kinds):
+    """
+    두 연락처가 일치하지 않은 종류 중 서로 다른 값을 가진 종류 수 (다른 사람일 가능성)
+    first, second: (연락처 ID, 이메일 키, 전화번호 숫자)
+    """
+    count = 0
+    if "email" not in kinds and first[1] and second[1] and first[1] != second[1]:
+        count += 1
+    if (
+        "phone" not in kinds
+        and len(first[2]) >= MIN_PHONE_DIGITS
+        and len(second[2]) >= MIN_PHONE_DIGITS
+        and first[2] != second[2]
+    ):
+        count += 1
+    return count
+
+
+def score_pair(kinds, conflict_count):
+    """
+    일치한 키 종류들의 점수 (종류별 가중치를 독립된 근거로 합침: 1 - Π(1 - 가중치))
+    """
+    weights = {kind: weight for kind, _, weight in BLOCKING_KEYS}
+    remaining = 1.0
+    for kind in kinds:
+        remaining *= 1 - weights[kind]
+    return round((1 - remaining) * CONFLICT_PENALTY**conflict_count, 4)
+
+
+def find_clusters(min_score, max_block=None):
+    """
+    현재 주소록의 중복 묶음들을 계산합니다
+    반환값: [{"contact_ids": [...], "score": ..., "reasons": [...]}] (점수 높은 순)
+    """
+    max_block = max_block or get_max_block()
+    # 후보 쌍별로 일치한 키 종류와 비교용 값
+    pairs = defaultdict(set)
+    values = {}
+    for kind, field, _ in BLOCKING_KEYS:
+        for _, members in read_blocks(kind, field, max_block):
+            for member in members:
+                values[member[0]] = member
+            for first, second in combinations(members, 2):
+                pairs[first[0], second[0]].add(kind)
+
+    # 점수가 기준 이상인 쌍을 유니온-파인드로 연결
+    parents = {}
+
+    def find(contact_id):
+        root = contact_id
+        while parents.get(root, root) != root:
+            root = parents[root]
+        parents[contact_id] = root
+        return root
+
+    scores, reasons = {}, defaultdict(set)
+    for (first, second), kinds in pairs.items():
+        score = score_pair(kinds, conflicts(values[first], values[second], kinds))
+        if score < min_score:
+            continue
+        parents[find(second)] = find(first)
+        scores[first, second] = score
+        reasons[first, second] = kinds
+
+    members = defaultdict(list)
+    for contact_id in parents:
+        members[find(contact_id)].append(contact_id)
+    best, matched = Counter(), defaultdict(set)
+    for pair, score in scores.items():
+        root = find(pair[0])
+        best[root] = max(best[root], score)
+        matched[root] |= reasons[pair]
+
+    clusters = [
+        {
+            "contact_ids": sorted(contact_ids),
+            "score": best[root],
+            "reasons": sorted(matched[root]),
+        }
+        for root, contact_ids in members.items()
+    ]
+    clusters.sort(
+        key=lambda cluster: (
+            -cluster["score"],
+            -len(cluster["contact_ids"]),
+            cluster["contact_ids"][0],
+        )
+    )
+    return clusters
+
+
+def get_clusters(min_score):
+    """
+    중복 묶음 목록 (연락처 변경 버전별 캐시)
+    최신 변경을 아직 받지 못한 복제본에서 계산한 목록은 새 버전 키로 저장하지 않습니다
+    """
+    key = "contacts:duplicates:{}:{}:{}".format(
+        current_address_book(), caching.get_version(CONTACTS_NAMESPACE), min_score
+    )
+    clusters = cache.get(key)
+    if clusters is None:
+        clusters = find_clusters(min_score)
+        changed_at = caching.get_changed_at(CONTACTS_NAMESPACE)
+        if replicas.includes_changes(Contact.objects.db, changed_at):
+            cache.set(
+                key,
+                clusters,
+                getattr(settings, "CONTACTS_DUPLICATE_CACHE_TIMEOUT", 600),
+            )
+    return clusters
+
+
+def parse_merge_ids(survivor_id, raw):
+    """
+    합칠 연락처 ID 목록을 검증합니다 (순서 유지, 중복 제거)
+    """
+    if not isinstance(raw, list) or not raw:
+        raise MergeError("contact_ids는 비어 있지 않은 ID 목록이어야 합니다.")
+    if len(raw) > get_max_merge():
+        raise MergeError(f"한 번에 최대 {get_max_merge()}개까지 합칠 수 있습니다.")
+    ids = []
+    for value in raw:
+        if isinstance(value, bool) or not isinstance(value, (int, str)):
+            raise MergeError("contact_ids는 정수 ID 목록이어야 합니다.")
+        try:
+            contact_id = int(value)
+        except ValueError:
+            raise MergeError("contact_ids는 정수 ID 목록이어야 합니다.")
+        if contact_id == survivor_id:
+            raise MergeError("대상 연락처 자신은 합칠 수 없습니다.")
+        if contact_id not in ids:
+            ids.append(contact_id)
+    return ids
+
+
+def merge_contacts(survivor_id, merged_ids):
+    """
+    merged_ids 연락처들을 survivor_id 연락처로 합칩니다 (IMMEDIATE 트랜잭션 하나)
+    - 대상 연락처의 빈 필드를 합칠 연락처 값으로 요청 순서대로 채움
+    - 라벨 연결은 합집합: 합칠 연락처의 연결을 한 번에 지우고, 대상에 없던 라벨만 한 번에 추가
+    - 합칠 연락처는 삭제 (통계 카운터, 동기화 삭제 기록 반영)
+    반환값: {"contact": 대상 Contact, "merged_ids", "filled_fields", "added_label_ids"}
+    """
+    with immediate_atomic():
+        contacts = Contact.objects.in_bulk([survivor_id, *merged_ids])
+        missing = [
+            contact_id
+            for contact_id in [survivor_id, *merged_ids]
+            if contact_id not in contacts
+        ]
+        if missing:
+            raise MergeError(f"연락처를 찾을 수 없습니다: {missing}")
+        survivor = contacts[survivor_id]
+        merged = [contacts[contact_id] for contact_id in merged_ids]
+
+        # 빈 필드 채우기 (post_save 시그널이 통계 카운터를 갱신)
+        filled = []
+        for field in MERGE_FIELDS:
+            if getattr(survivor, field) not in (None, ""):
+                continue
+            for contact in merged:
+                value = getattr(contact, field)
+                if value not in (None, ""):
+                    setattr(survivor, field, value)
+                    filled.append(field)
+                    break
+        if filled:
+            survivor.save(update_fields=[*filled, "updated_at"])
+
+        # 라벨 합집합 (중간 테이블에서 직접 읽고 쓰므로 연결마다 시그널을 보내지 않음)
+        # 합칠 연락처의 연결을 지우면서 센 라벨 중 대상에 없던 라벨만 추가
+        existing = set(
+            ContactLabel.objects.filter(contact_id=survivor_id).values_list(
+                "label_id", flat=True
+            )
+        )
+        unlinked = unlink_all_labels(merged_ids)
+        added = sorted(set(unlinked) - existing)
+        deltas = Counter(link_labels((survivor_id, label_id) for label_id in added))
+        deltas.subtract(unlinked)
+
+        # _raw_delete: 시그널/연쇄 삭제 수집 없이 DELETE 한 번 실행
+        queryset = Contact.objects.filter(id__in=merged_ids)
+        queryset._raw_delete(queryset.db)
+        changes.contacts_deleted(merged)
+        changes.label_counts_changed(deltas)
+        if added:
+            changes.contact_labels_changed([survivor_id])
+            survivor.refresh_from_db(fields=["label_snapshot", "updated_at"])
+
+    return {
+        "contact": survivor,
+        "merged_ids": merged_ids,
+        "filled_fields": filled,
+        "added_label_ids": added,
+    }
@@ -0,0 +1,217 @@
+# CSV 작성과 메모리 버퍼 도구를 가져옵니다
+import csv
+import io
+from datetime import timezone
+
+# Django의 설정 도구를 가져옵니다
+from django.conf import settings
+
+
+# 연락처 내보내기(CSV, vCard) 모듈
+# 쿼리셋을 .iterator(chunk_size)로 조금씩 읽고 청크 단위 문자열을 yield하므로
+# StreamingHttpResponse와 함께 쓰면 연락처 수와 관계없이 메모리 사용량이 일정합니다
+
+# CSV 열 (모델 필드명, 헤더명)
+CSV_COLUMNS = [
+    ("id", "ID"),
+    ("name", "이름"),
+    ("email", "이메일"),
+    ("phone", "전화번호"),
+    ("company", "회사"),
+    ("position", "직책"),
+    ("memo", "메모"),
+    ("profile_url", "프로필 사진"),
+    ("address", "주소"),
+    ("birthday", "생일"),
+    ("website", "웹사이트"),
+    ("labels", "라벨"),
+    ("created_at", "생성일"),
+    ("updated_at", "수정일"),
+]
+
+# CSV 라벨 열에서 라벨명 구분자
+CSV_LABEL_SEPARATOR = ";"
+
+# 스프레드시트(엑셀 등)가 수식으로 실행하는 셀의 첫 글자 (CSV 수식 주입 방지용)
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+# 수식으로 실행되지 않도록 셀 앞에 붙이는 문자 (가져오기에서 다시 제거)
+CSV_ESCAPE_CHAR = "'"
+
+# 지원하는 vCard 버전
+VCARD_VERSIONS = ("3.0", "4.0")
+
+# vCard 한 줄의 최대 길이 (RFC 6350 3.2: CRLF 제외 75 옥텟)
+VCARD_LINE_LIMIT = 75
+
+
+def get_chunk_size():
+    """
+    한 번에 읽어올 연락처 수 (settings.CONTACTS_EXPORT_CHUNK_SIZE)
+    """
+    return getattr(settings, "CONTACTS_EXPORT_CHUNK_SIZE", 2000)
+
+
+def iter_chunks(queryset, chunk_size=None):
+    """
+    연락처를 chunk_size개씩 묶어서 반환합니다
+    iterator(chunk_size)는 청크마다 prefetch_related("labels")를 IN 쿼리 한 번으로 처리하므로
+    연락처마다 라벨 쿼리가 실행되지 않습니다
+    """
+    chunk_size = chunk_size or get_chunk_size()
+    chunk = []
+    for contact in queryset.prefetch_related("labels").iterator(chunk_size=chunk_size):
+        chunk.append(contact)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# ===== CSV =====
+
+
+def csv_escape(value):
+    """
+    스프레드시트가 수식으로 실행할 수 있는 문자열 앞에 '를 붙입니다 (CSV 수식 주입 방지)
+    예: "=HYPERLINK(...)" -> "'=HYPERLINK(...)", "+82-10-1234-5678" -> "'+82-10-1234-5678"
+    원래 '로 시작하는 값도 하나를 더 붙여서 가져오기(importers.csv_unescape)에서 그대로 복원됩니다
+    """
+    if value.lstrip(CSV_ESCAPE_CHAR).startswith(CSV_FORMULA_PREFIXES):
+        return CSV_ESCAPE_CHAR + value
+    return value
+
+
+def csv_value(contact, field):
+    """
+    연락처의 필드 값을 CSV 셀 문자열로 변환합니다
+    사용자가 입력한 문자열은 수식으로 실행되지 않도록 csv_escape()를 거칩니다
+    """
+    if field == "labels":
+        return csv_escape(
+            CSV_LABEL_SEPARATOR.join(label.name for label in contact.labels.all())
+        )
+    value = getattr(contact, field)
+    if value is None:
+        return ""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if isinstance(value, str):
+        return csv_escape(value)
+    return value
+
+
+def export_csv(queryset, chunk_size=None):
+    """
+    연락처들을 CSV 문자열 조각으로 반환합니다
+    엑셀에서 한글이 깨지지 않도록 UTF-8 BOM으로 시작합니다
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([header for _, header in CSV_COLUMNS])
+    yield "\ufeff" + buffer.getvalue()
+
+    for chunk in iter_chunks(queryset, chunk_size):
+        # 버퍼를 비우고 청크 하나를 CSV로 작성
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(
+            [csv_value(contact, field) for field, _ in CSV_COLUMNS] for contact in chunk
+        )
+        yield buffer.getvalue()
+
+
+# ===== vCard =====
+
+
+def vcard_escape(value):
+    """
+    vCard 텍스트 값의 특수문자를 이스케이프합니다 (\\, 쉼표, 세미콜론, 줄바꿈)
+    """
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace(",", "\\,")
+        .replace(";", "\\;")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+        .replace("\r", "\\n")
+    )
+
+
+def vcard_fold(line):
+    """
+    75 옥텟이 넘는 줄을 CRLF + 공백으로 접습니다
+    UTF-8 멀티바이트 문자(한글 등)가 중간에 잘리지 않도록 문자 단위로 자릅니다
+    """
+    if len(line.encode("utf-8")) <= VCARD_LINE_LIMIT:
+        return line + "\r\n"
+
+    parts, current, size = [], [], 0
+    # 이어지는 줄은 맨 앞의 공백 1옥텟을 포함해서 75옥텟
+    limit = VCARD_LINE_LIMIT
+    for char in line:
+        length = len(char.encode("utf-8"))
+        if size + length > limit:
+            parts.append("".join(current))
+            current, size, limit = [], 0, VCARD_LINE_LIMIT - 1
+        current.append(char)
+        size += length
+    parts.append("".join(current))
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def vcard_lines(contact, version):
+    """
+    연락처 하나를 vCard 속성 줄 목록으로 변환합니다
+    """
+    lines = ["BEGIN:VCARD", f"VERSION:{version}"]
+    name = vcard_escape(contact.name)
+    lines.append(f"FN:{name}")
+    # 한국어 이름은 성/이름을 나눌 수 없으므로 전체를 성(family name) 자리에 저장
+    lines.append(f"N:{name};;;;")
+    if contact.email:
+        lines.append(f"EMAIL:{vcard_escape(contact.email)}")
+    if contact.phone:
+        # 4.0의 TEL 기본 값 형식은 URI이므로 텍스트임을 명시
+        prefix = "TEL;VALUE=text" if version == "4.0" else "TEL"
+        lines.append(f"{prefix}:{vcard_escape(contact.phone)}")
+    if contact.company:
+        lines.append(f"ORG:{vcard_escape(contact.company)}")
+    if contact.position:
+        lines.append(f"TITLE:{vcard_escape(contact.position)}")
+    if contact.address:
+        # ADR 구성: 사서함;상세주소;거리;도시;지역;우편번호;국가 -> 전체 주소를 거리에 저장
+        lines.append(f"ADR:;;{vcard_escape(contact.address)};;;;")
+    if contact.birthday:
+        # 3.0은 YYYY-MM-DD, 4.0은 YYYYMMDD 형식
+        if version == "4.0":
+            lines.append(f"BDAY:{contact.birthday:%Y%m%d}")
+        else:
+            lines.append(f"BDAY:{contact.birthday:%Y-%m-%d}")
+    if contact.website:
+        lines.append(f"URL:{contact.website}")
+    if contact.profile_url:
+        prefix = "PHOTO" if version == "4.0" else "PHOTO;VALUE=uri"
+        lines.append(f"{prefix}:{contact.profile_url}")
+    if contact.memo:
+        lines.append(f"NOTE:{vcard_escape(contact.memo)}")
+    labels = [vcard_escape(label.name) for label in contact.labels.all()]
+    if labels:
+        lines.append(f"CATEGORIES:{','.join(labels)}")
+    revised = contact.updated_at.astimezone(timezone.utc)
+    lines.append(f"REV:{revised:%Y%m%dT%H%M%SZ}")
+    lines.append("END:VCARD")
+    return lines
+
+
+def export_vcard(queryset, version="3.0", chunk_size=None):
+    """
+    연락처들을 vCard 문자열 조각으로 반환합니다 (청크마다 하나)
+    """
+    for chunk in iter_chunks(queryset, chunk_size):
+        yield "".join(
+            vcard_fold(line)
+            for contact in chunk
+            for line in vcard_lines(contact, version)
+        )
@@ -0,0 +1,111 @@
+# 파이썬 표준 라이브러리
+from operator import itemgetter
+
+# Django의 설정 도구를 가져옵니다
+from django.conf import settings
+
+# 현재 앱의 부분 필드/모델 도구를 가져옵니다
+from .fieldsets import columns_for
+from .models import company_with_position
+
+
+# 연락처 목록의 빠른 직렬화 모듈
+# ContactListSerializer는 행마다 모델 객체를 만들고 필드마다 to_representation을 호출하므로,
+# 목록 API는 필요한 컬럼만 values()로 읽어서 딕셔너리로 바로 변환합니다
+# 결과는 ContactListSerializer와 같은 필드 순서/값이므로 JSON 응답이 바이트 단위로 같습니다
+# (라벨은 label_snapshot 컬럼에 이미 id/name/color가 있으므로 라벨 조회 쿼리가 필요 없음)
+
+# 목록 응답에 필요한 컬럼
+LIST_COLUMNS = (
+    "id",
+    "name",
+    "email",
+    "phone",
+    "company",
+    "position",
+    "profile_url",
+    "label_snapshot",
+)
+
+# 컬럼 값을 그대로 쓰지 않는 응답 필드의 계산 방법 (부분 필드 응답용)
+FIELD_GETTERS = {
+    "labels": itemgetter("label_snapshot"),
+    "company_with_position": lambda row: company_with_position(
+        row["company"], row["position"]
+    ),
+}
+
+
+def is_enabled():
+    """
+    빠른 목록 직렬화 사용 여부 (settings.CONTACTS_FAST_LIST)
+    """
+    return getattr(settings, "CONTACTS_FAST_LIST", True)
+
+
+def ordering_columns(queryset, columns):
+    """
+    쿼리셋의 정렬 필드 중 columns에 없는 것들
+    (커서 페이지네이션이 마지막 행의 정렬 값으로 다음 위치를 만들기 때문에 함께 읽어야 함)
+    """
+    ordering = queryset.query.order_by or queryset.model._meta.ordering
+    extra = []
+    for field in ordering:
+        if isinstance(field, str):
+            field = field.lstrip("-")
+            if field not in columns and field not in extra:
+                extra.append(field)
+    return extra
+
+
+def list_rows(queryset, fieldset=None):
+    """
+    목록 컬럼만 읽는 values() 쿼리셋을 반환합니다
+    fieldset(?fields= / ?omit=)이 있으면 그 필드에 필요한 컬럼만 읽습니다
+    커서 페이지네이션이 위치 값을 읽을 수 있도록 정렬 필드도 함께 읽습니다
+    """
+    columns = LIST_COLUMNS if fieldset is None else columns_for(fieldset)
+    return queryset.values(*columns, *ordering_columns(queryset, columns))
+
+
+def represent(rows, fieldset=None):
+    """
+    values() 행들을 ContactListSerializer와 같은 형식의 딕셔너리 목록으로 변환합니다
+    fieldset이 있으면 그 필드들만 같은 순서로 포함합니다
+    """
+    if fieldset is not None:
+        getters = [
+            (name, FIELD_GETTERS.get(name, itemgetter(name))) for name in fieldset
+        ]
+        return [{name: getter(row) for name, getter in getters} for row in rows]
+    return [
+        {
+            "id": row["id"],
+            "name": row["name"],
+            "email": row["email"],
+            "phone": row["phone"],
+            "company": row["company"],
+            "position": row["position"],
+            "profile_url": row["profile_url"],
+            "labels": row["label_snapshot"],
+            "company_with_position": company_with_position(
+                row["company"], row["position"]
+            ),
+        }
+        for row in rows
+    ]
+
+
+def iter_represented(queryset, chunk_size):
+    """
+    쿼리셋을 .iterator(chunk_size)로 조금씩 읽어서 chunk_size개씩 변환한 목록을 반환합니다
+    (대용량 목록을 스트리밍 응답으로 보낼 때 전체 행을 메모리에 올리지 않기 위해 사용)
+    """
+    chunk = []
+    for row in list_rows(queryset).iterator(chunk_size=chunk_size):
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            yield represent(chunk)
+            chunk = []
+    if chunk:
+        yield represent(chunk)
@@ -0,0 +1,82 @@
+# Django REST Framework의 검증 오류를 가져옵니다
+from rest_framework.exceptions import ValidationError
+
+
+# 부분 필드(sparse fieldset) 모듈
+# ?fields=id,name,phone 또는 ?omit=memo,address 로 응답에 포함할 필드를 고르면
+# 시리얼라이저 출력뿐 아니라 쿼리셋에서도 필요한 컬럼만 읽습니다 (.only() / values())
+# 예) 연락처 선택 화면: GET /api/contacts/?fields=id,name,phone
+
+# 포함할 필드 / 제외할 필드 쿼리 파라미터 이름
+FIELDS_PARAM = "fields"
+OMIT_PARAM = "omit"
+
+# 응답 필드를 만드는 데 필요한 모델 컬럼 (목록에 없으면 같은 이름의 컬럼)
+FIELD_COLUMNS = {
+    # 라벨은 라벨 스냅샷 컬럼에서 읽음 (목록: 그대로, 상세: 스냅샷 ID -> 라벨 레지스트리)
+    "labels": ("label_snapshot",),
+    "company_with_position": ("company", "position"),
+}
+
+
+def readable_fields(serializer_class):
+    """
+    시리얼라이저가 응답에 표시하는 필드 이름들 (쓰기 전용 필드 제외, Meta.fields 순서)
+    """
+    declared = serializer_class._declared_fields
+    return tuple(
+        name
+        for name in serializer_class.Meta.fields
+        if not (name in declared and declared[name].write_only)
+    )
+
+
+def split_names(value):
+    """
+    "id, name,,phone" -> ["id", "name", "phone"]
+    """
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+
+def parse_fieldset(query_params, available):
+    """
+    ?fields= / ?omit= 파라미터로 응답에 포함할 필드 목록을 만듭니다
+    - 파라미터가 없으면 None (모든 필드)
+    - 결과는 available(시리얼라이저 필드 순서)의 순서를 따릅니다
+    - 알 수 없는 필드를 지정했거나 남는 필드가 없으면 ValidationError (400)
+    """
+    if FIELDS_PARAM not in query_params and OMIT_PARAM not in query_params:
+        return None
+    selected = set(available)
+    for param in (FIELDS_PARAM, OMIT_PARAM):
+        if param not in query_params:
+            continue
+        names = split_names(query_params[param])
+        unknown = [name for name in names if name not in available]
+        if unknown:
+            raise ValidationError(
+                {
+                    "error": "{}에 알 수 없는 필드가 있습니다: {} (사용 가능: {})".format(
+                        param, ", ".join(unknown), ", ".join(available)
+                    )
+                }
+            )
+        if param == FIELDS_PARAM:
+            selected &= set(names)
+        else:
+            selected -= set(names)
+    if not selected:
+        raise ValidationError({"error": "응답에 포함할 필드가 없습니다."})
+    return tuple(name for name in available if name in selected)
+
+
+def columns_for(fieldset):
+    """
+    필드 목록을 표시하는 데 필요한 모델 컬럼들 (기본키 포함, 중복 없음)
+    """
+    columns = ["id"]
+    for name in fieldset:
+        for column in FIELD_COLUMNS.get(name, (name,)):
+            if column not in columns:
+                columns.append(column)
+    return columns
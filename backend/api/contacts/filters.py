@@ -1,7 +1,17 @@
 # django-filter 라이브러리를 가져옵니다 (고급 필터링 기능 제공)
 import django_filters
 # 현재 앱의 모델들을 가져옵니다
-from .models import Contact, Label
+from .birthdays import month_range
+from .models import Contact
+from .normalizers import (
+    choseong_key,
+    choseong_pattern,
+    has_hangul_syllable,
+    normalize_phone,
+    prefix_range,
+    split_leading_syllables,
+)
+from .registry import label_choices
 
 
 # 연락처 모델용 커스텀 필터 클래스
@@ -14,6 +24,10 @@ class ContactFilter(django_filters.FilterSet):
     # 이름 필드 필터: 부분 일치 검색 (대소문자 무시)
     # icontains: case-insensitive contains (예: ?name=김 -> "김민수" 찾음)
     name = django_filters.CharFilter(lookup_expr="icontains")
+
+    # 이름 초성 검색 필터: 초성과 음절을 섞어서 이름 앞부분을 검색 (인덱스 사용)
+    # 예: ?name_search=ㅎㄱㄷ, ?name_search=홍ㄱ -> "홍길동" 찾음
+    name_search = django_filters.CharFilter(method="filter_name_search")
     
     # 이메일 필드 필터: 부분 일치 검색
     # 예: ?email=gmail -> "test@gmail.com" 찾음
@@ -40,13 +54,26 @@ class ContactFilter(django_filters.FilterSet):
     )
     
     # 생일 월 필터: 특정 월에 생일인 연락처들만
-    # birthday__month: birthday 필드의 월 부분만 추출 (예: 3월 -> 3)
+    # 생일 키 컬럼(월 * 100 + 일)의 인덱스 범위 검색 (예: 3월 -> 301 ~ 331)
     # 예: ?birthday_month=3 -> 3월에 생일인 사람들
-    birthday_month = django_filters.NumberFilter(field_name="birthday__month")
+    birthday_month = django_filters.NumberFilter(method="filter_birthday_month")
     
     # 라벨 필터: 여러 라벨을 동시에 선택하여 필터링 가능
     # 예: ?labels=1&labels=2 -> ID가 1 또는 2인 라벨이 연결된 연락처들
-    labels = django_filters.ModelMultipleChoiceFilter(queryset=Label.objects.all())
+    # 라벨 ID 검증은 라벨 레지스트리의 선택지로 하므로 라벨 조회 쿼리가 실행되지 않음
+    labels = django_filters.MultipleChoiceFilter(choices=label_choices)
+
+    # 전화번호 숫자 필터: 하이픈/공백 등 형식과 관계없이 숫자만 비교 (인덱스 사용)
+    # 예: ?phone_digits=01012345678 -> "010-1234-5678" 찾음
+    phone_digits = django_filters.CharFilter(method="filter_phone_digits")
+
+    # 전화번호 앞자리 필터: 정규화 전화번호의 인덱스 범위 검색
+    # 예: ?phone_prefix=010-1234 -> "010-1234-5678" 찾음
+    phone_prefix = django_filters.CharFilter(method="filter_phone_prefix")
+
+    # 전화번호 뒷자리 필터: 역순 전화번호의 인덱스 범위 검색
+    # 예: ?phone_suffix=5678 -> "010-1234-5678" 찾음
+    phone_suffix = django_filters.CharFilter(method="filter_phone_suffix")
 
     class Meta:
         model = Contact  # 이 필터가 적용될 모델
@@ -59,3 +86,64 @@ class ContactFilter(django_filters.FilterSet):
             "phone": ["exact", "icontains"],     # 전화번호 정확 일치 또는 부분 일치
             "company": ["exact", "icontains"],   # 회사명 정확 일치 또는 부분 일치
         }
+
+    def filter_name_search(self, queryset, name, value):
+        """
+        초성과 음절이 섞인 검색어로 이름 앞부분을 검색합니다
+        - 초성 키 컬럼의 앞자리 범위 검색으로 후보를 좁힘 (예: "ㅎㄱㄷ")
+        - 검색어 앞쪽의 연속된 음절은 이름 컬럼의 앞자리 범위 검색으로 확인 (예: "홍ㄱ"의 "홍")
+        - 초성 뒤에 나오는 음절이 있을 때만 정규식으로 해당 위치의 글자를 확인 (예: "ㅎ길")
+        """
+        key = choseong_key(value)
+        if not key:
+            return queryset
+        low, high = prefix_range(key)
+        queryset = queryset.filter(name_choseong__gte=low, name_choseong__lt=high)
+
+        leading, rest = split_leading_syllables(value)
+        if leading:
+            low, high = prefix_range(leading)
+            queryset = queryset.filter(name__gte=low, name__lt=high)
+        if has_hangul_syllable(rest):
+            queryset = queryset.filter(name__iregex=choseong_pattern(value))
+        return queryset
+
+    def filter_phone_digits(self, queryset, name, value):
+        """
+        입력값을 숫자만 남겨 정규화 전화번호와 정확히 비교합니다
+        """
+        digits = normalize_phone(value)
+        if not digits:
+            return queryset.none()
+        return queryset.filter(phone_digits=digits)
+
+    def filter_phone_prefix(self, queryset, name, value):
+        """
+        정규화 전화번호가 입력한 숫자로 시작하는 연락처를 찾습니다
+        """
+        digits = normalize_phone(value)
+        if not digits:
+            return queryset.none()
+        low, high = prefix_range(digits)
+        return queryset.filter(phone_digits__gte=low, phone_digits__lt=high)
+
+    def filter_phone_suffix(self, queryset, name, value):
+        """
+        정규화 전화번호가 입력한 숫자로 끝나는 연락처를 찾습니다
+        뒤집은 값의 앞자리 범위 검색으로 바꿔서 인덱스를 사용합니다
+        """
+        digits = normalize_phone(value)
+        if not digits:
+            return queryset.none()
+        low, high = prefix_range(digits[::-1])
+        return queryset.filter(
+            phone_digits_reversed__gte=low, phone_digits_reversed__lt=high
+        )
+
+    def filter_birthday_month(self, queryset, name, value):
+        """
+        해당 월에 생일인 연락처를 생일 키 컬럼의 범위 검색으로 찾습니다
+        """
+        if value != int(value) or not 1 <= value <= 12:
+            return queryset.none()
+        return queryset.filter(birthday_key__range=month_range(int(value)))
@@ -0,0 +1,620 @@
+# 파일 처리, 로그, 백그라운드 실행 도구를 가져옵니다
+import csv
+import io
+import logging
+import os
+import tempfile
+import threading
+from datetime import timedelta
+
+# Django의 설정, 데이터베이스, 시간 도구를 가져옵니다
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+# Django REST Framework의 검증 예외를 가져옵니다
+from rest_framework.exceptions import ValidationError
+
+# 현재 앱의 모듈들을 가져옵니다
+from . import bulk, changes
+from .addressbooks import current_address_book, use_address_book
+from .exporters import (
+    CSV_COLUMNS,
+    CSV_ESCAPE_CHAR,
+    CSV_FORMULA_PREFIXES,
+    CSV_LABEL_SEPARATOR,
+)
+from .models import Contact, ContactImportJob, Label
+from .normalizers import has_hangul_syllable, normalize_phone
+from .serializers import ContactSerializer
+from .transactions import immediate_atomic
+
+
+logger = logging.getLogger(__name__)
+
+
+# 연락처 가져오기(CSV, vCard) 모듈
+# 업로드 파일을 한 줄씩 읽어 청크 단위로 검증하고, 청크마다 트랜잭션 하나로
+# 라벨 생성 + 연락처 bulk_create + 라벨 연결 일괄 추가를 처리합니다
+
+# 가져올 연락처 필드 (CSV 열 / vCard 속성에서 읽음)
+IMPORT_FIELDS = [
+    "name",
+    "email",
+    "phone",
+    "company",
+    "position",
+    "memo",
+    "profile_url",
+    "address",
+    "birthday",
+    "website",
+]
+
+# 작업에 보관할 최대 오류 수 (전체 실패 수는 failed_rows에 집계)
+MAX_ERRORS = 100
+
+
+def get_chunk_size():
+    """
+    트랜잭션 하나로 처리할 행 수 (settings.CONTACTS_IMPORT_CHUNK_SIZE)
+    """
+    return getattr(settings, "CONTACTS_IMPORT_CHUNK_SIZE", 500)
+
+
+def detect_file_type(file_name):
+    """
+    파일 확장자로 형식을 추정합니다 (.vcf/.vcard -> vCard, 그 외 CSV)
+    """
+    extension = os.path.splitext(file_name or "")[1].lower()
+    if extension in (".vcf", ".vcard"):
+        return ContactImportJob.TYPE_VCARD
+    return ContactImportJob.TYPE_CSV
+
+
+def clean_labels(names):
+    """
+    라벨명 목록에서 공백과 중복을 제거합니다
+    """
+    labels = []
+    for name in names:
+        name = name.strip()
+        if name and name not in labels:
+            labels.append(name)
+    return labels
+
+
+# ===== CSV =====
+
+# CSV 헤더(소문자) -> 필드명 (필드명 그대로 또는 내보내기 파일의 한글 헤더 모두 허용)
+CSV_HEADERS = {
+    key.lower(): field
+    for field, header in CSV_COLUMNS
+    if field in IMPORT_FIELDS or field == "labels"
+    for key in (field, header)
+}
+
+
+def csv_unescape(value):
+    """
+    내보내기(exporters.csv_escape)에서 수식 방지용으로 붙인 ' 하나를 제거합니다
+    """
+    if value.startswith(CSV_ESCAPE_CHAR) and value.lstrip(CSV_ESCAPE_CHAR).startswith(
+        CSV_FORMULA_PREFIXES
+    ):
+        return value[1:]
+    return value
+
+
+def parse_csv(source):
+    """
+    CSV 바이너리 스트림을 한 행씩 읽어서 (행 번호, 데이터) 를 반환합니다
+    행 번호는 헤더 다음 행부터 1로 시작합니다
+    """
+    text = io.TextIOWrapper(source, encoding="utf-8-sig", newline="")
+    reader = csv.reader(text)
+    header = next(reader, None)
+    if header is None:
+        return
+    fields = [CSV_HEADERS.get(column.strip().lower()) for column in header]
+
+    for row_number, values in enumerate(reader, start=1):
+        row = {}
+        for field, value in zip(fields, values):
+            value = csv_unescape(value.strip()).strip()
+            if field is None or not value:
+                continue
+            if field == "labels":
+                row["labels"] = clean_labels(value.split(CSV_LABEL_SEPARATOR))
+            else:
+                row[field] = value
+        yield row_number, row
+
+
+# ===== vCard =====
+
+
+def vcard_unescape(value):
+    """
+    vCard 텍스트 값의 이스케이프를 해제합니다 (\\n, \\, , \\; , \\\\)
+    """
+    result, escaped = [], False
+    for char in value:
+        if escaped:
+            result.append("\n" if char in "nN" else char)
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        else:
+            result.append(char)
+    return "".join(result)
+
+
+def vcard_split(value, separator):
+    """
+    이스케이프되지 않은 구분자로 값을 나누고 각 부분의 이스케이프를 해제합니다
+    (예: N, ADR 의 세미콜론 구분, CATEGORIES 의 쉼표 구분)
+    """
+    parts, current, escaped = [], [], False
+    for char in value:
+        if escaped:
+            current.append("\\" + char)
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char == separator:
+            parts.append(vcard_unescape("".join(current)))
+            current = []
+        else:
+            current.append(char)
+    parts.append(vcard_unescape("".join(current)))
+    return parts
+
+
+def unfold_lines(lines):
+    """
+    공백/탭으로 시작하는 이어지는 줄을 앞 줄에 붙여서 속성 한 줄씩 반환합니다
+    """
+    current = None
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and current is not None:
+            current += line[1:]
+            continue
+        if current:
+            yield current
+        current = line
+    if current:
+        yield current
+
+
+def parse_property(line):
+    """
+    vCard 속성 줄을 (속성명, 파라미터, 값) 으로 나눕니다
+    예: "item1.TEL;TYPE=cell:010-1234-5678" -> ("TEL", {"TYPE": "cell"}, "010-1234-5678")
+    """
+    in_quotes = False
+    for position, char in enumerate(line):
+        if char == '"':
+            in_quotes = not in_quotes
+        elif char == ":" and not in_quotes:
+            head, value = line[:position], line[position + 1 :]
+            break
+    else:
+        return None
+
+    name, *params = head.split(";")
+    # 그룹 접두어(item1.) 제거
+    name = name.rsplit(".", 1)[-1].upper()
+    params = {
+        key.upper(): value
+        for key, _, value in (param.partition("=") for param in params)
+    }
+    return name, params, value
+
+
+def vcard_birthday(value):
+    """
+    vCard 생일 값을 YYYY-MM-DD 로 변환합니다 (연도가 없는 --MMDD 형식은 None)
+    """
+    value = value.split("T", 1)[0].replace("-", "")
+    if len(value) != 8 or not value.isdigit():
+        return None
+    return f"{value[:4]}-{value[4:6]}-{value[6:]}"
+
+
+def vcard_card_to_row(properties):
+    """
+    vCard 한 장의 속성 목록을 연락처 데이터로 변환합니다
+    같은 속성이 여러 개면 첫 번째 값만 사용합니다 (CATEGORIES는 모두 합침)
+    """
+    row, labels, structured_name = {}, [], None
+    for name, params, value in properties:
+        if name == "CATEGORIES":
+            labels.extend(vcard_split(value, ","))
+            continue
+        if name == "N":
+            # 구조화된 이름은 FN(표시 이름)이 없을 때만 사용
+            structured_name = structured_name or value
+            continue
+        field, text = None, None
+        if name == "FN":
+            field, text = "name", vcard_unescape(value)
+        elif name == "EMAIL":
+            field, text = "email", vcard_unescape(value)
+        elif name == "TEL":
+            field, text = "phone", vcard_unescape(value)
+            # 4.0의 URI 형식 전화번호 (tel:+82-10-...)
+            if text.lower().startswith("tel:"):
+                text = text[4:]
+        elif name == "ORG":
+            field, text = "company", vcard_split(value, ";")[0]
+        elif name == "TITLE":
+            field, text = "position", vcard_unescape(value)
+        elif name == "NOTE":
+            field, text = "memo", vcard_unescape(value)
+        elif name == "ADR":
+            parts = [part.strip() for part in vcard_split(value, ";")]
+            field, text = "address", " ".join(part for part in parts if part)
+        elif name == "BDAY":
+            field, text = "birthday", vcard_birthday(value)
+        elif name == "URL":
+            field, text = "website", value
+        elif name == "PHOTO":
+            # 파일 내장(base64) 사진은 URL 필드에 저장할 수 없으므로 제외
+            inline = params.get("ENCODING", "").lower() in ("b", "base64")
+            if not inline and not value.startswith("data:"):
+                field, text = "profile_url", value
+        if field and text and field not in row:
+            row[field] = text.strip()
+
+    if "name" not in row and structured_name:
+        family, given = (vcard_split(structured_name, ";") + ["", ""])[:2]
+        # 한글 이름은 성+이름을 붙여 쓰고, 그 외에는 "이름 성" 순서로 표시
+        if has_hangul_syllable(family):
+            name = family + given
+        else:
+            name = " ".join(part for part in (given, family) if part)
+        if name.strip():
+            row["name"] = name.strip()
+    labels = clean_labels(labels)
+    if labels:
+        row["labels"] = labels
+    return row
+
+
+def parse_vcard(source):
+    """
+    vCard 바이너리 스트림을 한 줄씩 읽어서 카드마다 (카드 번호, 데이터) 를 반환합니다
+    """
+    text = io.TextIOWrapper(source, encoding="utf-8-sig", newline="")
+    properties, card_number = None, 0
+    for line in unfold_lines(text):
+        parsed = parse_property(line)
+        if parsed is None:
+            continue
+        name, params, value = parsed
+        if name == "BEGIN" and value.upper() == "VCARD":
+            properties = []
+        elif name == "END" and value.upper() == "VCARD":
+            if properties is not None:
+                card_number += 1
+                yield card_number, vcard_card_to_row(properties)
+            properties = None
+        elif properties is not None:
+            properties.append(parsed)
+
+
+# ===== 가져오기 처리 =====
+
+
+class ContactImporter:
+    """
+    (행 번호, 데이터) 스트림을 청크 단위로 검증하고 저장합니다
+    - 이름/이메일/전화번호가 모두 같은 연락처가 이미 있으면 건너뜁니다 (재업로드 시 중복 방지)
+    - 없는 라벨은 라벨명으로 새로 만듭니다
+    - dry_run=True 이면 저장 없이 생성될 연락처/라벨 수만 집계합니다
+    """
+
+    def __init__(self, dry_run=False, chunk_size=None):
+        self.dry_run = dry_run
+        self.chunk_size = chunk_size or get_chunk_size()
+        # 시리얼라이저 하나를 재사용 (인스턴스마다 라벨 선택지를 다시 조회하지 않도록)
+        self.serializer = ContactSerializer()
+        # 라벨명 -> ID (라벨 테이블은 작으므로 한 번 읽어서 캐시)
+        self.labels = dict(Label.objects.values_list("name", "id"))
+        self.label_max_length = Label._meta.get_field("name").max_length
+        # 미리보기에서 생성될 라벨명 / 이미 처리한 연락처 키
+        self.new_labels = set()
+        self.seen = set()
+        self.counts = {
+            "processed_rows": 0,
+            "created_rows": 0,
+            "failed_rows": 0,
+            "skipped_rows": 0,
+            "created_labels": 0,
+        }
+        self.errors = []
+
+    def run(self, rows, progress=None):
+        """
+        전체 행을 청크 단위로 처리합니다
+        progress: 청크마다 호출할 함수 (진행 상황 저장용)
+        """
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= self.chunk_size:
+                self.import_chunk(chunk)
+                chunk = []
+                if progress:
+                    progress(self)
+        if chunk:
+            self.import_chunk(chunk)
+        if progress:
+            progress(self)
+
+    def fail(self, row_number, errors):
+        """
+        실패한 행을 집계합니다 (오류 내용은 MAX_ERRORS개까지 보관)
+        """
+        self.counts["failed_rows"] += 1
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append({"row": row_number, "errors": errors})
+
+    @staticmethod
+    def duplicate_key(name, email, phone_digits):
+        """
+        중복 판단 기준: 이름 + 이메일 + 숫자만 남긴 전화번호
+        """
+        return (name, email or "", phone_digits or "")
+
+    def validate_chunk(self, chunk):
+        """
+        청크의 행들을 검증하고 (행 번호, 검증된 데이터, 라벨명 목록) 목록을 반환합니다
+        """
+        valid = []
+        for row_number, row in chunk:
+            label_names = row.pop("labels", [])
+            if not row and not label_names:
+                self.counts["skipped_rows"] += 1
+                continue
+            too_long = [
+                name for name in label_names if len(name) > self.label_max_length
+            ]
+            if too_long:
+                self.fail(
+                    row_number,
+                    {
+                        "labels": [
+                            f"라벨명은 {self.label_max_length}자 이하여야 합니다."
+                        ]
+                    },
+                )
+                continue
+            try:
+                data = self.serializer.run_validation(row)
+            except ValidationError as exc:
+                self.fail(row_number, exc.detail)
+                continue
+            valid.append((row_number, data, label_names))
+        return valid
+
+    def exclude_duplicates(self, valid):
+        """
+        이미 저장된 연락처 또는 파일 안에서 앞서 나온 연락처와 같은 행을 제외합니다
+        기존 연락처는 청크의 이름들로 한 번에 조회합니다 (idx_contact_name 사용)
+        """
+        names = {data["name"] for _, data, _ in valid}
+        existing = {
+            self.duplicate_key(*values)
+            for values in Contact.objects.filter(name__in=names).values_list(
+                "name", "email", "phone_digits"
+            )
+        }
+        # 실제 저장 시에는 앞 청크가 이미 DB에 있으므로 청크 안에서만 비교하고,
+        # 미리보기에서는 저장되지 않으므로 파일 전체에서 비교합니다
+        seen = self.seen if self.dry_run else set()
+
+        rows = []
+        for row_number, data, label_names in valid:
+            key = self.duplicate_key(
+                data["name"], data.get("email"), normalize_phone(data.get("phone"))
+            )
+            if key in existing or key in seen:
+                self.counts["skipped_rows"] += 1
+                continue
+            seen.add(key)
+            rows.append((row_number, data, label_names))
+        return rows
+
+    def resolve_labels(self, names):
+        """
+        없는 라벨을 생성하고 라벨명 -> ID 캐시를 갱신합니다
+        """
+        missing = set(names) - set(self.labels)
+        if not missing:
+            return
+        if self.dry_run:
+            self.new_labels |= missing
+            self.counts["created_labels"] = len(self.new_labels)
+            return
+        # 작업 시작 후 다른 요청이 만든 라벨은 생성 수에 넣지 않도록 쓰기 잠금을 잡은 뒤 다시 조회
+        # (IMMEDIATE 트랜잭션 안이므로 조회와 저장 사이에 다른 요청이 라벨을 만들 수 없음)
+        existing = dict(
+            Label.objects.filter(name__in=missing).values_list("name", "id")
+        )
+        self.labels.update(existing)
+        missing -= set(existing)
+        if not missing:
+            return
+        created = Label.objects.bulk_create(
+            [Label(name=name) for name in sorted(missing)], ignore_conflicts=True
+        )
+        # bulk_create는 시그널을 보내지 않으므로 라벨 레지스트리 무효화를 직접 호출
+        changes.labels_created(created)
+        self.labels.update(
+            Label.objects.filter(name__in=missing).values_list("name", "id")
+        )
+        self.counts["created_labels"] += len(missing)
+
+    def import_chunk(self, chunk):
+        """
+        청크 하나를 검증 -> 중복 제외 -> 라벨 생성 -> 연락처 일괄 저장 순서로 처리합니다
+        """
+        self.counts["processed_rows"] += len(chunk)
+        rows = self.exclude_duplicates(self.validate_chunk(chunk))
+        if not rows:
+            return
+
+        with immediate_atomic():
+            self.resolve_labels(name for _, _, names in rows for name in names)
+            if not self.dry_run:
+                bulk.create_contacts(
+                    [
+                        (
+                            row_number,
+                            {
+                                **data,
+                                "label_ids": [self.labels[name] for name in names],
+                            },
+                        )
+                        for row_number, data, names in rows
+                    ],
+                    chunk_size=len(rows),
+                )
+        self.counts["created_rows"] += len(rows)
+
+
+# ===== 작업 실행 =====
+
+
+def save_upload(uploaded_file):
+    """
+    업로드 파일을 작업이 끝날 때까지 보관할 임시 파일로 복사하고 경로를 반환합니다
+    (요청이 끝나면 Django의 업로드 임시 파일은 삭제되므로)
+    """
+    suffix = os.path.splitext(uploaded_file.name or "")[1]
+    directory = getattr(settings, "CONTACTS_IMPORT_DIR", None)
+    descriptor, path = tempfile.mkstemp(
+        prefix="contacts-import-", suffix=suffix, dir=directory
+    )
+    with os.fdopen(descriptor, "wb") as destination:
+        for piece in uploaded_file.chunks():
+            destination.write(piece)
+    return path
+
+
+def remove_source(path):
+    """
+    작업의 임시 업로드 파일을 삭제합니다 (이미 없으면 무시)
+    """
+    if path and os.path.exists(path):
+        os.remove(path)
+
+
+def save_progress(job, importer):
+    """
+    가져오기 진행 상황을 작업 행에 저장합니다
+    """
+    ContactImportJob.objects.filter(pk=job.pk).update(
+        errors=importer.errors, **importer.counts
+    )
+
+
+def run_job(job_id):
+    """
+    가져오기 작업 하나를 실행합니다
+    """
+    job = ContactImportJob.objects.get(pk=job_id)
+    job.status = ContactImportJob.STATUS_RUNNING
+    job.started_at = timezone.now()
+    job.save(update_fields=["status", "started_at"])
+
+    parse = parse_vcard if job.file_type == ContactImportJob.TYPE_VCARD else parse_csv
+    importer = ContactImporter(dry_run=job.dry_run)
+    try:
+        with open(job.source_path, "rb") as source:
+            importer.run(parse(source), progress=lambda imp: save_progress(job, imp))
+        job.status = ContactImportJob.STATUS_COMPLETED
+    except Exception as exc:
+        # 파일 형식 오류 등으로 중단된 경우: 앞서 저장된 청크는 유지하고 실패로 기록
+        logger.exception("연락처 가져오기 작업 %s 실패", job.pk)
+        job.status = ContactImportJob.STATUS_FAILED
+        job.message = str(exc)
+    finally:
+        remove_source(job.source_path)
+
+    for field, value in importer.counts.items():
+        setattr(job, field, value)
+    job.errors = importer.errors
+    job.finished_at = timezone.now()
+    job.save()
+    return job
+
+
+def run_job_in_thread(job_id, address_book):
+    """
+    백그라운드 스레드에서 작업을 요청한 주소록 범위로 실행하고 스레드의 DB 연결을 닫습니다
+    """
+    try:
+        with use_address_book(address_book):
+            run_job(job_id)
+    finally:
+        connections.close_all()
+
+
+def start_job(job):
+    """
+    가져오기 작업을 시작합니다
+    settings.CONTACTS_IMPORT_BACKGROUND 가 True(기본)면 요청 트랜잭션이 커밋된 뒤
+    백그라운드 스레드에서 실행하고, False면 요청 안에서 바로 실행합니다 (테스트용)
+    """
+    if not getattr(settings, "CONTACTS_IMPORT_BACKGROUND", True):
+        return run_job(job.pk)
+    thread = threading.Thread(
+        target=run_job_in_thread,
+        args=(job.pk, current_address_book()),
+        daemon=True,
+    )
+    transaction.on_commit(thread.start, using=job._state.db)
+    return job
+
+
+def get_stale_timeout():
+    """
+    끝나지 않은 작업을 중단된 것으로 볼 시간 (settings.CONTACTS_IMPORT_STALE_MINUTES)
+    """
+    return timedelta(minutes=getattr(settings, "CONTACTS_IMPORT_STALE_MINUTES", 60))
+
+
+def fail_stale_jobs(timeout=None):
+    """
+    현재 주소록에서 timeout이 지나도록 끝나지 않은 작업을 실패로 표시하고 임시 파일을 삭제합니다
+    백그라운드 스레드는 웹 워커와 함께 종료되므로, 워커가 재시작되면
+    대기/진행 중 상태와 임시 파일이 그대로 남습니다 (recover_import_jobs 명령에서 사용)
+    기준 시각은 진행 중이면 시작일, 대기 중이면 생성일이며 실패로 바꾼 작업 수를 반환합니다
+    """
+    timeout = timeout or get_stale_timeout()
+    cutoff = timezone.now() - timeout
+    stale = ContactImportJob.objects.filter(
+        Q(status=ContactImportJob.STATUS_PENDING, created_at__lt=cutoff)
+        | Q(status=ContactImportJob.STATUS_RUNNING, started_at__lt=cutoff)
+    )
+    message = (
+        f"{int(timeout.total_seconds() // 60)}분 안에 끝나지 않아 중단된 작업으로 "
+        "처리했습니다. 파일을 다시 업로드해 주세요."
+    )
+    failed = 0
+    for job in stale.only("pk", "status", "source_path"):
+        # 그 사이에 작업이 끝난 경우는 건드리지 않도록 상태가 그대로일 때만 바꿉니다
+        updated = ContactImportJob.objects.filter(pk=job.pk, status=job.status).update(
+            status=ContactImportJob.STATUS_FAILED,
+            message=message,
+            finished_at=timezone.now(),
+        )
+        if updated:
+            remove_source(job.source_path)
+            failed += 1
+    return failed
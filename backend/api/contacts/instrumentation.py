@@ -0,0 +1,217 @@
+# 파이썬 표준 라이브러리
+import json
+import logging
+import time
+from contextlib import ExitStack, contextmanager
+
+# 비동기 미들웨어 지원 도구를 가져옵니다
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+# Django의 설정과 데이터베이스 연결 도구를 가져옵니다
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+
+# 요청별 SQL 계측 모듈
+# - SQLInstrumentationMiddleware: 요청마다 SQL 실행 수, 전체 DB 시간, 가장 느린 SQL, 렌더링(직렬화) 시간을
+#   Server-Timing 헤더로 응답에 붙이고, 느린 요청은 구조화된 로그(JSON)로 남깁니다
+# - query_budget: 코드 블록(또는 테스트 함수)의 SQL 실행 수가 예산을 넘으면 실패시키는 도구
+#   (예: 연락처 목록은 페이지 크기와 관계없이 쿼리 2번 이하)
+# 두 기능 모두 Django의 connection.execute_wrapper()로 실제 실행되는 SQL을 셉니다 (DEBUG와 무관)
+
+# Server-Timing 헤더 / 느린 요청 로그에 기록할 SQL 문장의 최대 길이
+SQL_PREVIEW_LENGTH = 300
+
+
+def is_enabled():
+    """
+    Server-Timing 헤더 사용 여부 (settings.CONTACTS_SERVER_TIMING)
+    """
+    return getattr(settings, "CONTACTS_SERVER_TIMING", True)
+
+
+def get_slow_request_ms():
+    """
+    이 시간(ms) 이상 걸린 요청을 느린 요청 로그로 남깁니다 (settings.CONTACTS_SLOW_REQUEST_MS)
+    """
+    return getattr(settings, "CONTACTS_SLOW_REQUEST_MS", 500)
+
+
+class QueryStats:
+    """
+    실행된 SQL의 수, 전체 실행 시간, 가장 느린 SQL을 기록합니다
+    connection.execute_wrapper()에 등록하는 호출 가능 객체
+    """
+
+    def __init__(self, keep_sql=False):
+        self.count = 0
+        self.duration = 0.0  # 초
+        self.slowest_duration = 0.0
+        self.slowest_sql = None
+        # 예산 초과 시 어떤 SQL이 실행되었는지 보여주기 위해 SQL 목록을 보관할지 여부
+        self.statements = [] if keep_sql else None
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.count += 1
+            self.duration += elapsed
+            if elapsed >= self.slowest_duration:
+                self.slowest_duration = elapsed
+                self.slowest_sql = sql
+            if self.statements is not None:
+                self.statements.append(sql)
+
+    @contextmanager
+    def capture(self):
+        """
+        with 블록 안에서 모든 데이터베이스 연결의 SQL 실행을 기록합니다
+        """
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(self))
+            yield self
+
+
+def server_timing(stats, render_ms, total_ms):
+    """
+    Server-Timing 헤더 값
+    예) db;dur=3.1;desc="4 queries", db-slowest;dur=1.2, render;dur=0.8, total;dur=9.5
+    stats가 None이면(비동기 요청) DB 항목을 생략합니다
+    """
+    metrics = []
+    if stats is not None:
+        metrics += [
+            f'db;dur={stats.duration * 1000:.2f};desc="{stats.count} queries"',
+            f"db-slowest;dur={stats.slowest_duration * 1000:.2f}",
+        ]
+    if render_ms is not None:
+        metrics.append(f"render;dur={render_ms:.2f}")
+    metrics.append(f"total;dur={total_ms:.2f}")
+    return ", ".join(metrics)
+
+
+class SQLInstrumentationMiddleware:
+    """
+    요청별 SQL 실행 수, DB 시간, 가장 느린 SQL, 렌더링(직렬화) 시간을 측정하는 미들웨어
+    - 응답에 Server-Timing 헤더 추가 (브라우저 개발자 도구의 Timing 탭에서 확인 가능)
+    - 전체 시간이 CONTACTS_SLOW_REQUEST_MS 이상이면 느린 요청 로그를 남김
+    렌더링 시간은 DRF 응답의 render() (JSON 인코딩) 시간입니다
+    스트리밍 응답은 본문을 보내는 동안 실행되는 SQL이 포함되지 않습니다
+
+    ASGI 서버에서 비동기 뷰(async_views)로 가는 요청이 스레드를 거치지 않도록 비동기로도 동작합니다
+    이때 비동기 ORM의 SQL은 다른 스레드의 연결에서 실행되므로 전체 시간만 기록합니다
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        stats = QueryStats()
+        request._render_timing = {}
+        started = time.perf_counter()
+        with stats.capture():
+            response = self.get_response(request)
+        return self.finish(request, response, stats, started)
+
+    async def __acall__(self, request):
+        request._render_timing = {}
+        started = time.perf_counter()
+        response = await self.get_response(request)
+        return self.finish(request, response, None, started)
+
+    def finish(self, request, response, stats, started):
+        """
+        Server-Timing 헤더를 붙이고, 느린 요청이면 로그를 남깁니다
+        """
+        total_ms = (time.perf_counter() - started) * 1000
+        render_ms = request._render_timing.get("duration")
+
+        if is_enabled():
+            response.headers["Server-Timing"] = server_timing(
+                stats, render_ms, total_ms
+            )
+        if total_ms >= get_slow_request_ms():
+            record = {
+                "method": request.method,
+                "path": request.get_full_path(),
+                "status": response.status_code,
+                "total_ms": round(total_ms, 2),
+                "db_ms": None,
+                "queries": None,
+                "slowest_sql_ms": None,
+                "slowest_sql": None,
+                "render_ms": None if render_ms is None else round(render_ms, 2),
+            }
+            if stats is not None:
+                record.update(
+                    db_ms=round(stats.duration * 1000, 2),
+                    queries=stats.count,
+                    slowest_sql_ms=round(stats.slowest_duration * 1000, 2),
+                    slowest_sql=(stats.slowest_sql or "")[:SQL_PREVIEW_LENGTH],
+                )
+            logger.warning(
+                "느린 요청 %s",
+                json.dumps(record, ensure_ascii=False),
+                extra={"request_stats": record},
+            )
+        return response
+
+    def process_template_response(self, request, response):
+        """
+        DRF Response(SimpleTemplateResponse)는 미들웨어를 거친 뒤 render()되므로
+        렌더링 직전 시각을 기록하고 렌더링 후 콜백에서 걸린 시간을 계산합니다
+        """
+        timing = request._render_timing
+        timing["started"] = time.perf_counter()
+
+        def finished(response):
+            timing["duration"] = (time.perf_counter() - timing["started"]) * 1000
+
+        response.add_post_render_callback(finished)
+        return response
+
+
+class QueryBudgetExceeded(AssertionError):
+    """
+    SQL 실행 수가 예산을 넘었을 때 발생하는 예외 (테스트 실패로 표시됨)
+    """
+
+
+@contextmanager
+def query_budget(max_queries, label=""):
+    """
+    with 블록 안에서 실행된 SQL이 max_queries번을 넘으면 QueryBudgetExceeded를 발생시킵니다
+    실패 메시지에 실행된 SQL 목록을 포함하므로 어떤 쿼리가 늘었는지 바로 확인할 수 있습니다
+
+    사용 예:
+        with query_budget(2, "연락처 목록"):
+            client.get("/api/contacts/?page_size=100")
+
+        @query_budget(3)  # 함수 전체의 예산 (contextmanager는 데코레이터로도 사용 가능)
+        def test_detail(self): ...
+    """
+    stats = QueryStats(keep_sql=True)
+    with stats.capture():
+        yield stats
+    if stats.count > max_queries:
+        statements = "\n".join(
+            f"  {index}. {sql[:SQL_PREVIEW_LENGTH]}"
+            for index, sql in enumerate(stats.statements, 1)
+        )
+        raise QueryBudgetExceeded(
+            f"{label or '쿼리 예산'}: SQL {stats.count}번 실행 (예산 {max_queries}번)\n"
+            f"{statements}"
+        )
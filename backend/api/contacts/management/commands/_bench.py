@@ -0,0 +1,107 @@
+# 벤치마크 관리 명령들이 함께 사용하는 도구 모음
+# 파일명이 _로 시작하므로 Django 관리 명령으로 등록되지 않습니다
+
+# 파이썬 표준 라이브러리
+import random
+import statistics
+import time
+
+# 현재 앱의 모델을 가져옵니다
+from api.contacts.models import Contact
+
+
+# 합성 데이터용 한국어 이름 구성 요소
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류전홍"
+GIVEN_SYLLABLES = "민서준지현우도예하은수영진성훈윤채원유나연정동길철희"
+
+
+def random_korean_name(rng):
+    """
+    성 1글자 + 이름 2글자로 된 임의의 한국어 이름을 만듭니다
+    """
+    return rng.choice(SURNAMES) + "".join(rng.choices(GIVEN_SYLLABLES, k=2))
+
+
+# 합성 데이터용 회사/직책/라벨 구성 요소
+COMPANIES = ["가나상사", "다라전자", "마바물산", "사아건설", "자차은행", None]
+POSITIONS = ["사원", "대리", "과장", "부장", None]
+LABEL_SNAPSHOTS = [
+    [],
+    [{"id": 1, "name": "가족", "color": "#ff0000"}],
+    [
+        {"id": 2, "name": "친구", "color": "#00ff00"},
+        {"id": 3, "name": "회사", "color": "#0000ff"},
+    ],
+]
+
+
+def seed_contacts(count, seed=0, batch_size=5000, detailed=False):
+    """
+    합성 연락처를 count개 생성합니다 (bulk_create로 batch_size개씩 저장)
+    detailed=True이면 이메일, 회사, 직책, 메모, 주소, 라벨 스냅샷도 채웁니다
+    """
+    rng = random.Random(seed)
+    for start in range(0, count, batch_size):
+        size = min(batch_size, count - start)
+        contacts = []
+        for index in range(size):
+            contact = Contact(
+                name=random_korean_name(rng),
+                phone="010-{:04d}-{:04d}".format(
+                    rng.randrange(10000), rng.randrange(10000)
+                ),
+            )
+            if detailed:
+                contact.email = f"user{start + index}@example.com"
+                contact.company = rng.choice(COMPANIES)
+                contact.position = rng.choice(POSITIONS)
+                contact.memo = "메모 " * rng.randrange(50)
+                contact.address = "서울특별시 강남구 테헤란로 " + str(
+                    rng.randrange(500)
+                )
+                contact.label_snapshot = rng.choice(LABEL_SNAPSHOTS)
+            contacts.append(contact)
+        Contact.objects.bulk_create(contacts, batch_size=batch_size)
+
+
+def measure(func, repeat):
+    """
+    func를 repeat번 실행해서 실행 시간(ms) 통계를 반환합니다
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return {
+        "runs": repeat,
+        "min_ms": round(timings[0], 3),
+        "median_ms": round(statistics.median(timings), 3),
+        "max_ms": round(timings[-1], 3),
+    }
+
+
+def percentile(sorted_values, percent):
+    """
+    정렬된 값 목록의 백분위수 (nearest-rank 방식)
+    """
+    if not sorted_values:
+        return None
+    rank = max(1, -(-len(sorted_values) * percent // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def latency_summary(timings):
+    """
+    실행 시간(ms) 목록의 p50/p95/p99, 평균, 최댓값
+    """
+    timings = sorted(timings)
+    return {
+        "runs": len(timings),
+        "p50_ms": round(percentile(timings, 50), 3),
+        "p95_ms": round(percentile(timings, 95), 3),
+        "p99_ms": round(percentile(timings, 99), 3),
+        "mean_ms": round(statistics.fmean(timings), 3),
+        "max_ms": round(timings[-1], 3),
+    }
@@ -0,0 +1,335 @@
+# 대용량 합성 연락처 데이터 생성 도구 (generate_contacts 명령에서 사용)
+# 파일명이 _로 시작하므로 Django 관리 명령으로 등록되지 않습니다
+
+# 파이썬 표준 라이브러리
+import itertools
+import random
+from datetime import date, timedelta
+
+# 현재 앱의 모델과 라벨 스냅샷 도구를 가져옵니다
+from api.contacts.models import Contact, Label
+from api.contacts.snapshots import label_entry
+
+
+# 한국어 성씨와 대략적인 비율 (김/이/박이 절반 이상을 차지하는 실제 분포를 흉내냄)
+KOREAN_SURNAMES = {
+    "김": 21,
+    "이": 15,
+    "박": 8,
+    "최": 5,
+    "정": 5,
+    "강": 2,
+    "조": 2,
+    "윤": 2,
+    "장": 2,
+    "임": 2,
+    "한": 1,
+    "오": 1,
+    "서": 1,
+    "신": 1,
+    "권": 1,
+    "황": 1,
+    "안": 1,
+    "송": 1,
+    "류": 1,
+    "전": 1,
+    "홍": 1,
+    "남궁": 0.1,
+    "제갈": 0.1,
+}
+KOREAN_GIVEN = "민서준지현우도예하은수영진성훈윤채원유나연정동길철희태경승재혜주"
+
+# 영어 이름 구성 요소
+ENGLISH_FIRST = [
+    "James",
+    "Mary",
+    "John",
+    "Patricia",
+    "Robert",
+    "Jennifer",
+    "Michael",
+    "Linda",
+    "David",
+    "Elizabeth",
+    "William",
+    "Susan",
+    "Daniel",
+    "Sarah",
+    "Emily",
+    "Chris",
+    "Olivia",
+    "Noah",
+    "Emma",
+    "Liam",
+    "Sophia",
+    "Lucas",
+    "Grace",
+    "Ethan",
+]
+ENGLISH_LAST = [
+    "Smith",
+    "Johnson",
+    "Williams",
+    "Brown",
+    "Jones",
+    "Garcia",
+    "Miller",
+    "Davis",
+    "Wilson",
+    "Anderson",
+    "Taylor",
+    "Thomas",
+    "Moore",
+    "Martin",
+    "Lee",
+    "Kim",
+    "Park",
+    "Clark",
+    "Lewis",
+    "Walker",
+]
+
+# 이메일 도메인과 비율
+EMAIL_DOMAINS = {
+    "gmail.com": 40,
+    "naver.com": 30,
+    "daum.net": 10,
+    "kakao.com": 8,
+    "hanmail.net": 5,
+    "outlook.com": 5,
+    "example.com": 2,
+}
+
+# 회사명 구성 요소 (조합해서 회사 목록을 만들고 자주 쓰이는 회사가 많도록 지프 분포로 선택)
+COMPANY_PREFIXES = [
+    "가나",
+    "다라",
+    "마바",
+    "사아",
+    "자차",
+    "한빛",
+    "새솔",
+    "푸른",
+    "미래",
+    "대한",
+    "서울",
+    "누리",
+    "하늘",
+    "바다",
+    "동방",
+    "Acme",
+    "Global",
+    "Blue",
+    "Next",
+    "Bright",
+]
+COMPANY_SUFFIXES = [
+    "상사",
+    "전자",
+    "물산",
+    "건설",
+    "은행",
+    "증권",
+    "소프트",
+    "랩스",
+    "제약",
+    "식품",
+    " Corp",
+    " Inc",
+    " Labs",
+    " Systems",
+]
+POSITIONS = {
+    "사원": 30,
+    "주임": 10,
+    "대리": 20,
+    "과장": 15,
+    "차장": 8,
+    "부장": 7,
+    "이사": 3,
+    "대표": 1,
+    "Engineer": 4,
+    "Manager": 2,
+}
+CITIES = [
+    "서울특별시",
+    "부산광역시",
+    "인천광역시",
+    "대구광역시",
+    "경기도 성남시",
+    "Seoul",
+]
+STREETS = ["테헤란로", "강남대로", "세종대로", "판교역로", "해운대로", "올림픽로"]
+
+# 라벨 이름 후보 (앞쪽 라벨일수록 많이 연결되도록 지프 분포로 선택)
+LABEL_NAMES = [
+    "가족",
+    "친구",
+    "회사",
+    "학교",
+    "VIP",
+    "거래처",
+    "동호회",
+    "이웃",
+    "고객",
+    "협력사",
+    "동창",
+    "교회",
+    "운동",
+    "스터디",
+    "여행",
+    "병원",
+    "Investors",
+    "Friends",
+    "Work",
+    "Family",
+]
+LABEL_COLORS = ["#FF0000", "#00AA00", "#0000FF", "#FF9900", "#9900CC", "#007BFF"]
+
+# 연락처 하나에 연결하는 라벨 수의 비율 (0개 40%, 1개 35%, 2개 18%, 3개 7%)
+LABEL_COUNT_WEIGHTS = [40, 35, 18, 7]
+
+# 생일 범위 (윤년 2월 29일 포함)
+BIRTHDAY_START = date(1950, 1, 1)
+BIRTHDAY_DAYS = (date(2010, 12, 31) - BIRTHDAY_START).days
+
+
+def cumulative(weights):
+    """
+    rng.choices(cum_weights=...)에 사용할 누적 가중치
+    (선택할 때마다 누적합을 다시 계산하지 않도록 미리 계산)
+    """
+    return list(itertools.accumulate(weights))
+
+
+def zipf_weights(size, exponent=1.1):
+    """
+    순위가 높을수록(앞쪽일수록) 자주 선택되는 지프 분포 가중치
+    """
+    return [1 / (rank**exponent) for rank in range(1, size + 1)]
+
+
+def company_names():
+    """
+    회사명 후보 목록 (접두어 x 접미어 조합, 고정된 순서)
+    """
+    return [
+        prefix + suffix for prefix in COMPANY_PREFIXES for suffix in COMPANY_SUFFIXES
+    ]
+
+
+def ensure_labels(count):
+    """
+    합성 데이터용 라벨을 count개 준비합니다 (이미 같은 이름의 라벨이 있으면 재사용)
+    반환값: 라벨 목록 (LABEL_NAMES 순서, 지프 분포의 순위)
+    """
+    names = LABEL_NAMES[:count]
+    existing = {label.name: label for label in Label.objects.filter(name__in=names)}
+    missing = [
+        Label(name=name, color=LABEL_COLORS[index % len(LABEL_COLORS)])
+        for index, name in enumerate(names)
+        if name not in existing
+    ]
+    for label in Label.objects.bulk_create(missing):
+        existing[label.name] = label
+    return [existing[name] for name in names]
+
+
+class ContactFactory:
+    """
+    실제와 비슷한 분포의 합성 연락처를 만듭니다 (같은 seed이면 같은 데이터)
+    - 이름: 한국어 75% (성씨 비율 반영), 영어 25%
+    - 전화번호 95%, 이메일 85%, 회사 70% (지프 분포), 생일 60%, 주소 50%, 메모 30%
+    - 라벨: 0~3개 (많이 쓰이는 라벨이 더 자주 연결되도록 지프 분포)
+    """
+
+    def __init__(self, labels, seed=0):
+        self.rng = random.Random(seed)
+        self.labels = labels
+        self.surnames = list(KOREAN_SURNAMES)
+        self.surname_weights = cumulative(KOREAN_SURNAMES.values())
+        self.domains = list(EMAIL_DOMAINS)
+        self.domain_weights = cumulative(EMAIL_DOMAINS.values())
+        self.companies = company_names()
+        self.company_weights = cumulative(zipf_weights(len(self.companies)))
+        self.positions = list(POSITIONS)
+        self.position_weights = cumulative(POSITIONS.values())
+        self.label_weights = cumulative(zipf_weights(len(labels)))
+        self.label_count_weights = cumulative(LABEL_COUNT_WEIGHTS)
+
+    def chance(self, percent):
+        return self.rng.random() * 100 < percent
+
+    def name(self):
+        rng = self.rng
+        if self.chance(75):
+            surname = rng.choices(self.surnames, cum_weights=self.surname_weights)[0]
+            return surname + "".join(rng.choices(KOREAN_GIVEN, k=2))
+        return f"{rng.choice(ENGLISH_FIRST)} {rng.choice(ENGLISH_LAST)}"
+
+    def phone(self):
+        rng = self.rng
+        if self.chance(90):
+            return "010-{:04d}-{:04d}".format(
+                rng.randrange(10000), rng.randrange(10000)
+            )
+        # 지역 번호 (서울)
+        return "02-{:03d}-{:04d}".format(rng.randrange(200, 1000), rng.randrange(10000))
+
+    def email(self, index):
+        domain = self.rng.choices(self.domains, cum_weights=self.domain_weights)[0]
+        # 순번을 붙여서 이메일이 겹치지 않게 함
+        handle = "".join(self.rng.choices("abcdefghijklmnopqrstuvwxyz", k=5))
+        return f"{handle}{index}@{domain}"
+
+    def label_ids(self):
+        rng = self.rng
+        count = rng.choices(range(4), cum_weights=self.label_count_weights)[0]
+        count = min(count, len(self.labels))
+        chosen = set()
+        while len(chosen) < count:
+            chosen.add(
+                rng.choices(range(len(self.labels)), cum_weights=self.label_weights)[0]
+            )
+        return sorted(chosen)
+
+    def build(self, index):
+        """
+        index번째 연락처를 만듭니다
+        반환값: (저장 전 Contact 객체, 연결할 라벨 목록)
+        """
+        rng = self.rng
+        contact = Contact(name=self.name())
+        if self.chance(95):
+            contact.phone = self.phone()
+        if self.chance(85):
+            contact.email = self.email(index)
+        if self.chance(70):
+            contact.company = rng.choices(
+                self.companies, cum_weights=self.company_weights
+            )[0]
+            if self.chance(80):
+                contact.position = rng.choices(
+                    self.positions, cum_weights=self.position_weights
+                )[0]
+        if self.chance(60):
+            contact.birthday = BIRTHDAY_START + timedelta(
+                days=rng.randrange(BIRTHDAY_DAYS + 1)
+            )
+        if self.chance(50):
+            contact.address = "{} {} {}".format(
+                rng.choice(CITIES), rng.choice(STREETS), rng.randrange(1, 500)
+            )
+        if self.chance(30):
+            contact.memo = "메모 " * rng.randrange(1, 40)
+        if self.chance(20):
+            contact.profile_url = f"https://img.example.com/profiles/{index}.png"
+        if self.chance(10):
+            contact.website = f"https://blog.example.com/{index}"
+        labels = [self.labels[position] for position in self.label_ids()]
+        # 라벨 스냅샷은 라벨 이름순 (snapshots.build_snapshots와 같은 순서)
+        contact.label_snapshot = [
+            label_entry(label.id, label.name, label.color)
+            for label in sorted(labels, key=lambda label: label.name)
+        ]
+        return contact, labels
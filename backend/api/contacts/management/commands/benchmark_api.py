@@ -0,0 +1,227 @@
+# 파이썬 표준 라이브러리
+import json
+import time
+import tracemalloc
+
+# Django의 관리 명령 기반 클래스, 캐시, 데이터베이스, 테스트 클라이언트 도구를 가져옵니다
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+# 현재 앱의 모델을 가져옵니다
+from api.contacts.models import Contact, Label
+
+from ._bench import latency_summary
+
+
+# 측정할 요청 목록: (이름, URL 이름, 상세 객체 종류, 쿼리 파라미터)
+# 파라미터 값의 {label}, {company}는 데이터베이스에서 고른 실제 값으로 바뀝니다
+CASES = [
+    ("list", "contact-list", None, {}),
+    ("list_deep_page", "contact-list", None, {"page": "50"}),
+    ("list_cursor", "contact-list", None, {"cursor": ""}),
+    ("list_fields", "contact-list", None, {"fields": "id,name,phone"}),
+    ("list_count_skip", "contact-list", None, {"count": "skip"}),
+    ("search_name", "contact-list", None, {"search": "김민"}),
+    ("search_phone", "contact-list", None, {"search": "1234"}),
+    ("search_choseong", "contact-list", None, {"name_search": "ㄱㅁ"}),
+    ("filter_label", "contact-list", None, {"labels": "{label}"}),
+    ("filter_company", "contact-list", None, {"company": "{company}"}),
+    ("filter_has_email", "contact-list", None, {"has_email": "true"}),
+    ("filter_birthday_month", "contact-list", None, {"birthday_month": "3"}),
+    ("ordering_name", "contact-list", None, {"ordering": "name"}),
+    ("ordering_email_desc", "contact-list", None, {"ordering": "-email"}),
+    ("detail", "contact-detail", "contact", {}),
+    ("upcoming_birthdays", "contact-upcoming-birthdays", None, {}),
+    ("statistics", "contact-statistics", None, {}),
+    ("statistics_fresh", "contact-statistics", None, {"fresh": "true"}),
+    ("label_list", "label-list", None, {}),
+    ("label_stats", "label-stats", None, {}),
+]
+
+
+class Command(BaseCommand):
+    """
+    API 엔드포인트 성능 벤치마크
+    현재 데이터베이스(예: generate_contacts로 만든 데이터)에 대해 목록, 검색, 필터, 정렬, 상세,
+    통계, 라벨 통계 요청(CASES)을 테스트 클라이언트로 반복 실행하고
+    요청별 p50/p95/p99 응답 시간, 쿼리 수, 최대 메모리(tracemalloc)를 JSON으로 출력합니다
+
+    --save-baseline으로 결과를 파일에 저장해 두고, 나중에 --baseline으로 비교하면
+    응답 시간이 tolerance 이상 늘었거나 쿼리 수가 늘어난 요청을 regressions에 표시합니다
+
+    사용 예:
+        python manage.py generate_contacts --count 100000
+        python manage.py benchmark_api --repeat 50 --save-baseline benchmarks/api.json
+        python manage.py benchmark_api --repeat 50 --baseline benchmarks/api.json
+    """
+
+    help = "API 엔드포인트별 응답 시간(p50/p95/p99), 쿼리 수, 최대 메모리를 측정합니다"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=30, help="요청별 측정 횟수")
+        parser.add_argument(
+            "--warmup", type=int, default=3, help="측정 전 예열 요청 수"
+        )
+        parser.add_argument(
+            "--cases", nargs="+", help="측정할 요청 이름 (생략하면 전체)"
+        )
+        parser.add_argument(
+            "--cold",
+            action="store_true",
+            help="요청마다 캐시를 비우고 측정 (개수/라벨 캐시가 없는 상태)",
+        )
+        parser.add_argument("--baseline", help="비교할 기준 결과 JSON 파일")
+        parser.add_argument("--save-baseline", help="이번 결과를 기준으로 저장할 파일")
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.2,
+            help="기준보다 느려져도 허용하는 비율 (기본 0.2 = 20%%)",
+        )
+        parser.add_argument(
+            "--fail-on-regression",
+            action="store_true",
+            help="성능 저하가 있으면 오류로 종료",
+        )
+
+    def handle(self, *args, repeat, warmup, cases, cold, **options):
+        if repeat < 1:
+            raise CommandError("repeat는 1 이상이어야 합니다.")
+        known = [case[0] for case in CASES]
+        unknown = sorted(set(cases or []) - set(known))
+        if unknown:
+            raise CommandError(
+                f"알 수 없는 요청: {', '.join(unknown)} (사용 가능: {', '.join(known)})"
+            )
+
+        samples = self.pick_samples()
+        client = Client(HTTP_ACCEPT="application/json")
+        results = {
+            "rows": Contact.objects.count(),
+            "repeat": repeat,
+            "cold": cold,
+            "cases": {},
+        }
+        # 테스트 클라이언트의 호스트(testserver)를 허용 목록에 추가하고 요청
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+            for name, url_name, detail, params in CASES:
+                if cases and name not in cases:
+                    continue
+                url = reverse(url_name, args=[samples[detail]] if detail else [])
+                params = {key: value.format(**samples) for key, value in params.items()}
+                results["cases"][name] = self.run_case(
+                    client, url, params, repeat, warmup, cold
+                )
+
+        if options["baseline"]:
+            with open(options["baseline"], encoding="utf-8") as file:
+                baseline = json.load(file)
+            results["comparison"] = self.compare(
+                baseline, results, options["tolerance"]
+            )
+            results["regressions"] = [
+                name
+                for name, item in results["comparison"].items()
+                if item["regression"]
+            ]
+        if options["save_baseline"]:
+            with open(options["save_baseline"], "w", encoding="utf-8") as file:
+                json.dump(results["cases"], file, ensure_ascii=False, indent=2)
+
+        self.stdout.write(json.dumps(results, ensure_ascii=False, indent=2))
+        if options["fail_on_regression"] and results.get("regressions"):
+            raise CommandError(f"성능 저하: {', '.join(results['regressions'])}")
+
+    def pick_samples(self):
+        """
+        요청에 사용할 실제 값 (가운데 연락처, 연락처가 가장 많은 라벨, 가장 많은 회사)
+        """
+        contact_ids = Contact.objects.order_by("id").values_list("id", flat=True)
+        count = contact_ids.count()
+        if not count:
+            raise CommandError(
+                "연락처가 없습니다. generate_contacts로 먼저 데이터를 만드세요."
+            )
+        label = Label.objects.order_by("-contact_count", "name").first()
+        company = (
+            Contact.objects.exclude(company__isnull=True)
+            .exclude(company="")
+            .values_list("company", flat=True)
+            .first()
+        )
+        return {
+            "contact": contact_ids[count // 2],
+            "label": label.id if label else "",
+            "company": company or "",
+        }
+
+    def request(self, client, url, params, cold):
+        """
+        요청 하나를 보내고 (상태 코드, 응답 시간 ms, 쿼리 수)를 반환합니다
+        스트리밍 응답도 본문을 모두 읽을 때까지의 시간을 잽니다
+        """
+        if cold:
+            cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            response = client.get(url, params)
+            response.getvalue()
+            elapsed = (time.perf_counter() - started) * 1000
+        return response.status_code, elapsed, len(queries)
+
+    def run_case(self, client, url, params, repeat, warmup, cold):
+        """
+        요청 하나를 warmup번 예열한 뒤 repeat번 측정하고, 한 번 더 실행해서 최대 메모리를 잽니다
+        """
+        for _ in range(warmup):
+            self.request(client, url, params, cold)
+        timings, query_counts, statuses = [], [], set()
+        for _ in range(repeat):
+            status_code, elapsed, query_count = self.request(client, url, params, cold)
+            statuses.add(status_code)
+            timings.append(elapsed)
+            query_counts.append(query_count)
+
+        tracemalloc.start()
+        try:
+            self.request(client, url, params, cold)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        return {
+            "url": url,
+            "params": params,
+            "status": sorted(statuses),
+            **latency_summary(timings),
+            "queries": max(query_counts),
+            "peak_kib": round(peak / 1024, 1),
+        }
+
+    def compare(self, baseline, results, tolerance):
+        """
+        기준 결과와 비교합니다 (p50/p95 비율, 쿼리 수 차이)
+        p50 또는 p95가 1 + tolerance배를 넘거나 쿼리 수가 늘었으면 regression
+        """
+        comparison = {}
+        for name, current in results["cases"].items():
+            before = baseline.get(name)
+            if before is None:
+                continue
+            p50_ratio = round(current["p50_ms"] / max(before["p50_ms"], 0.001), 2)
+            p95_ratio = round(current["p95_ms"] / max(before["p95_ms"], 0.001), 2)
+            queries_delta = current["queries"] - before["queries"]
+            comparison[name] = {
+                "p50_ratio": p50_ratio,
+                "p95_ratio": p95_ratio,
+                "queries_delta": queries_delta,
+                "peak_kib_delta": round(current["peak_kib"] - before["peak_kib"], 1),
+                "regression": max(p50_ratio, p95_ratio) > 1 + tolerance
+                or queries_delta > 0,
+            }
+        return comparison
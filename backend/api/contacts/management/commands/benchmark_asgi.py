@@ -0,0 +1,182 @@
+# 파이썬 표준 라이브러리
+import asyncio
+import json
+import time
+from urllib.parse import urlencode
+
+# Django의 관리 명령 기반 클래스, 설정, URL 도구를 가져옵니다
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import override_settings
+from django.urls import reverse
+
+# 현재 앱의 모델을 가져옵니다
+from api.contacts.models import Contact
+
+from ._bench import latency_summary
+
+
+# 측정할 요청 목록: (이름, 동기 URL 이름, 비동기 URL 이름, 상세 요청 여부, 쿼리 파라미터)
+CASES = [
+    ("list", "contact-list", "async-contact-list", False, {}),
+    ("list_search", "contact-list", "async-contact-list", False, {"search": "김"}),
+    ("list_cursor", "contact-list", "async-contact-list", False, {"cursor": ""}),
+    ("detail", "contact-detail", "async-contact-detail", True, {}),
+    ("statistics", "contact-statistics", "async-contact-statistics", False, {}),
+    ("label_list", "label-list", "async-label-list", False, {}),
+    ("label_stats", "label-stats", "async-label-stats", False, {}),
+]
+
+# 비교할 경로: 동기 ViewSet(ASGI에서 스레드로 실행) / 비동기 뷰(async_views)
+MODES = ("sync", "async")
+
+
+class Command(BaseCommand):
+    """
+    ASGI 동시 요청 벤치마크 (동기 ViewSet vs 비동기 뷰)
+    conf.asgi.application을 uvicorn이 호출하는 것과 같은 방식(scope, receive, send)으로
+    한 이벤트 루프에서 직접 호출하고, 동시 요청 수(concurrency)별로
+    초당 처리 요청 수(rps)와 p50/p95/p99 응답 시간을 동기/비동기 경로에 대해 측정합니다
+    (소켓/HTTP 파싱은 두 경로가 같으므로 제외하고 Django 처리 부분만 비교)
+
+    실제 서버로 측정하려면 uvicorn conf.asgi:application 으로 실행한 뒤
+    /api/contacts/ 와 /api/contacts/async/ 에 부하 도구로 같은 요청을 보내면 됩니다
+
+    사용 예:
+        python manage.py generate_contacts --count 100000
+        python manage.py benchmark_asgi --concurrency 1 8 32 --requests 400
+    """
+
+    help = "ASGI로 동기/비동기 조회 API를 동시 요청 수별로 호출해서 처리량과 응답 시간을 비교합니다"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            nargs="+",
+            default=[1, 8, 32],
+            help="동시 요청 수 목록",
+        )
+        parser.add_argument(
+            "--requests", type=int, default=200, help="동시 요청 수별 전체 요청 수"
+        )
+        parser.add_argument(
+            "--warmup", type=int, default=5, help="측정 전 예열 요청 수"
+        )
+        parser.add_argument(
+            "--cases", nargs="+", help="측정할 요청 이름 (생략하면 전체)"
+        )
+
+    def handle(self, *args, concurrency, requests, warmup, cases, **options):
+        if requests < 1 or min(concurrency) < 1:
+            raise CommandError("requests와 concurrency는 1 이상이어야 합니다.")
+        known = [case[0] for case in CASES]
+        unknown = sorted(set(cases or []) - set(known))
+        if unknown:
+            raise CommandError(
+                f"알 수 없는 요청: {', '.join(unknown)} (사용 가능: {', '.join(known)})"
+            )
+        # 상세 요청에 사용할 가운데 연락처
+        contact_ids = Contact.objects.order_by("id").values_list("id", flat=True)
+        count = contact_ids.count()
+        if not count:
+            raise CommandError(
+                "연락처가 없습니다. generate_contacts로 먼저 데이터를 만드세요."
+            )
+        contact_id = contact_ids[count // 2]
+
+        # ASGI 애플리케이션은 설정을 읽은 뒤 가져옴 (conf.asgi가 Django를 초기화)
+        from conf.asgi import application
+
+        results = {
+            "rows": count,
+            "requests": requests,
+            "concurrency": concurrency,
+            "cases": {},
+        }
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+            for name, sync_name, async_name, detail, params in CASES:
+                if cases and name not in cases:
+                    continue
+                url_args = [contact_id] if detail else []
+                paths = {
+                    "sync": reverse(sync_name, args=url_args),
+                    "async": reverse(async_name, args=url_args),
+                }
+                query = urlencode(params)
+                case = {mode: {} for mode in MODES}
+                for level in concurrency:
+                    for mode in MODES:
+                        case[mode][level] = asyncio.run(
+                            self.run_level(
+                                application, paths[mode], query, level, requests, warmup
+                            )
+                        )
+                case["speedup"] = {
+                    level: round(
+                        case["async"][level]["rps"]
+                        / max(case["sync"][level]["rps"], 0.001),
+                        2,
+                    )
+                    for level in concurrency
+                }
+                results["cases"][name] = case
+
+        self.stdout.write(json.dumps(results, ensure_ascii=False, indent=2))
+
+    async def run_level(self, application, path, query, concurrency, requests, warmup):
+        """
+        concurrency개의 작업이 요청을 나눠서 보내는 방식으로 requests번 요청하고
+        초당 처리 요청 수와 응답 시간 통계를 반환합니다
+        """
+        for _ in range(warmup):
+            await self.request(application, path, query)
+
+        remaining = iter(range(requests))
+        timings, statuses = [], set()
+
+        async def worker():
+            for _ in remaining:
+                started = time.perf_counter()
+                status = await self.request(application, path, query)
+                timings.append((time.perf_counter() - started) * 1000)
+                statuses.add(status)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+        return {
+            "status": sorted(statuses),
+            "rps": round(requests / elapsed, 1),
+            **latency_summary(timings),
+        }
+
+    async def request(self, application, path, query):
+        """
+        ASGI HTTP 요청 하나를 보내고 응답 본문을 모두 받은 뒤 상태 코드를 반환합니다
+        """
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": query.encode(),
+            "root_path": "",
+            "headers": [(b"host", b"testserver"), (b"accept", b"application/json")],
+            "client": ("127.0.0.1", 50000),
+            "server": ("testserver", 80),
+        }
+        response = {}
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+
+        await application(scope, receive, send)
+        return response["status"]
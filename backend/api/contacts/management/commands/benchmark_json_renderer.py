@@ -0,0 +1,116 @@
+# 파이썬 표준 라이브러리
+import json
+import tracemalloc
+
+# Django의 관리 명령 기반 클래스와 트랜잭션 도구를 가져옵니다
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+# Django REST Framework의 JSON 렌더러를 가져옵니다
+from rest_framework.renderers import JSONRenderer
+
+# 현재 앱의 모듈들을 가져옵니다
+from api.contacts import renderers
+from api.contacts.models import Contact
+
+from ._bench import measure, seed_contacts
+
+
+def peak_memory(func):
+    """
+    func 실행 중 늘어난 메모리의 최댓값(KiB, tracemalloc 기준)을 반환합니다
+    """
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return round(peak / 1024, 1)
+
+
+class Command(BaseCommand):
+    """
+    JSON 렌더러 성능 비교 벤치마크
+    연락처 rows개(기본 1만 개, 날짜/시간 필드 포함)를 JSON으로 만드는 시간과 최대 메모리를
+    DRF JSONRenderer, FastJSONRenderer, 청크 스트리밍(stream_json_array)으로 비교합니다
+    합성 데이터는 트랜잭션 안에서 생성한 뒤 롤백하므로 데이터베이스에 남지 않습니다
+
+    사용 예: python manage.py benchmark_json_renderer --rows 10000 --chunk-size 1000
+    """
+
+    help = "JSON 렌더러(DRF JSONRenderer vs FastJSONRenderer vs 스트리밍) 시간/메모리를 비교합니다"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=10000, help="합성 연락처 수")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=renderers.STREAM_CHUNK_SIZE,
+            help="스트리밍 청크 크기",
+        )
+        parser.add_argument("--repeat", type=int, default=10, help="반복 횟수")
+
+    def handle(self, *args, rows, chunk_size, repeat, **options):
+        with transaction.atomic():
+            seed_contacts(rows, detailed=True)
+            payload = list(
+                Contact.objects.order_by("id").values(
+                    "id",
+                    "name",
+                    "email",
+                    "phone",
+                    "company",
+                    "position",
+                    "memo",
+                    "address",
+                    "birthday",
+                    "label_snapshot",
+                    "created_at",
+                    "updated_at",
+                )
+            )
+            # 합성 데이터 삭제
+            transaction.set_rollback(True)
+
+        drf_renderer = JSONRenderer()
+        fast_renderer = renderers.FastJSONRenderer()
+
+        def drf():
+            return drf_renderer.render(payload)
+
+        def fast():
+            return fast_renderer.render(payload)
+
+        def streamed():
+            # 응답을 보내는 것처럼 청크를 하나씩 소비 (전체를 합치지 않음)
+            chunks = (
+                payload[start : start + chunk_size]
+                for start in range(0, len(payload), chunk_size)
+            )
+            return sum(len(part) for part in renderers.stream_json_array(chunks))
+
+        # 세 경로의 결과가 같은지 먼저 확인
+        identical = (
+            drf()
+            == fast()
+            == b"".join(
+                renderers.stream_json_array(
+                    payload[start : start + chunk_size]
+                    for start in range(0, len(payload), chunk_size)
+                )
+            )
+        )
+        results = {
+            "rows": rows,
+            "backend": renderers.get_backend(),
+            "identical_output": identical,
+            "payload_kib": round(len(drf()) / 1024, 1),
+        }
+        for name, func in (("drf", drf), ("fast", fast), ("streamed", streamed)):
+            results[name] = measure(func, repeat)
+            results[name]["peak_kib"] = peak_memory(func)
+        results["speedup"] = round(
+            results["drf"]["median_ms"] / results["fast"]["median_ms"], 2
+        )
+        self.stdout.write(json.dumps(results, ensure_ascii=False, indent=2))
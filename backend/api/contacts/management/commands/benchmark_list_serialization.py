@@ -0,0 +1,64 @@
+# 파이썬 표준 라이브러리
+import json
+
+# Django의 관리 명령 기반 클래스와 트랜잭션 도구를 가져옵니다
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+# Django REST Framework의 JSON 렌더러를 가져옵니다
+from rest_framework.renderers import JSONRenderer
+
+# 현재 앱의 모듈들을 가져옵니다
+from api.contacts import fastlist
+from api.contacts.models import Contact
+from api.contacts.serializers import ContactListSerializer
+
+from ._bench import measure, seed_contacts
+
+
+class Command(BaseCommand):
+    """
+    연락처 목록 직렬화 성능 비교 벤치마크
+    한 페이지(기본 100개)를 조회해서 JSON으로 만드는 시간을
+    ContactListSerializer 경로와 values() 기반 빠른 경로(fastlist)로 비교합니다
+    합성 데이터는 트랜잭션 안에서 생성한 뒤 롤백하므로 데이터베이스에 남지 않습니다
+
+    사용 예: python manage.py benchmark_list_serialization --rows 10000 --page-size 100
+    """
+
+    help = "연락처 목록 직렬화(ContactListSerializer vs fastlist) 시간을 비교합니다"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=10000, help="합성 연락처 수")
+        parser.add_argument("--page-size", type=int, default=100, help="페이지 크기")
+        parser.add_argument("--repeat", type=int, default=50, help="반복 횟수")
+
+    def handle(self, *args, rows, page_size, repeat, **options):
+        renderer = JSONRenderer()
+        with transaction.atomic():
+            seed_contacts(rows, detailed=True)
+            queryset = Contact.objects.order_by("-created_at", "-id")
+
+            def serializer_page():
+                page = list(queryset[:page_size])
+                return renderer.render(ContactListSerializer(page, many=True).data)
+
+            def fast_page():
+                page = list(fastlist.list_rows(queryset)[:page_size])
+                return renderer.render(fastlist.represent(page))
+
+            # 두 경로의 결과가 같은지 먼저 확인
+            identical = serializer_page() == fast_page()
+            results = {
+                "rows": rows,
+                "page_size": page_size,
+                "identical_output": identical,
+                "serializer": measure(serializer_page, repeat),
+                "fastlist": measure(fast_page, repeat),
+            }
+            # 합성 데이터 삭제
+            transaction.set_rollback(True)
+        results["speedup"] = round(
+            results["serializer"]["median_ms"] / results["fastlist"]["median_ms"], 2
+        )
+        self.stdout.write(json.dumps(results, ensure_ascii=False, indent=2))
@@ -0,0 +1,70 @@
+# 파이썬 표준 라이브러리
+import json
+
+# Django의 관리 명령 기반 클래스와 트랜잭션 도구를 가져옵니다
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+# 현재 앱의 필터와 모델을 가져옵니다
+from api.contacts.filters import ContactFilter
+from api.contacts.models import Contact
+
+from ._bench import measure, seed_contacts
+
+
+class Command(BaseCommand):
+    """
+    이름 검색 성능 비교 벤치마크
+    기존 icontains(LIKE '%검색어%') 검색과 초성 키 인덱스 범위 검색의 실행 시간을 비교합니다
+    합성 데이터는 트랜잭션 안에서 생성한 뒤 롤백하므로 데이터베이스에 남지 않습니다
+
+    사용 예: python manage.py benchmark_name_search --rows 200000
+    """
+
+    help = "이름 검색(icontains vs 초성 인덱스) 실행 시간을 비교합니다"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100000, help="합성 연락처 수")
+        parser.add_argument("--repeat", type=int, default=20, help="쿼리 반복 횟수")
+        parser.add_argument(
+            "--queries",
+            nargs="+",
+            default=["김", "ㄱㅁ", "김민", "김ㅁㅅ", "ㅎㄱㄷ"],
+            help="비교할 검색어 목록",
+        )
+
+    def handle(self, *args, rows, repeat, queries, **options):
+        with transaction.atomic():
+            seed_contacts(rows)
+            results = {"rows": rows, "queries": {}}
+            for query in queries:
+                results["queries"][query] = self.compare(query, repeat)
+            # 합성 데이터 삭제
+            transaction.set_rollback(True)
+        self.stdout.write(json.dumps(results, ensure_ascii=False, indent=2))
+
+    def compare(self, query, repeat):
+        """
+        검색어 하나에 대해 두 방식의 첫 페이지(20개) 조회 시간과 전체 결과 수를 측정합니다
+        """
+        icontains = Contact.objects.filter(name__icontains=query).order_by("name")
+        choseong = ContactFilter(
+            {"name_search": query}, queryset=Contact.objects.order_by("name")
+        ).qs
+        return {
+            "icontains": {
+                "matches": icontains.count(),
+                **measure(lambda: list(icontains[:20]), repeat),
+                **self.prefixed("count_", measure(icontains.count, repeat)),
+            },
+            "name_search": {
+                "matches": choseong.count(),
+                **measure(lambda: list(choseong[:20]), repeat),
+                **self.prefixed("count_", measure(choseong.count, repeat)),
+            },
+        }
+
+    def prefixed(self, prefix, timings):
+        return {
+            f"{prefix}{key}": value for key, value in timings.items() if key != "runs"
+        }
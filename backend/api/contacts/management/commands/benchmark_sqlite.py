@@ -0,0 +1,259 @@
+# 파이썬 표준 라이브러리
+import json
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+
+# Django의 관리 명령 기반 클래스, 설정, 데이터베이스 연결을 가져옵니다
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+# 현재 앱의 모델과 SQLite 백엔드 도구를 가져옵니다
+from api.contacts.addressbooks import current_address_book
+from api.contacts.models import Contact, ContactStatistics
+from api.contacts.sqlite_backend import PRODUCTION_PRAGMAS
+from api.contacts.sqlite_backend.base import apply_pragmas
+
+from ._bench import latency_summary
+
+
+# 비교할 프로필: (PRAGMA, 쓰기 트랜잭션 시작 방식)
+# - default: Django 기본 SQLite 설정 (롤백 저널, sqlite3 기본 잠금 대기 5초, BEGIN DEFERRED)
+# - production: settings.SQLITE_PRODUCTION_OPTIONS의 PRAGMA + 쓰기는 BEGIN IMMEDIATE
+def get_profiles():
+    options = getattr(settings, "SQLITE_PRODUCTION_OPTIONS", {})
+    return {
+        "default": ({"journal_mode": "DELETE"}, "DEFERRED"),
+        "production": (options.get("pragmas") or PRODUCTION_PRAGMAS, "IMMEDIATE"),
+    }
+
+
+# 읽기 요청과 같은 형태의 쿼리 (목록 첫 페이지, 이름 검색 개수)
+LIST_SQL = (
+    "SELECT id, name, phone, email, company, label_snapshot FROM contracts_contact "
+    "ORDER BY created_at DESC LIMIT 20"
+)
+COUNT_SQL = "SELECT COUNT(*) FROM contracts_contact WHERE name LIKE ?"
+# 쓰기 요청과 같은 형태의 트랜잭션 (연락처를 읽은 뒤 수정하고 통계 행 갱신)
+READ_CONTACT_SQL = "SELECT id, memo FROM contracts_contact WHERE id = ?"
+UPDATE_CONTACT_SQL = (
+    "UPDATE contracts_contact SET memo = ?, updated_at = ? WHERE id = ?"
+)
+UPDATE_STATISTICS_SQL = (
+    "UPDATE contracts_contact_statistics SET updated_at = ? WHERE address_book = ?"
+)
+
+
+def is_lock_error(error):
+    """
+    잠금 때문에 실패한 오류인지 여부 ("database is locked" / "database table is locked" 등)
+    """
+    message = str(error).lower()
+    return "locked" in message or "busy" in message
+
+
+class Command(BaseCommand):
+    """
+    SQLite 동시 읽기/쓰기 경합 벤치마크
+    현재 DB를 임시 파일로 복사한 뒤 프로필(default / production)마다
+    읽기 스레드와 쓰기 스레드를 duration초 동안 동시에 실행해서
+    초당 처리 수, p50/p95/p99 응답 시간, 잠금 오류("database is locked") 비율을 비교합니다
+
+    스레드마다 별도 연결을 사용하므로 스레드로 요청을 처리하는 WSGI 서버와 같은 조건입니다
+    (원본 DB는 바꾸지 않음)
+
+    사용 예:
+        python manage.py generate_contacts --count 100000
+        python manage.py benchmark_sqlite --readers 8 --writers 4 --duration 10
+    """
+
+    help = "SQLite 프로필별 동시 읽기/쓰기 처리량과 잠금 오류 비율을 측정합니다"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--readers", type=int, default=8, help="읽기 스레드 수")
+        parser.add_argument("--writers", type=int, default=4, help="쓰기 스레드 수")
+        parser.add_argument(
+            "--duration", type=float, default=5.0, help="프로필별 측정 시간 (초)"
+        )
+        parser.add_argument(
+            "--profiles",
+            nargs="+",
+            choices=["default", "production"],
+            default=["default", "production"],
+            help="측정할 프로필",
+        )
+
+    def handle(self, *args, readers, writers, duration, profiles, **options):
+        if connection.vendor != "sqlite":
+            raise CommandError("SQLite 데이터베이스에서만 실행할 수 있습니다.")
+        if readers < 0 or writers < 0 or readers + writers == 0 or duration <= 0:
+            raise CommandError("스레드 수와 측정 시간을 확인하세요.")
+        contact_ids = list(Contact.objects.values_list("id", flat=True)[:10000])
+        if not contact_ids:
+            raise CommandError(
+                "연락처가 없습니다. generate_contacts로 먼저 데이터를 만드세요."
+            )
+        ContactStatistics.load()
+
+        results = {
+            "rows": Contact.objects.count(),
+            "readers": readers,
+            "writers": writers,
+            "duration": duration,
+            "profiles": {},
+        }
+        available = get_profiles()
+        with tempfile.TemporaryDirectory() as directory:
+            for name in profiles:
+                path = os.path.join(directory, f"{name}.sqlite3")
+                self.copy_database(path)
+                pragmas, transaction_mode = available[name]
+                results["profiles"][name] = self.run_profile(
+                    path,
+                    pragmas,
+                    transaction_mode,
+                    contact_ids,
+                    readers,
+                    writers,
+                    duration,
+                )
+
+        if {"default", "production"} <= set(results["profiles"]):
+            before = results["profiles"]["default"]
+            after = results["profiles"]["production"]
+            results["comparison"] = {
+                kind: {
+                    "ops_ratio": round(
+                        after[kind]["ops_per_sec"]
+                        / max(before[kind]["ops_per_sec"], 0.001),
+                        2,
+                    ),
+                    "error_rate_before": before[kind]["error_rate"],
+                    "error_rate_after": after[kind]["error_rate"],
+                }
+                for kind in ("reads", "writes")
+            }
+        self.stdout.write(json.dumps(results, ensure_ascii=False, indent=2))
+
+    def copy_database(self, path):
+        """
+        현재 DB를 path로 복사합니다 (sqlite3 백업 API, 일관된 시점의 복사본)
+        """
+        connection.ensure_connection()
+        destination = sqlite3.connect(path)
+        try:
+            connection.connection.backup(destination)
+        finally:
+            destination.close()
+
+    def connect(self, path, pragmas):
+        """
+        Django SQLite 백엔드와 같은 방식(자동 커밋, BEGIN 직접 실행)의 연결을 만들고 PRAGMA를 적용합니다
+        """
+        conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        apply_pragmas(conn, pragmas)
+        return conn
+
+    def run_profile(
+        self, path, pragmas, transaction_mode, contact_ids, readers, writers, duration
+    ):
+        """
+        읽기/쓰기 스레드를 duration초 동안 실행하고 종류별 결과를 반환합니다
+        """
+        # 저널 모드(DB 파일에 저장됨)를 스레드 시작 전에 한 연결에서 먼저 바꿈
+        self.connect(path, pragmas).close()
+
+        stats = {
+            kind: {"timings": [], "errors": 0, "lock": threading.Lock()}
+            for kind in ("reads", "writes")
+        }
+        start = threading.Barrier(readers + writers + 1)
+        deadline = []
+
+        def record(kind, started, error=None):
+            stat = stats[kind]
+            with stat["lock"]:
+                if error is None:
+                    stat["timings"].append((time.perf_counter() - started) * 1000)
+                else:
+                    stat["errors"] += 1
+
+        def reader(seed):
+            rng = random.Random(seed)
+            conn = self.connect(path, pragmas)
+            start.wait()
+            try:
+                while time.perf_counter() < deadline[0]:
+                    started = time.perf_counter()
+                    try:
+                        conn.execute(LIST_SQL).fetchall()
+                        conn.execute(
+                            COUNT_SQL, [rng.choice("김이박최정") + "%"]
+                        ).fetchone()
+                    except sqlite3.OperationalError as error:
+                        if not is_lock_error(error):
+                            raise
+                        record("reads", started, error)
+                    else:
+                        record("reads", started)
+            finally:
+                conn.close()
+
+        def writer(seed):
+            rng = random.Random(seed)
+            conn = self.connect(path, pragmas)
+            start.wait()
+            try:
+                while time.perf_counter() < deadline[0]:
+                    started = time.perf_counter()
+                    contact_id = rng.choice(contact_ids)
+                    try:
+                        conn.execute(f"BEGIN {transaction_mode}")
+                        conn.execute(READ_CONTACT_SQL, [contact_id]).fetchone()
+                        now = time.strftime("%Y-%m-%d %H:%M:%S")
+                        conn.execute(
+                            UPDATE_CONTACT_SQL, [f"벤치마크 {started}", now, contact_id]
+                        )
+                        conn.execute(
+                            UPDATE_STATISTICS_SQL, [now, current_address_book()]
+                        )
+                        conn.execute("COMMIT")
+                    except sqlite3.OperationalError as error:
+                        if conn.in_transaction:
+                            conn.execute("ROLLBACK")
+                        if not is_lock_error(error):
+                            raise
+                        record("writes", started, error)
+                    else:
+                        record("writes", started)
+            finally:
+                conn.close()
+
+        threads = [
+            threading.Thread(target=reader, args=(index,)) for index in range(readers)
+        ] + [
+            threading.Thread(target=writer, args=(readers + index,))
+            for index in range(writers)
+        ]
+        for thread in threads:
+            thread.start()
+        deadline.append(time.perf_counter() + duration)
+        start.wait()
+        for thread in threads:
+            thread.join()
+
+        result = {"pragmas": pragmas, "write_transaction": transaction_mode}
+        for kind, stat in stats.items():
+            succeeded, errors = len(stat["timings"]), stat["errors"]
+            attempts = succeeded + errors
+            result[kind] = {
+                "ops_per_sec": round(succeeded / duration, 1),
+                "errors": errors,
+                "error_rate": round(errors / attempts, 4) if attempts else 0.0,
+                **(latency_summary(stat["timings"]) if succeeded else {"runs": 0}),
+            }
+        return result
@@ -0,0 +1,74 @@
+# Django의 관리 명령 기반 클래스와 트랜잭션 도구를 가져옵니다
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+# 현재 앱의 모델과 주소록/샤드, 라벨 스냅샷 도구를 가져옵니다
+from api.contacts.addressbooks import use_address_book
+from api.contacts.models import Contact
+from api.contacts.shards import all_address_books
+from api.contacts.snapshots import find_drift, save_snapshots
+
+
+class Command(BaseCommand):
+    """
+    라벨 스냅샷 일관성 검사
+    모든 연락처의 label_snapshot 컬럼을 실제 라벨 연결(contracts_contact_labels)과 비교하고,
+    다른 연락처는 올바른 값으로 수정합니다 (--dry-run 이면 보고만 함)
+    모든 샤드의 모든 주소록을 검사합니다 (--address-book으로 주소록 하나만 검사)
+
+    사용 예: python manage.py check_label_snapshots --dry-run
+    """
+
+    help = "연락처 라벨 스냅샷을 실제 라벨 연결과 비교하고 불일치를 수정합니다"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run", action="store_true", help="수정하지 않고 불일치만 보고"
+        )
+        parser.add_argument(
+            "--chunk-size", type=int, default=1000, help="한 번에 검사할 연락처 수"
+        )
+        parser.add_argument("--address-book", help="이 주소록만 검사")
+
+    def handle(self, *args, dry_run, chunk_size, address_book, **options):
+        checked = drifted = 0
+        for alias, name in all_address_books((Contact,)):
+            if address_book is not None and name != address_book:
+                continue
+            with use_address_book(name, alias=alias):
+                book_checked, book_drifted = self.check(alias, dry_run, chunk_size)
+            checked += book_checked
+            drifted += len(book_drifted)
+            if book_drifted and options["verbosity"] > 1:
+                self.stdout.write(f"[{alias}/{name}] 불일치 연락처 ID: {book_drifted}")
+
+        action = "보고만 함" if dry_run else "수정함"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"연락처 {checked}명 검사, 라벨 스냅샷 불일치 {drifted}명 ({action})"
+            )
+        )
+
+    def check(self, alias, dry_run, chunk_size):
+        """
+        현재 주소록의 연락처를 검사하고 (검사한 수, 불일치 연락처 ID 목록)을 반환합니다
+        """
+        checked, drifted = 0, []
+        last_id = 0
+        while True:
+            # id 순서로 다음 청크를 읽음 (수정 중인 테이블을 커서로 계속 읽지 않도록 키셋 방식)
+            chunk = list(
+                Contact.objects.filter(id__gt=last_id)
+                .order_by("id")
+                .values_list("id", "label_snapshot")[:chunk_size]
+            )
+            if not chunk:
+                return checked, drifted
+            last_id = chunk[-1][0]
+            checked += len(chunk)
+
+            drift = find_drift(chunk)
+            drifted.extend(sorted(drift))
+            if drift and not dry_run:
+                with transaction.atomic(using=alias):
+                    save_snapshots(drift)
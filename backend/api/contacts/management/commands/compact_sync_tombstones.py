@@ -0,0 +1,36 @@
+# Django의 관리 명령 기반 클래스를 가져옵니다
+from django.core.management.base import BaseCommand, CommandError
+
+# 현재 앱의 동기화 피드와 샤드 도구를 가져옵니다
+from api.contacts.shards import get_shards
+from api.contacts.syncfeed import compact_tombstones, get_tombstone_retention
+
+
+class Command(BaseCommand):
+    """
+    동기화 피드의 삭제 기록 정리
+    모든 샤드에서 보관 기간(settings.CONTACTS_SYNC_TOMBSTONE_DAYS)이 지난 삭제 기록을 삭제합니다
+    보관 기간보다 오래된 동기화 토큰은 410(full_resync) 응답을 받으므로 정리해도 삭제를 놓치지 않습니다
+
+    사용 예: python manage.py compact_sync_tombstones (cron 등으로 하루 한 번 실행)
+    """
+
+    help = "보관 기간이 지난 동기화 삭제 기록(툼스톤)을 정리합니다"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=5000, help="한 번에 삭제할 행 수"
+        )
+
+    def handle(self, *args, batch_size, **options):
+        if batch_size <= 0:
+            raise CommandError("batch-size는 0보다 커야 합니다.")
+        removed = {
+            alias: compact_tombstones(alias, batch_size) for alias in get_shards()
+        }
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{get_tombstone_retention().days}일이 지난 삭제 기록 "
+                f"{sum(removed.values())}건 삭제함 ({removed})"
+            )
+        )
@@ -0,0 +1,63 @@
+# 파이썬 표준 라이브러리
+import time
+from collections import Counter
+
+# Django의 관리 명령 기반 클래스를 가져옵니다
+from django.core.management.base import BaseCommand, CommandError
+
+# 현재 앱의 모듈들을 가져옵니다
+from api.contacts import duplicates
+from api.contacts.addressbooks import (
+    DEFAULT_ADDRESS_BOOK,
+    is_valid_address_book,
+    use_address_book,
+)
+from api.contacts.models import Contact
+
+
+class Command(BaseCommand):
+    """
+    중복 연락처 묶음 계산
+    주소록의 중복 묶음을 계산해서 묶음 수/종류별 수와 걸린 시간을 출력하고,
+    결과를 GET /contacts/duplicates/ 가 사용하는 캐시에 저장합니다 (대용량 주소록의 첫 요청 대기 방지)
+
+    사용 예: python manage.py find_duplicates --address-book acme --min-score 0.6
+    """
+
+    help = "블로킹 키로 중복 연락처 묶음을 계산하고 캐시에 저장합니다"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--address-book", default=DEFAULT_ADDRESS_BOOK, help="대상 주소록"
+        )
+        parser.add_argument(
+            "--min-score",
+            type=float,
+            default=None,
+            help="중복으로 볼 최소 점수 (기본값: settings.CONTACTS_DUPLICATE_MIN_SCORE)",
+        )
+
+    def handle(self, *args, address_book, min_score, **options):
+        if not is_valid_address_book(address_book):
+            raise CommandError(f"잘못된 주소록 이름입니다: {address_book}")
+        if min_score is not None and not 0 < min_score <= 1:
+            raise CommandError("min-score는 0보다 크고 1 이하여야 합니다.")
+
+        with use_address_book(address_book):
+            if min_score is None:
+                min_score = duplicates.get_default_min_score()
+            started = time.perf_counter()
+            total = Contact.objects.count()
+            clusters = duplicates.get_clusters(round(min_score, 2))
+            elapsed = time.perf_counter() - started
+
+        reasons = Counter(
+            reason for cluster in clusters for reason in cluster["reasons"]
+        )
+        contacts = sum(len(cluster["contact_ids"]) for cluster in clusters)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"연락처 {total}개 중 중복 묶음 {len(clusters)}개 (연락처 {contacts}개, "
+                f"종류별 {dict(reasons)}), {elapsed:.1f}초"
+            )
+        )
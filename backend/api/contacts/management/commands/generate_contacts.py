@@ -0,0 +1,126 @@
+# 파이썬 표준 라이브러리
+import time
+
+# Django의 관리 명령 기반 클래스, 데이터베이스 연결, 트랜잭션 도구를 가져옵니다
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+# 현재 앱의 모듈들을 가져옵니다
+from api.contacts import caching, search
+from api.contacts.changes import CONTACTS_NAMESPACE, LABEL_COUNTS_NAMESPACE
+from api.contacts.models import Contact, ContactStatistics, Label, SyncTombstone
+from api.contacts.registry import LABELS_NAMESPACE
+
+from ._dataset import ContactFactory, LABEL_NAMES, ensure_labels
+
+# 연락처-라벨 다대다 관계의 중간(through) 테이블 모델
+ContactLabel = Contact.labels.through
+
+
+class Command(BaseCommand):
+    """
+    대용량 합성 연락처 생성
+    실제와 비슷한 분포(한국어/영어 이름, 전화번호, 이메일, 회사, 생일, 라벨)의 연락처를
+    count개 생성해서 데이터베이스에 저장합니다 (성능 측정용, benchmark_api 명령과 함께 사용)
+
+    - 연락처와 라벨 연결은 batch_size개씩 bulk_create로 저장 (배치마다 트랜잭션 하나)
+    - 라벨 스냅샷은 생성할 때 함께 채우고, 통계/라벨별 연락처 수는 마지막에 한 번 다시 계산
+    - SQLite 전문 검색 색인은 생성 중에는 트리거를 끄고 마지막에 한 번에 다시 만듦
+
+    사용 예: python manage.py generate_contacts --count 100000 --labels 12 --seed 1
+    """
+
+    help = "실제와 비슷한 분포의 합성 연락처를 대량으로 생성합니다"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--count", type=int, default=100000, help="생성할 연락처 수"
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=5000, help="한 번에 저장할 연락처 수"
+        )
+        parser.add_argument(
+            "--labels",
+            type=int,
+            default=12,
+            help=f"사용할 라벨 수 (최대 {len(LABEL_NAMES)})",
+        )
+        parser.add_argument(
+            "--seed", type=int, default=0, help="난수 시드 (같으면 같은 데이터)"
+        )
+        parser.add_argument(
+            "--clear", action="store_true", help="생성 전에 기존 연락처를 모두 삭제"
+        )
+
+    def handle(self, *args, count, batch_size, labels, seed, clear, **options):
+        if count < 1 or batch_size < 1:
+            raise CommandError("count와 batch-size는 1 이상이어야 합니다.")
+        if not 1 <= labels <= len(LABEL_NAMES):
+            raise CommandError(f"labels는 1에서 {len(LABEL_NAMES)} 사이여야 합니다.")
+
+        started = time.perf_counter()
+        factory = ContactFactory(ensure_labels(labels), seed=seed)
+
+        # 행마다 실행되는 전문 검색 동기화 트리거를 끄고 마지막에 색인을 한 번에 다시 만듦
+        search.uninstall_fulltext_index(connection)
+        try:
+            if clear:
+                self.clear(batch_size)
+            for start in range(0, count, batch_size):
+                self.create_batch(factory, start, min(batch_size, count - start))
+                self.stdout.write(f"{start + min(batch_size, count - start)}/{count}")
+        finally:
+            search.install_fulltext_index(connection)
+            search.rebuild_fulltext_index(connection)
+
+        # bulk_create는 시그널을 거치지 않으므로 파생 데이터를 한 번에 다시 계산
+        ContactStatistics.rebuild()
+        Label.rebuild_contact_counts()
+        for namespace in (CONTACTS_NAMESPACE, LABEL_COUNTS_NAMESPACE, LABELS_NAMESPACE):
+            caching.bump_version(namespace)
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"연락처 {count}개 생성 완료 ({elapsed:.1f}초, 초당 {count / elapsed:.0f}개)"
+            )
+        )
+
+    def create_batch(self, factory, start, size):
+        """
+        연락처 size개와 라벨 연결을 만들어서 저장합니다
+        """
+        built = [factory.build(start + index) for index in range(size)]
+        contacts = [contact for contact, _ in built]
+        with transaction.atomic():
+            Contact.objects.bulk_create(contacts, batch_size=size)
+            ContactLabel.objects.bulk_create(
+                [
+                    ContactLabel(contact_id=contact.id, label_id=label.id)
+                    for contact, contact_labels in built
+                    for label in contact_labels
+                ],
+                batch_size=size,
+            )
+
+    def clear(self, batch_size):
+        """
+        현재 주소록의 연락처와 라벨 연결을 batch_size개씩 모두 삭제합니다
+        연락처마다 삭제 시그널을 보내지 않도록 DELETE 쿼리를 바로 실행합니다 (통계/라벨 수는 마지막에 다시 계산)
+        중간 테이블에는 주소록 컬럼이 없으므로 현재 주소록 연락처의 연결만 골라서 삭제합니다
+        (같은 샤드에 있는 다른 주소록의 라벨 연결은 그대로 유지)
+        동기화 피드가 삭제를 알릴 수 있도록 bulk.delete_contacts와 같이 삭제 기록을 남기고 캐시 버전을 바꿉니다
+        """
+        with transaction.atomic():
+            while True:
+                ids = list(Contact.objects.values_list("id", flat=True)[:batch_size])
+                if not ids:
+                    break
+                ContactLabel.objects.filter(contact_id__in=ids)._raw_delete(
+                    ContactLabel.objects.db
+                )
+                contacts = Contact.objects.filter(id__in=ids)
+                contacts._raw_delete(contacts.db)
+                SyncTombstone.record(SyncTombstone.KIND_CONTACT, ids)
+            for namespace in (CONTACTS_NAMESPACE, LABEL_COUNTS_NAMESPACE):
+                caching.bump_version_on_commit(namespace)
@@ -0,0 +1,323 @@
+# 파이썬 표준 라이브러리
+import json
+import time
+from datetime import timedelta
+
+# Django의 관리 명령 기반 클래스, 데이터베이스 연결, 시간 도구를 가져옵니다
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+from django.utils import timezone
+
+# 현재 앱의 모델과 주소록/샤드 도구를 가져옵니다
+from api.contacts import caching
+from api.contacts.addressbooks import is_valid_address_book, use_address_book
+from api.contacts.changes import CONTACTS_NAMESPACE, LABEL_COUNTS_NAMESPACE
+from api.contacts.models import (
+    CompanyCounter,
+    Contact,
+    ContactImportJob,
+    ContactStatistics,
+    Label,
+    SyncTombstone,
+)
+from api.contacts.registry import LABELS_NAMESPACE
+from api.contacts.shards import (
+    all_address_books,
+    directory,
+    get_shards,
+    restore_id_sequences,
+)
+from api.contacts.snapshots import ContactLabel
+from api.contacts.transactions import immediate_atomic
+
+
+# 차이 반영 단계에서 복사 시작 시각보다 이만큼 앞선 수정도 다시 복사 (시계/저장 정밀도 여유)
+DELTA_MARGIN = timedelta(seconds=1)
+# 주소록 단위로 통째로 다시 복사하는 모델 (행 수가 적음, 삭제 기록은 보관 기간 안의 행만 있음)
+SMALL_MODELS = (ContactImportJob, SyncTombstone)
+# 원본 정리 시 주소록 행을 지우는 보조 모델 (통계는 대상 샤드에서 다시 계산)
+DERIVED_MODELS = (ContactStatistics, CompanyCounter)
+
+
+def book_rows(model, alias, name):
+    """
+    alias DB에 있는 name 주소록의 행 (현재 주소록 범위와 관계없이 조회하는 기본(base) 매니저 사용)
+    """
+    return model._base_manager.using(alias).filter(address_book=name)
+
+
+def insert_rows(model, alias, objs):
+    """
+    원본에서 읽은 행들을 값 그대로(ID, 생성일/수정일 포함) alias DB에 추가합니다
+    bulk_create는 auto_now 필드를 현재 시각으로 바꾸므로 INSERT를 직접 실행합니다
+    (시그널과 파생 컬럼 계산 없이 복사, 전문 검색 트리거는 DB에서 실행됨)
+    """
+    objs = list(objs)
+    if not objs:
+        return
+    connection = connections[alias]
+    quote = connection.ops.quote_name
+    fields = model._meta.concrete_fields
+    sql = "INSERT INTO {} ({}) VALUES ({})".format(
+        quote(model._meta.db_table),
+        ", ".join(quote(field.column) for field in fields),
+        ", ".join(["%s"] * len(fields)),
+    )
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            sql,
+            [
+                [
+                    field.get_db_prep_save(getattr(obj, field.attname), connection)
+                    for field in fields
+                ]
+                for obj in objs
+            ],
+        )
+
+
+class Command(BaseCommand):
+    """
+    주소록 하나를 다른 샤드로 온라인 이동
+    복사하는 동안에도 주소록을 계속 읽고 쓸 수 있고, 쓰기는 마지막 차이 반영 동안만 잠시 거절됩니다 (503)
+
+    1. 복사: 라벨, 연락처(ID 순서로 batch-size개씩)와 라벨 연결을 대상 샤드에 복사 (ID 유지)
+    2. 쓰기 중지: 샤드 디렉터리에 읽기 전용으로 표시하고, 원본 샤드의 쓰기 잠금(BEGIN IMMEDIATE)을 잡음
+       (진행 중이던 쓰기는 끝난 뒤 잠금을 넘겨주고, 기다리던 쓰기는 잠금을 얻은 뒤 503으로 거절됨)
+    3. 차이 반영: 복사 시작 후 수정/생성된 연락처, 삭제된 연락처, 라벨과 가져오기 작업을 다시 맞춤
+    4. 대상 샤드에서 통계/회사별 카운터를 다시 계산하고 ID 발급 위치를 대상 샤드의 범위로 되돌림
+    5. 전환: 원본 샤드의 잠금을 풀고 샤드 디렉터리를 대상 샤드로 바꿈 (이후 요청은 대상 샤드 사용)
+    6. 정리: 원본 샤드에서 주소록의 행을 삭제하고 주소록의 캐시 버전을 증가
+
+    중간에 실패하면 대상 샤드에 복사한 행을 지우고 원본 샤드로 되돌립니다
+
+    --pin-all: 지금 각 주소록이 있는 샤드를 디렉터리에 고정합니다
+    (CONTACTS_SHARDS에 샤드를 추가하기 전에 실행하면 해시 결과가 바뀌어도 주소록이 옮겨지지 않음)
+
+    사용 예:
+        CONTACTS_SQLITE_SHARDS=3 python manage.py migrate --database shard2
+        CONTACTS_SQLITE_SHARDS=3 python manage.py move_address_book acme --to shard2
+        python manage.py move_address_book --pin-all
+    """
+
+    help = "주소록 하나를 다른 샤드로 온라인 이동합니다"
+
+    def add_arguments(self, parser):
+        parser.add_argument("address_book", nargs="?", help="옮길 주소록")
+        parser.add_argument("--to", dest="target", help="대상 샤드 DB 별칭")
+        parser.add_argument(
+            "--batch-size", type=int, default=1000, help="한 번에 복사/삭제할 연락처 수"
+        )
+        parser.add_argument(
+            "--pin-all",
+            action="store_true",
+            help="모든 주소록의 현재 샤드를 디렉터리에 고정",
+        )
+
+    def handle(self, *args, address_book, target, batch_size, pin_all, **options):
+        if pin_all:
+            self.stdout.write(
+                json.dumps({"pinned": self.pin_all()}, ensure_ascii=False)
+            )
+            return
+        if not address_book or not target:
+            raise CommandError("옮길 주소록과 --to 대상 샤드를 지정하세요.")
+        if not is_valid_address_book(address_book):
+            raise CommandError(f"잘못된 주소록 이름입니다: {address_book}")
+        if target not in get_shards():
+            raise CommandError(f"CONTACTS_SHARDS에 없는 샤드입니다: {target}")
+        if batch_size <= 0:
+            raise CommandError("batch-size는 0보다 커야 합니다.")
+        if (
+            Contact._meta.db_table
+            not in connections[target].introspection.table_names()
+        ):
+            raise CommandError(
+                f"대상 샤드에 테이블이 없습니다. migrate --database {target} 를 먼저 실행하세요."
+            )
+        source = directory.alias_for(address_book)
+        if source == target:
+            raise CommandError(
+                f"{address_book} 주소록은 이미 {target} 샤드에 있습니다."
+            )
+
+        result = self.move(address_book, source, target, batch_size)
+        self.stdout.write(json.dumps(result, ensure_ascii=False))
+
+    def pin_all(self):
+        """
+        모든 샤드에 있는 주소록을 데이터가 있는 샤드로 디렉터리에 고정하고 {주소록: 샤드}를 반환합니다
+        (여러 샤드에 행이 있으면 지금 라우팅되는 샤드를 우선)
+        """
+        found = {}
+        for alias, name in all_address_books():
+            found.setdefault(name, []).append(alias)
+        pinned = {}
+        for name, aliases in sorted(found.items()):
+            current = directory.alias_for(name)
+            pinned[name] = current if current in aliases else aliases[0]
+        for name, alias in pinned.items():
+            directory.assign(name, alias)
+        return pinned
+
+    def move(self, name, source, target, batch_size):
+        """
+        name 주소록을 source 샤드에서 target 샤드로 옮기고 결과 요약을 반환합니다
+        """
+        started = time.perf_counter()
+        # 이전에 실패한 이동이 남긴 행이 있으면 먼저 지움
+        self.purge(target, name, batch_size)
+        copy_started = timezone.now()
+        try:
+            copied = self.copy(name, source, target, batch_size)
+            frozen = time.perf_counter()
+            directory.assign(name, source, read_only=True)
+            with use_address_book(name, alias=source), immediate_atomic(using=source):
+                with transaction.atomic(using=target):
+                    delta = self.apply_delta(name, source, target, copy_started)
+                    with use_address_book(name, alias=target):
+                        ContactStatistics.rebuild()
+                    restore_id_sequences(target)
+            # 원본 잠금을 푼 뒤 전환 (그 사이 잠금을 얻은 쓰기는 읽기 전용 표시를 보고 거절됨)
+            directory.assign(name, target)
+            frozen = time.perf_counter() - frozen
+        except Exception as exc:
+            self.purge(target, name, batch_size)
+            directory.assign(name, source)
+            raise CommandError(f"주소록 이동 실패 (원본 샤드로 되돌림): {exc}") from exc
+
+        removed = self.purge(source, name, batch_size)
+        for namespace in (CONTACTS_NAMESPACE, LABELS_NAMESPACE, LABEL_COUNTS_NAMESPACE):
+            caching.bump_version(namespace, name)
+        return {
+            "address_book": name,
+            "source": source,
+            "target": target,
+            "copied": copied,
+            "delta": delta,
+            "removed_from_source": removed,
+            "write_pause_seconds": round(frozen, 3),
+            "seconds": round(time.perf_counter() - started, 3),
+        }
+
+    def copy(self, name, source, target, batch_size):
+        """
+        1단계: 라벨과 연락처(라벨 연결 포함)를 대상 샤드에 복사합니다 (쓰기를 막지 않음)
+        """
+        labels = list(book_rows(Label, source, name))
+        insert_rows(Label, target, labels)
+        contacts = 0
+        last_id = 0
+        while True:
+            batch = list(
+                book_rows(Contact, source, name)
+                .filter(id__gt=last_id)
+                .order_by("id")[:batch_size]
+            )
+            if not batch:
+                break
+            with transaction.atomic(using=target):
+                self.insert_contacts(batch, source, target)
+            contacts += len(batch)
+            last_id = batch[-1].id
+        return {"labels": len(labels), "contacts": contacts}
+
+    def insert_contacts(self, contacts, source, target):
+        """
+        연락처들과 그 라벨 연결을 원본에서 읽은 그대로 대상 샤드에 추가합니다
+        """
+        insert_rows(Contact, target, contacts)
+        links = ContactLabel.objects.using(source).filter(
+            contact_id__in=[contact.id for contact in contacts]
+        )
+        ContactLabel.objects.using(target).bulk_create(
+            ContactLabel(contact_id=link.contact_id, label_id=link.label_id)
+            for link in links
+        )
+
+    def apply_delta(self, name, source, target, copy_started):
+        """
+        3단계: 복사를 시작한 뒤의 변경을 대상 샤드에 반영합니다 (원본 샤드 쓰기 잠금 안에서 실행)
+        """
+        # 라벨: 개수가 적으므로 삭제/수정/추가를 모두 맞춤 (라벨별 연락처 수 포함)
+        source_labels = {label.id: label for label in book_rows(Label, source, name)}
+        target_label_ids = set(
+            book_rows(Label, target, name).values_list("id", flat=True)
+        )
+        removed_labels = target_label_ids - set(source_labels)
+        ContactLabel.objects.using(target).filter(label_id__in=removed_labels).delete()
+        book_rows(Label, target, name).filter(id__in=removed_labels)._raw_delete(target)
+        Label._base_manager.using(target).bulk_update(
+            [source_labels[pk] for pk in target_label_ids & set(source_labels)],
+            ["name", "color", "contact_count", "updated_at"],
+        )
+        insert_rows(
+            Label,
+            target,
+            (
+                label
+                for pk, label in source_labels.items()
+                if pk not in target_label_ids
+            ),
+        )
+
+        # 연락처: 삭제된 연락처는 지우고, 수정/생성된 연락처는 다시 복사
+        source_ids = set(book_rows(Contact, source, name).values_list("id", flat=True))
+        target_ids = set(book_rows(Contact, target, name).values_list("id", flat=True))
+        deleted = list(target_ids - source_ids)
+        changed = set(
+            book_rows(Contact, source, name)
+            .filter(updated_at__gte=copy_started - DELTA_MARGIN)
+            .values_list("id", flat=True)
+        ) | (source_ids - target_ids)
+        stale = deleted + list(changed & target_ids)
+        ContactLabel.objects.using(target).filter(contact_id__in=stale).delete()
+        book_rows(Contact, target, name).filter(id__in=stale)._raw_delete(target)
+        if changed:
+            self.insert_contacts(
+                list(book_rows(Contact, source, name).filter(id__in=changed)),
+                source,
+                target,
+            )
+
+        # 가져오기 작업, 삭제 기록 등 행이 적은 모델은 통째로 다시 복사
+        for model in SMALL_MODELS:
+            book_rows(model, target, name)._raw_delete(target)
+            insert_rows(model, target, book_rows(model, source, name))
+        return {
+            "labels": len(source_labels),
+            "contacts_changed": len(changed),
+            "contacts_deleted": len(deleted),
+        }
+
+    def purge(self, alias, name, batch_size):
+        """
+        alias 샤드에서 name 주소록의 행을 모두 삭제하고 삭제한 연락처 수를 반환합니다
+        시그널(통계 증감 등)이 실행되지 않도록 원시 삭제(_raw_delete)를 사용합니다
+        """
+        removed = 0
+        with use_address_book(name, alias=alias):
+            while True:
+                contact_ids = list(
+                    book_rows(Contact, alias, name).values_list("id", flat=True)[
+                        :batch_size
+                    ]
+                )
+                if not contact_ids:
+                    break
+                with immediate_atomic(using=alias):
+                    ContactLabel.objects.using(alias).filter(
+                        contact_id__in=contact_ids
+                    ).delete()
+                    book_rows(Contact, alias, name).filter(
+                        id__in=contact_ids
+                    )._raw_delete(alias)
+                removed += len(contact_ids)
+            with immediate_atomic(using=alias):
+                label_ids = book_rows(Label, alias, name).values_list("id", flat=True)
+                ContactLabel.objects.using(alias).filter(
+                    label_id__in=label_ids
+                ).delete()
+                for model in (Label, *SMALL_MODELS, *DERIVED_MODELS):
+                    book_rows(model, alias, name)._raw_delete(alias)
+        return removed
@@ -0,0 +1,33 @@
+# Django의 관리 명령 기반 클래스를 가져옵니다
+from django.core.management.base import BaseCommand
+
+# 현재 앱의 모델과 주소록/샤드 도구를 가져옵니다
+from api.contacts.addressbooks import use_address_book
+from api.contacts.models import Label
+from api.contacts.shards import all_address_books
+
+
+class Command(BaseCommand):
+    """
+    라벨별 연락처 수 재계산
+    라벨의 contact_count를 연락처-라벨 중간 테이블(contracts_contact_labels) 집계 값으로 다시 계산합니다
+    모든 샤드의 모든 주소록을 검사합니다 (--address-book으로 주소록 하나만 검사)
+
+    사용 예: python manage.py rebuild_label_counts
+    """
+
+    help = "라벨별 연락처 수(contact_count)를 실제 라벨 연결로 다시 계산합니다"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--address-book", help="이 주소록만 검사")
+
+    def handle(self, *args, address_book, **options):
+        drifted = 0
+        for alias, name in all_address_books((Label,)):
+            if address_book is not None and name != address_book:
+                continue
+            with use_address_book(name, alias=alias):
+                drifted += Label.rebuild_contact_counts()
+        self.stdout.write(
+            self.style.SUCCESS(f"라벨별 연락처 수 불일치 {drifted}건 수정함")
+        )
@@ -0,0 +1,59 @@
+# Django의 관리 명령 기반 클래스를 가져옵니다
+from django.core.management.base import BaseCommand
+
+# 현재 앱의 모델과 주소록/샤드 도구를 가져옵니다
+from api.contacts.addressbooks import use_address_book
+from api.contacts.models import Contact, ContactStatistics
+from api.contacts.shards import all_address_books
+
+
+class Command(BaseCommand):
+    """
+    연락처 통계 재계산
+    증감으로 관리하는 통계 행(ContactStatistics)과 회사별 연락처 수를 실제 연락처 테이블로 다시 계산합니다
+    QuerySet.update() 등 시그널을 거치지 않는 변경으로 생긴 오차를 바로잡으므로 주기적으로(cron 등) 실행합니다
+    모든 샤드의 모든 주소록을 검사합니다 (--address-book으로 주소록 하나만 검사)
+
+    사용 예: python manage.py reconcile_contact_statistics --dry-run
+    """
+
+    help = "연락처 통계 행을 실제 연락처 테이블로 다시 계산합니다"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run", action="store_true", help="수정하지 않고 차이만 보고"
+        )
+        parser.add_argument("--address-book", help="이 주소록만 검사")
+
+    def handle(self, *args, dry_run, address_book, **options):
+        drifted = 0
+        # 연락처를 모두 지운 주소록의 통계 행도 검사하도록 통계 행이 있는 주소록도 포함
+        for alias, name in all_address_books((Contact, ContactStatistics)):
+            if address_book is not None and name != address_book:
+                continue
+            with use_address_book(name, alias=alias):
+                drift = self.reconcile(dry_run)
+            for field, (before, after) in drift.items():
+                self.stdout.write(f"[{alias}/{name}] {field}: {before} -> {after}")
+            drifted += len(drift)
+
+        action = "보고만 함" if dry_run else "수정함"
+        self.stdout.write(
+            self.style.SUCCESS(f"연락처 통계 불일치 {drifted}건 ({action})")
+        )
+
+    def reconcile(self, dry_run):
+        """
+        현재 주소록의 통계 차이 {필드: (저장된 값, 실제 값)}를 반환하고, dry_run이 아니면 다시 계산합니다
+        """
+        stored = ContactStatistics.load().as_dict()
+        expected = ContactStatistics.compute()
+        drift = {
+            field: (stored[field], expected[field])
+            for field in ContactStatistics.FIELDS
+            if stored[field] != expected[field]
+        }
+        if not dry_run:
+            # 회사 수는 회사별 카운터와 함께 맞아야 하므로 차이가 없어도 카운터까지 다시 계산
+            ContactStatistics.rebuild()
+        return drift
@@ -0,0 +1,52 @@
+# 파이썬 표준 라이브러리
+from datetime import timedelta
+
+# Django의 관리 명령 기반 클래스를 가져옵니다
+from django.core.management.base import BaseCommand, CommandError
+
+# 현재 앱의 모듈들을 가져옵니다
+from api.contacts.addressbooks import use_address_book
+from api.contacts.importers import fail_stale_jobs, get_stale_timeout
+from api.contacts.models import ContactImportJob
+from api.contacts.shards import all_address_books
+
+
+class Command(BaseCommand):
+    """
+    중단된 연락처 가져오기 작업 정리
+    웹 워커가 종료되면 백그라운드 스레드의 작업이 대기/진행 중 상태로 남고 임시 파일도 삭제되지 않습니다
+    모든 샤드/주소록에서 제한 시간이 지나도록 끝나지 않은 작업을 실패로 표시하고 임시 파일을 삭제합니다
+
+    사용 예: python manage.py recover_import_jobs --timeout-minutes 30 (서버 시작 시 또는 cron으로 실행)
+    """
+
+    help = "제한 시간이 지나도록 끝나지 않은 연락처 가져오기 작업을 실패로 표시합니다"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--timeout-minutes",
+            type=int,
+            default=None,
+            help="중단된 것으로 볼 시간(분) (기본값: settings.CONTACTS_IMPORT_STALE_MINUTES)",
+        )
+
+    def handle(self, *args, timeout_minutes, **options):
+        if timeout_minutes is not None and timeout_minutes <= 0:
+            raise CommandError("timeout-minutes는 0보다 커야 합니다.")
+        timeout = (
+            timedelta(minutes=timeout_minutes)
+            if timeout_minutes is not None
+            else get_stale_timeout()
+        )
+
+        failed = {}
+        for alias, name in all_address_books((ContactImportJob,)):
+            with use_address_book(name, alias=alias):
+                count = fail_stale_jobs(timeout)
+            if count:
+                failed[f"{alias}:{name}"] = count
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"중단된 가져오기 작업 {sum(failed.values())}건을 실패로 처리함 ({failed})"
+            )
+        )
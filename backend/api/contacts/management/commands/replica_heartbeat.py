@@ -0,0 +1,77 @@
+# 파이썬 표준 라이브러리
+import json
+import time
+
+# Django의 관리 명령 기반 클래스를 가져옵니다
+from django.core.management.base import BaseCommand, CommandError
+
+# 현재 앱의 모델과 복제본 라우팅 도구를 가져옵니다
+from api.contacts import replicas
+from api.contacts.models import ReplicaHeartbeat
+
+
+class Command(BaseCommand):
+    """
+    복제본 하트비트 기록
+    기본 DB에 현재 시각(ReplicaHeartbeat)을 주기적으로 기록하고, 복제본별 지연을 출력합니다
+    라우터는 복제본에 반영된 하트비트로 지연을 계산하므로 복제본을 사용하려면 이 명령이 실행 중이어야 합니다
+    (실행하지 않으면 지연을 알 수 없어 모든 조회를 기본 DB에서 읽음)
+
+    --copy-sqlite: 하트비트를 기록한 뒤 SQLite 기본 DB를 복제본 파일로 복사합니다
+    (로컬에서 SQLite 파일 복사본을 복제본 대신 사용할 때, 복사 간격이 곧 복제 지연)
+
+    사용 예:
+        CONTACTS_SQLITE_REPLICAS=2 python manage.py replica_heartbeat --copy-sqlite --interval 1
+        python manage.py replica_heartbeat --once
+    """
+
+    help = "기본 DB에 하트비트를 기록하고 복제본별 지연을 출력합니다"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval", type=float, default=1.0, help="하트비트 기록 간격 (초)"
+        )
+        parser.add_argument("--once", action="store_true", help="한 번만 기록하고 종료")
+        parser.add_argument(
+            "--copy-sqlite",
+            action="store_true",
+            help="기록 후 SQLite 기본 DB를 복제본 파일로 복사",
+        )
+
+    def handle(self, *args, interval, once, copy_sqlite, **options):
+        if interval <= 0:
+            raise CommandError("interval은 0보다 커야 합니다.")
+        if copy_sqlite and not replicas.get_replicas():
+            raise CommandError(
+                "복제본이 없습니다. CONTACTS_READ_REPLICAS(또는 CONTACTS_SQLITE_REPLICAS)를 설정하세요."
+            )
+        try:
+            while True:
+                self.tick(copy_sqlite)
+                if once:
+                    break
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
+
+    def tick(self, copy_sqlite):
+        """
+        하트비트를 한 번 기록하고 (필요하면 복사한 뒤) 복제본별 지연을 출력합니다
+        """
+        heartbeat = ReplicaHeartbeat.beat()
+        if copy_sqlite:
+            for alias in replicas.get_replicas():
+                try:
+                    replicas.copy_sqlite(alias)
+                except ValueError as error:
+                    raise CommandError(str(error))
+        replicas.lag_monitor.refresh()
+        self.stdout.write(
+            json.dumps(
+                {
+                    "beat_at": heartbeat.beat_at.isoformat(),
+                    "replicas": replicas.lag_monitor.status(),
+                },
+                ensure_ascii=False,
+            )
+        )
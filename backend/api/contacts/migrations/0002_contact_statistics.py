@@ -0,0 +1,54 @@
+# Generated by Django 4.2.7 on 2026-10-17 03:43
+
+from django.db import migrations, models
+
+
+def create_statistics_row(apps, schema_editor):
+    """
+    기존 연락처 수로 통계 행(id=1)을 초기화합니다
+    """
+    Contact = apps.get_model("contacts", "Contact")
+    ContactStatistics = apps.get_model("contacts", "ContactStatistics")
+    db_alias = schema_editor.connection.alias
+    ContactStatistics.objects.using(db_alias).update_or_create(
+        pk=1,
+        defaults={"total_contacts": Contact.objects.using(db_alias).count()},
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contacts", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ContactStatistics",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "total_contacts",
+                    models.BigIntegerField(default=0, verbose_name="전체 연락처 수"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정일"),
+                ),
+            ],
+            options={
+                "verbose_name": "연락처 통계",
+                "verbose_name_plural": "연락처 통계",
+                "db_table": "contracts_contact_statistics",
+            },
+        ),
+        migrations.RunPython(create_statistics_row, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.7 on 2026-10-17 03:47
+
+from django.db import migrations
+
+from api.contacts.search import (
+    install_fulltext_index,
+    rebuild_fulltext_index,
+    uninstall_fulltext_index,
+)
+
+
+def create_fulltext_index(apps, schema_editor):
+    """
+    전문 검색 가상 테이블/트리거를 만들고 기존 연락처로 색인을 채웁니다
+    """
+    install_fulltext_index(schema_editor.connection)
+    rebuild_fulltext_index(schema_editor.connection)
+
+
+def drop_fulltext_index(apps, schema_editor):
+    uninstall_fulltext_index(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contacts", "0002_contact_statistics"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fulltext_index, drop_fulltext_index),
+    ]
@@ -0,0 +1,78 @@
+# Generated by Django 4.2.7 on 2026-10-17 03:46
+
+from django.db import migrations, models
+
+from api.contacts.normalizers import normalize_phone
+
+
+def backfill_phone_digits(apps, schema_editor):
+    """
+    기존 연락처의 정규화/역순 전화번호 컬럼을 채웁니다 (2000개 단위로 일괄 수정)
+    """
+    Contact = apps.get_model("contacts", "Contact")
+    db_alias = schema_editor.connection.alias
+    contacts = (
+        Contact.objects.using(db_alias)
+        .exclude(phone__isnull=True)
+        .exclude(phone="")
+        .only("id", "phone")
+    )
+    batch = []
+    for contact in contacts.iterator(chunk_size=2000):
+        contact.phone_digits = normalize_phone(contact.phone)
+        contact.phone_digits_reversed = contact.phone_digits[::-1]
+        batch.append(contact)
+        if len(batch) >= 2000:
+            Contact.objects.using(db_alias).bulk_update(
+                batch, ["phone_digits", "phone_digits_reversed"]
+            )
+            batch = []
+    if batch:
+        Contact.objects.using(db_alias).bulk_update(
+            batch, ["phone_digits", "phone_digits_reversed"]
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contacts", "0003_contact_fulltext_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="contact",
+            name="phone_digits",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                max_length=20,
+                verbose_name="정규화 전화번호",
+            ),
+        ),
+        migrations.AddField(
+            model_name="contact",
+            name="phone_digits_reversed",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                max_length=20,
+                verbose_name="역순 전화번호",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="contact",
+            index=models.Index(
+                fields=["phone_digits"], name="idx_contact_phone_digits"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="contact",
+            index=models.Index(
+                fields=["phone_digits_reversed"], name="idx_contact_phone_rev"
+            ),
+        ),
+        migrations.RunPython(backfill_phone_digits, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 4.2.7 on 2026-10-17 03:47
+
+from django.db import migrations, models
+
+from api.contacts.normalizers import choseong_key
+
+
+def backfill_name_choseong(apps, schema_editor):
+    """
+    기존 연락처의 초성 검색 키 컬럼을 채웁니다 (2000개 단위로 일괄 수정)
+    """
+    Contact = apps.get_model("contacts", "Contact")
+    db_alias = schema_editor.connection.alias
+    batch = []
+    contacts = Contact.objects.using(db_alias).only("id", "name")
+    for contact in contacts.iterator(chunk_size=2000):
+        contact.name_choseong = choseong_key(contact.name)
+        batch.append(contact)
+        if len(batch) >= 2000:
+            Contact.objects.using(db_alias).bulk_update(batch, ["name_choseong"])
+            batch = []
+    if batch:
+        Contact.objects.using(db_alias).bulk_update(batch, ["name_choseong"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contacts", "0004_contact_phone_digits"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="contact",
+            name="name_choseong",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                max_length=100,
+                verbose_name="초성 검색 키",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="contact",
+            index=models.Index(
+                fields=["name_choseong"], name="idx_contact_name_choseong"
+            ),
+        ),
+        migrations.RunPython(backfill_name_choseong, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,121 @@
+# Generated by Django 4.2.7 on 2026-10-17 04:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contacts", "0005_contact_name_choseong"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ContactImportJob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("file_name", models.CharField(max_length=255, verbose_name="파일명")),
+                (
+                    "file_type",
+                    models.CharField(
+                        choices=[("csv", "CSV"), ("vcard", "vCard")],
+                        max_length=10,
+                        verbose_name="파일 형식",
+                    ),
+                ),
+                (
+                    "dry_run",
+                    models.BooleanField(
+                        default=False,
+                        help_text="저장하지 않고 변경될 내용만 집계",
+                        verbose_name="미리보기",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "대기"),
+                            ("running", "진행 중"),
+                            ("completed", "완료"),
+                            ("failed", "실패"),
+                        ],
+                        default="pending",
+                        max_length=20,
+                        verbose_name="상태",
+                    ),
+                ),
+                (
+                    "source_path",
+                    models.CharField(
+                        blank=True,
+                        editable=False,
+                        max_length=500,
+                        verbose_name="임시 파일 경로",
+                    ),
+                ),
+                (
+                    "processed_rows",
+                    models.PositiveIntegerField(default=0, verbose_name="처리한 행 수"),
+                ),
+                (
+                    "created_rows",
+                    models.PositiveIntegerField(default=0, verbose_name="생성한 행 수"),
+                ),
+                (
+                    "failed_rows",
+                    models.PositiveIntegerField(default=0, verbose_name="실패한 행 수"),
+                ),
+                (
+                    "skipped_rows",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="빈 행, 이미 있는 연락처",
+                        verbose_name="건너뛴 행 수",
+                    ),
+                ),
+                (
+                    "created_labels",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="생성한 라벨 수"
+                    ),
+                ),
+                (
+                    "errors",
+                    models.JSONField(
+                        blank=True, default=list, verbose_name="오류 목록"
+                    ),
+                ),
+                (
+                    "message",
+                    models.TextField(blank=True, verbose_name="작업 실패 사유"),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일"),
+                ),
+                (
+                    "started_at",
+                    models.DateTimeField(blank=True, null=True, verbose_name="시작일"),
+                ),
+                (
+                    "finished_at",
+                    models.DateTimeField(blank=True, null=True, verbose_name="종료일"),
+                ),
+            ],
+            options={
+                "verbose_name": "연락처 가져오기 작업",
+                "verbose_name_plural": "연락처 가져오기 작업",
+                "db_table": "contracts_contact_import_job",
+                "ordering": ["-created_at"],
+            },
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 4.2.7 on 2026-10-17 04:03
+
+from django.db import migrations, models
+
+
+def backfill_label_snapshots(apps, schema_editor):
+    """
+    기존 연락처의 라벨 스냅샷을 채웁니다 (라벨이 연결된 연락처만, 2000개 단위로 일괄 수정)
+    """
+    Contact = apps.get_model("contacts", "Contact")
+    ContactLabel = Contact.labels.through
+    db_alias = schema_editor.connection.alias
+    rows = (
+        ContactLabel.objects.using(db_alias)
+        .order_by("contact_id", "label__name")
+        .values_list("contact_id", "label_id", "label__name", "label__color")
+    )
+    batch, current = [], None
+    for contact_id, label_id, name, color in rows.iterator(chunk_size=2000):
+        if current is None or current.id != contact_id:
+            if len(batch) >= 2000:
+                Contact.objects.using(db_alias).bulk_update(batch, ["label_snapshot"])
+                batch = []
+            current = Contact(id=contact_id, label_snapshot=[])
+            batch.append(current)
+        current.label_snapshot.append({"id": label_id, "name": name, "color": color})
+    if batch:
+        Contact.objects.using(db_alias).bulk_update(batch, ["label_snapshot"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contacts", "0006_contact_import_job"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="contact",
+            name="label_snapshot",
+            field=models.JSONField(
+                blank=True, default=list, editable=False, verbose_name="라벨 스냅샷"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="contact",
+            name="labels",
+            field=models.ManyToManyField(
+                blank=True,
+                help_text="연락처 연결 라벨",
+                related_name="contacts",
+                to="contacts.label",
+                verbose_name="라벨",
+            ),
+        ),
+        migrations.RunPython(backfill_label_snapshots, migrations.RunPython.noop),
+    ]
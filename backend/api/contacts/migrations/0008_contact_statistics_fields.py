@@ -0,0 +1,100 @@
+# Generated by Django 4.2.7 on 2026-10-17 04:07
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def backfill_statistics(apps, schema_editor):
+    """
+    새 통계 값과 회사별 연락처 수를 실제 연락처 테이블로 계산해서 채웁니다
+    """
+    Contact = apps.get_model("contacts", "Contact")
+    ContactStatistics = apps.get_model("contacts", "ContactStatistics")
+    CompanyCounter = apps.get_model("contacts", "CompanyCounter")
+    db_alias = schema_editor.connection.alias
+    contacts = Contact.objects.using(db_alias)
+
+    rows = (
+        contacts.exclude(company__isnull=True)
+        .exclude(company="")
+        .values_list("company")
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+    CompanyCounter.objects.using(db_alias).bulk_create(
+        (
+            CompanyCounter(company=company, contact_count=count)
+            for company, count in rows
+        ),
+        batch_size=1000,
+    )
+    values = contacts.aggregate(
+        total_contacts=Count("id"),
+        with_email=Count("id", filter=Q(email__isnull=False) & ~Q(email="")),
+        with_phone=Count("id", filter=Q(phone__isnull=False) & ~Q(phone="")),
+        with_birthday=Count("id", filter=Q(birthday__isnull=False)),
+        companies=Count("company", filter=~Q(company=""), distinct=True),
+    )
+    ContactStatistics.objects.using(db_alias).update_or_create(pk=1, defaults=values)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contacts", "0007_contact_label_snapshot"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CompanyCounter",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "company",
+                    models.CharField(max_length=100, unique=True, verbose_name="회사"),
+                ),
+                (
+                    "contact_count",
+                    models.BigIntegerField(default=0, verbose_name="연락처 수"),
+                ),
+            ],
+            options={
+                "verbose_name": "회사별 연락처 수",
+                "verbose_name_plural": "회사별 연락처 수",
+                "db_table": "contracts_company_counter",
+            },
+        ),
+        migrations.AddField(
+            model_name="contactstatistics",
+            name="companies",
+            field=models.BigIntegerField(default=0, verbose_name="서로 다른 회사 수"),
+        ),
+        migrations.AddField(
+            model_name="contactstatistics",
+            name="with_birthday",
+            field=models.BigIntegerField(default=0, verbose_name="생일 등록 연락처 수"),
+        ),
+        migrations.AddField(
+            model_name="contactstatistics",
+            name="with_email",
+            field=models.BigIntegerField(
+                default=0, verbose_name="이메일 보유 연락처 수"
+            ),
+        ),
+        migrations.AddField(
+            model_name="contactstatistics",
+            name="with_phone",
+            field=models.BigIntegerField(
+                default=0, verbose_name="전화번호 보유 연락처 수"
+            ),
+        ),
+        migrations.RunPython(backfill_statistics, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 4.2.7 on 2026-10-17 04:10
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_contact_counts(apps, schema_editor):
+    """
+    기존 라벨의 연락처 수를 중간 테이블 집계로 채웁니다
+    """
+    Label = apps.get_model("contacts", "Label")
+    Contact = apps.get_model("contacts", "Contact")
+    db_alias = schema_editor.connection.alias
+    counts = (
+        Contact.labels.through.objects.using(db_alias)
+        .values_list("label_id")
+        .annotate(count=Count("*"))
+        .order_by()
+    )
+    for label_id, count in counts:
+        Label.objects.using(db_alias).filter(id=label_id).update(contact_count=count)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contacts", "0008_contact_statistics_fields"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="label",
+            name="contact_count",
+            field=models.IntegerField(
+                default=0, editable=False, verbose_name="연락처 수"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="label",
+            index=models.Index(
+                fields=["-contact_count", "name"], name="contract_label_count_idx"
+            ),
+        ),
+        migrations.RunPython(backfill_contact_counts, migrations.RunPython.noop),
+    ]
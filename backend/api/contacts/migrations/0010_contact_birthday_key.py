@@ -0,0 +1,38 @@
+# Generated by Django 4.2.7 on 2026-10-17 04:13
+
+from django.db import migrations, models
+from django.db.models.functions import ExtractDay, ExtractMonth
+
+
+def backfill_birthday_keys(apps, schema_editor):
+    """
+    기존 연락처의 생일 키(월 * 100 + 일)를 UPDATE 한 번으로 채웁니다
+    """
+    Contact = apps.get_model("contacts", "Contact")
+    Contact.objects.using(schema_editor.connection.alias).filter(
+        birthday__isnull=False
+    ).update(birthday_key=ExtractMonth("birthday") * 100 + ExtractDay("birthday"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contacts", "0009_label_contact_count"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="contact",
+            name="birthday_key",
+            field=models.PositiveSmallIntegerField(
+                blank=True, editable=False, null=True, verbose_name="생일 키"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="contact",
+            index=models.Index(
+                fields=["birthday_key"], name="idx_contact_birthday_key"
+            ),
+        ),
+        migrations.RunPython(backfill_birthday_keys, migrations.RunPython.noop),
+    ]
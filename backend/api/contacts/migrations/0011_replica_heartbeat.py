@@ -0,0 +1,33 @@
+# Generated by Django 4.2.7 on 2026-10-17 04:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contacts", "0010_contact_birthday_key"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReplicaHeartbeat",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("beat_at", models.DateTimeField(verbose_name="기록 시각")),
+            ],
+            options={
+                "verbose_name": "복제본 하트비트",
+                "verbose_name_plural": "복제본 하트비트",
+                "db_table": "contracts_replica_heartbeat",
+            },
+        ),
+    ]
@@ -0,0 +1,128 @@
+# Generated by Django 4.2.7 on 2026-10-17 04:56
+
+import api.contacts.addressbooks
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contacts", "0011_replica_heartbeat"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AddressBookShard",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "address_book",
+                    models.CharField(max_length=64, unique=True, verbose_name="주소록"),
+                ),
+                ("alias", models.CharField(max_length=100, verbose_name="DB 별칭")),
+                (
+                    "read_only",
+                    models.BooleanField(
+                        default=False,
+                        help_text="다른 샤드로 옮기는 중",
+                        verbose_name="읽기 전용",
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정일"),
+                ),
+            ],
+            options={
+                "verbose_name": "주소록 샤드",
+                "verbose_name_plural": "주소록 샤드",
+                "db_table": "contracts_address_book_shard",
+            },
+        ),
+        migrations.AddField(
+            model_name="companycounter",
+            name="address_book",
+            field=api.contacts.addressbooks.AddressBookField(
+                default=api.contacts.addressbooks.current_address_book,
+                editable=False,
+                max_length=64,
+                verbose_name="주소록",
+            ),
+        ),
+        migrations.AddField(
+            model_name="contact",
+            name="address_book",
+            field=api.contacts.addressbooks.AddressBookField(
+                default=api.contacts.addressbooks.current_address_book,
+                editable=False,
+                max_length=64,
+                verbose_name="주소록",
+            ),
+        ),
+        migrations.AddField(
+            model_name="contactimportjob",
+            name="address_book",
+            field=api.contacts.addressbooks.AddressBookField(
+                default=api.contacts.addressbooks.current_address_book,
+                editable=False,
+                max_length=64,
+                verbose_name="주소록",
+            ),
+        ),
+        migrations.AddField(
+            model_name="contactstatistics",
+            name="address_book",
+            field=api.contacts.addressbooks.AddressBookField(
+                default=api.contacts.addressbooks.current_address_book,
+                editable=False,
+                max_length=64,
+                unique=True,
+                verbose_name="주소록",
+            ),
+        ),
+        migrations.AddField(
+            model_name="label",
+            name="address_book",
+            field=api.contacts.addressbooks.AddressBookField(
+                default=api.contacts.addressbooks.current_address_book,
+                editable=False,
+                max_length=64,
+                verbose_name="주소록",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="companycounter",
+            name="company",
+            field=models.CharField(max_length=100, verbose_name="회사"),
+        ),
+        migrations.AlterField(
+            model_name="label",
+            name="name",
+            field=models.CharField(
+                help_text="연락처 분류용 라벨명 (예: 가족, 친구, 회사)",
+                max_length=50,
+                verbose_name="라벨명",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="companycounter",
+            constraint=models.UniqueConstraint(
+                fields=("address_book", "company"),
+                name="contracts_company_counter_book_uniq",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="label",
+            constraint=models.UniqueConstraint(
+                fields=("address_book", "name"), name="contract_label_book_name_uniq"
+            ),
+        ),
+    ]
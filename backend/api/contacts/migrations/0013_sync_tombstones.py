@@ -0,0 +1,70 @@
+# Generated by Django 4.2.7 on 2026-10-17 05:07
+
+import api.contacts.addressbooks
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contacts", "0012_address_book_shards"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SyncTombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "address_book",
+                    api.contacts.addressbooks.AddressBookField(
+                        default=api.contacts.addressbooks.current_address_book,
+                        editable=False,
+                        max_length=64,
+                        verbose_name="주소록",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[("contact", "연락처"), ("label", "라벨")],
+                        max_length=10,
+                        verbose_name="종류",
+                    ),
+                ),
+                ("object_id", models.BigIntegerField(verbose_name="삭제된 ID")),
+                (
+                    "deleted_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="삭제일"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "삭제 기록",
+                "verbose_name_plural": "삭제 기록",
+                "db_table": "contracts_sync_tombstone",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="contact",
+            index=models.Index(
+                fields=["updated_at", "id"], name="idx_contact_updated_id"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="synctombstone",
+            index=models.Index(
+                fields=["deleted_at", "id"], name="idx_tombstone_deleted_id"
+            ),
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 4.2.7 on 2026-10-17 05:10
+
+from django.db import migrations, models
+
+from api.contacts.normalizers import name_company_key, normalize_email
+
+
+def backfill_duplicate_keys(apps, schema_editor):
+    """
+    기존 연락처의 중복 찾기 블로킹 키 컬럼을 채웁니다 (2000개 단위로 일괄 수정)
+    """
+    Contact = apps.get_model("contacts", "Contact")
+    db_alias = schema_editor.connection.alias
+    fields = ["email_key", "name_key"]
+    batch = []
+    contacts = Contact.objects.using(db_alias).only("id", "name", "email", "company")
+    for contact in contacts.iterator(chunk_size=2000):
+        contact.email_key = normalize_email(contact.email)
+        contact.name_key = name_company_key(contact.name, contact.company)
+        batch.append(contact)
+        if len(batch) >= 2000:
+            Contact.objects.using(db_alias).bulk_update(batch, fields)
+            batch = []
+    if batch:
+        Contact.objects.using(db_alias).bulk_update(batch, fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contacts", "0013_sync_tombstones"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="contact",
+            name="email_key",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                max_length=254,
+                verbose_name="정규화 이메일",
+            ),
+        ),
+        migrations.AddField(
+            model_name="contact",
+            name="name_key",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                max_length=201,
+                verbose_name="이름+회사 키",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="contact",
+            index=models.Index(fields=["email_key"], name="idx_contact_email_key"),
+        ),
+        migrations.AddIndex(
+            model_name="contact",
+            index=models.Index(fields=["name_key"], name="idx_contact_name_key"),
+        ),
+        migrations.RunPython(backfill_duplicate_keys, migrations.RunPython.noop),
+    ]
@@ -1,14 +1,34 @@
+# 비동기 코드에서 동기 함수를 실행하는 도구를 가져옵니다
+from asgiref.sync import sync_to_async
 # Django의 유효성 검사 도구를 가져옵니다
 from django.core.validators import RegexValidator
 # Django의 데이터베이스 모델링 도구를 가져옵니다
-from django.db import models
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, models, router, transaction
+from django.db.models import DEFERRED, Count, F, Q
+from django.utils import timezone
+
+# 현재 앱의 정규화 함수들과 주소록 범위 도구를 가져옵니다
+from .addressbooks import (
+    ADDRESS_BOOK_MAX_LENGTH,
+    AddressBookField,
+    AddressBookManager,
+    current_address_book,
+)
+from .birthdays import birthday_key
+from .normalizers import (
+    choseong_key,
+    name_company_key,
+    normalize_email,
+    normalize_phone,
+)
 
 
 # 라벨 모델 정의 - 연락처를 분류하기 위한 태그 역할
 class Label(models.Model):
+    # 라벨이 속한 주소록 (라벨명은 주소록 안에서만 고유)
+    address_book = AddressBookField()
     name = models.CharField(
         max_length=50,
-        unique=True,
         verbose_name="라벨명",
         help_text="연락처 분류용 라벨명 (예: 가족, 친구, 회사)",
     )
@@ -21,20 +41,155 @@ class Label(models.Model):
         verbose_name="색상",
         help_text="라벨 색상 (HEX 코드, 예: #FF0000",
     )
+    # 연결된 연락처 수 (라벨 연결이 바뀔 때 증감시키는 값, 통계 조회 시 COUNT 없이 사용)
+    contact_count = models.IntegerField(
+        default=0, editable=False, verbose_name="연락처 수"
+    )
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
 
+    # 현재 주소록의 라벨만 조회하는 매니저
+    objects = AddressBookManager()
+
     class Meta:
         db_table = "contract_label"
         verbose_name = "라벨"
         verbose_name_plural = verbose_name
         ordering = ["name"]
+        indexes = [
+            # 라벨 통계(연락처 수 많은 순) 정렬용 인덱스
+            models.Index(fields=["-contact_count", "name"], name="contract_label_count_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["address_book", "name"], name="contract_label_book_name_uniq"
+            ),
+        ]
 
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        """
+        기존 라벨을 수정할 때는 연락처 수를 저장 대상에서 제외합니다
+        (먼저 읽어 둔 객체를 저장할 때 그 사이 증감된 값을 덮어쓰지 않도록)
+        """
+        if (
+            kwargs.get("update_fields") is None
+            and not self._state.adding
+            and not kwargs.get("force_insert")
+        ):
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != "contact_count"
+            ]
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def adjust_contact_counts(cls, deltas):
+        """
+        라벨별 연락처 수를 증감시킵니다
+        deltas: {라벨 ID: 증감값}, 같은 증감값인 라벨들은 UPDATE 한 번으로 묶습니다
+        """
+        by_delta = {}
+        for label_id, delta in deltas.items():
+            if delta:
+                by_delta.setdefault(delta, []).append(label_id)
+        for delta, label_ids in by_delta.items():
+            cls.objects.filter(id__in=label_ids).update(
+                contact_count=F("contact_count") + delta
+            )
+
+    @classmethod
+    def rebuild_contact_counts(cls):
+        """
+        연락처-라벨 중간 테이블을 집계해서 현재 주소록 라벨들의 연락처 수를 다시 계산합니다
+        반환값: 값이 달랐던 라벨 수
+        """
+        actual = dict(
+            cls.contacts.through.objects.filter(label_id__in=cls.objects.values("id"))
+            .values_list("label_id")
+            .annotate(count=Count("*"))
+            .order_by()
+        )
+        drifted = [
+            label
+            for label in cls.objects.only("id", "contact_count")
+            if label.contact_count != actual.get(label.id, 0)
+        ]
+        for label in drifted:
+            label.contact_count = actual.get(label.id, 0)
+        cls.objects.bulk_update(drifted, ["contact_count"], batch_size=500)
+        return len(drifted)
+
+
+# 연락처 통계 집계에 사용하는 필드들 (이 필드가 바뀌면 통계 카운터를 증감)
+STATISTICS_FIELDS = ("email", "phone", "birthday", "company")
+
+
+def statistics_values_of(values):
+    """
+    필드 값 딕셔너리로 통계 집계 값을 계산합니다
+    NULL과 빈 문자열은 모두 "없음"으로 취급합니다
+    """
+    return {
+        "with_email": bool(values["email"]),
+        "with_phone": bool(values["phone"]),
+        "with_birthday": values["birthday"] is not None,
+        "company": values["company"] or None,
+    }
+
+
+def company_with_position(company, position):
+    """
+    회사명과 직책을 조합한 표시 문자열 (예: "가나상사 (과장)")
+    모델 객체 없이 values() 결과로도 계산할 수 있도록 함수로 분리
+    """
+    if company and position:
+        return f"{company} ({position})"
+    elif company:
+        return f"{company}"
+    elif position:
+        return f"{position}"
+    return ""
+
+
+# 연락처 쿼리셋: 일괄 처리(bulk) 경로에서도 파생 컬럼을 채우도록 확장
+class ContactQuerySet(models.QuerySet):
+    def bulk_create(self, objs, *args, **kwargs):
+        """
+        save()를 거치지 않는 bulk_create에서도 파생 컬럼(정규화 전화번호 등)을 채웁니다
+        """
+        objs = list(objs)
+        for obj in objs:
+            obj.fill_derived_fields()
+        return super().bulk_create(objs, *args, **kwargs)
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        """
+        원본 필드가 수정 대상에 포함되면 해당 파생 컬럼도 함께 다시 계산해서 저장합니다
+        """
+        objs = list(objs)
+        for obj in objs:
+            obj.fill_derived_fields()
+        fields = Contact.with_derived_fields(fields)
+        return super().bulk_update(objs, fields, *args, **kwargs)
+
 
 class Contact(models.Model):
+    # 원본 필드 -> 저장 시 자동으로 계산되는 파생 컬럼들
+    DERIVED_FIELDS = {
+        "name": ("name_choseong", "name_key"),
+        "email": ("email_key",),
+        "phone": ("phone_digits", "phone_digits_reversed"),
+        "company": ("name_key",),
+        "birthday": ("birthday_key",),
+    }
+
+    # 연락처가 속한 주소록
+    address_book = AddressBookField()
+
     name = models.CharField(
         max_length=100, verbose_name="이름", help_text="연락처 이름 (필수)"
     )
@@ -87,9 +242,71 @@ class Contact(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
 
+    # 파생 컬럼 (저장 시 자동 계산, 직접 수정하지 않음)
+    # 이름의 초성 검색 키: 초성 검색의 앞자리 범위 검색용 (예: "홍길동" -> "ㅎㄱㄷ")
+    name_choseong = models.CharField(
+        max_length=100,
+        blank=True,
+        default="",
+        editable=False,
+        verbose_name="초성 검색 키",
+    )
+    # 숫자만 남긴 전화번호: 정확히 일치/앞자리 검색용 (예: "01012345678")
+    phone_digits = models.CharField(
+        max_length=20,
+        blank=True,
+        default="",
+        editable=False,
+        verbose_name="정규화 전화번호",
+    )
+    # 숫자를 뒤집은 전화번호: 뒷자리 검색을 앞자리 범위 검색으로 처리 (예: "87654321010")
+    phone_digits_reversed = models.CharField(
+        max_length=20,
+        blank=True,
+        default="",
+        editable=False,
+        verbose_name="역순 전화번호",
+    )
+
+    # 생일의 월 * 100 + 일 (예: 3월 5일 -> 305): 월별/다가오는 생일을 인덱스 범위로 검색
+    birthday_key = models.PositiveSmallIntegerField(
+        blank=True, null=True, editable=False, verbose_name="생일 키"
+    )
+
+    # 중복 연락처 찾기의 블로킹 키 (duplicates 모듈, 같은 키끼리만 비교)
+    # 정규화 이메일: 앞뒤 공백 제거, 소문자 (예: "kim@example.com")
+    email_key = models.CharField(
+        max_length=254,
+        blank=True,
+        default="",
+        editable=False,
+        verbose_name="정규화 이메일",
+    )
+    # 이름+회사 키: 공백/문장부호/법인 표기 제거 (예: "홍길동|가나상사")
+    name_key = models.CharField(
+        max_length=201,
+        blank=True,
+        default="",
+        editable=False,
+        verbose_name="이름+회사 키",
+    )
+
+    # 연결된 라벨의 id/name/color 복사본 (목록 API에서 라벨 조회 쿼리 없이 표시하기 위함)
+    # 라벨 연결/라벨 수정/라벨 삭제 시 snapshots.refresh_label_snapshots()로 다시 계산
+    label_snapshot = models.JSONField(
+        default=list, blank=True, editable=False, verbose_name="라벨 스냅샷"
+    )
+
+    # 현재 주소록의 연락처만 조회하고, 일괄 처리에서도 파생 컬럼을 채우는 커스텀 매니저
+    objects = AddressBookManager.from_queryset(ContactQuerySet)()
+
     # 관계
     labels = models.ManyToManyField(
-        Label, blank=True, verbose_name="라벨", help_text="연락처 연결 라벨"
+        Label,
+        blank=True,
+        related_name="contacts",
+        verbose_name="라벨",
+        help_text="연락처 연결 라벨",
     )
 
     class Meta:
@@ -102,17 +319,509 @@ class Contact(models.Model):
             models.Index(fields=["email"], name="idx_contact_email"),
             models.Index(fields=["phone"], name="idx_contact_phone"),
             models.Index(fields=["created_at"], name="idx_contact_created_at"),
+            models.Index(fields=["name_choseong"], name="idx_contact_name_choseong"),
+            models.Index(fields=["phone_digits"], name="idx_contact_phone_digits"),
+            models.Index(
+                fields=["phone_digits_reversed"], name="idx_contact_phone_rev"
+            ),
+            models.Index(fields=["birthday_key"], name="idx_contact_birthday_key"),
+            models.Index(fields=["email_key"], name="idx_contact_email_key"),
+            models.Index(fields=["name_key"], name="idx_contact_name_key"),
+            # 동기화 피드: (수정일, id) 순서로 변경분을 이어서 읽음
+            # (주소록을 앞에 두면 주소록 조건만 있는 다른 검색도 이 인덱스를 골라서 주소록은 행마다 확인)
+            models.Index(fields=["updated_at", "id"], name="idx_contact_updated_id"),
         ]
 
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        """
+        저장 전에 파생 컬럼을 계산합니다
+        update_fields로 일부 필드만 저장할 때도 관련 파생 컬럼을 함께 저장합니다
+        기존 연락처를 수정할 때는 라벨 스냅샷을 저장 대상에서 제외합니다
+        """
+        self.fill_derived_fields()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = self.with_derived_fields(update_fields)
+        elif not self._state.adding and not kwargs.get("force_insert"):
+            # 라벨 스냅샷은 라벨 연결이 바뀔 때 따로 저장하므로,
+            # 먼저 읽어 둔 객체를 저장할 때 오래된 스냅샷으로 덮어쓰지 않도록 제외
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != "label_snapshot"
+            ]
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        데이터베이스에서 읽은 통계 관련 필드 값을 보관합니다
+        수정 후 저장할 때 이전 값과 비교해서 통계 카운터를 증감하는 데 사용합니다
+        """
+        instance = super().from_db(db, field_names, values)
+        loaded = dict(zip(field_names, values))
+        if all(loaded.get(field, DEFERRED) is not DEFERRED for field in STATISTICS_FIELDS):
+            instance._statistics_values = {field: loaded[field] for field in STATISTICS_FIELDS}
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None):
+        """
+        다시 읽은 값으로 객체를 갱신합니다
+        통계 관련 필드가 바뀌었을 수 있으므로 보관한 이전 값은 버립니다 (저장 직전에 다시 읽음)
+        """
+        super().refresh_from_db(using=using, fields=fields)
+        if fields is None or set(fields) & set(STATISTICS_FIELDS):
+            self.__dict__.pop("_statistics_values", None)
+
+    def statistics_field_values(self):
+        """
+        통계 관련 필드의 현재 값 (저장하지 않은 변경 포함)
+        """
+        return {field: getattr(self, field) for field in STATISTICS_FIELDS}
+
+    def fill_derived_fields(self):
+        """
+        원본 필드 값으로 파생 컬럼들을 계산합니다
+        """
+        self.name_choseong = choseong_key(self.name)
+        self.name_key = name_company_key(self.name, self.company)
+        self.email_key = normalize_email(self.email)
+        self.phone_digits = normalize_phone(self.phone)
+        self.phone_digits_reversed = self.phone_digits[::-1]
+        # 문자열로 지정한 생일(예: "1990-05-01")도 날짜로 변환해서 계산
+        self.birthday_key = birthday_key(
+            self._meta.get_field("birthday").to_python(self.birthday)
+        )
+
+    @classmethod
+    def with_derived_fields(cls, fields):
+        """
+        필드 목록에 원본 필드가 있으면 해당 파생 컬럼들을 추가한 목록을 반환합니다
+        """
+        fields = list(fields)
+        for source, derived in cls.DERIVED_FIELDS.items():
+            if source in fields:
+                fields.extend(field for field in derived if field not in fields)
+        return fields
+
+    @classmethod
+    def derives_only_from(cls, fields):
+        """
+        fields의 값만으로 관련 파생 컬럼 값이 모두 정해지는지 여부
+        (이름+회사 키처럼 fields에 없는 원본 필드도 사용하는 파생 컬럼이 있으면 False)
+        """
+        fields = set(fields)
+        columns = set(cls.with_derived_fields(fields)) - fields
+        return all(
+            source in fields
+            for source, derived in cls.DERIVED_FIELDS.items()
+            if columns.intersection(derived)
+        )
+
     @property
     def company_with_position(self):
-        if self.company and self.position:
-            return f"{self.company} ({self.position})"
-        elif self.company:
-            return f"{self.company}"
-        elif self.position:
-            return f"{self.position}"
-        return ""
+        return company_with_position(self.company, self.position)
+
+
+# 연락처 집계 값을 미리 계산해서 저장하는 모델 (주소록별 한 행)
+class ContactStatistics(models.Model):
+    """
+    연락처 수 등의 집계 값을 주소록별로 한 행씩 저장하는 테이블
+    연락처 생성/수정/삭제 시그널과 일괄 처리 경로에서 증감시키므로 COUNT(*) 없이 바로 읽을 수 있습니다
+    """
+
+    # 통계 API에서 반환하는 집계 값들
+    FIELDS = ["total_contacts", "with_email", "with_phone", "with_birthday", "companies"]
+
+    address_book = AddressBookField(unique=True)
+
+    total_contacts = models.BigIntegerField(default=0, verbose_name="전체 연락처 수")
+    with_email = models.BigIntegerField(default=0, verbose_name="이메일 보유 연락처 수")
+    with_phone = models.BigIntegerField(default=0, verbose_name="전화번호 보유 연락처 수")
+    with_birthday = models.BigIntegerField(default=0, verbose_name="생일 등록 연락처 수")
+    companies = models.BigIntegerField(default=0, verbose_name="서로 다른 회사 수")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
+
+    # 현재 주소록의 통계 행만 조회하는 매니저
+    objects = AddressBookManager()
+
+    class Meta:
+        db_table = "contracts_contact_statistics"
+        verbose_name = "연락처 통계"
+        verbose_name_plural = verbose_name
+
+    @classmethod
+    def load(cls):
+        """
+        현재 주소록의 통계 행을 반환합니다 (행이 없으면 실제 데이터로 다시 계산해서 생성)
+        """
+        statistics = cls.objects.first()
+        if statistics is None:
+            statistics = cls.rebuild()
+        return statistics
+
+    @classmethod
+    async def aload(cls):
+        """
+        load()의 비동기 버전 (비동기 뷰에서 사용)
+        """
+        statistics = await cls.objects.afirst()
+        if statistics is None:
+            # 행이 없는 경우는 드물므로 다시 계산은 동기 코드(트랜잭션)를 스레드에서 실행
+            statistics = await sync_to_async(cls.rebuild)()
+        return statistics
+
+    @classmethod
+    def compute(cls):
+        """
+        연락처 테이블을 한 번만 훑어서 모든 집계 값을 정확히 계산합니다
+        (조건부 COUNT로 전체/이메일/전화번호/생일/회사 수를 한 쿼리에서 계산)
+        """
+        return Contact.objects.aggregate(**cls.aggregates())
+
+    @classmethod
+    async def acompute(cls):
+        """
+        compute()의 비동기 버전
+        """
+        return await Contact.objects.aaggregate(**cls.aggregates())
+
+    @classmethod
+    def aggregates(cls):
+        """
+        통계 값별 집계 식
+        """
+        return {
+            "total_contacts": Count("id"),
+            "with_email": Count("id", filter=Q(email__isnull=False) & ~Q(email="")),
+            "with_phone": Count("id", filter=Q(phone__isnull=False) & ~Q(phone="")),
+            "with_birthday": Count("id", filter=Q(birthday__isnull=False)),
+            # COUNT(DISTINCT company)는 NULL을 제외하므로 빈 문자열만 추가로 제외
+            "companies": Count("company", filter=~Q(company=""), distinct=True),
+        }
+
+    @classmethod
+    def rebuild(cls):
+        """
+        현재 주소록의 연락처를 집계해서 통계 행과 회사별 카운터를 다시 계산합니다
+        """
+        with transaction.atomic(using=router.db_for_write(cls)):
+            CompanyCounter.rebuild()
+            statistics, _ = cls.objects.update_or_create(
+                address_book=current_address_book(), defaults=cls.compute()
+            )
+        return statistics
+
+    @classmethod
+    def adjust(cls, **deltas):
+        """
+        통계 값을 증감시킵니다 (예: adjust(total_contacts=-1))
+        F() 표현식으로 데이터베이스에서 직접 계산하므로 동시 요청에도 값이 유실되지 않습니다
+        """
+        changes = {field: F(field) + delta for field, delta in deltas.items() if delta}
+        if changes:
+            cls.objects.update(**changes)
+
+    @classmethod
+    def apply_changes(cls, changes):
+        """
+        연락처 변경 목록을 통계 값 증감으로 반영합니다
+        changes: [(변경 전 통계 집계 값, 변경 후 통계 집계 값)] 목록
+                 생성은 (None, 값), 삭제는 (값, None)
+        """
+        deltas = {field: 0 for field in cls.FIELDS}
+        company_deltas = {}
+        for before, after in changes:
+            for values, sign in ((before, -1), (after, 1)):
+                if values is None:
+                    continue
+                deltas["total_contacts"] += sign
+                for field in ("with_email", "with_phone", "with_birthday"):
+                    if values[field]:
+                        deltas[field] += sign
+                if values["company"]:
+                    company = values["company"]
+                    company_deltas[company] = company_deltas.get(company, 0) + sign
+        deltas["companies"] = CompanyCounter.adjust(company_deltas)
+        cls.adjust(**deltas)
+
+    def as_dict(self):
+        """
+        통계 API 응답용 딕셔너리
+        """
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+
+# 회사별 연락처 수 (서로 다른 회사 수를 증감으로 관리하기 위한 보조 테이블)
+class CompanyCounter(models.Model):
+    """
+    주소록의 회사명별 연락처 수를 저장합니다 (연락처가 1명 이상인 회사만 행이 있음)
+    회사의 연락처 수가 0 -> 1이 되거나 1 -> 0이 될 때 ContactStatistics.companies를 증감합니다
+    """
+
+    address_book = AddressBookField()
+    company = models.CharField(max_length=100, verbose_name="회사")
+    contact_count = models.BigIntegerField(default=0, verbose_name="연락처 수")
+
+    # 현재 주소록의 카운터만 조회하는 매니저
+    objects = AddressBookManager()
+
+    class Meta:
+        db_table = "contracts_company_counter"
+        verbose_name = "회사별 연락처 수"
+        verbose_name_plural = verbose_name
+        constraints = [
+            models.UniqueConstraint(
+                fields=["address_book", "company"],
+                name="contracts_company_counter_book_uniq",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.company} ({self.contact_count})"
+
+    @classmethod
+    def adjust(cls, deltas):
+        """
+        회사별 연락처 수를 증감시키고, 서로 다른 회사 수의 변화량을 반환합니다
+        deltas: {회사명: 증감값}
+        같은 증감값인 회사들은 UPDATE 한 번으로 묶습니다
+        """
+        deltas = {company: delta for company, delta in deltas.items() if delta}
+        if not deltas:
+            return 0
+
+        increased = [company for company, delta in deltas.items() if delta > 0]
+        if increased:
+            cls.objects.bulk_create(
+                [cls(company=company) for company in increased], ignore_conflicts=True
+            )
+        by_delta = {}
+        for company, delta in deltas.items():
+            by_delta.setdefault(delta, []).append(company)
+        for delta, companies in by_delta.items():
+            cls.objects.filter(company__in=companies).update(
+                contact_count=F("contact_count") + delta
+            )
+
+        after = dict(
+            cls.objects.filter(company__in=deltas).values_list("company", "contact_count")
+        )
+        if any(count <= 0 for count in after.values()):
+            cls.objects.filter(company__in=deltas, contact_count__lte=0).delete()
+        # 변경 전 값 = 변경 후 값 - 증감값
+        return sum(
+            (after.get(company, 0) > 0) - (after.get(company, 0) - delta > 0)
+            for company, delta in deltas.items()
+        )
+
+    @classmethod
+    def rebuild(cls):
+        """
+        연락처 테이블을 회사별로 집계해서 카운터를 다시 만듭니다
+        """
+        cls.objects.all().delete()
+        rows = (
+            Contact.objects.exclude(company__isnull=True)
+            .exclude(company="")
+            .values_list("company")
+            .annotate(count=Count("id"))
+            .order_by()
+        )
+        cls.objects.bulk_create(
+            (cls(company=company, contact_count=count) for company, count in rows),
+            batch_size=1000,
+        )
+
+
+# 연락처 가져오기(CSV/vCard 업로드) 작업 모델
+class ContactImportJob(models.Model):
+    """
+    업로드된 파일을 백그라운드에서 가져오는 작업의 상태와 진행 상황을 저장합니다
+    GET /contacts/imports/{id}/ 로 처리/실패/건너뛴 행 수를 조회할 수 있습니다
+    """
+
+    # 작업 상태
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_COMPLETED = "completed"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "대기"),
+        (STATUS_RUNNING, "진행 중"),
+        (STATUS_COMPLETED, "완료"),
+        (STATUS_FAILED, "실패"),
+    ]
+
+    # 파일 형식
+    TYPE_CSV = "csv"
+    TYPE_VCARD = "vcard"
+    TYPE_CHOICES = [(TYPE_CSV, "CSV"), (TYPE_VCARD, "vCard")]
+
+    # 작업을 요청한 주소록 (가져온 연락처도 이 주소록에 저장)
+    address_book = AddressBookField()
+    file_name = models.CharField(max_length=255, verbose_name="파일명")
+    file_type = models.CharField(
+        max_length=10, choices=TYPE_CHOICES, verbose_name="파일 형식"
+    )
+    dry_run = models.BooleanField(
+        default=False,
+        verbose_name="미리보기",
+        help_text="저장하지 않고 변경될 내용만 집계",
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING,
+        verbose_name="상태",
+    )
+    # 업로드 파일을 작업이 끝날 때까지 보관하는 임시 파일 경로
+    source_path = models.CharField(
+        max_length=500, blank=True, editable=False, verbose_name="임시 파일 경로"
+    )
+    processed_rows = models.PositiveIntegerField(default=0, verbose_name="처리한 행 수")
+    created_rows = models.PositiveIntegerField(default=0, verbose_name="생성한 행 수")
+    failed_rows = models.PositiveIntegerField(default=0, verbose_name="실패한 행 수")
+    skipped_rows = models.PositiveIntegerField(
+        default=0, verbose_name="건너뛴 행 수", help_text="빈 행, 이미 있는 연락처"
+    )
+    created_labels = models.PositiveIntegerField(
+        default=0, verbose_name="생성한 라벨 수"
+    )
+    # 실패한 행의 오류 내용 (앞부분 일부만 보관)
+    errors = models.JSONField(default=list, blank=True, verbose_name="오류 목록")
+    message = models.TextField(blank=True, verbose_name="작업 실패 사유")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
+    started_at = models.DateTimeField(null=True, blank=True, verbose_name="시작일")
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name="종료일")
+
+    # 현재 주소록의 작업만 조회하는 매니저
+    objects = AddressBookManager()
+
+    class Meta:
+        db_table = "contracts_contact_import_job"
+        verbose_name = "연락처 가져오기 작업"
+        verbose_name_plural = verbose_name
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"{self.file_name} ({self.get_status_display()})"
+
+
+# 삭제 기록 (동기화 피드의 툼스톤)
+class SyncTombstone(models.Model):
+    """
+    삭제된 연락처/라벨의 ID와 삭제 시각을 저장하는 테이블
+    행이 없어진 삭제는 수정일로 찾을 수 없으므로, 동기화 피드(sync 모듈)가 이 기록으로 오프라인 클라이언트에 삭제를 알립니다
+    보관 기간(settings.CONTACTS_SYNC_TOMBSTONE_DAYS)이 지난 행은 compact_sync_tombstones 명령으로 정리합니다
+    """
+
+    # 삭제된 객체 종류
+    KIND_CONTACT = "contact"
+    KIND_LABEL = "label"
+    KIND_CHOICES = [(KIND_CONTACT, "연락처"), (KIND_LABEL, "라벨")]
+
+    address_book = AddressBookField()
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES, verbose_name="종류")
+    object_id = models.BigIntegerField(verbose_name="삭제된 ID")
+    deleted_at = models.DateTimeField(default=timezone.now, verbose_name="삭제일")
+
+    # 현재 주소록의 삭제 기록만 조회하는 매니저
+    objects = AddressBookManager()
+
+    class Meta:
+        db_table = "contracts_sync_tombstone"
+        verbose_name = "삭제 기록"
+        verbose_name_plural = verbose_name
+        indexes = [
+            # 동기화 피드는 (삭제일, id) 순서로 이어서 읽고, 정리는 삭제일 범위로 삭제
+            models.Index(fields=["deleted_at", "id"], name="idx_tombstone_deleted_id"),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.object_id}"
+
+    @classmethod
+    def record(cls, kind, object_ids):
+        """
+        삭제된 객체들의 삭제 기록을 추가합니다 (삭제와 같은 트랜잭션에서 INSERT 한 번)
+        """
+        now = timezone.now()
+        cls.objects.bulk_create(
+            [cls(kind=kind, object_id=object_id, deleted_at=now) for object_id in object_ids]
+        )
+
+
+# 복제본 지연 측정용 하트비트 (단일 행)
+class ReplicaHeartbeat(models.Model):
+    """
+    기본 DB에 주기적으로 현재 시각을 기록하는 단일 행(id=1) 테이블
+    복제본에서 이 값을 읽으면 복제본이 기본 DB의 어느 시점까지 반영했는지 알 수 있습니다
+    (지연 = 현재 시각 - 복제본의 beat_at, replica_heartbeat 관리 명령이 기록)
+    """
+
+    # 단일 행의 기본키 값
+    SINGLETON_ID = 1
+
+    beat_at = models.DateTimeField(verbose_name="기록 시각")
+
+    class Meta:
+        db_table = "contracts_replica_heartbeat"
+        verbose_name = "복제본 하트비트"
+        verbose_name_plural = verbose_name
+
+    @classmethod
+    def beat(cls):
+        """
+        기본 DB에 현재 시각을 기록합니다
+        """
+        heartbeat, _ = cls.objects.using(DEFAULT_DB_ALIAS).update_or_create(
+            pk=cls.SINGLETON_ID, defaults={"beat_at": timezone.now()}
+        )
+        return heartbeat
+
+    @classmethod
+    def synced_at(cls, using):
+        """
+        using DB에 기록된 하트비트 시각(유닉스 시간)을 반환합니다
+        행이 없거나 DB를 읽을 수 없으면 None
+        """
+        try:
+            beat_at = (
+                cls.objects.using(using)
+                .filter(pk=cls.SINGLETON_ID)
+                .values_list("beat_at", flat=True)
+                .first()
+            )
+        except DatabaseError:
+            return None
+        return None if beat_at is None else beat_at.timestamp()
+
+
+# 주소록별 DB(샤드) 지정 테이블 (기본 DB에만 있음)
+class AddressBookShard(models.Model):
+    """
+    해시로 정해지는 샤드 대신 사용할 주소록의 DB 별칭을 저장하는 테이블
+    주소록을 다른 샤드로 옮기면(move_address_book 관리 명령) 이 테이블에 새 DB가 기록되고,
+    옮기는 동안에는 read_only로 표시해서 쓰기 요청을 잠시 거절합니다
+    """
+
+    address_book = models.CharField(
+        max_length=ADDRESS_BOOK_MAX_LENGTH, unique=True, verbose_name="주소록"
+    )
+    alias = models.CharField(max_length=100, verbose_name="DB 별칭")
+    read_only = models.BooleanField(
+        default=False, verbose_name="읽기 전용", help_text="다른 샤드로 옮기는 중"
+    )
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
+
+    class Meta:
+        db_table = "contracts_address_book_shard"
+        verbose_name = "주소록 샤드"
+        verbose_name_plural = verbose_name
+
+    def __str__(self):
+        return f"{self.address_book} -> {self.alias}"
@@ -0,0 +1,156 @@
+# 파이썬 표준 라이브러리
+import re
+
+
+# 숫자가 아닌 문자를 찾는 정규식
+NON_DIGIT_RE = re.compile(r"\D")
+
+# 전화번호 형식으로 볼 수 있는 문자열 (숫자, 공백, -, +, 괄호, 점)
+PHONE_LIKE_RE = re.compile(r"^[\d\s\-+().]+$")
+
+
+def normalize_phone(value):
+    """
+    전화번호에서 숫자만 남긴 정규화 값을 반환합니다
+    예: "010-1234-5678" -> "01012345678", "+82 10-1234-5678" -> "01012345678"
+    국가번호 +82로 시작하면 국내 형식(0으로 시작)으로 바꿉니다
+    """
+    if not value:
+        return ""
+    digits = NON_DIGIT_RE.sub("", value)
+    if value.strip().startswith("+82") and digits.startswith("82"):
+        digits = "0" + digits[2:]
+    return digits
+
+
+def is_phone_like(value):
+    """
+    검색어가 전화번호 형식(숫자와 구분자만 포함)인지 확인합니다
+    """
+    return bool(value) and bool(PHONE_LIKE_RE.match(value))
+
+
+# 이름/회사명 중복 비교에서 무시하는 문자 (공백, 문장부호)
+NON_WORD_RE = re.compile(r"[\W_]+")
+
+# 회사명 중복 비교에서 무시하는 법인 표기
+COMPANY_SUFFIX_RE = re.compile(
+    r"주식회사|유한회사|\(주\)|㈜|\b(?:inc|corp|co|ltd|llc)\b\.?", re.IGNORECASE
+)
+
+
+def normalize_email(value):
+    """
+    이메일의 중복 비교 키를 반환합니다 (앞뒤 공백 제거, 소문자)
+    예: " Kim@Example.COM " -> "kim@example.com"
+    """
+    if not value:
+        return ""
+    return value.strip().lower()
+
+
+def compact_text(value):
+    """
+    공백과 문장부호를 제거한 소문자 문자열을 반환합니다
+    예: "Kim, Chul-Soo" -> "kimchulsoo", "홍 길동" -> "홍길동"
+    """
+    if not value:
+        return ""
+    return NON_WORD_RE.sub("", value).lower()
+
+
+def name_company_key(name, company):
+    """
+    이름+회사의 중복 비교 키를 반환합니다 (이름이 없으면 빈 문자열)
+    공백/문장부호/대소문자와 회사명의 법인 표기는 무시합니다
+    예: ("홍 길동", "(주)가나상사") -> "홍길동|가나상사", ("홍길동", None) -> "홍길동|"
+    """
+    name = compact_text(name)
+    if not name:
+        return ""
+    company = compact_text(COMPANY_SUFFIX_RE.sub("", company or ""))
+    return f"{name}|{company}"
+
+
+def prefix_range(prefix):
+    """
+    접두사 검색을 인덱스 범위 조건으로 바꾸기 위한 (하한, 상한) 값을 반환합니다
+    prefix <= 값 < 상한 조건은 LIKE 'prefix%'와 같은 결과이면서 항상 인덱스 범위 검색이 됩니다
+    예: "0101" -> ("0101", "0102")
+    """
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+# 한글 초성 (호환용 자모, 유니코드 음절 조합 순서)
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+
+# 한글 음절 범위와 초성 하나에 해당하는 음절 개수 (중성 21 x 종성 28)
+HANGUL_FIRST, HANGUL_LAST = 0xAC00, 0xD7A3
+SYLLABLES_PER_CHOSEONG = 21 * 28
+
+# 초성 전용 자모(U+1100~U+1112)를 호환용 자모로 바꾸는 변환표
+CHOSEONG_JAMO_MAP = {chr(0x1100 + index): jamo for index, jamo in enumerate(CHOSEONG)}
+
+
+def is_hangul_syllable(char):
+    return HANGUL_FIRST <= ord(char) <= HANGUL_LAST
+
+
+def choseong_of(char):
+    """
+    글자 하나의 초성 검색 키를 반환합니다
+    - 한글 음절: 초성 (예: "홍" -> "ㅎ")
+    - 초성 자모: 호환용 자모로 통일
+    - 그 외: 소문자 (예: "J" -> "j")
+    """
+    if is_hangul_syllable(char):
+        return CHOSEONG[(ord(char) - HANGUL_FIRST) // SYLLABLES_PER_CHOSEONG]
+    return CHOSEONG_JAMO_MAP.get(char, char.lower())
+
+
+def choseong_key(text):
+    """
+    이름의 초성 검색 키를 만듭니다 (공백은 제외)
+    예: "홍길동" -> "ㅎㄱㄷ", "John Kim" -> "johnkim"
+    """
+    if not text:
+        return ""
+    return "".join(choseong_of(char) for char in text if not char.isspace())
+
+
+def choseong_pattern(text):
+    """
+    초성과 완성된 음절이 섞인 검색어를 이름 앞부분과 비교하는 정규식으로 바꿉니다
+    - 초성: 해당 초성으로 시작하는 모든 음절 (예: "ㄱ" -> [ㄱ가-깋])
+    - 음절/기타 글자: 같은 글자
+    - 글자 사이의 공백은 무시
+    예: "홍ㄱ동" -> 홍길동, 홍기동 매칭
+    """
+    parts = []
+    for char in text:
+        if char.isspace():
+            continue
+        jamo = CHOSEONG_JAMO_MAP.get(char, char)
+        if jamo in CHOSEONG:
+            first = HANGUL_FIRST + CHOSEONG.index(jamo) * SYLLABLES_PER_CHOSEONG
+            last = first + SYLLABLES_PER_CHOSEONG - 1
+            parts.append(f"[{jamo}{chr(first)}-{chr(last)}]")
+        else:
+            parts.append(re.escape(char))
+    return r"^\s*" + r"\s*".join(parts)
+
+
+def split_leading_syllables(text):
+    """
+    검색어를 앞쪽의 연속된 한글 음절 부분과 나머지 부분으로 나눕니다
+    예: "김ㅁ수" -> ("김", "ㅁ수"), "ㅎ길동" -> ("", "ㅎ길동")
+    """
+    text = text.strip()
+    index = 0
+    while index < len(text) and is_hangul_syllable(text[index]):
+        index += 1
+    return text[:index], text[index:]
+
+
+def has_hangul_syllable(text):
+    return any(is_hangul_syllable(char) for char in text)
@@ -1,6 +1,104 @@
+# 파이썬 표준 라이브러리 (커서 인코딩/디코딩용)
+import base64
+import json
+
+# Django의 쿼리 조건, 캐시, 페이지 분할 도구를 가져옵니다
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.paginator import EmptyPage, InvalidPage, Page, Paginator
+from django.db.models import Q
+
 # Django REST Framework의 페이지네이션 기능을 가져옵니다
-from rest_framework.pagination import PageNumberPagination  # 페이지 번호 기반 페이지네이션
+from rest_framework.exceptions import NotFound  # 잘못된 커서 요청 시 404 응답
+from rest_framework.pagination import (
+    BasePagination,  # 커스텀 페이지네이션의 기반 클래스
+    PageNumberPagination,  # 페이지 번호 기반 페이지네이션
+    _positive_int,  # page_size 파라미터 검증 헬퍼
+)
 from rest_framework.response import Response  # API 응답 객체
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+# 현재 앱의 캐시 버전 / 복제본 라우팅 도구를 가져옵니다
+from . import caching, replicas
+from .addressbooks import current_address_book
+
+
+# 미리 계산된 개수를 사용하는 Django Paginator
+class CountedPaginator(Paginator):
+    """
+    count 값을 외부(캐시, 통계 카운터)에서 받아 COUNT(*) 쿼리를 생략하는 Paginator
+    count가 None이면 기본 Paginator처럼 COUNT(*)를 실행합니다
+    """
+
+    def __init__(self, object_list, per_page, count=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        if count is not None:
+            # cached_property인 count를 미리 채워 둡니다
+            self.count = count
+
+    async def apage(self, number):
+        """
+        page()의 비동기 버전 (개수를 미리 받은 경우에만 사용 - 페이지 행만 비동기 ORM으로 조회)
+        """
+        page = self.page(number)
+        page.object_list = [row async for row in page.object_list]
+        return page
+
+
+# 전체 개수를 세지 않는 Django Paginator
+class UncountedPaginator(Paginator):
+    """
+    COUNT(*) 없이 page_size + 1개를 조회해서 다음 페이지 존재 여부만 판단하는 Paginator
+    전체 개수와 전체 페이지 수는 알 수 없습니다
+    """
+
+    def validate_number(self, number):
+        # 전체 페이지 수를 모르므로 1 이상의 정수인지만 확인
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise InvalidPage("페이지 번호가 정수가 아닙니다.")
+        if number < 1:
+            raise EmptyPage("페이지 번호가 1보다 작습니다.")
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        rows = list(self.page_rows(number))
+        return self.make_page(rows, number)
+
+    async def apage(self, number):
+        """
+        page()의 비동기 버전 (비동기 ORM으로 page_size + 1개를 조회)
+        """
+        number = self.validate_number(number)
+        rows = [row async for row in self.page_rows(number)]
+        return self.make_page(rows, number)
+
+    def page_rows(self, number):
+        # 다음 페이지 여부를 알기 위해 한 개 더 조회하는 쿼리셋
+        bottom = (number - 1) * self.per_page
+        return self.object_list[bottom : bottom + self.per_page + 1]
+
+    def make_page(self, rows, number):
+        if not rows and number > 1:
+            raise EmptyPage("해당 페이지에 결과가 없습니다.")
+        has_next = len(rows) > self.per_page
+        return UncountedPage(rows[: self.per_page], number, self, has_next)
+
+
+class UncountedPage(Page):
+    """
+    UncountedPaginator가 반환하는 페이지 (다음 페이지 여부를 조회 결과로 판단)
+    """
+
+    def __init__(self, object_list, number, paginator, has_next):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self):
+        return self._has_next
 
 
 # 커스텀 페이지네이션 클래스
@@ -21,12 +119,212 @@ class CustomPageNumberPagination(PageNumberPagination):
     # 한 페이지에 표시할 수 있는 최대 아이템 개수 (서버 보호를 위한 제한)
     max_page_size = 100
 
+    # 전체 개수 계산 방식을 선택하는 쿼리 파라미터 이름
+    # - exact: 정확한 개수 (필터/검색 조건별로 캐시)
+    # - estimated: 필터가 없는 목록에서 통계 카운터 값 사용 (필터가 있으면 exact)
+    # - skip: 개수를 세지 않고 다음 페이지 여부(has_next)만 반환
+    # 예: ?count=skip
+    count_query_param = "count"
+    count_modes = ("exact", "estimated", "skip")
+
+    # 개수 캐시 키(필터 서명)에서 제외할 파라미터들 (개수에 영향이 없는 값)
+    count_ignored_params = (
+        "page",
+        "page_size",
+        "ordering",
+        "count",
+        "cursor",
+        "format",
+    )
+
+    # 페이지 데이터를 조회하는 메소드 (개수 계산 방식 적용)
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        개수 계산 방식에 맞는 Paginator로 현재 페이지 데이터를 조회합니다
+        DRF 기본 구현과 같지만 COUNT(*) 대신 캐시/카운터 값을 사용할 수 있습니다
+        """
+        page_size = self.start(request)
+        if not page_size:
+            return None
+
+        count = None
+        if self.count_mode != "skip":
+            count, self.count_exact = self.get_count(queryset, request, view)
+        paginator = self.make_paginator(queryset, page_size, count)
+        page_number = self.get_page_number(request, paginator)
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            raise self.page_not_found(page_number, exc)
+        self.finish(paginator)
+        return list(self.page)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """
+        paginate_queryset()의 비동기 버전 (비동기 뷰에서 사용)
+        개수(acount)와 페이지 행을 비동기 ORM으로 조회하고, 나머지 동작은 같습니다
+        """
+        page_size = self.start(request)
+        if not page_size:
+            return None
+
+        count = None
+        if self.count_mode != "skip":
+            count, self.count_exact = await self.aget_count(queryset, request, view)
+        paginator = self.make_paginator(queryset, page_size, count)
+        page_number = self.get_page_number(request, paginator)
+        try:
+            self.page = await paginator.apage(page_number)
+        except InvalidPage as exc:
+            raise self.page_not_found(page_number, exc)
+        self.finish(paginator)
+        return list(self.page)
+
+    def start(self, request):
+        """
+        요청의 페이지 크기와 개수 계산 방식을 정합니다 (페이지 크기 반환)
+        """
+        self.request = request
+        self.count_mode = self.get_count_mode(request)
+        self.count_exact = False
+        return self.get_page_size(request)
+
+    def make_paginator(self, queryset, page_size, count):
+        """
+        개수 계산 방식에 맞는 Paginator (skip이면 개수 없이, 아니면 미리 구한 개수 사용)
+        """
+        if self.count_mode == "skip":
+            return UncountedPaginator(queryset, page_size)
+        return CountedPaginator(queryset, page_size, count=count)
+
+    def get_page_number(self, request, paginator):
+        page_number = request.query_params.get(self.page_query_param, 1)
+        if page_number in self.last_page_strings:
+            if self.count_mode == "skip":
+                raise NotFound("count=skip에서는 마지막 페이지를 지정할 수 없습니다.")
+            page_number = paginator.num_pages
+        return page_number
+
+    def page_not_found(self, page_number, exc):
+        msg = self.invalid_page_message.format(
+            page_number=page_number, message=str(exc)
+        )
+        return NotFound(msg)
+
+    def finish(self, paginator):
+        if self.count_mode != "skip" and paginator.num_pages > 1:
+            self.display_page_controls = self.template is not None
+
+    def get_count_mode(self, request):
+        """
+        ?count= 파라미터로 개수 계산 방식을 결정합니다 (잘못된 값이면 기본값)
+        """
+        default = getattr(settings, "CONTACTS_COUNT_MODE", "exact")
+        mode = request.query_params.get(self.count_query_param, default)
+        return mode if mode in self.count_modes else default
+
+    def get_count(self, queryset, request, view):
+        """
+        전체 개수와 정확한 값인지 여부를 반환합니다
+        반환값: (개수, 정확 여부) 튜플
+        """
+        # 이미 계산한 목록(중복 묶음 등)은 길이가 전체 개수
+        if isinstance(queryset, (list, tuple)):
+            return len(queryset), True
+
+        signature = self.get_count_signature(request)
+
+        # 필터가 없는 목록의 추정 개수: 뷰가 제공하는 카운터 값 사용
+        estimate = getattr(view, "get_estimated_count", None)
+        if self.count_mode == "estimated" and not signature and estimate is not None:
+            return estimate(), False
+
+        # 정확한 개수: 뷰가 캐시 네임스페이스를 지정한 경우 필터 서명별로 캐시
+        key = self.get_count_cache_key(view, signature)
+        if key is None:
+            return queryset.count(), True
+        count = cache.get(key)
+        if count is None:
+            count = queryset.count()
+            if self.can_cache_count(queryset, view):
+                cache.set(key, count, self.get_count_cache_timeout())
+        return count, True
+
+    async def aget_count(self, queryset, request, view):
+        """
+        get_count()의 비동기 버전
+        추정 개수는 뷰의 aget_estimated_count()를, 정확한 개수는 acount()를 사용합니다
+        """
+        signature = self.get_count_signature(request)
+
+        estimate = getattr(view, "aget_estimated_count", None)
+        if self.count_mode == "estimated" and not signature and estimate is not None:
+            return await estimate(), False
+
+        key = self.get_count_cache_key(view, signature)
+        if key is None:
+            return await queryset.acount(), True
+        count = await cache.aget(key)
+        if count is None:
+            count = await queryset.acount()
+            if self.can_cache_count(queryset, view):
+                await cache.aset(key, count, self.get_count_cache_timeout())
+        return count, True
+
+    def get_count_signature(self, request):
+        """
+        개수에 영향을 주는 쿼리 파라미터의 서명 (필터가 없으면 빈 값)
+        """
+        return caching.make_signature(
+            request.query_params, ignored=self.count_ignored_params
+        )
+
+    def get_count_cache_key(self, view, signature):
+        """
+        주소록/필터 서명별 개수 캐시 키 (뷰가 캐시 네임스페이스를 지정하지 않았으면 None)
+        """
+        namespace = getattr(view, "count_cache_namespace", None)
+        if namespace is None:
+            return None
+        return "contacts:count:{}:{}:{}:{}".format(
+            current_address_book(),
+            namespace,
+            caching.get_version(namespace),
+            signature or "all",
+        )
+
+    def can_cache_count(self, queryset, view):
+        """
+        계산한 개수를 캐시에 저장해도 되는지 여부
+        최신 변경을 아직 받지 못한 복제본에서 센 개수는 새 버전 키로 저장되면 안 되므로 저장하지 않습니다
+        """
+        changed_at = caching.get_changed_at(view.count_cache_namespace)
+        return replicas.includes_changes(queryset.db, changed_at)
+
+    def get_count_cache_timeout(self):
+        return getattr(settings, "CONTACTS_COUNT_CACHE_TIMEOUT", 300)
+
     # 페이지네이션된 응답을 생성하는 메소드 (DRF 기본 형식을 커스텀)
     def get_paginated_response(self, data):
         """
         페이지네이션 메타데이터를 포함한 전용 응답 형식 생성
         기본 DRF 형식 대신 더 상세한 페이지 정보를 제공
         """
+        if self.count_mode == "skip":
+            # 개수를 세지 않은 경우: 다음 페이지 여부만 제공
+            return Response(
+                {
+                    "pagination": {
+                        "count_exact": False,
+                        "has_next": self.page.has_next(),
+                        "page_size": self.page_size,
+                        "current_page": self.page.number,
+                        "next": self.get_next_link(),
+                        "previous": self.get_previous_link(),
+                    },
+                    "results": data,
+                }
+            )
         return Response(
             {
                 # 페이지네이션 전용 섹션에 모든 메타데이터를 그룹화
@@ -48,9 +346,342 @@ class CustomPageNumberPagination(PageNumberPagination):
                     
                     # 이전 페이지 URL (첫 번째 페이지인 경우 null)
                     "previous": self.get_previous_link(),
+
+                    # count가 정확한 값인지 여부 (estimated 방식이면 false)
+                    "count_exact": self.count_exact,
                 },
                 
                 # 실제 데이터 내용 (연락처 목록)
                 "results": data,
             }
         )
+
+
+# 키셋(커서) 기반 페이지네이션 클래스 - 스크롤 페이징 전용
+class ContactCursorPagination(BasePagination):
+    """
+    연락처 스크롤 페이징을 위한 키셋(커서) 페이지네이션 클래스
+    OFFSET 대신 "마지막으로 본 (정렬값, id)" 위치 이후의 행만 조회하므로
+    페이지가 깊어져도 속도가 일정하고 COUNT(*) 쿼리도 실행하지 않습니다
+    스크롤 도중 연락처가 추가/삭제되어도 중복되거나 건너뛰는 행이 없습니다
+
+    - 첫 페이지: GET /contacts/?cursor=
+    - 다음/이전 페이지: 응답의 pagination.next / pagination.previous URL 사용
+    - 정렬: OrderingFilter가 적용한 첫 번째 정렬 필드 + id(동점 처리)
+    - NULL 값: 오름차순에서는 가장 앞, 내림차순에서는 가장 뒤 (SQLite 인덱스 순서와 동일)
+    """
+
+    # 커서 값을 전달할 쿼리 파라미터 이름
+    cursor_query_param = "cursor"
+
+    # 페이지 크기 설정은 CustomPageNumberPagination과 동일하게 유지
+    page_size = CustomPageNumberPagination.page_size
+    page_size_query_param = CustomPageNumberPagination.page_size_query_param
+    max_page_size = CustomPageNumberPagination.max_page_size
+
+    # 정렬 정보가 없을 때 사용할 기본 정렬 (최신 생성순)
+    default_ordering = "-created_at"
+
+    # 동점(같은 정렬값)일 때 순서를 확정하기 위한 보조 정렬 필드
+    tie_breaker = "id"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        커서 위치 이후의 한 페이지 분량 데이터를 조회합니다
+        page_size + 1개를 가져와서 다음(또는 이전) 페이지 존재 여부를 판단합니다
+        """
+        descending, position = self.start(queryset, request)
+        rows = self.fetch(queryset, descending, position, self.page_size + 1)
+        return self.finish(rows)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """
+        paginate_queryset()의 비동기 버전 (행 조회만 비동기 ORM 사용)
+        """
+        descending, position = self.start(queryset, request)
+        rows = await self.afetch(queryset, descending, position, self.page_size + 1)
+        return self.finish(rows)
+
+    def start(self, queryset, request):
+        """
+        요청의 페이지 크기, 정렬, 커서를 읽어서 (조회 방향, 커서 위치)를 반환합니다
+        """
+        self.request = request
+        self.model = queryset.model
+        self.page_size = self.get_page_size(request)
+        self.field, self.descending = self.get_ordering(queryset)
+        self.nullable = self.is_nullable(queryset.model, self.field)
+
+        # 커서 디코딩 (없으면 첫 페이지)
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is None:
+            position, self.reverse = None, False
+        else:
+            position, self.reverse = self.cursor
+
+        # 이전 페이지 요청이면 정렬 방향을 뒤집어서 조회한 뒤 결과를 다시 뒤집습니다
+        return self.descending != self.reverse, position
+
+    def finish(self, rows):
+        """
+        조회한 page_size + 1개의 행으로 현재 페이지와 다음/이전 링크 상태를 정합니다
+        """
+        reverse = self.reverse
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if reverse:
+            rows.reverse()
+
+        # 다음/이전 링크를 만들기 위한 상태 저장
+        self.has_next = has_more if not reverse else True
+        self.has_previous = has_more if reverse else self.cursor is not None
+        self.first_row = rows[0] if rows else None
+        self.last_row = rows[-1] if rows else None
+        if not rows and self.cursor is not None:
+            # 빈 페이지에서도 되돌아갈 수 있도록 요청받은 커서 위치를 유지
+            self.has_next = reverse
+            self.has_previous = not reverse
+            self.empty_position = self.cursor[0]
+        return rows
+
+    def get_paginated_response(self, data):
+        """
+        CustomPageNumberPagination과 같은 pagination/results 형식으로 응답합니다
+        커서 방식은 전체 개수를 세지 않으므로 count/page_count는 포함하지 않습니다
+        """
+        return Response(
+            {
+                "pagination": {
+                    # 한 페이지당 아이템 개수
+                    "page_size": self.page_size,
+                    # 다음 페이지 URL (마지막 페이지인 경우 null)
+                    "next": self.get_next_link(),
+                    # 이전 페이지 URL (첫 번째 페이지인 경우 null)
+                    "previous": self.get_previous_link(),
+                },
+                "results": data,
+            }
+        )
+
+    def get_page_size(self, request):
+        """
+        ?page_size= 파라미터로 페이지 크기를 결정합니다 (최대 max_page_size)
+        """
+        if self.page_size_query_param:
+            try:
+                return _positive_int(
+                    request.query_params[self.page_size_query_param],
+                    strict=True,
+                    cutoff=self.max_page_size,
+                )
+            except (KeyError, ValueError):
+                pass
+        return self.page_size
+
+    def get_ordering(self, queryset):
+        """
+        쿼리셋에 적용된 첫 번째 정렬 필드와 방향을 반환합니다
+        반환값: ("name", False) 형태의 (필드명, 내림차순 여부) 튜플
+        """
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        first = ordering[0] if ordering else self.default_ordering
+        if not isinstance(first, str):
+            first = self.default_ordering
+        return first.lstrip("-"), first.startswith("-")
+
+    def is_nullable(self, model, field):
+        """
+        정렬 필드가 NULL을 허용하는지 확인합니다
+        모델 필드가 아닌 값(annotate로 추가된 값 등)은 NULL 가능으로 취급합니다
+        """
+        try:
+            return model._meta.get_field(field).null
+        except FieldDoesNotExist:
+            return True
+
+    def get_segments(self, descending, position):
+        """
+        커서 위치 이후의 행을 조회하기 위한 조건 목록을 만듭니다
+        각 조건은 하나의 인덱스 범위 검색으로 처리되며, 앞의 조건부터 순서대로 조회합니다
+        NULL 구간과 값이 있는 구간을 나누어 OR 조건 때문에 인덱스를 못 쓰는 문제를 피합니다
+        """
+        field, pk = self.field, self.tie_breaker
+        is_null = Q(**{f"{field}__isnull": True})
+        not_null = Q(**{f"{field}__isnull": False})
+
+        # 첫 페이지: 오름차순은 NULL 구간부터, 내림차순은 값이 있는 구간부터
+        if position is None:
+            if not self.nullable:
+                return [Q()]
+            return [not_null, is_null] if descending else [is_null, not_null]
+
+        value, last_id = position
+        # NULL 위치의 커서: 같은 NULL 구간 안에서 id로만 위치를 판단
+        if value is None:
+            if descending:
+                return [is_null & Q(**{f"{pk}__lt": last_id})]
+            return [is_null & Q(**{f"{pk}__gt": last_id}), not_null]
+
+        # 값이 있는 위치의 커서: (정렬값, id) 튜플 비교를 범위 조건 + 동점 조건으로 표현
+        if descending:
+            after = Q(**{f"{field}__lte": value}) & (
+                Q(**{f"{field}__lt": value}) | Q(**{f"{pk}__lt": last_id})
+            )
+            return [after, is_null] if self.nullable else [after]
+        after = Q(**{f"{field}__gte": value}) & (
+            Q(**{f"{field}__gt": value}) | Q(**{f"{pk}__gt": last_id})
+        )
+        return [after]
+
+    def fetch(self, queryset, descending, position, limit):
+        """
+        조건 목록을 순서대로 조회하면서 limit개가 채워질 때까지 행을 모읍니다
+        """
+        rows = []
+        for segment in self.get_segments(descending, position):
+            remaining = limit - len(rows)
+            if remaining <= 0:
+                break
+            rows.extend(self.segment_rows(queryset, segment, descending, remaining))
+        return rows
+
+    async def afetch(self, queryset, descending, position, limit):
+        """
+        fetch()의 비동기 버전
+        """
+        rows = []
+        for segment in self.get_segments(descending, position):
+            remaining = limit - len(rows)
+            if remaining <= 0:
+                break
+            queryset_part = self.segment_rows(queryset, segment, descending, remaining)
+            rows.extend([row async for row in queryset_part])
+        return rows
+
+    def segment_rows(self, queryset, segment, descending, limit):
+        # 조건 하나에 해당하는 행을 (정렬값, id) 순서로 limit개까지 조회하는 쿼리셋
+        prefix = "-" if descending else ""
+        order_by = [f"{prefix}{self.field}", f"{prefix}{self.tie_breaker}"]
+        return queryset.filter(segment).order_by(*order_by)[:limit]
+
+    def get_position(self, row):
+        """
+        행에서 커서에 저장할 (정렬값, id) 위치를 추출합니다
+        """
+        if isinstance(row, dict):
+            # values()로 조회한 행 (빠른 목록 직렬화 경로)
+            value, pk = row[self.field], row[self.tie_breaker]
+        else:
+            value, pk = getattr(row, self.field), getattr(row, self.tie_breaker)
+        if value is not None and not isinstance(value, (str, int, float)):
+            # 날짜/시간 등은 ISO 문자열로 저장 (디코딩 시 모델 필드가 다시 변환)
+            value = value.isoformat()
+        return value, pk
+
+    def encode_cursor(self, position, reverse):
+        """
+        커서 위치를 URL에 넣을 수 있는 불투명(opaque) 문자열로 인코딩합니다
+        정렬 조건도 함께 저장해서 다른 정렬로 커서를 재사용하는 것을 막습니다
+        """
+        value, last_id = position
+        payload = {
+            "o": f"{'-' if self.descending else ''}{self.field}",
+            "v": value,
+            "i": last_id,
+            "r": int(reverse),
+        }
+        raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    def decode_cursor(self, request):
+        """
+        요청의 커서 문자열을 ((정렬값, id), 역방향 여부)로 디코딩합니다
+        커서가 비어 있으면 None (첫 페이지), 형식이 잘못되었으면 404 응답
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            padding = "=" * (-len(encoded) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(encoded + padding))
+            ordering = f"{'-' if self.descending else ''}{self.field}"
+            if payload["o"] != ordering:
+                raise ValueError("cursor ordering mismatch")
+            value = self.to_python(payload["v"])
+            return (value, int(payload["i"])), bool(payload["r"])
+        except (TypeError, ValueError, KeyError):
+            raise NotFound("잘못된 커서입니다.")
+
+    def to_python(self, value):
+        """
+        커서에 저장된 값을 정렬 필드 타입에 맞는 파이썬 값으로 변환합니다
+        """
+        if value is None:
+            return None
+        try:
+            field = self.model._meta.get_field(self.field)
+        except FieldDoesNotExist:
+            return value
+        try:
+            return field.to_python(value)
+        except ValidationError:
+            raise ValueError("invalid cursor value")
+
+    def get_next_link(self):
+        """
+        현재 페이지의 마지막 행 위치를 담은 다음 페이지 URL을 반환합니다
+        """
+        if not self.has_next:
+            return None
+        if self.last_row is not None:
+            position = self.get_position(self.last_row)
+        else:
+            position = self.empty_position
+        return self.build_link(self.encode_cursor(position, reverse=False))
+
+    def get_previous_link(self):
+        """
+        현재 페이지의 첫 번째 행 위치를 담은 이전 페이지 URL을 반환합니다
+        """
+        if not self.has_previous:
+            return None
+        if self.first_row is not None:
+            position = self.get_position(self.first_row)
+        else:
+            position = self.empty_position
+        return self.build_link(self.encode_cursor(position, reverse=True))
+
+    def build_link(self, cursor):
+        """
+        현재 요청 URL에서 cursor 파라미터만 교체한 URL을 만듭니다
+        """
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, "page")
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+
+async def apaginate_queryset(pagination, queryset, request, view=None):
+    """
+    페이지네이션 객체의 paginate_queryset()을 비동기로 실행합니다 (비동기 뷰에서 사용)
+    apaginate_queryset()이 있는 클래스는 그대로 사용하고, DRF 기본 PageNumberPagination(라벨 목록)은
+    DRF 구현과 같은 순서로 개수(acount)와 페이지 행을 비동기 ORM으로 조회합니다
+    """
+    if hasattr(pagination, "apaginate_queryset"):
+        return await pagination.apaginate_queryset(queryset, request, view)
+
+    page_size = pagination.get_page_size(request)
+    if not page_size:
+        return None
+    paginator = CountedPaginator(queryset, page_size, count=await queryset.acount())
+    page_number = pagination.get_page_number(request, paginator)
+    try:
+        pagination.page = await paginator.apage(page_number)
+    except InvalidPage as exc:
+        msg = pagination.invalid_page_message.format(
+            page_number=page_number, message=str(exc)
+        )
+        raise NotFound(msg)
+    if paginator.num_pages > 1 and pagination.template is not None:
+        pagination.display_page_controls = True
+    pagination.request = request
+    return list(pagination.page)
@@ -0,0 +1,118 @@
+# 여러 스레드에서 동시에 다시 읽지 않도록 잠금 도구를 가져옵니다
+import threading
+
+# 비동기 코드에서 동기 함수를 실행하는 도구를 가져옵니다
+from asgiref.sync import sync_to_async
+
+# Django의 트랜잭션 도구를 가져옵니다
+from django.db import transaction
+
+# 현재 앱의 모듈들을 가져옵니다
+from . import caching, shards
+from .addressbooks import current_address_book
+from .models import Label
+
+
+# 라벨 목록의 변경 버전 이름 (버전 값은 Django 캐시에 저장되어 모든 워커가 공유)
+LABELS_NAMESPACE = "labels"
+
+
+class LabelRegistry:
+    """
+    프로세스 안에 주소록별 전체 라벨을 보관하는 레지스트리
+    라벨은 개수가 적고 거의 바뀌지 않으므로 한 번 읽어서 재사용하고,
+    라벨이 생성/수정/삭제되면 주소록의 공유 버전(caching.bump_version)이 바뀌어 모든 워커가 다시 읽습니다
+
+    요청마다 버전 확인(캐시 조회 1번)만 하므로 라벨 조회 쿼리가 실행되지 않습니다
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # 주소록 -> (버전, {라벨 ID: 라벨})
+        self._books = {}
+
+    def _cached(self, version):
+        """
+        현재 주소록의 보관한 라벨 (보관한 버전이 version과 다르면 None)
+        """
+        cached = self._books.get(current_address_book())
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        return None
+
+    def _load(self):
+        """
+        현재 주소록의 현재 버전 라벨 목록을 반환합니다 (버전이 바뀌었으면 데이터베이스에서 다시 읽음)
+        """
+        # 라벨을 읽기 전에 버전을 먼저 확인해야, 읽는 도중 바뀐 라벨이 다음 요청에서 다시 읽힘
+        version = caching.get_version(LABELS_NAMESPACE)
+        labels = self._cached(version)
+        if labels is not None:
+            return labels
+
+        # 복제본에서 읽으면 아직 반영되지 않은 예전 라벨이 새 버전으로 보관될 수 있으므로
+        # 주소록 샤드의 원본 DB에서 읽음
+        alias = shards.current_alias()
+        labels = {label.id: label for label in Label.objects.using(alias).all()}
+        # 트랜잭션 안에서 읽은 값은 롤백될 수 있으므로 보관하지 않음
+        if not transaction.get_connection(alias).in_atomic_block:
+            with self._lock:
+                self._books[current_address_book()] = (version, labels)
+        return labels
+
+    async def aload(self):
+        """
+        _load()의 비동기 버전 (비동기 뷰에서 요청 처리 전에 호출)
+        보관한 라벨이 현재 버전이면 바로 반환하고, 다시 읽어야 할 때만 스레드에서 조회합니다
+        이후 같은 요청의 필터/시리얼라이저는 보관한 라벨을 쿼리 없이 사용합니다
+        """
+        labels = self._cached(caching.get_version(LABELS_NAMESPACE))
+        if labels is not None:
+            return labels
+        return await sync_to_async(self._load)()
+
+    def clear(self):
+        """
+        보관한 라벨을 비웁니다 (다음 조회 시 다시 읽음)
+        """
+        with self._lock:
+            self._books = {}
+
+    def all(self):
+        """
+        전체 라벨 목록 (Label 기본 정렬과 같은 이름순)
+        """
+        return sorted(self._load().values(), key=lambda label: label.name)
+
+    def get_many(self, label_ids):
+        """
+        ID 목록에 해당하는 라벨들을 이름순으로 반환합니다 (없는 ID와 잘못된 값은 무시)
+        """
+        labels = self._load()
+        found = {}
+        for label_id in label_ids:
+            try:
+                label = labels.get(int(label_id))
+            except (TypeError, ValueError):
+                continue
+            if label is not None:
+                found[label.id] = label
+        return sorted(found.values(), key=lambda label: label.name)
+
+    def choices(self):
+        """
+        라벨 선택지 목록: [(라벨 ID, "라벨명 (색상)")]
+        """
+        return [(label.id, f"{label.name} ({label.color})") for label in self.all()]
+
+
+# 프로세스 전체에서 공유하는 라벨 레지스트리
+label_registry = LabelRegistry()
+
+
+def label_choices():
+    """
+    라벨 선택지 목록 (필터 등에 선택지 함수로 넘길 때 사용)
+    필터 클래스는 필드를 deepcopy하므로 레지스트리의 메소드 대신 모듈 함수를 넘깁니다
+    """
+    return label_registry.choices()
@@ -0,0 +1,131 @@
+# 파이썬 표준 라이브러리
+import datetime
+import decimal
+
+# Django의 설정 도구와 Django REST Framework의 JSON 렌더러를 가져옵니다
+from django.conf import settings
+from rest_framework.renderers import JSONRenderer
+
+# 빠른 JSON 인코더 (설치되어 있으면 orjson -> msgspec 순서로 사용, 없으면 표준 json 모듈)
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 설치 환경에 따라 다름
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - 설치 환경에 따라 다름
+    msgspec = None
+
+
+# 빠른 JSON 렌더러 모듈
+# DRF 기본 JSONRenderer(표준 json 모듈)와 같은 JSON을 만들되 orjson/msgspec으로 인코딩합니다
+# - 날짜/시간은 인코더가 직접 처리 (UTC는 DRF와 같이 "Z"로 표기), Decimal은 DRF와 같이 숫자로 변환
+# - 큰 배열은 stream_json_array()로 청크 단위로 인코딩해서 StreamingHttpResponse로 보낼 수 있습니다
+
+# 스트리밍 시 한 번에 인코딩할 항목 수
+STREAM_CHUNK_SIZE = 1000
+
+# DRF JSONRenderer는 JSONP 안전을 위해 U+2028/U+2029를 이스케이프하므로 같은 결과를 위해 변환
+LINE_SEPARATORS = (
+    ("\u2028".encode("utf-8"), b"\\u2028"),
+    ("\u2029".encode("utf-8"), b"\\u2029"),
+)
+
+
+def default(obj):
+    """
+    인코더가 직접 처리하지 못하는 값의 변환 (DRF의 JSONEncoder와 같은 규칙)
+    """
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    if isinstance(obj, datetime.timedelta):
+        return str(obj.total_seconds())
+    if isinstance(obj, bytes):
+        return obj.decode()
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    if hasattr(obj, "__iter__") and not isinstance(obj, (str, bytes, dict)):
+        return list(obj)
+    # 지연 번역 문자열(gettext_lazy) 등
+    return str(obj)
+
+
+def get_backend():
+    """
+    사용할 JSON 인코더 이름 (settings.CONTACTS_JSON_BACKEND로 지정 가능)
+    지정하지 않으면 설치된 인코더 중 orjson -> msgspec -> json 순서로 선택합니다
+    """
+    backend = getattr(settings, "CONTACTS_JSON_BACKEND", None)
+    if backend == "orjson" and orjson is not None:
+        return "orjson"
+    if backend == "msgspec" and msgspec is not None:
+        return "msgspec"
+    if backend is None:
+        if orjson is not None:
+            return "orjson"
+        if msgspec is not None:
+            return "msgspec"
+    return "json"
+
+
+# msgspec은 Decimal을 직접 인코딩하므로 DRF와 같이 숫자로 표기하도록 지정
+if msgspec is not None:
+    _msgspec_encoder = msgspec.json.Encoder(enc_hook=default, decimal_format="number")
+
+
+def dumps(data):
+    """
+    값을 간결한(공백 없는) UTF-8 JSON 바이트로 인코딩합니다
+    """
+    backend = get_backend()
+    if backend == "orjson":
+        content = orjson.dumps(
+            data,
+            default=default,
+            option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+        )
+    elif backend == "msgspec":
+        content = _msgspec_encoder.encode(data)
+    else:
+        return JSONRenderer().render(data)
+    for raw, escaped in LINE_SEPARATORS:
+        if raw in content:
+            content = content.replace(raw, escaped)
+    return content
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    orjson/msgspec으로 인코딩하는 JSON 렌더러 (DRF JSONRenderer와 같은 결과)
+    들여쓰기를 요청한 경우(Accept: application/json; indent=4)와
+    빠른 인코더가 설치되지 않은 경우에는 DRF JSONRenderer로 처리합니다
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        renderer_context = renderer_context or {}
+        if get_backend() == "json" or self.get_indent(
+            accepted_media_type, renderer_context
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        return dumps(data)
+
+
+def stream_json_array(chunks):
+    """
+    항목 목록(청크)들을 하나의 JSON 배열로 조금씩 인코딩해서 반환합니다
+    전체 응답을 한 번에 만들지 않으므로 항목 수와 관계없이 메모리 사용량이 청크 크기 정도로 유지됩니다
+    chunks: 항목 리스트들의 이터레이터
+    """
+    yield b"["
+    first = True
+    for chunk in chunks:
+        if not chunk:
+            continue
+        # "[a,b]" 에서 대괄호를 뗀 "a,b" 부분만 이어 붙임
+        body = dumps(chunk)[1:-1]
+        yield body if first else b"," + body
+        first = False
+    yield b"]"
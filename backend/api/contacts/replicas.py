@@ -0,0 +1,373 @@
+# 파이썬 표준 라이브러리
+import math
+import random
+import sqlite3
+import threading
+import time
+from contextvars import ContextVar
+
+# 비동기 미들웨어 지원 도구를 가져옵니다
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+
+# Django의 설정과 데이터베이스 연결 도구를 가져옵니다
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from rest_framework.permissions import SAFE_METHODS
+
+# 현재 앱의 모델과 샤드 도구를 가져옵니다
+from . import shards
+from .models import ReplicaHeartbeat
+
+
+# 읽기 전용 복제본 라우팅 모듈
+# 연락처/라벨 API의 부하는 대부분 조회(목록, 검색, 통계, 라벨 통계, 생일)이므로
+# 안전한 조회(GET/HEAD/OPTIONS)는 복제본(settings.CONTACTS_READ_REPLICAS)에서 읽고 쓰기는 기본 DB로 보냅니다
+#
+# - ReplicaRouter: DATABASE_ROUTERS에 등록하는 라우터 (이 앱의 모델만 라우팅)
+# - ReplicaRoutingMiddleware: 요청마다 라우팅 상태를 만들고, 쓰기를 한 클라이언트에 고정 쿠키를 붙임
+# - ReplicaReadMixin: ViewSet의 안전한 조회 요청을 복제본으로 보내도록 표시하는 믹스인
+#
+# 자기 쓰기 읽기(read-your-writes):
+#   요청 안에서 쓰기가 한 번이라도 일어나면 그 요청의 이후 조회는 기본 DB에서 읽고,
+#   응답에 고정 쿠키(PIN_COOKIE)를 붙여 같은 클라이언트의 다음 요청들도 잠시 기본 DB에서 읽습니다
+# 지연 보호(lag guard):
+#   기본 DB에 주기적으로 기록하는 하트비트(ReplicaHeartbeat)를 복제본에서 읽어서 지연을 계산하고,
+#   지연이 CONTACTS_REPLICA_MAX_LAG초를 넘거나 읽을 수 없는 복제본은 사용하지 않습니다
+#   (모든 복제본이 늦으면 기본 DB에서 읽음)
+#
+# 로컬에서는 SQLite 파일 복사본을 복제본으로 사용할 수 있습니다 (conf/settings.py 참고)
+#   CONTACTS_SQLITE_REPLICAS=2 python manage.py runserver
+#   CONTACTS_SQLITE_REPLICAS=2 python manage.py replica_heartbeat --copy-sqlite
+
+# 최근 쓰기를 한 클라이언트를 기본 DB에 고정하는 쿠키 이름 (값: 고정이 끝나는 유닉스 시간)
+PIN_COOKIE = "contacts_primary_until"
+# 라우팅 대상 앱 (다른 앱의 모델은 기본 DB 사용)
+APP_LABEL = "contacts"
+
+
+def get_replicas():
+    """
+    조회에 사용할 복제본 DB 별칭 목록 (settings.CONTACTS_READ_REPLICAS)
+    """
+    return list(getattr(settings, "CONTACTS_READ_REPLICAS", []))
+
+
+def get_max_lag():
+    """
+    복제본을 사용할 수 있는 최대 지연 (초, settings.CONTACTS_REPLICA_MAX_LAG)
+    """
+    return getattr(settings, "CONTACTS_REPLICA_MAX_LAG", 5)
+
+
+def get_pin_seconds():
+    """
+    쓰기 후 같은 클라이언트를 기본 DB에 고정하는 시간 (초, settings.CONTACTS_REPLICA_PIN_SECONDS)
+    최대 지연보다 짧으면 고정이 끝난 뒤 아직 쓰기를 받지 못한 복제본에서 읽을 수 있으므로 최대 지연 이상으로 맞춥니다
+    """
+    return max(getattr(settings, "CONTACTS_REPLICA_PIN_SECONDS", 10), get_max_lag())
+
+
+def get_lag_check_seconds():
+    """
+    복제본 지연을 다시 확인하는 간격 (초, settings.CONTACTS_REPLICA_LAG_CHECK_SECONDS)
+    """
+    return getattr(settings, "CONTACTS_REPLICA_LAG_CHECK_SECONDS", 1)
+
+
+class ReplicaLagMonitor:
+    """
+    복제본별 하트비트 시각을 프로세스 안에 보관하고 지연을 계산합니다
+    하트비트는 미들웨어가 요청 처리 전에 확인 간격마다 한 번씩만 읽으므로,
+    라우터는 쿼리 없이 보관한 값만으로 복제본을 고릅니다 (비동기 뷰의 이벤트 루프에서도 안전)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._checked_at = None
+        self._synced_at = {}
+
+    def is_due(self):
+        """
+        하트비트를 다시 읽을 때가 되었는지 여부
+        """
+        checked_at = self._checked_at
+        return (
+            checked_at is None
+            or time.monotonic() - checked_at >= get_lag_check_seconds()
+        )
+
+    def refresh(self):
+        """
+        모든 복제본의 하트비트 시각을 다시 읽습니다
+        """
+        synced_at = {
+            alias: ReplicaHeartbeat.synced_at(alias) for alias in get_replicas()
+        }
+        with self._lock:
+            self._synced_at, self._checked_at = synced_at, time.monotonic()
+
+    def clear(self):
+        """
+        보관한 값을 비웁니다 (다음 요청에서 다시 읽음)
+        """
+        with self._lock:
+            self._synced_at, self._checked_at = {}, None
+
+    def synced_at(self, alias):
+        """
+        복제본이 반영한 기본 DB의 마지막 시각 (유닉스 시간, 모르면 None)
+        """
+        return self._synced_at.get(alias)
+
+    def lag(self, alias):
+        """
+        복제본의 지연 (초, 하트비트를 읽을 수 없으면 None)
+        """
+        synced_at = self.synced_at(alias)
+        if synced_at is None:
+            return None
+        return max(0.0, time.time() - synced_at)
+
+    def fresh_replicas(self):
+        """
+        지연이 최대 지연 이하인 복제본 목록
+        """
+        max_lag = get_max_lag()
+        fresh = []
+        for alias in get_replicas():
+            lag = self.lag(alias)
+            if lag is not None and lag <= max_lag:
+                fresh.append(alias)
+        return fresh
+
+    def choose(self):
+        """
+        사용할 복제본 하나를 고릅니다 (사용할 수 있는 복제본이 없으면 None)
+        """
+        fresh = self.fresh_replicas()
+        return random.choice(fresh) if fresh else None
+
+    def includes(self, alias, changed_at):
+        """
+        alias DB에서 읽은 데이터가 changed_at 시각의 변경을 포함하는지 여부
+        기본 DB는 항상 포함하고, 복제본은 하트비트 시각이 changed_at 이후일 때만 포함합니다
+        """
+        if alias is None or alias not in get_replicas():
+            return True
+        synced_at = self.synced_at(alias)
+        return synced_at is not None and changed_at <= synced_at
+
+    def status(self):
+        """
+        복제본별 {"lag": 지연 초, "fresh": 사용 가능 여부}
+        """
+        fresh = set(self.fresh_replicas())
+        return {
+            alias: {
+                "lag": None if self.lag(alias) is None else round(self.lag(alias), 3),
+                "fresh": alias in fresh,
+            }
+            for alias in get_replicas()
+        }
+
+
+# 프로세스 전체에서 공유하는 지연 측정기
+lag_monitor = ReplicaLagMonitor()
+
+
+class RoutingState:
+    """
+    요청 하나의 읽기 라우팅 상태 (ReplicaRoutingMiddleware가 요청마다 만듦)
+    """
+
+    def __init__(self, pinned=False):
+        # 최근 쓰기를 한 클라이언트인지 여부 (고정 쿠키)
+        self.pinned = pinned
+        # 이 요청에서 쓰기가 일어났는지 여부
+        self.wrote = False
+        # 이 요청의 조회에 사용할 복제본 (None이면 기본 DB)
+        # 요청 안의 모든 조회(개수와 페이지 등)가 같은 복제본을 보도록 요청마다 한 번만 고릅니다
+        self.replica = None
+
+
+# 현재 요청의 라우팅 상태 (요청 밖에서는 None -> 항상 기본 DB)
+# contextvars는 sync_to_async / async_to_sync로 실행되는 코드에도 전달됩니다
+_state = ContextVar("contacts_replica_state", default=None)
+
+
+def current_replica():
+    """
+    현재 요청의 조회에 사용할 복제본 (기본 DB에서 읽어야 하면 None)
+    """
+    state = _state.get()
+    if state is None or state.wrote:
+        return None
+    return state.replica
+
+
+def use_replicas_for(request):
+    """
+    요청이 안전한 조회이고 최근 쓰기를 한 클라이언트가 아니면 이 요청의 조회를 복제본으로 보냅니다
+    선택한 복제본 별칭을 반환합니다 (기본 DB에서 읽으면 None)
+    복제본은 기본 DB의 복사본이므로 현재 주소록이 기본 DB에 있을 때만 사용합니다
+    """
+    state = _state.get()
+    if state is None or state.pinned or request.method not in SAFE_METHODS:
+        return None
+    if shards.current_alias() != DEFAULT_DB_ALIAS:
+        return None
+    state.replica = lag_monitor.choose()
+    return state.replica
+
+
+def stale_snapshot(changed_at):
+    """
+    현재 요청이 changed_at 시각의 변경을 아직 받지 못한 복제본에서 읽으면 그 복제본의 하트비트 시각을,
+    최신 데이터를 읽으면 None을 반환합니다 (목록 ETag / Last-Modified를 읽은 데이터 기준으로 만들 때 사용)
+    """
+    alias = current_replica()
+    if lag_monitor.includes(alias, changed_at):
+        return None
+    return lag_monitor.synced_at(alias)
+
+
+def includes_changes(alias, changed_at):
+    """
+    alias DB에서 읽은 값이 changed_at 시각의 변경을 포함하는지 여부 (공유 캐시에 저장해도 되는지 판단)
+    """
+    return lag_monitor.includes(alias, changed_at)
+
+
+def is_pinned(request):
+    """
+    요청의 고정 쿠키가 아직 유효한지 여부
+    """
+    try:
+        return float(request.COOKIES.get(PIN_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+class ReplicaRouter:
+    """
+    이 앱 모델의 조회는 현재 요청이 고른 복제본으로 보내는 라우터
+    복제본을 사용하지 않는 조회와 모든 쓰기는 다음 라우터(shards.ShardRouter)가 주소록의 샤드로 보냅니다
+    - 요청 밖(관리 명령, 백그라운드 작업)이나 기본 DB 트랜잭션 안의 조회는 복제본을 사용하지 않음
+    - 쓰기가 일어나면 요청 상태에 기록해서 같은 요청의 이후 조회도 복제본을 사용하지 않음
+    - 복제본에는 마이그레이션을 실행하지 않음 (기본 DB의 복사본)
+    """
+
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label != APP_LABEL:
+            return None
+        alias = current_replica()
+        if alias is None or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return None
+        return alias
+
+    def db_for_write(self, model, **hints):
+        if model._meta.app_label != APP_LABEL:
+            return None
+        state = _state.get()
+        if state is not None:
+            state.wrote = True
+        # 복제본에서 읽은 객체를 저장해도 원본 DB에 쓰도록 샤드 라우터에 맡김
+        return None
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 복제본은 기본 DB의 복사본이므로 어느 쪽에서 읽은 객체끼리도 연결할 수 있음
+        aliases = {DEFAULT_DB_ALIAS, *get_replicas()}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in get_replicas():
+            return False
+        return None
+
+
+class ReplicaRoutingMiddleware:
+    """
+    요청마다 읽기 라우팅 상태를 만들고, 쓰기가 일어난 요청의 응답에 고정 쿠키를 붙이는 미들웨어
+    확인 간격이 지났으면 요청 처리 전에 복제본 하트비트를 다시 읽습니다
+    복제본이 설정되지 않았으면 아무 일도 하지 않습니다
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not get_replicas():
+            return self.get_response(request)
+        if lag_monitor.is_due():
+            lag_monitor.refresh()
+        state = RoutingState(pinned=is_pinned(request))
+        token = _state.set(state)
+        try:
+            return self.finish(self.get_response(request), state)
+        finally:
+            _state.reset(token)
+
+    async def __acall__(self, request):
+        if not get_replicas():
+            return await self.get_response(request)
+        if lag_monitor.is_due():
+            await sync_to_async(lag_monitor.refresh)()
+        state = RoutingState(pinned=is_pinned(request))
+        token = _state.set(state)
+        try:
+            return self.finish(await self.get_response(request), state)
+        finally:
+            _state.reset(token)
+
+    def finish(self, response, state):
+        """
+        쓰기가 성공한 요청이면 같은 클라이언트를 잠시 기본 DB에 고정하는 쿠키를 붙입니다
+        """
+        if state.wrote and response.status_code < 400:
+            pin_seconds = get_pin_seconds()
+            response.set_cookie(
+                PIN_COOKIE,
+                f"{time.time() + pin_seconds:.3f}",
+                max_age=math.ceil(pin_seconds),
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+
+class ReplicaReadMixin:
+    """
+    ViewSet의 안전한 조회 요청(목록, 상세, 검색, 통계 등)을 복제본에서 읽도록 하는 믹스인
+    인증/권한 확인(initial)이 끝난 뒤 핸들러 실행 전에 이 요청이 사용할 복제본을 고릅니다
+    """
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        use_replicas_for(request)
+
+
+def copy_sqlite(alias, source_alias=DEFAULT_DB_ALIAS):
+    """
+    SQLite 기본 DB를 SQLite 복제본 파일로 복사합니다 (로컬에서 복제를 흉내낼 때 사용)
+    sqlite3 백업 API로 복사하므로 복사 중에도 일관된 시점의 데이터가 만들어집니다
+    """
+    source, target = connections[source_alias], connections[alias]
+    if source.vendor != "sqlite" or target.vendor != "sqlite":
+        raise ValueError(f"SQLite DB만 복사할 수 있습니다: {source_alias} -> {alias}")
+    source.ensure_connection()
+    # 현재 스레드의 복제본 연결은 닫아서 복사 후 새 파일 내용을 읽도록 함
+    target.close()
+    destination = sqlite3.connect(target.settings_dict["NAME"])
+    try:
+        source.connection.backup(destination)
+    finally:
+        destination.close()
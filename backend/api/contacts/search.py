@@ -0,0 +1,237 @@
+# 파이썬 표준 라이브러리
+import re
+
+# Django의 데이터베이스 도구를 가져옵니다
+from django.db import connections
+from django.db.models import FloatField, Q
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Coalesce
+
+# Django REST Framework의 검색/정렬 필터를 가져옵니다
+from rest_framework import filters
+
+# 현재 앱의 정규화 함수들을 가져옵니다
+from .normalizers import is_phone_like, normalize_phone, prefix_range
+
+
+# SQLite FTS5 전문 검색(full-text search) 가상 테이블 설정
+# contracts_contact 테이블을 외부 콘텐츠(external content)로 사용하므로
+# 검색 색인만 저장하고 원본 데이터는 중복 저장하지 않습니다
+CONTACT_TABLE = "contracts_contact"
+FTS_TABLE = "contracts_contact_fts"
+FTS_COLUMNS = ("name", "email", "phone", "company", "position", "memo", "address")
+
+# bm25 컬럼별 가중치 (FTS_COLUMNS 순서) - 이름/연락처 일치가 메모/주소 일치보다 우선
+FTS_WEIGHTS = (10.0, 5.0, 5.0, 3.0, 2.0, 1.0, 1.0)
+
+# bm25 순위 점수를 담을 annotate 필드명 (값이 작을수록 관련도가 높음)
+RANK_FIELD = "search_rank"
+
+# 검색어를 전화번호 앞자리/뒷자리로도 비교하기 위한 최소 숫자 개수
+PHONE_SEARCH_MIN_DIGITS = 4
+
+
+def _column_list(prefix=""):
+    return ", ".join(f"{prefix}{column}" for column in FTS_COLUMNS)
+
+
+# 가상 테이블과 동기화 트리거 생성 SQL
+# - unicode61 토크나이저: 공백/구두점 기준으로 단어 분리 (한글 포함)
+# - prefix='2 3': 2~3글자 접두사 색인으로 접두사 검색 속도 향상
+# - 수정 트리거는 검색 대상 컬럼이 바뀐 경우에만 색인을 갱신
+INSTALL_SQL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        {_column_list()},
+        content='{CONTACT_TABLE}',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON {CONTACT_TABLE}
+    BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, {_column_list()})
+        VALUES (new.id, {_column_list("new.")});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON {CONTACT_TABLE}
+    BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_column_list()})
+        VALUES ('delete', old.id, {_column_list("old.")});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au
+    AFTER UPDATE OF {_column_list()} ON {CONTACT_TABLE}
+    BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_column_list()})
+        VALUES ('delete', old.id, {_column_list("old.")});
+        INSERT INTO {FTS_TABLE}(rowid, {_column_list()})
+        VALUES (new.id, {_column_list("new.")});
+    END
+    """,
+]
+
+UNINSTALL_SQL = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+
+def fulltext_available(connection):
+    """
+    전문 검색 색인을 사용할 수 있는 데이터베이스인지 확인합니다 (SQLite 전용)
+    """
+    return connection.vendor == "sqlite"
+
+
+def install_fulltext_index(connection):
+    """
+    전문 검색 가상 테이블과 동기화 트리거를 생성합니다 (이미 있으면 건너뜀)
+    SQLite에서 Django가 컬럼 변경 시 테이블을 다시 만들면 트리거가 함께 삭제되므로
+    마이그레이션이 끝날 때마다(post_migrate) 다시 호출해서 트리거를 복구합니다
+    """
+    if not fulltext_available(connection):
+        return
+    with connection.cursor() as cursor:
+        for sql in INSTALL_SQL:
+            cursor.execute(sql)
+
+
+def rebuild_fulltext_index(connection):
+    """
+    연락처 테이블의 현재 데이터로 전문 검색 색인 전체를 다시 만듭니다
+    """
+    if not fulltext_available(connection):
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+
+
+def uninstall_fulltext_index(connection):
+    """
+    전문 검색 가상 테이블과 트리거를 삭제합니다
+    """
+    if not fulltext_available(connection):
+        return
+    with connection.cursor() as cursor:
+        for sql in UNINSTALL_SQL:
+            cursor.execute(sql)
+
+
+def ensure_fulltext_index(sender, using, **kwargs):
+    """
+    post_migrate 시그널 수신 함수: 연락처 테이블이 있으면 전문 검색 트리거를 복구합니다
+    """
+    connection = connections[using]
+    if not fulltext_available(connection):
+        return
+    tables = connection.introspection.table_names()
+    if CONTACT_TABLE in tables and FTS_TABLE in tables:
+        install_fulltext_index(connection)
+
+
+def build_match_query(terms):
+    """
+    검색어 목록을 FTS5 MATCH 문법으로 변환합니다
+    - 각 검색어는 따옴표로 감싸서 특수문자가 연산자로 해석되지 않도록 함
+    - 끝에 *를 붙여 접두사 검색 (예: "홍길" -> 홍길동 매칭)
+    - 여러 검색어는 공백으로 연결해서 모두 포함하는(AND) 조건
+    단어 문자가 하나도 없는 검색어(예: "@")는 무시합니다
+    """
+    phrases = []
+    for term in terms:
+        if not re.search(r"\w", term):
+            continue
+        escaped = term.replace('"', '""')
+        phrases.append(f'"{escaped}"*')
+    return " ".join(phrases)
+
+
+def phone_search_q(text):
+    """
+    검색어가 전화번호 형식이면 정규화 전화번호의 앞자리 또는 뒷자리가 일치하는 조건을 반환합니다
+    예: "5678", "01012345678", "010 1234" -> 저장 형식(하이픈 유무)과 관계없이 매칭
+    전화번호 형식이 아니면 None을 반환합니다
+    """
+    if not is_phone_like(text):
+        return None
+    digits = normalize_phone(text)
+    if len(digits) < PHONE_SEARCH_MIN_DIGITS:
+        return None
+    low, high = prefix_range(digits)
+    reversed_low, reversed_high = prefix_range(digits[::-1])
+    return Q(phone_digits__gte=low, phone_digits__lt=high) | Q(
+        phone_digits_reversed__gte=reversed_low,
+        phone_digits_reversed__lt=reversed_high,
+    )
+
+
+# 전문 검색 색인을 사용하는 검색 필터 백엔드
+class ContactSearchFilter(filters.SearchFilter):
+    """
+    ?search= 검색어를 FTS5 전문 검색 색인으로 조회하는 검색 필터
+    LIKE '%검색어%' 전체 테이블 스캔 대신 색인에서 일치하는 id만 찾고,
+    bm25 관련도 점수를 search_rank로 annotate해서 정렬에 사용할 수 있게 합니다
+    SQLite가 아닌 데이터베이스에서는 기존 SearchFilter(LIKE 검색)로 동작합니다
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        # 전화번호 형식의 검색어는 정규화 전화번호 인덱스로도 검색
+        phone_q = phone_search_q(request.query_params.get(self.search_param, ""))
+
+        connection = connections[queryset.db]
+        if not fulltext_available(connection):
+            matched = super().filter_queryset(request, queryset, view)
+            if phone_q is not None:
+                matched = matched | queryset.filter(phone_q)
+            return matched
+
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+        match = build_match_query(terms)
+        if not match:
+            # 검색 가능한 단어가 없으면 결과 없음
+            return queryset.none()
+
+        table = queryset.model._meta.db_table
+        matched_ids = RawSQL(
+            f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", (match,)
+        )
+        # 일치한 행마다 bm25 점수를 계산 (rowid 조건으로 해당 행만 조회)
+        weights = ", ".join(str(weight) for weight in FTS_WEIGHTS)
+        rank = RawSQL(
+            f"SELECT bm25({FTS_TABLE}, {weights}) FROM {FTS_TABLE} "
+            f"WHERE {FTS_TABLE} MATCH %s AND rowid = {table}.id",
+            (match,),
+            output_field=FloatField(),
+        )
+        condition = Q(id__in=matched_ids)
+        if phone_q is not None:
+            # 전화번호로만 일치한 행은 점수가 없으므로 0(가장 낮은 관련도)으로 처리
+            condition |= phone_q
+            rank = Coalesce(rank, 0.0)
+        return queryset.filter(condition).annotate(**{RANK_FIELD: rank})
+
+
+# 검색 관련도 정렬을 지원하는 정렬 필터
+class ContactOrderingFilter(filters.OrderingFilter):
+    """
+    ?ordering= 파라미터가 없고 전문 검색이 적용된 경우 관련도(bm25) 순으로 정렬하는 필터
+    ?ordering= 파라미터가 있으면 기존 OrderingFilter와 동일하게 동작합니다
+    """
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        if request.query_params.get(self.ordering_param):
+            return ordering
+        if RANK_FIELD in queryset.query.annotations:
+            # 관련도 순으로 정렬하고, 점수가 같으면 기본 정렬을 따름
+            return [RANK_FIELD, *(ordering or [])]
+        return ordering
@@ -3,7 +3,9 @@ from rest_framework import serializers  # 기본 시리얼라이저 클래스들
 from rest_framework.fields import MultipleChoiceField  # 다중 선택 필드
 
 # 현재 앱의 데이터베이스 모델들을 가져옵니다
-from .models import Label, Contact  # 라벨과 연락처 모델
+from .birthdays import next_birthday  # 다음 생일 날짜 계산
+from .models import Label, Contact, ContactImportJob  # 라벨, 연락처, 가져오기 작업 모델
+from .registry import label_registry  # 프로세스 안에 보관한 라벨 목록
 
 
 # 커스텀 필드 클래스: 체크박스 형태의 다중 선택을 위한 필드
@@ -20,6 +22,21 @@ class CheckboxSelectMultipleField(MultipleChoiceField):
         super().__init__(*args, **kwargs)
 
 
+# 부분 필드 응답을 위한 시리얼라이저 믹스인
+class SparseFieldsMixin:
+    """
+    context["fieldset"]에 필드 목록(?fields= / ?omit=)이 있으면 그 필드들만 표시합니다
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        fieldset = self.context.get("fieldset")
+        if fieldset is not None:
+            for name in list(self.fields):
+                if name not in fieldset:
+                    self.fields.pop(name)
+
+
 # 라벨 모델용 시리얼라이저 클래스
 class LabelSerializer(serializers.ModelSerializer):
     """
@@ -30,13 +47,36 @@ class LabelSerializer(serializers.ModelSerializer):
     class Meta:
         model = Label  # 이 시리얼라이저가 다룰 모델
         # JSON에 포함될 필드들 (API 응답/요청에서 사용됨)
-        fields = ["id", "name", "color", "created_at", "updated_at"]
+        fields = ["id", "name", "color", "contact_count", "created_at", "updated_at"]
         # 읽기 전용 필드들 (API 요청 시 수정할 수 없고, 응답에만 포함됨)
-        read_only_fields = ["id", "created_at", "updated_at"]
+        read_only_fields = ["id", "contact_count", "created_at", "updated_at"]
+
+    def validate_name(self, value):
+        """
+        라벨명은 주소록 안에서만 고유하므로 현재 주소록의 라벨과 중복되는지 확인합니다
+        (DRF는 여러 필드 유니크 제약 중 요청에 없는 주소록 필드를 자동 검사하지 않음)
+        """
+        labels = Label.objects.filter(name=value)
+        if self.instance is not None:
+            labels = labels.exclude(pk=self.instance.pk)
+        if labels.exists():
+            raise serializers.ValidationError("같은 이름의 라벨이 이미 있습니다.")
+        return value
+
+
+# 연락처에 연결된 라벨 표시용 시리얼라이저 클래스
+class ContactLabelSerializer(LabelSerializer):
+    """
+    연락처 상세에 중첩해서 표시하는 라벨 정보
+    라벨 레지스트리에 보관된 라벨은 연락처 수가 최신이 아닐 수 있으므로 contact_count는 제외합니다
+    """
+
+    class Meta(LabelSerializer.Meta):
+        fields = ["id", "name", "color", "created_at", "updated_at"]
 
 
 # 연락처 모델용 상세 시리얼라이저 클래스 (생성/수정/조회용)
-class ContactSerializer(serializers.ModelSerializer):
+class ContactSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """
     연락처의 모든 정보를 다루는 시리얼라이저
     생성, 수정, 상세 조회 시에 사용됩니다
@@ -45,9 +85,9 @@ class ContactSerializer(serializers.ModelSerializer):
     # 모델의 @property 메소드를 읽기 전용 필드로 추가
     company_with_position = serializers.ReadOnlyField()
 
-    # 연결된 라벨들을 중첩된 시리얼라이저로 표시 (읽기 전용)
-    # many=True: 여러 개의 라벨 객체를 처리
-    labels = LabelSerializer(many=True, read_only=True)
+    # 연결된 라벨들을 중첩 객체로 표시 (읽기 전용)
+    # 라벨 스냅샷의 ID로 라벨 레지스트리에서 읽으므로 라벨 조회 쿼리가 필요 없음
+    labels = serializers.SerializerMethodField()
 
     # 라벨 연결을 위한 별도의 쓰기 전용 필드
     # 체크박스 형태로 여러 라벨을 선택할 수 있게 함
@@ -91,13 +131,20 @@ class ContactSerializer(serializers.ModelSerializer):
         # 부모 클래스의 초기화 메소드 먼저 호출
         super().__init__(*args, **kwargs)
 
-        # 데이터베이스에서 모든 라벨을 가져와서 선택지로 설정
-        labels = Label.objects.all()
-        # label_ids 필드의 choices를 동적으로 생성
+        # 라벨 레지스트리에서 모든 라벨을 가져와서 선택지로 설정 (쿼리 없음)
         # 각 라벨의 ID를 값으로, "라벨명 (색상)" 형태를 표시명으로 사용
-        self.fields["label_ids"].choices = [
-            (label.id, f"{label.name} ({label.color})") for label in labels
-        ]
+        # (부분 필드 응답에서 label_ids가 제외된 경우는 생략)
+        if "label_ids" in self.fields:
+            self.fields["label_ids"].choices = label_registry.choices()
+
+    def get_labels(self, contact):
+        """
+        연결된 라벨들의 전체 정보 (라벨 스냅샷의 ID -> 라벨 레지스트리)
+        """
+        label_ids = [label["id"] for label in contact.label_snapshot]
+        return ContactLabelSerializer(
+            label_registry.get_many(label_ids), many=True
+        ).data
 
     # 새 연락처 생성 메소드 (POST 요청 처리)
     def create(self, validated_data):
@@ -117,8 +164,8 @@ class ContactSerializer(serializers.ModelSerializer):
 
         # 라벨 ID가 제공된 경우 다대다 관계 설정
         if label_ids:
-            # 해당 ID들의 라벨 객체들을 조회
-            labels = Label.objects.filter(id__in=label_ids)
+            # 해당 ID들의 라벨 객체들을 라벨 레지스트리에서 조회
+            labels = label_registry.get_many(label_ids)
             # 다대다 관계 필드에 라벨들을 설정 (기존 것들은 교체됨)
             contact.labels.set(labels)
 
@@ -144,8 +191,8 @@ class ContactSerializer(serializers.ModelSerializer):
 
         # 라벨 ID가 제공된 경우에만 라벨 관계 업데이트
         if label_ids is not None:
-            # 해당 ID들의 라벨 객체들 조회
-            labels = Label.objects.filter(id__in=label_ids)
+            # 해당 ID들의 라벨 객체들을 라벨 레지스트리에서 조회
+            labels = label_registry.get_many(label_ids)
             # 기존 라벨 관계를 모두 지우고 새로운 라벨들로 설정
             instance.labels.set(labels)
 
@@ -153,18 +200,20 @@ class ContactSerializer(serializers.ModelSerializer):
 
 
 # 연락처 목록 조회용 간소화된 시리얼라이저 클래스
-class ContactListSerializer(serializers.ModelSerializer):
+class ContactListSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """
     연락처 목록용 간소화된 시리얼라이저
     목록 조회 시 필요한 핵심 정보만 포함하여 응답 속도를 향상시킵니다
     메모, 주소, 생일, 웹사이트 등 상세 정보는 제외
+    라벨은 label_snapshot 컬럼에서 읽으므로 prefetch_related("labels")가 필요 없습니다
     """
 
     # 회사명과 직책을 조합한 읽기 전용 필드
     company_with_position = serializers.ReadOnlyField()
 
-    # 연결된 라벨들을 중첩 객체로 표시
-    labels = LabelSerializer(many=True, read_only=True)
+    # 연결된 라벨들 (id, name, color)
+    # 연락처 행에 저장된 라벨 스냅샷을 그대로 표시하므로 라벨 조회 쿼리가 필요 없음
+    labels = serializers.JSONField(source="label_snapshot", read_only=True)
 
     class Meta:
         model = Contact
@@ -182,6 +231,30 @@ class ContactListSerializer(serializers.ModelSerializer):
         ]
 
 
+# 다가오는 생일 목록용 시리얼라이저 클래스
+class UpcomingBirthdaySerializer(ContactListSerializer):
+    """
+    목록용 연락처 정보에 생일, 다음 생일 날짜, 남은 일수를 추가합니다
+    기준 날짜는 context["today"] (설정된 시간대의 오늘)
+    """
+
+    next_birthday = serializers.SerializerMethodField()
+    days_until = serializers.SerializerMethodField()
+
+    class Meta(ContactListSerializer.Meta):
+        fields = ContactListSerializer.Meta.fields + [
+            "birthday",  # 생년월일
+            "next_birthday",  # 다음 생일 날짜 (평년의 2월 29일생은 2월 28일)
+            "days_until",  # 다음 생일까지 남은 일수 (오늘이면 0)
+        ]
+
+    def get_next_birthday(self, contact):
+        return next_birthday(contact.birthday, self.context["today"])
+
+    def get_days_until(self, contact):
+        return (self.get_next_birthday(contact) - self.context["today"]).days
+
+
 # 라벨 통계 정보용 시리얼라이저 클래스
 class LabelStatsSerializer(serializers.ModelSerializer):
     """
@@ -190,11 +263,55 @@ class LabelStatsSerializer(serializers.ModelSerializer):
     ViewSet의 stats 액션에서 사용됩니다
     """
 
-    # annotate()로 추가된 가상 필드를 정수 필드로 정의
-    # read_only=True: 계산된 값이므로 읽기 전용
-    contact_count = serializers.IntegerField(read_only=True)
-
     class Meta:
         model = Label
-        # 통계에 필요한 라벨 기본 정보 + 연락처 개수
+        # 통계에 필요한 라벨 기본 정보 + 연락처 개수 (라벨에 저장된 contact_count)
         fields = ["id", "name", "color", "contact_count"]
+
+
+# 연락처 가져오기 작업 조회용 시리얼라이저 클래스
+class ContactImportJobSerializer(serializers.ModelSerializer):
+    """
+    가져오기 작업의 상태와 진행 상황(처리/생성/실패/건너뛴 행 수)을 표시합니다
+    """
+
+    class Meta:
+        model = ContactImportJob
+        fields = [
+            "id",
+            "file_name",  # 업로드 파일명
+            "file_type",  # csv / vcard
+            "dry_run",  # 미리보기 여부
+            "status",  # pending / running / completed / failed
+            "processed_rows",  # 읽은 행 수
+            "created_rows",  # 생성한(미리보기: 생성될) 연락처 수
+            "failed_rows",  # 검증 실패 행 수
+            "skipped_rows",  # 빈 행, 이미 있는 연락처 수
+            "created_labels",  # 새로 만든(미리보기: 만들어질) 라벨 수
+            "errors",  # 실패한 행의 오류 (앞부분 일부)
+            "message",  # 작업 실패 사유
+            "created_at",
+            "started_at",
+            "finished_at",
+        ]
+        read_only_fields = fields
+
+
+# 연락처 가져오기 요청용 시리얼라이저 클래스
+class ContactImportSerializer(serializers.Serializer):
+    """
+    가져오기 업로드 요청(multipart/form-data)을 검증합니다
+    """
+
+    # 업로드 파일 (CSV 또는 vCard)
+    file = serializers.FileField(help_text="CSV 또는 vCard(.vcf) 파일")
+    # 파일 형식 (생략하면 확장자로 추정)
+    type = serializers.ChoiceField(
+        choices=ContactImportJob.TYPE_CHOICES,
+        required=False,
+        help_text="파일 형식 (생략 시 확장자로 판단)",
+    )
+    # 미리보기: 저장 없이 변경될 내용만 집계
+    dry_run = serializers.BooleanField(
+        default=False, help_text="저장하지 않고 결과만 확인"
+    )
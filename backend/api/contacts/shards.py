@@ -0,0 +1,294 @@
+# 파이썬 표준 라이브러리
+import hashlib
+import threading
+
+# Django의 설정, 예외, 데이터베이스 연결 도구를 가져옵니다
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+# 현재 앱의 모듈들을 가져옵니다
+from . import caching
+from .addressbooks import DEFAULT_ADDRESS_BOOK, current_address_book, current_scope
+from .models import AddressBookShard, Contact, ContactImportJob, Label, SyncTombstone
+
+
+# 주소록 샤딩 모듈
+# 연락처 테이블 하나, DB 파일 하나로는 크기와 쓰기 잠금 경합에 한계가 있으므로
+# 주소록(addressbooks 모듈의 현재 주소록)마다 여러 DB 별칭(settings.CONTACTS_SHARDS) 중 하나에 저장합니다
+#
+# - 샤드 결정: 샤드 디렉터리(AddressBookShard, 기본 DB)에 지정이 있으면 그 DB,
+#   없으면 주소록 이름의 렌데부 해시(rendezvous hash)로 고른 DB (기본 주소록은 기본 DB)
+#   (샤드를 추가해도 해시 결과가 바뀌는 주소록은 새 샤드로 가는 약 1/N뿐이며,
+#    추가 전에 move_address_book --pin-all로 기존 주소록을 디렉터리에 고정해 두면 하나도 바뀌지 않음)
+# - ShardRouter: DATABASE_ROUTERS에서 ReplicaRouter 다음에 등록 (복제본을 쓰지 않는 조회/쓰기를 샤드로)
+# - 주소록 이동: move_address_book 관리 명령 (복사 -> 쓰기 중지 -> 차이 반영 -> 디렉터리 전환)
+# - ID: 샤드마다 ID 범위(CONTACTS_SHARD_ID_RANGE)를 나누어 시작하므로 연락처/라벨 ID는 전체에서 고유합니다
+#
+# 로컬에서는 SQLite 파일 여러 개를 샤드로 사용할 수 있습니다 (conf/settings.py 참고)
+#   CONTACTS_SQLITE_SHARDS=3 python manage.py migrate --database shard1
+#   CONTACTS_SQLITE_SHARDS=3 python manage.py runserver
+
+# 라우팅 대상 앱 (다른 앱의 모델은 기본 DB 사용)
+APP_LABEL = "contacts"
+# 샤드 디렉터리의 변경 버전 이름 (버전 값은 Django 캐시에 저장되어 모든 워커가 공유)
+SHARDS_NAMESPACE = "shards"
+# 샤드별 ID 범위를 나누는 모델 (API에 ID가 노출되거나 주소록 이동 시 ID를 유지해서 복사하는 테이블)
+SEQUENCE_MODELS = (Contact, Label, ContactImportJob, SyncTombstone)
+
+
+def get_shards():
+    """
+    주소록을 저장하는 DB 별칭 목록 (settings.CONTACTS_SHARDS, 순서가 ID 범위를 정함)
+    """
+    return list(getattr(settings, "CONTACTS_SHARDS", [DEFAULT_DB_ALIAS]))
+
+
+def get_id_range():
+    """
+    샤드 하나가 사용하는 ID 범위 크기 (settings.CONTACTS_SHARD_ID_RANGE)
+    n번째 샤드는 n * 범위 + 1부터 ID를 발급합니다
+    """
+    return getattr(settings, "CONTACTS_SHARD_ID_RANGE", 2**40)
+
+
+def address_books_on(alias, models=(Contact, Label)):
+    """
+    alias DB에 models 행이 하나라도 있는 주소록 이름 목록
+    (현재 주소록 범위와 관계없이 조회하는 기본(base) 매니저 사용, 모든 주소록을 다루는 관리 명령에서 사용)
+    """
+    names = set()
+    for model in models:
+        names.update(
+            model._base_manager.using(alias)
+            .values_list("address_book", flat=True)
+            .distinct()
+        )
+    return sorted(names)
+
+
+def all_address_books(models=(Contact, Label)):
+    """
+    모든 샤드의 (DB 별칭, 주소록) 목록
+    주소록을 옮기다 실패해서 두 샤드에 행이 남은 경우 두 샤드 모두 포함합니다
+    """
+    return [
+        (alias, name)
+        for alias in get_shards()
+        for name in address_books_on(alias, models)
+    ]
+
+
+def hashed_shard(name, shards=None):
+    """
+    주소록 이름의 렌데부 해시로 고른 샤드
+    (샤드마다 "샤드:주소록" 해시를 계산해서 가장 큰 값의 샤드, 프로세스/서버가 달라도 같은 결과)
+    """
+    shards = get_shards() if shards is None else shards
+    return max(
+        shards,
+        key=lambda alias: hashlib.sha1(f"{alias}:{name}".encode("utf-8")).digest(),
+    )
+
+
+class AddressBookUnavailable(APIException):
+    """
+    주소록을 다른 샤드로 옮기는 중이라 쓰기를 받을 수 없음 (잠시 후 다시 시도)
+    """
+
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "주소록을 옮기는 중입니다. 잠시 후 다시 시도하세요."
+    default_code = "address_book_moving"
+
+
+class ShardDirectory:
+    """
+    샤드 디렉터리(AddressBookShard)를 프로세스 안에 보관하는 클래스
+    디렉터리는 주소록을 옮길 때만 바뀌므로 한 번 읽어서 재사용하고,
+    바뀌면 공유 버전(caching.bump_version)이 바뀌어 모든 워커가 다시 읽습니다
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = None
+        self._entries = {}
+
+    def _load(self):
+        """
+        현재 버전의 디렉터리 {주소록: AddressBookShard}를 반환합니다
+        """
+        version = caching.get_version(SHARDS_NAMESPACE, caching.GLOBAL_SCOPE)
+        if version == self._version:
+            return self._entries
+        try:
+            entries = {
+                entry.address_book: entry
+                for entry in AddressBookShard.objects.using(DEFAULT_DB_ALIAS)
+            }
+        except DatabaseError:
+            # 마이그레이션 전(테이블 없음)에는 해시로만 결정하고 보관하지 않음
+            return {}
+        if not connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            with self._lock:
+                self._entries, self._version = entries, version
+        return entries
+
+    def clear(self):
+        """
+        보관한 디렉터리를 비웁니다 (다음 조회 시 다시 읽음)
+        """
+        with self._lock:
+            self._entries, self._version = {}, None
+
+    def entry(self, name):
+        """
+        주소록의 디렉터리 항목 (없으면 None)
+        """
+        return self._load().get(name)
+
+    def alias_for(self, name):
+        """
+        주소록을 저장하는 DB 별칭
+        디렉터리 지정이 없으면 기본 주소록(샤딩 전의 기존 데이터)은 기본 DB, 나머지는 해시로 고른 샤드
+        샤드가 하나뿐이면 디렉터리를 읽지 않고 그 샤드를 반환합니다
+        """
+        shards = get_shards()
+        if len(shards) == 1:
+            return shards[0]
+        entry = self.entry(name)
+        if entry is not None and entry.alias in connections.settings:
+            return entry.alias
+        if name == DEFAULT_ADDRESS_BOOK:
+            return DEFAULT_DB_ALIAS
+        return hashed_shard(name, shards)
+
+    def is_read_only(self, name):
+        """
+        주소록을 옮기는 중이라 쓰기를 받지 않는지 여부
+        """
+        entry = self.entry(name)
+        return entry is not None and entry.read_only
+
+    def assign(self, name, alias, read_only=False):
+        """
+        주소록을 alias DB에 지정합니다 (기본 DB의 디렉터리에 기록하고 모든 워커의 보관 값을 무효화)
+        """
+        entry, _ = AddressBookShard.objects.using(DEFAULT_DB_ALIAS).update_or_create(
+            address_book=name, defaults={"alias": alias, "read_only": read_only}
+        )
+        caching.bump_version(SHARDS_NAMESPACE, caching.GLOBAL_SCOPE)
+        self.clear()
+        return entry
+
+
+# 프로세스 전체에서 공유하는 샤드 디렉터리
+directory = ShardDirectory()
+
+
+def current_alias():
+    """
+    현재 주소록을 저장하는 DB 별칭
+    주소록 범위 안에서는 처음 찾은 별칭을 보관해서 같은 범위의 쿼리가 디렉터리를 다시 확인하지 않습니다
+    """
+    scope = current_scope()
+    if scope is None:
+        return directory.alias_for(DEFAULT_ADDRESS_BOOK)
+    if scope.alias is None:
+        scope.alias = directory.alias_for(scope.name)
+    return scope.alias
+
+
+def check_writable(alias):
+    """
+    현재 주소록을 alias DB에 써도 되는지 확인합니다
+    쓰기 트랜잭션이 쓰기 잠금을 잡은 뒤(BEGIN IMMEDIATE) 호출하므로, 이동 명령이 원본 샤드의 잠금을 잡고
+    디렉터리를 바꾸는 동안 기다린 쓰기도 여기서 이동 중/이동 완료를 확인하고 거절됩니다 (503, 다시 시도)
+    DB를 직접 지정한 범위(이동 명령)와 샤드가 아닌 DB는 확인하지 않습니다
+    """
+    scope = current_scope()
+    if (scope is not None and scope.forced) or alias not in get_shards():
+        return
+    if len(get_shards()) == 1:
+        return
+    name = current_address_book()
+    if directory.is_read_only(name) or directory.alias_for(name) != alias:
+        raise AddressBookUnavailable()
+
+
+class ShardRouter:
+    """
+    이 앱 모델의 조회/쓰기를 현재 주소록의 샤드로 보내는 라우터
+    - 샤드 디렉터리(AddressBookShard)는 항상 기본 DB
+    - 샤드 디렉터리 테이블은 기본 DB에만 마이그레이션
+    """
+
+    def db_for_read(self, model, **hints):
+        return self.db_for_model(model)
+
+    def db_for_write(self, model, **hints):
+        return self.db_for_model(model)
+
+    def db_for_model(self, model):
+        if model._meta.app_label != APP_LABEL:
+            return None
+        if model._meta.model_name == AddressBookShard._meta.model_name:
+            return DEFAULT_DB_ALIAS
+        return current_alias()
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if app_label == APP_LABEL and model_name == AddressBookShard._meta.model_name:
+            return db == DEFAULT_DB_ALIAS
+        return None
+
+
+def id_floor(alias):
+    """
+    샤드가 발급하는 ID 범위의 시작값 (샤드 목록에 없으면 None)
+    """
+    shards = get_shards()
+    if alias not in shards:
+        return None
+    return shards.index(alias) * get_id_range()
+
+
+def restore_id_sequences(alias):
+    """
+    SQLite 샤드의 ID 발급 위치(sqlite_sequence)를 그 샤드의 ID 범위 안의 가장 큰 ID로 맞춥니다
+    - 마이그레이션 직후: 범위 시작값부터 발급하도록 설정
+    - 주소록을 옮겨 온 뒤: 다른 샤드 범위의 ID가 들어와도 이 샤드의 범위에서 계속 발급하도록 되돌림
+    SQLite가 아닌 DB는 시퀀스를 직접 설정해야 하므로 아무 일도 하지 않습니다
+    """
+    floor = id_floor(alias)
+    connection = connections[alias]
+    if floor is None or connection.vendor != "sqlite":
+        return
+    ceiling = floor + get_id_range()
+    with connection.cursor() as cursor:
+        for model in SEQUENCE_MODELS:
+            table = model._meta.db_table
+            cursor.execute(
+                f'SELECT MAX(id) FROM "{table}" WHERE id > %s AND id <= %s',
+                [floor, ceiling],
+            )
+            candidates = [floor, cursor.fetchone()[0] or 0]
+            # 삭제된 ID가 다시 발급되지 않도록 범위 안의 기존 발급 위치는 유지
+            cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = %s", [table])
+            candidates.extend(
+                seq for (seq,) in cursor.fetchall() if floor <= seq <= ceiling
+            )
+            cursor.execute("DELETE FROM sqlite_sequence WHERE name = %s", [table])
+            if max(candidates):
+                cursor.execute(
+                    "INSERT INTO sqlite_sequence (name, seq) VALUES (%s, %s)",
+                    [table, max(candidates)],
+                )
+
+
+def seed_id_sequences(sender, using, **kwargs):
+    """
+    post_migrate 시그널 수신 함수: 샤드의 ID 발급 위치를 샤드의 ID 범위로 맞춥니다
+    """
+    tables = connections[using].introspection.table_names()
+    if all(model._meta.db_table in tables for model in SEQUENCE_MODELS):
+        restore_id_sequences(using)
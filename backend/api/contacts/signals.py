@@ -0,0 +1,149 @@
+# Django의 모델 시그널들을 가져옵니다
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+
+# 현재 앱의 모듈들을 가져옵니다
+from . import changes
+from .models import STATISTICS_FIELDS, Contact, Label
+from .snapshots import ContactLabel, label_contact_ids
+
+
+# 연락처 저장 직전 시그널 수신 함수
+@receiver(pre_save, sender=Contact)
+def contact_saving(sender, instance, **kwargs):
+    """
+    데이터베이스에서 불러오지 않은 객체(예: Contact(id=1, ...).save())를 수정하는 경우,
+    통계 증감 계산에 필요한 이전 값을 저장 전에 읽어 둡니다
+    """
+    if instance.pk is None or hasattr(instance, "_statistics_values"):
+        return
+    values = Contact.objects.filter(pk=instance.pk).values(*STATISTICS_FIELDS).first()
+    if values is not None:
+        instance._statistics_values = values
+
+
+# 연락처 저장(생성/수정) 시그널 수신 함수
+@receiver(post_save, sender=Contact)
+def contact_saved(sender, instance, created, update_fields=None, **kwargs):
+    """
+    연락처가 저장된 뒤 통계 카운터와 캐시 버전을 갱신합니다
+    """
+    if created:
+        changes.contacts_created([instance])
+    else:
+        changes.contacts_updated([instance], update_fields)
+
+
+# 연락처 삭제 직전 시그널 수신 함수
+@receiver(pre_delete, sender=Contact)
+def contact_deleting(sender, instance, **kwargs):
+    """
+    연락처가 삭제되면 라벨 연결도 함께 삭제되므로, 삭제 전에 연결된 라벨 ID들을 보관합니다
+    """
+    instance._deleted_label_ids = list(
+        ContactLabel.objects.filter(contact_id=instance.pk).values_list(
+            "label_id", flat=True
+        )
+    )
+
+
+# 연락처 삭제 시그널 수신 함수
+@receiver(post_delete, sender=Contact)
+def contact_deleted(sender, instance, **kwargs):
+    """
+    연락처가 삭제된 뒤 통계 카운터, 라벨별 연락처 수와 캐시 버전을 갱신합니다
+    """
+    changes.contacts_deleted([instance])
+    changes.label_counts_changed(
+        {label_id: -1 for label_id in getattr(instance, "_deleted_label_ids", [])}
+    )
+
+
+# 연락처-라벨 다대다 관계 변경 시그널 수신 함수
+@receiver(m2m_changed, sender=ContactLabel)
+def contact_labels_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    labels.add()/remove()/clear()/set() 이후 라벨 스냅샷, 라벨별 연락처 수와 캐시 버전을 갱신합니다
+    reverse=True이면 라벨 쪽에서 변경한 경우 (instance가 Label, pk_set이 연락처 ID들)
+
+    remove()의 pk_set은 실제로 연결되어 있지 않던 ID도 포함하고 clear()는 ID를 주지 않으므로,
+    삭제 전(pre_remove/pre_clear)에 실제로 연결된 ID들을 보관해 둡니다
+    (add()의 pk_set은 새로 추가된 ID만 포함)
+    """
+    if action in ("pre_remove", "pre_clear"):
+        links = ContactLabel.objects.filter(**{linked_field(reverse): instance.pk})
+        if action == "pre_remove":
+            links = links.filter(**{f"{other_field(reverse)}__in": pk_set})
+        instance._unlinked_ids = list(
+            links.values_list(other_field(reverse), flat=True)
+        )
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    if action == "post_add":
+        linked_ids, sign = list(pk_set or []), 1
+    else:
+        linked_ids, sign = getattr(instance, "_unlinked_ids", []), -1
+    if not linked_ids:
+        return
+
+    if reverse:
+        changes.label_counts_changed({instance.pk: sign * len(linked_ids)})
+        changes.contact_labels_changed(linked_ids)
+    else:
+        changes.label_counts_changed({label_id: sign for label_id in linked_ids})
+        changes.contact_labels_changed([instance.pk])
+        # 연락처 객체의 스냅샷과 수정일도 저장된 값으로 갱신 (응답 표시와 이후 저장에 사용)
+        instance.refresh_from_db(fields=["label_snapshot", "updated_at"])
+
+
+def linked_field(reverse):
+    """
+    중간 테이블에서 변경 대상(instance) 쪽 컬럼 이름
+    """
+    return "label_id" if reverse else "contact_id"
+
+
+def other_field(reverse):
+    """
+    중간 테이블에서 추가/제거되는 상대 쪽 컬럼 이름
+    """
+    return "contact_id" if reverse else "label_id"
+
+
+# 라벨 저장(생성/수정) 시그널 수신 함수
+@receiver(post_save, sender=Label)
+def label_saved(sender, instance, created, **kwargs):
+    """
+    라벨이 생성되면 라벨 레지스트리를 무효화하고,
+    이름/색상이 수정되면 연결된 연락처들의 라벨 스냅샷도 갱신합니다
+    """
+    if created:
+        changes.labels_created([instance])
+    else:
+        changes.label_changed(instance)
+
+
+# 라벨 삭제 직전 시그널 수신 함수
+@receiver(pre_delete, sender=Label)
+def label_deleting(sender, instance, **kwargs):
+    """
+    라벨이 삭제되면 연결 관계도 함께 삭제되므로, 삭제 전에 연결된 연락처 ID들을 보관합니다
+    """
+    instance._deleted_contact_ids = list(label_contact_ids(instance.pk))
+
+
+# 라벨 삭제 시그널 수신 함수
+@receiver(post_delete, sender=Label)
+def label_deleted(sender, instance, **kwargs):
+    """
+    라벨이 삭제되면 연결되어 있던 연락처들의 라벨 스냅샷과 캐시 버전을 갱신합니다
+    """
+    changes.label_deleted(instance, getattr(instance, "_deleted_contact_ids", []))
@@ -0,0 +1,113 @@
+# 같은 스냅샷끼리 묶기 위한 도구를 가져옵니다
+import json
+from collections import defaultdict
+
+# Django의 시간 도구를 가져옵니다
+from django.utils import timezone
+
+# 현재 앱의 모델을 가져옵니다
+from .models import Contact
+
+
+# 연락처의 라벨 스냅샷(label_snapshot) 관리 모듈
+# 목록 API가 라벨을 prefetch 쿼리 없이 표시할 수 있도록, 연결된 라벨의 id/name/color를
+# 연락처 행의 JSON 컬럼에 복사해 둡니다. 라벨 연결 변경, 라벨 수정/삭제 시 changes 모듈에서
+# refresh_label_snapshots()를 호출해서 다시 계산합니다
+
+# 연락처-라벨 다대다 관계의 중간(through) 테이블 모델
+ContactLabel = Contact.labels.through
+
+# 한 번에 다시 계산할 연락처 수
+CHUNK_SIZE = 500
+
+
+def label_entry(label_id, name, color):
+    """
+    스냅샷에 저장할 라벨 하나의 값
+    """
+    return {"id": label_id, "name": name, "color": color}
+
+
+def build_snapshots(contact_ids):
+    """
+    연락처들의 현재 라벨 연결로 스냅샷을 계산합니다 (쿼리 1번)
+    반환값: {연락처 ID: [라벨 값, ...]} (라벨은 Label 기본 정렬과 같은 이름순)
+    """
+    snapshots = {contact_id: [] for contact_id in contact_ids}
+    rows = (
+        ContactLabel.objects.filter(contact_id__in=snapshots)
+        .order_by("label__name")
+        .values_list("contact_id", "label_id", "label__name", "label__color")
+    )
+    for contact_id, label_id, name, color in rows:
+        snapshots[contact_id].append(label_entry(label_id, name, color))
+    return snapshots
+
+
+def save_snapshots(snapshots):
+    """
+    계산한 스냅샷들을 저장합니다
+    같은 스냅샷(같은 라벨 조합)인 연락처들은 UPDATE ... WHERE id IN (...) 한 번으로 묶고,
+    나머지만 bulk_update로 저장합니다
+    표시되는 라벨이 바뀌었으므로 수정일(updated_at)도 함께 갱신합니다 (ETag, Last-Modified 계산용)
+    """
+    now = timezone.now()
+    groups = defaultdict(list)
+    for contact_id, snapshot in snapshots.items():
+        groups[json.dumps(snapshot, ensure_ascii=False)].append(contact_id)
+
+    singles = []
+    for key, contact_ids in groups.items():
+        if len(contact_ids) > 1:
+            Contact.objects.filter(id__in=contact_ids).update(
+                label_snapshot=json.loads(key), updated_at=now
+            )
+        else:
+            singles.append(
+                Contact(
+                    id=contact_ids[0], label_snapshot=json.loads(key), updated_at=now
+                )
+            )
+    if singles:
+        Contact.objects.bulk_update(singles, ["label_snapshot", "updated_at"])
+
+
+def refresh_label_snapshots(contact_ids):
+    """
+    연락처들의 라벨 스냅샷을 CHUNK_SIZE개씩 다시 계산해서 저장합니다
+    contact_ids: 연락처 ID 목록 (이터레이터도 가능)
+    """
+    chunk = []
+    for contact_id in contact_ids:
+        chunk.append(contact_id)
+        if len(chunk) >= CHUNK_SIZE:
+            save_snapshots(build_snapshots(chunk))
+            chunk = []
+    if chunk:
+        save_snapshots(build_snapshots(chunk))
+
+
+def label_contact_ids(label_id):
+    """
+    라벨에 연결된 연락처 ID들을 반환합니다 (연결이 많아도 메모리에 모두 올리지 않도록 이터레이터)
+    """
+    return (
+        ContactLabel.objects.filter(label_id=label_id)
+        .values_list("contact_id", flat=True)
+        .iterator(chunk_size=CHUNK_SIZE * 4)
+    )
+
+
+def find_drift(contacts):
+    """
+    저장된 스냅샷과 실제 라벨 연결이 다른 연락처들을 찾습니다
+    contacts: (연락처 ID, 저장된 스냅샷) 목록
+    반환값: {연락처 ID: 올바른 스냅샷}
+    """
+    stored = dict(contacts)
+    expected = build_snapshots(list(stored))
+    return {
+        contact_id: snapshot
+        for contact_id, snapshot in expected.items()
+        if stored[contact_id] != snapshot
+    }
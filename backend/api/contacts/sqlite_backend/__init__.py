@@ -0,0 +1,21 @@
+# SQLite 운영 프로필용 데이터베이스 백엔드 (settings.DATABASES의 ENGINE: "api.contacts.sqlite_backend")
+# Django 기본 SQLite 백엔드에 연결마다 PRAGMA 적용과 트랜잭션 시작 방식(BEGIN IMMEDIATE 등) 선택을 추가합니다
+#
+# Django는 이 패키지의 base 모듈을 백엔드로 불러오고, 설정 파일(conf/settings.py)은 아래 PRAGMA를 가져다 씁니다
+# (설정 파일에서 불러오므로 이 파일에서는 Django 모듈을 가져오지 않습니다)
+
+# 운영 프로필의 PRAGMA (settings.SQLITE_PRODUCTION_OPTIONS가 이 값을 사용)
+# - journal_mode=WAL: 쓰기 중에도 읽기가 막히지 않고, 읽기 중에도 쓰기가 막히지 않음 (DB 파일에 저장되는 설정)
+# - busy_timeout: 다른 연결이 쓰기 잠금을 잡고 있으면 바로 "database is locked" 대신 이 시간(ms)만큼 기다림
+# - synchronous=NORMAL: WAL에서는 커밋마다 fsync하지 않고 체크포인트 때만 (전원 장애 시 마지막 커밋만 유실 가능, DB 손상 없음)
+# - mmap_size: DB 파일을 메모리 맵으로 읽어서 read() 시스템 호출과 복사를 줄임 (바이트)
+# - cache_size: 연결별 페이지 캐시 크기 (음수는 KiB 단위, -65536 = 64MB)
+# - temp_store=MEMORY: 정렬/임시 테이블을 디스크 대신 메모리에서 처리
+PRODUCTION_PRAGMAS = {
+    "journal_mode": "WAL",
+    "busy_timeout": 5000,
+    "synchronous": "NORMAL",
+    "mmap_size": 268435456,
+    "cache_size": -65536,
+    "temp_store": "MEMORY",
+}
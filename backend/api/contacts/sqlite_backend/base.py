@@ -0,0 +1,59 @@
+# Django 기본 SQLite 백엔드와 설정 오류 예외를 가져옵니다
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.sqlite3 import base
+
+
+# 트랜잭션 시작 방식 (SQLite BEGIN 뒤에 붙는 키워드)
+# DEFERRED는 첫 쓰기 때 쓰기 잠금을 잡으므로, 읽은 뒤 쓰는 트랜잭션끼리 부딪히면 기다리지 않고 바로 실패합니다
+# IMMEDIATE는 시작할 때 쓰기 잠금을 잡으므로 busy_timeout만큼 기다렸다가 순서대로 실행됩니다
+TRANSACTION_MODES = ("DEFERRED", "IMMEDIATE", "EXCLUSIVE")
+
+# Django 연결 옵션 중 sqlite3.connect()에 넘기지 않는 이 백엔드 전용 옵션
+BACKEND_OPTIONS = ("pragmas", "transaction_mode")
+
+
+def apply_pragmas(connection, pragmas):
+    """
+    sqlite3 연결에 PRAGMA들을 적용합니다
+    pragmas: {이름: 값} (예: {"journal_mode": "WAL", "busy_timeout": 5000})
+    """
+    for name, value in pragmas.items():
+        if not name.isidentifier() or not str(value).replace("-", "").isalnum():
+            raise ImproperlyConfigured(
+                f"잘못된 SQLite PRAGMA 설정입니다: {name}={value}"
+            )
+        connection.execute(f"PRAGMA {name} = {value}")
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    연결할 때 OPTIONS["pragmas"]를 적용하고, 트랜잭션을 OPTIONS["transaction_mode"]로 시작하는 SQLite 백엔드
+    transaction_mode 속성을 바꾸면 다음 트랜잭션의 시작 방식이 바뀝니다 (transactions.immediate_atomic 참고)
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        options = self.settings_dict["OPTIONS"]
+        self.pragmas = dict(options.get("pragmas") or {})
+        self.transaction_mode = (options.get("transaction_mode") or "DEFERRED").upper()
+        if self.transaction_mode not in TRANSACTION_MODES:
+            raise ImproperlyConfigured(
+                f"transaction_mode는 {', '.join(TRANSACTION_MODES)} 중 하나여야 합니다."
+            )
+
+    def get_connection_params(self):
+        params = super().get_connection_params()
+        for option in BACKEND_OPTIONS:
+            params.pop(option, None)
+        return params
+
+    def get_new_connection(self, conn_params):
+        connection = super().get_new_connection(conn_params)
+        apply_pragmas(connection, self.pragmas)
+        return connection
+
+    def _start_transaction_under_autocommit(self):
+        """
+        atomic() 블록을 시작할 때 실행하는 BEGIN에 트랜잭션 시작 방식을 붙입니다
+        """
+        self.cursor().execute(f"BEGIN {self.transaction_mode}")
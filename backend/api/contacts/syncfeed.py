@@ -0,0 +1,241 @@
+# 파이썬 표준 라이브러리
+import base64
+import json
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+# Django의 설정, 쿼리 조건, 시간 도구를 가져옵니다
+from django.conf import settings
+from django.db import connections
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+# 현재 앱의 모듈들을 가져옵니다
+from . import replicas
+from .addressbooks import current_address_book
+from .models import Contact, SyncTombstone
+
+
+# 연락처 동기화(변경 피드) 모듈
+# 주소록을 기기에 저장해 두는 오프라인 클라이언트가 목록 전체를 다시 받지 않고
+# 마지막 동기화 이후의 변경만 받도록 합니다 (GET /contacts/sync/)
+#
+# - 변경: 연락처를 (수정일, id) 순서로 이어서 읽음 (idx_contact_updated_id 인덱스)
+#   라벨 연결 추가/제거, 라벨 이름 수정/삭제도 라벨 스냅샷과 함께 수정일이 바뀌므로 연락처가 다시 전달됨
+# - 삭제: 삭제 기록(SyncTombstone)을 (삭제일, id) 순서로 이어서 읽음
+# - 토큰: 두 위치와 주소록을 담은 불투명(opaque) 문자열, 응답의 next_token을 다음 요청에 사용
+# - 만료: 삭제 기록 보관 기간보다 오래된 토큰은 사이의 삭제 기록이 정리되었을 수 있으므로 전체 재동기화
+#
+# 쓰기 트랜잭션은 커밋 전에 수정일이 정해지므로 최근 CONTACTS_SYNC_SETTLE_SECONDS초의 변경은
+# 다음 동기화에서 보냅니다 (읽는 순간 커밋 중이던 변경을 건너뛰지 않도록)
+
+# 토큰 형식 버전 (형식이 바뀌면 예전 토큰은 잘못된 토큰으로 처리)
+TOKEN_VERSION = 1
+# 요청 파라미터 이름
+TOKEN_PARAM = "token"
+BATCH_SIZE_PARAM = "batch_size"
+
+
+class InvalidSyncToken(ValueError):
+    """
+    형식이 잘못되었거나 다른 주소록의 동기화 토큰
+    """
+
+
+class SyncTokenExpired(InvalidSyncToken):
+    """
+    삭제 기록 보관 기간이 지난 동기화 토큰 (클라이언트는 저장한 데이터를 버리고 처음부터 다시 동기화)
+    """
+
+
+def get_batch_size(request):
+    """
+    한 번에 보낼 변경/삭제 수 (?batch_size=, 없거나 잘못되었으면 settings.CONTACTS_SYNC_BATCH_SIZE)
+    """
+    default = getattr(settings, "CONTACTS_SYNC_BATCH_SIZE", 500)
+    try:
+        size = int(request.query_params.get(BATCH_SIZE_PARAM, default))
+    except (TypeError, ValueError):
+        return default
+    if size <= 0:
+        return default
+    return min(size, getattr(settings, "CONTACTS_SYNC_MAX_BATCH_SIZE", 2000))
+
+
+def get_settle_time():
+    """
+    아직 보내지 않고 다음 동기화로 미루는 최근 변경 구간 (settings.CONTACTS_SYNC_SETTLE_SECONDS)
+    """
+    return timedelta(seconds=getattr(settings, "CONTACTS_SYNC_SETTLE_SECONDS", 2))
+
+
+def get_tombstone_retention():
+    """
+    삭제 기록 보관 기간 (settings.CONTACTS_SYNC_TOMBSTONE_DAYS)
+    """
+    return timedelta(days=getattr(settings, "CONTACTS_SYNC_TOMBSTONE_DAYS", 30))
+
+
+def get_horizon():
+    """
+    이번 응답에서 보낼 변경의 마지막 시각
+    읽기 복제본에서 읽으면 복제본이 반영한 시점(하트비트)보다 뒤의 변경은 아직 없을 수 있으므로 그 시점까지만 보냅니다
+    """
+    horizon = timezone.now()
+    synced_at = replicas.lag_monitor.synced_at(replicas.current_replica())
+    if synced_at is not None:
+        horizon = min(horizon, datetime.fromtimestamp(synced_at, tz=dt_timezone.utc))
+    return horizon - get_settle_time()
+
+
+def encode_token(contacts_position, tombstones_position):
+    """
+    두 위치와 현재 주소록을 URL에 넣을 수 있는 불투명 문자열로 인코딩합니다
+    위치: (시각, id), 연락처를 하나도 보내지 않은 처음 동기화의 연락처 위치는 None
+    """
+    payload = {
+        "v": TOKEN_VERSION,
+        "b": current_address_book(),
+        "c": encode_position(contacts_position),
+        "d": encode_position(tombstones_position),
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def encode_position(position):
+    if position is None:
+        return None
+    moment, last_id = position
+    return [moment.isoformat(), last_id]
+
+
+def decode_token(encoded):
+    """
+    토큰을 (연락처 위치, 삭제 기록 위치)로 디코딩합니다
+    형식이 잘못되었거나 다른 주소록의 토큰이면 InvalidSyncToken,
+    삭제 기록 보관 기간이 지났으면 SyncTokenExpired
+    """
+    try:
+        padding = "=" * (-len(encoded) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(encoded + padding))
+        if payload["v"] != TOKEN_VERSION:
+            raise ValueError("token version mismatch")
+        book = payload["b"]
+        contacts_position = decode_position(payload["c"])
+        tombstones_position = decode_position(payload["d"])
+    except (TypeError, ValueError, KeyError):
+        raise InvalidSyncToken("잘못된 동기화 토큰입니다.")
+    if book != current_address_book() or tombstones_position is None:
+        raise InvalidSyncToken("다른 주소록의 동기화 토큰입니다.")
+    if tombstones_position[0] < timezone.now() - get_tombstone_retention():
+        raise SyncTokenExpired(
+            "동기화 토큰이 만료되었습니다. 저장한 연락처를 지우고 토큰 없이 다시 동기화하세요."
+        )
+    return contacts_position, tombstones_position
+
+
+def decode_position(value):
+    if value is None:
+        return None
+    moment, last_id = value
+    moment = parse_datetime(moment)
+    if moment is None or timezone.is_naive(moment):
+        raise ValueError("invalid position")
+    return moment, int(last_id)
+
+
+def rows_after(queryset, field, position, horizon, limit):
+    """
+    (field, id) 위치 이후, horizon 이전의 행을 순서대로 limit개까지 조회합니다
+    튜플 비교를 범위 조건 + 동점 조건으로 표현해서 (field, id) 인덱스 범위 검색 하나로 처리합니다
+    """
+    queryset = queryset.filter(**{f"{field}__lte": horizon})
+    if position is not None:
+        moment, last_id = position
+        queryset = queryset.filter(
+            Q(**{f"{field}__gte": moment})
+            & (Q(**{f"{field}__gt": moment}) | Q(id__gt=last_id))
+        )
+    return list(queryset.order_by(field, "id")[:limit])
+
+
+def next_position(rows, field, position, horizon, has_more):
+    """
+    다음 요청이 이어서 읽을 위치
+    끝까지 읽었으면 horizon까지 읽은 것으로 표시합니다 (변경이 없는 동안에도 토큰이 만료되지 않도록)
+    """
+    if rows:
+        position = (getattr(rows[-1], field), rows[-1].id)
+    if has_more:
+        return position
+    settled = (horizon, 0)
+    return settled if position is None or position < settled else position
+
+
+def read_changes(token, batch_size):
+    """
+    토큰 이후의 변경된 연락처와 삭제 기록을 batch_size개까지 읽습니다 (토큰이 없으면 처음 동기화)
+    반환값: {"contacts": [Contact], "deleted": [...], "next_token": ..., "has_more": ...}
+    """
+    horizon = get_horizon()
+    if token:
+        contacts_position, tombstones_position = decode_token(token)
+    else:
+        # 처음 동기화: 모든 연락처를 보내고, 삭제 기록은 지금 이후의 것만 보냄
+        contacts_position, tombstones_position = None, (horizon, 0)
+
+    contacts = rows_after(
+        Contact.objects.all(), "updated_at", contacts_position, horizon, batch_size + 1
+    )
+    tombstones = rows_after(
+        SyncTombstone.objects.all(),
+        "deleted_at",
+        tombstones_position,
+        horizon,
+        batch_size + 1,
+    )
+    more_contacts = len(contacts) > batch_size
+    more_tombstones = len(tombstones) > batch_size
+    contacts, tombstones = contacts[:batch_size], tombstones[:batch_size]
+    return {
+        "contacts": contacts,
+        "deleted": [
+            {
+                "type": tombstone.kind,
+                "id": tombstone.object_id,
+                "deleted_at": tombstone.deleted_at.isoformat(),
+            }
+            for tombstone in tombstones
+        ],
+        "next_token": encode_token(
+            next_position(
+                contacts, "updated_at", contacts_position, horizon, more_contacts
+            ),
+            next_position(
+                tombstones, "deleted_at", tombstones_position, horizon, more_tombstones
+            ),
+        ),
+        "has_more": more_contacts or more_tombstones,
+    }
+
+
+def compact_tombstones(alias, batch_size=5000):
+    """
+    alias DB에서 보관 기간이 지난 삭제 기록을 batch_size개씩 삭제하고 삭제한 수를 반환합니다
+    (모든 주소록 대상, 보관 기간보다 오래된 토큰은 만료 처리되므로 정리해도 삭제를 놓치는 클라이언트가 없음)
+    """
+    if (
+        SyncTombstone._meta.db_table
+        not in connections[alias].introspection.table_names()
+    ):
+        return 0
+    cutoff = timezone.now() - get_tombstone_retention()
+    expired = SyncTombstone._base_manager.using(alias).filter(deleted_at__lt=cutoff)
+    removed = 0
+    while True:
+        ids = list(expired.values_list("id", flat=True)[:batch_size])
+        if not ids:
+            return removed
+        SyncTombstone._base_manager.using(alias).filter(id__in=ids)._raw_delete(alias)
+        removed += len(ids)
@@ -1,11 +1,50 @@
-from django.test import TestCase
+import csv
+import io
+import json
+import os
+import random
+import tempfile
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from urllib.parse import parse_qs, urlsplit
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection, connections, transaction
+from django.db.models import Count
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework.test import APIClient
 from rest_framework import status
+from rest_framework.renderers import JSONRenderer
 from rest_framework.test import APITestCase
-from .serializers import LabelSerializer, ContactSerializer
-
-from .models import Label, Contact
+from .serializers import LabelSerializer, ContactSerializer, ContactListSerializer
+from . import birthdays, exporters, importers, replicas, shards, syncfeed
+from .addressbooks import use_address_book
+from .management.commands.move_address_book import Command as MoveAddressBookCommand
+from .renderers import FastJSONRenderer, stream_json_array
+
+from .models import (
+    Label,
+    Contact,
+    ContactStatistics,
+    ContactImportJob,
+    ReplicaHeartbeat,
+    AddressBookShard,
+    SyncTombstone,
+)
+from .instrumentation import QueryBudgetExceeded, query_budget
+from .registry import LabelRegistry, label_registry
+from .snapshots import build_snapshots
+from .sqlite_backend.base import apply_pragmas
+from .transactions import immediate_atomic
 
 
 class LabelModelTests(TestCase):
@@ -84,6 +123,7 @@ class LabelSerializerTest(APITestCase):
             "id": label.id,
             "name": "회사",
             "color": "#0000FF",
+            "contact_count": 0,
             "created_at": serializer.data["created_at"],
             "updated_at": serializer.data["updated_at"],
         }
@@ -262,3 +302,2649 @@ class ContactAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data["results"]), 1)
         self.assertEqual(response.data["results"][0]["name"], "홍길동")
+
+
+class ContactCursorPaginationTest(APITestCase):
+    """연락처 키셋(커서) 페이지네이션 테스트"""
+
+    def setUp(self):
+        self.client = APIClient()
+        # 이름 중복, 이메일/전화번호 NULL이 섞인 데이터
+        for i in range(7):
+            Contact.objects.create(
+                name=f"이름{i % 3}",
+                email=f"user{i}@example.com" if i % 2 else None,
+                phone=f"010-0000-000{i}" if i % 3 else None,
+            )
+
+    def collect(self, params, page_size=2):
+        """next 링크를 따라가며 모든 페이지의 id를 모읍니다"""
+        url = reverse("contact-list")
+        response = self.client.get(
+            url, {**params, "cursor": "", "page_size": page_size}
+        )
+        ids = []
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids.extend(item["id"] for item in response.data["results"])
+            next_url = response.data["pagination"]["next"]
+            if not next_url:
+                return ids
+            response = self.client.get(next_url)
+
+    def test_all_orderings_match_full_sort(self):
+        """모든 정렬 필드/방향에서 중복이나 누락 없이 정렬 순서대로 조회되는지 테스트"""
+        contacts = list(Contact.objects.all())
+        for field in ["name", "email", "phone", "created_at"]:
+            for descending in (False, True):
+                # NULL은 오름차순에서 가장 앞, 내림차순에서 가장 뒤
+                expected = sorted(
+                    contacts,
+                    key=lambda c: (
+                        getattr(c, field) is not None,
+                        getattr(c, field) or "",
+                        c.id,
+                    ),
+                    reverse=descending,
+                )
+                ordering = f"{'-' if descending else ''}{field}"
+                with self.subTest(ordering=ordering):
+                    self.assertEqual(
+                        self.collect({"ordering": ordering}),
+                        [c.id for c in expected],
+                    )
+
+    def test_insert_during_scroll_does_not_duplicate(self):
+        """스크롤 도중 연락처가 추가되어도 중복 없이 조회되는지 테스트"""
+        url = reverse("contact-list")
+        response = self.client.get(url, {"cursor": "", "page_size": 3})
+        first_ids = [item["id"] for item in response.data["results"]]
+
+        # 최신 생성순 정렬에서 맨 앞에 들어갈 연락처 추가
+        Contact.objects.create(name="새 연락처")
+
+        response = self.client.get(response.data["pagination"]["next"])
+        second_ids = [item["id"] for item in response.data["results"]]
+        self.assertFalse(set(first_ids) & set(second_ids))
+
+    def test_previous_link_returns_previous_page(self):
+        """previous 링크로 이전 페이지를 다시 조회할 수 있는지 테스트"""
+        url = reverse("contact-list")
+        first = self.client.get(url, {"cursor": "", "ordering": "name", "page_size": 3})
+        second = self.client.get(first.data["pagination"]["next"])
+        back = self.client.get(second.data["pagination"]["previous"])
+
+        self.assertEqual(back.data["results"], first.data["results"])
+        self.assertIsNone(first.data["pagination"]["previous"])
+
+    def test_invalid_cursor(self):
+        """잘못된 커서 값은 404로 응답하는지 테스트"""
+        url = reverse("contact-list")
+        response = self.client.get(url, {"cursor": "invalid"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class ContactCountModeTest(APITestCase):
+    """연락처 목록 개수 계산 방식(?count=) 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.url = reverse("contact-list")
+        self.label = Label.objects.create(name="친구", color="#FF0000")
+        for i in range(3):
+            Contact.objects.create(name=f"홍길동{i}")
+
+    def test_exact_count_is_cached_per_filter(self):
+        """같은 필터 조건의 두 번째 요청은 COUNT 쿼리 없이 캐시된 개수를 사용하는지 테스트"""
+        self.client.get(self.url, {"search": "홍길동"})
+        with self.assertNumQueries(1):  # 목록 조회 (라벨은 스냅샷 컬럼)
+            response = self.client.get(self.url, {"search": "홍길동", "page": 1})
+
+        self.assertEqual(response.data["pagination"]["count"], 3)
+        self.assertTrue(response.data["pagination"]["count_exact"])
+
+    def test_cached_count_invalidated_on_change(self):
+        """연락처 추가나 라벨 연결이 바뀌면 캐시된 개수가 무효화되는지 테스트"""
+        response = self.client.get(self.url, {"labels": self.label.id})
+        self.assertEqual(response.data["pagination"]["count"], 0)
+
+        Contact.objects.get(name="홍길동0").labels.add(self.label)
+        response = self.client.get(self.url, {"labels": self.label.id})
+        self.assertEqual(response.data["pagination"]["count"], 1)
+
+        Contact.objects.create(name="새 연락처")
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["pagination"]["count"], 4)
+
+    def test_estimated_count_uses_counter(self):
+        """필터 없는 목록의 estimated 방식은 통계 카운터 값을 사용하는지 테스트"""
+        self.assertEqual(ContactStatistics.load().total_contacts, 3)
+        ContactStatistics.adjust(total_contacts=10)
+
+        response = self.client.get(self.url, {"count": "estimated"})
+        self.assertEqual(response.data["pagination"]["count"], 13)
+        self.assertFalse(response.data["pagination"]["count_exact"])
+
+        # 필터가 있으면 정확한 개수를 사용
+        response = self.client.get(self.url, {"count": "estimated", "search": "홍"})
+        self.assertEqual(response.data["pagination"]["count"], 3)
+        self.assertTrue(response.data["pagination"]["count_exact"])
+
+    def test_counter_follows_create_and_delete(self):
+        """연락처 생성/삭제 시 통계 카운터가 증감되는지 테스트"""
+        Contact.objects.create(name="추가")
+        Contact.objects.filter(name__startswith="홍길동").delete()
+        self.assertEqual(ContactStatistics.load().total_contacts, 1)
+
+    def test_skip_count_returns_has_next_only(self):
+        """skip 방식은 COUNT 쿼리 없이 다음 페이지 여부만 반환하는지 테스트"""
+        with self.assertNumQueries(1):  # 목록 조회(page_size + 1)
+            response = self.client.get(self.url, {"count": "skip", "page_size": 2})
+
+        pagination = response.data["pagination"]
+        self.assertNotIn("count", pagination)
+        self.assertTrue(pagination["has_next"])
+        self.assertEqual(len(response.data["results"]), 2)
+
+        response = self.client.get(pagination["next"])
+        self.assertFalse(response.data["pagination"]["has_next"])
+        self.assertEqual(len(response.data["results"]), 1)
+
+
+class ContactFullTextSearchTest(APITestCase):
+    """연락처 전문 검색(FTS5) 테스트"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("contact-list")
+        self.label = Label.objects.create(name="회사", color="#0000FF")
+        self.hong = Contact.objects.create(
+            name="홍길동", company="네이버", memo="장고 스터디 리더"
+        )
+        self.kim = Contact.objects.create(
+            name="김철수", company="카카오", memo="홍길동 소개로 만남"
+        )
+        self.lee = Contact.objects.create(name="이영희", address="서울 강남구 역삼동")
+
+    def search(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [item["name"] for item in response.data["results"]]
+
+    def test_search_memo_and_address(self):
+        """메모와 주소도 검색되는지 테스트"""
+        self.assertEqual(self.search(search="스터디"), ["홍길동"])
+        self.assertEqual(self.search(search="강남구"), ["이영희"])
+
+    def test_prefix_match(self):
+        """검색어로 시작하는 단어가 검색되는지 테스트 (접두사 검색)"""
+        self.assertEqual(self.search(search="카카"), ["김철수"])
+
+    def test_ranked_by_relevance(self):
+        """ordering이 없으면 관련도(bm25)순으로 정렬되는지 테스트"""
+        # 이름이 일치하는 홍길동이 메모에만 포함된 김철수보다 앞
+        self.assertEqual(self.search(search="홍길동")[0], "홍길동")
+        # ordering을 지정하면 지정한 정렬을 따름
+        self.assertEqual(
+            self.search(search="홍길동", ordering="name"), ["김철수", "홍길동"]
+        )
+
+    def test_combined_with_filter(self):
+        """검색이 ContactFilter와 함께 동작하는지 테스트"""
+        self.kim.labels.add(self.label)
+        self.assertEqual(self.search(search="홍길동", labels=self.label.id), ["김철수"])
+
+    def test_index_follows_update_and_delete(self):
+        """연락처 수정/삭제가 검색 색인에 반영되는지 테스트"""
+        self.lee.memo = "파이썬 개발자"
+        self.lee.save()
+        self.assertEqual(self.search(search="파이썬"), ["이영희"])
+
+        self.lee.delete()
+        self.assertEqual(self.search(search="파이썬"), [])
+
+    def test_search_without_word_characters(self):
+        """단어 문자가 없는 검색어는 오류 없이 빈 결과를 반환하는지 테스트"""
+        self.assertEqual(self.search(search='"*'), [])
+
+
+class ContactPhoneDigitsTest(APITestCase):
+    """정규화 전화번호 컬럼과 전화번호 검색 테스트"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("contact-list")
+        Contact.objects.create(name="홍길동", phone="010-1234-5678")
+        Contact.objects.create(name="김철수", phone="+82 10 9999 5678")
+        Contact.objects.create(name="이영희", phone="01055551234")
+
+    def names(self, **params):
+        response = self.client.get(self.url, {**params, "ordering": "name"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [item["name"] for item in response.data["results"]]
+
+    def test_digits_filled_on_save_and_bulk(self):
+        """저장/일괄 생성/일괄 수정 시 정규화 컬럼이 채워지는지 테스트"""
+        contact = Contact.objects.get(name="김철수")
+        self.assertEqual(contact.phone_digits, "01099995678")
+        self.assertEqual(contact.phone_digits_reversed, "87659999010")
+
+        [bulk] = Contact.objects.bulk_create(
+            [Contact(name="박민수", phone="02-123-4567")]
+        )
+        bulk.refresh_from_db()
+        self.assertEqual(bulk.phone_digits, "021234567")
+
+        bulk.phone = "031-000-1111"
+        Contact.objects.bulk_update([bulk], ["phone"])
+        bulk.refresh_from_db()
+        self.assertEqual(bulk.phone_digits, "0310001111")
+
+    def test_phone_filters(self):
+        """정확히 일치/앞자리/뒷자리 전화번호 필터 테스트"""
+        self.assertEqual(self.names(phone_digits="010 1234 5678"), ["홍길동"])
+        self.assertEqual(self.names(phone_prefix="010-5555"), ["이영희"])
+        self.assertEqual(self.names(phone_suffix="5678"), ["김철수", "홍길동"])
+
+    def test_suffix_filter_uses_index(self):
+        """뒷자리 검색이 역순 전화번호 인덱스 범위 검색으로 처리되는지 테스트"""
+        queryset = Contact.objects.filter(
+            phone_digits_reversed__gte="8765", phone_digits_reversed__lt="8766"
+        )
+        self.assertIn("idx_contact_phone_rev", queryset.explain())
+
+    def test_search_by_unformatted_digits(self):
+        """하이픈 없이 입력한 전화번호로도 검색되는지 테스트"""
+        self.assertEqual(self.names(search="01012345678"), ["홍길동"])
+        self.assertEqual(self.names(search="010-5555-1234"), ["이영희"])
+
+
+class ContactNameChoseongTest(APITestCase):
+    """이름 초성 검색 테스트"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("contact-list")
+        for name in ["홍길동", "홍기동", "한가람", "John Kim"]:
+            Contact.objects.create(name=name)
+        Contact.objects.bulk_create([Contact(name="허균")])
+
+    def names(self, query):
+        response = self.client.get(self.url, {"name_search": query, "ordering": "name"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [item["name"] for item in response.data["results"]]
+
+    def test_choseong_key(self):
+        """초성 검색 키가 저장/일괄 생성 시 채워지는지 테스트"""
+        self.assertEqual(Contact.objects.get(name="홍길동").name_choseong, "ㅎㄱㄷ")
+        self.assertEqual(Contact.objects.get(name="허균").name_choseong, "ㅎㄱ")
+        self.assertEqual(Contact.objects.get(name="John Kim").name_choseong, "johnkim")
+
+    def test_choseong_prefix(self):
+        """초성만 입력한 검색어가 이름 앞부분과 매칭되는지 테스트"""
+        self.assertEqual(self.names("ㅎㄱ"), ["한가람", "허균", "홍기동", "홍길동"])
+        self.assertEqual(self.names("ㅎㄱㄷ"), ["홍기동", "홍길동"])
+
+    def test_mixed_choseong_and_syllables(self):
+        """초성과 음절을 섞은 검색어 테스트"""
+        self.assertEqual(self.names("홍ㄱ"), ["홍기동", "홍길동"])
+        self.assertEqual(self.names("ㅎ길"), ["홍길동"])
+        self.assertEqual(self.names("홍 길ㄷ"), ["홍길동"])
+
+    def test_latin_case_insensitive(self):
+        """영문 이름은 대소문자 구분 없이 앞부분이 매칭되는지 테스트"""
+        self.assertEqual(self.names("jo"), ["John Kim"])
+
+
+class ContactBulkAPITest(APITestCase):
+    """연락처 일괄 생성/수정/삭제 API 테스트"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("contact-bulk")
+        self.family = Label.objects.create(name="가족")
+        self.work = Label.objects.create(name="회사")
+        self.contact = Contact.objects.create(name="홍길동", phone="010-1111-2222")
+        self.contact.labels.add(self.family)
+        ContactStatistics.rebuild()
+
+    def post(self, payload):
+        return self.client.post(self.url, payload, format="json")
+
+    def test_bulk_create_with_labels(self):
+        """일괄 생성 시 라벨 연결, 파생 컬럼, 통계 카운터가 반영되는지 테스트"""
+        response = self.post(
+            {
+                "create": [
+                    {
+                        "name": "김철수",
+                        "phone": "010-3333-4444",
+                        "label_ids": [self.work.id],
+                    },
+                    {"name": "", "email": "잘못된 이메일"},
+                    {"name": "이영희"},
+                ]
+            }
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["summary"]["created"], 2)
+        self.assertEqual(response.data["summary"]["failed"], 1)
+        results = response.data["results"]["create"]
+        self.assertEqual(
+            [r["status"] for r in results], ["created", "invalid", "created"]
+        )
+        self.assertIn("name", results[1]["errors"])
+
+        created = Contact.objects.get(id=results[0]["id"])
+        self.assertEqual(list(created.labels.all()), [self.work])
+        self.assertEqual(created.phone_digits, "01033334444")
+        self.assertEqual(ContactStatistics.load().total_contacts, 3)
+
+    def test_bulk_update_and_replace_labels(self):
+        """일괄 수정 시 지정한 필드만 바뀌고 라벨이 교체되는지 테스트"""
+        response = self.post(
+            {
+                "update": [
+                    {
+                        "id": self.contact.id,
+                        "company": "ABC",
+                        "label_ids": [self.work.id],
+                    },
+                    {"id": 999999, "company": "없음"},
+                    {"company": "ID 없음"},
+                ]
+            }
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data["results"]["update"]
+        self.assertEqual(
+            [r["status"] for r in results], ["updated", "not_found", "invalid"]
+        )
+        self.contact.refresh_from_db()
+        self.assertEqual(self.contact.company, "ABC")
+        self.assertEqual(self.contact.phone, "010-1111-2222")
+        self.assertEqual(list(self.contact.labels.all()), [self.work])
+
+    def test_same_values_grouped_update(self):
+        """같은 값으로 수정되는 연락처들도 파생 컬럼과 수정일이 갱신되는지 테스트"""
+        other = Contact.objects.create(name="김철수")
+        before = other.updated_at
+        response = self.post(
+            {
+                "update": [
+                    {"id": contact_id, "phone": "02-123-4567"}
+                    for contact_id in (self.contact.id, other.id)
+                ]
+            }
+        )
+        self.assertEqual(response.data["summary"]["updated"], 2)
+        other.refresh_from_db()
+        self.assertEqual(other.phone_digits, "021234567")
+        self.assertGreater(other.updated_at, before)
+        self.assertEqual(
+            Contact.objects.filter(phone_digits_reversed="765432120").count(), 2
+        )
+
+    def test_bulk_delete(self):
+        """일괄 삭제 시 라벨 연결과 통계 카운터가 함께 정리되는지 테스트"""
+        response = self.post({"delete": [self.contact.id, 999999, self.contact.id]})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data["results"]["delete"]
+        self.assertEqual(
+            [r["status"] for r in results], ["deleted", "not_found", "invalid"]
+        )
+        self.assertFalse(Contact.objects.exists())
+        self.assertFalse(Contact.labels.through.objects.exists())
+        self.assertEqual(ContactStatistics.load().total_contacts, 0)
+
+    def test_chunked_writes(self):
+        """청크 크기보다 많은 항목도 모두 처리되는지 테스트"""
+        with self.settings(CONTACTS_BULK_CHUNK_SIZE=3):
+            response = self.post(
+                {
+                    "create": [
+                        {"name": f"연락처{i}", "label_ids": [self.family.id]}
+                        for i in range(10)
+                    ]
+                }
+            )
+        self.assertEqual(response.data["summary"]["created"], 10)
+        self.assertEqual(self.family.contacts.count(), 11)
+
+    def test_request_limits(self):
+        """요청 형식 오류와 최대 항목 수 초과 테스트"""
+        self.assertEqual(
+            self.post({"create": {}}).status_code, status.HTTP_400_BAD_REQUEST
+        )
+        self.assertEqual(self.post({}).status_code, status.HTTP_400_BAD_REQUEST)
+        with self.settings(CONTACTS_BULK_MAX_ITEMS=2):
+            response = self.post(
+                {"create": [{"name": "a"}, {"name": "b"}], "delete": [1]}
+            )
+        self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+
+
+class ContactExportTest(APITestCase):
+    """연락처 CSV/vCard 스트리밍 내보내기 테스트"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("contact-export")
+        self.family = Label.objects.create(name="가족")
+        self.work = Label.objects.create(name="회사")
+        hong = Contact.objects.create(
+            name="홍길동",
+            email="hong@example.com",
+            phone="010-1234-5678",
+            company="ABC, Inc.",
+            memo="첫 줄\n둘째 줄; 메모",
+            birthday="1990-05-15",
+        )
+        hong.labels.add(self.family, self.work)
+        Contact.objects.create(name="김철수", company="XYZ")
+
+    def export(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        return b"".join(response.streaming_content).decode("utf-8")
+
+    def test_csv_export_with_filters(self):
+        """CSV 내보내기가 목록과 같은 필터/정렬을 따르는지 테스트"""
+        content = self.export(type="csv", ordering="name")
+        rows = list(csv.reader(io.StringIO(content.lstrip("\ufeff"))))
+        self.assertEqual(rows[0][:2], ["ID", "이름"])
+        self.assertEqual([row[1] for row in rows[1:]], ["김철수", "홍길동"])
+        self.assertEqual(rows[2][11], "가족;회사")
+
+        content = self.export(type="csv", company="XYZ")
+        self.assertEqual(len(content.strip().splitlines()), 2)
+
+    def test_csv_formula_injection_escaped(self):
+        """수식으로 해석될 수 있는 셀에 '가 붙고, 가져오기에서 원래 값으로 복원되는지 테스트"""
+        values = {
+            "name": '=HYPERLINK("http://evil.example","x")',
+            "memo": "+cmd|' /C calc'!A0",
+            "company": "@SUM(1)",
+            "position": "'-팀장",
+            "phone": "+82 10-1234-5678",
+        }
+        contact = Contact.objects.create(**values)
+        contact.labels.add(Label.objects.create(name="-위험"))
+
+        content = self.export(type="csv", search="+82")
+        header, row = list(csv.reader(io.StringIO(content.lstrip("\ufeff"))))
+        cells = dict(zip(header, row))
+        self.assertEqual(cells["이름"], "'" + values["name"])
+        self.assertEqual(cells["메모"], "'" + values["memo"])
+        self.assertEqual(cells["회사"], "'@SUM(1)")
+        self.assertEqual(cells["직책"], "''-팀장")
+        self.assertEqual(cells["전화번호"], "'+82 10-1234-5678")
+        self.assertEqual(cells["라벨"], "'-위험")
+
+        ((_, parsed),) = importers.parse_csv(io.BytesIO(content.encode("utf-8")))
+        for field, value in values.items():
+            self.assertEqual(parsed[field], value)
+        self.assertEqual(parsed["labels"], ["-위험"])
+
+    def test_vcard_escaping_and_versions(self):
+        """vCard 특수문자 이스케이프와 버전별 형식 테스트"""
+        content = self.export(type="vcard", search="홍길동")
+        self.assertIn("BEGIN:VCARD\r\nVERSION:3.0\r\nFN:홍길동\r\n", content)
+        self.assertIn("ORG:ABC\\, Inc.\r\n", content)
+        self.assertIn("NOTE:첫 줄\\n둘째 줄\; 메모\r\n", content)
+        self.assertIn("CATEGORIES:가족,회사\r\n", content)
+        self.assertIn("BDAY:1990-05-15\r\n", content)
+
+        content = self.export(type="vcard", vcard_version="4.0", search="홍길동")
+        self.assertIn("VERSION:4.0\r\n", content)
+        self.assertIn("BDAY:19900515\r\n", content)
+        self.assertIn("TEL;VALUE=text:010-1234-5678\r\n", content)
+
+    def test_vcard_line_folding(self):
+        """75옥텟이 넘는 줄이 한글을 자르지 않고 접히는지 테스트"""
+        line = "NOTE:" + "가" * 40
+        folded = exporters.vcard_fold(line)
+        parts = folded.split("\r\n")
+        self.assertTrue(all(len(p.encode("utf-8")) <= 75 for p in parts))
+        self.assertEqual("".join(p[1:] if i else p for i, p in enumerate(parts)), line)
+
+    def test_queries_batched_per_chunk(self):
+        """라벨을 연락처마다가 아닌 청크마다 한 번에 조회하는지 테스트"""
+        for i in range(8):
+            Contact.objects.create(name=f"연락처{i}").labels.add(self.family)
+        queryset = Contact.objects.all()
+        # 연락처 10명을 4명씩 읽기 -> 연락처 쿼리 1번(커서로 나눠 읽음) + 청크마다 라벨 1번
+        with self.assertNumQueries(4):
+            chunks = list(exporters.export_vcard(queryset, chunk_size=4))
+        self.assertEqual(len(chunks), 3)
+
+    def test_invalid_type(self):
+        """지원하지 않는 형식 요청 테스트"""
+        response = self.client.get(self.url, {"type": "xml"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+@override_settings(CONTACTS_IMPORT_BACKGROUND=False, CONTACTS_IMPORT_CHUNK_SIZE=2)
+class ContactImportTest(APITestCase):
+    """연락처 CSV/vCard 가져오기 작업 테스트"""
+
+    CSV = (
+        "이름,이메일,전화번호,회사,라벨\n"
+        "홍길동,hong@example.com,010-1234-5678,ABC,가족;친구\n"
+        ",,,,\n"
+        "김철수,잘못된 이메일,,,\n"
+        "이영희,,010-5555-1234,,회사\n"
+        "홍길동,hong@example.com,01012345678,ABC,가족\n"
+    )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("contactimportjob-list")
+        Label.objects.create(name="가족")
+        ContactStatistics.rebuild()
+
+    def upload(self, content, name="contacts.csv", **data):
+        upload = SimpleUploadedFile(name, content.encode("utf-8"))
+        response = self.client.post(self.url, {"file": upload, **data})
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        return response.data
+
+    def test_csv_import(self):
+        """CSV 가져오기: 생성/실패/건너뛴 행 집계와 라벨 자동 생성 테스트"""
+        job = self.upload(self.CSV)
+        self.assertEqual(job["status"], "completed")
+        self.assertEqual(job["processed_rows"], 5)
+        self.assertEqual(job["created_rows"], 2)
+        self.assertEqual(job["failed_rows"], 1)
+        # 빈 행 1개 + 파일 안에서 중복된 홍길동(전화번호 형식만 다름) 1개
+        self.assertEqual(job["skipped_rows"], 2)
+        self.assertEqual(job["created_labels"], 2)
+        self.assertEqual(job["errors"][0]["row"], 3)
+        self.assertIn("email", job["errors"][0]["errors"])
+
+        hong = Contact.objects.get(name="홍길동")
+        self.assertEqual(sorted(l.name for l in hong.labels.all()), ["가족", "친구"])
+        self.assertEqual(ContactStatistics.load().total_contacts, 2)
+
+        # 같은 파일을 다시 올리면 이미 있는 연락처는 건너뜀
+        job = self.upload(self.CSV)
+        self.assertEqual(job["created_rows"], 0)
+        self.assertEqual(Contact.objects.count(), 2)
+
+    def test_dry_run_writes_nothing(self):
+        """미리보기는 집계만 하고 연락처/라벨을 저장하지 않는지 테스트"""
+        job = self.upload(self.CSV, dry_run=True)
+        self.assertEqual(job["created_rows"], 2)
+        self.assertEqual(job["skipped_rows"], 2)
+        self.assertEqual(job["created_labels"], 2)
+        self.assertFalse(Contact.objects.exists())
+        self.assertEqual(Label.objects.count(), 1)
+
+    def test_labels_created_by_others_not_counted(self):
+        """작업 시작 후 다른 요청이 만든 라벨은 생성한 라벨 수에 포함하지 않는지 테스트"""
+        importer = importers.ContactImporter()
+        Label.objects.create(name="친구")
+        importer.resolve_labels(["가족", "친구", "회사"])
+        self.assertEqual(importer.counts["created_labels"], 1)
+        self.assertEqual(
+            set(importer.labels), set(Label.objects.values_list("name", flat=True))
+        )
+
+    def test_recover_stale_jobs(self):
+        """워커 종료로 멈춘 작업을 모든 주소록에서 실패로 표시하고 임시 파일을 삭제하는지 테스트"""
+        directory = self.enterContext(tempfile.TemporaryDirectory())
+
+        def make_job(status, minutes_ago):
+            path = os.path.join(directory, f"{status}-{minutes_ago}.csv")
+            open(path, "w").close()
+            job = ContactImportJob.objects.create(
+                file_name="contacts.csv",
+                file_type="csv",
+                status=status,
+                source_path=path,
+            )
+            past = timezone.now() - timedelta(minutes=minutes_ago)
+            ContactImportJob.objects.filter(pk=job.pk).update(
+                created_at=past, started_at=past
+            )
+            return job
+
+        with use_address_book("acme"):
+            stale = make_job(ContactImportJob.STATUS_RUNNING, 90)
+        pending = make_job(ContactImportJob.STATUS_PENDING, 90)
+        fresh = make_job(ContactImportJob.STATUS_RUNNING, 5)
+        done = make_job(ContactImportJob.STATUS_COMPLETED, 90)
+
+        out = io.StringIO()
+        call_command("recover_import_jobs", "--timeout-minutes", "60", stdout=out)
+        self.assertIn("2건", out.getvalue())
+
+        jobs = {job.pk: job for job in ContactImportJob._base_manager.all()}
+        for job in (stale, pending):
+            self.assertEqual(jobs[job.pk].status, ContactImportJob.STATUS_FAILED)
+            self.assertIn("60분", jobs[job.pk].message)
+            self.assertIsNotNone(jobs[job.pk].finished_at)
+            self.assertFalse(os.path.exists(job.source_path))
+        self.assertEqual(jobs[fresh.pk].status, ContactImportJob.STATUS_RUNNING)
+        self.assertEqual(jobs[done.pk].status, ContactImportJob.STATUS_COMPLETED)
+        self.assertTrue(os.path.exists(fresh.source_path))
+        self.assertTrue(os.path.exists(done.source_path))
+
+    def test_vcard_import_round_trip(self):
+        """내보낸 vCard 파일을 다시 가져오면 같은 내용으로 생성되는지 테스트"""
+        hong = Contact.objects.create(
+            name="홍길동",
+            company="ABC, Inc.",
+            memo="첫 줄\n둘째 줄; " + "가" * 40,
+            birthday="1990-05-15",
+        )
+        hong.labels.add(Label.objects.get(name="가족"))
+        content = "".join(exporters.export_vcard(Contact.objects.all(), "4.0"))
+        Contact.objects.all().delete()
+
+        job = self.upload(content, name="contacts.vcf")
+        self.assertEqual(job["file_type"], "vcard")
+        self.assertEqual(job["created_rows"], 1)
+        imported = Contact.objects.get()
+        self.assertEqual(imported.company, "ABC, Inc.")
+        self.assertEqual(imported.memo, hong.memo)
+        self.assertEqual(str(imported.birthday), "1990-05-15")
+        self.assertEqual([l.name for l in imported.labels.all()], ["가족"])
+
+    def test_vcard_structured_name_fallback(self):
+        """FN이 없으면 N(성;이름)으로 이름을 만드는지 테스트"""
+        content = (
+            "BEGIN:VCARD\r\nVERSION:3.0\r\nN:홍;길동;;;\r\n"
+            "item1.TEL;TYPE=cell:010-1234-5678\r\nEND:VCARD\r\n"
+            "BEGIN:VCARD\r\nVERSION:3.0\r\nN:Kim;John;;;\r\nEND:VCARD\r\n"
+        )
+        self.upload(content, name="contacts.vcf")
+        self.assertEqual(
+            sorted(Contact.objects.values_list("name", flat=True)),
+            ["John Kim", "홍길동"],
+        )
+        self.assertEqual(Contact.objects.get(name="홍길동").phone, "010-1234-5678")
+
+    def test_status_endpoint(self):
+        """작업 상태 조회 테스트"""
+        job = self.upload(self.CSV)
+        response = self.client.get(reverse("contactimportjob-detail", args=[job["id"]]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["created_rows"], 2)
+
+    @override_settings(CONTACTS_IMPORT_BACKGROUND=True)
+    def test_background_job_starts_after_commit(self):
+        """백그라운드 모드에서는 커밋 후 실행되도록 예약되고 대기 상태로 응답하는지 테스트"""
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            job = self.upload(self.CSV)
+        self.assertEqual(job["status"], "pending")
+        self.assertEqual(len(callbacks), 1)
+        # 예약된 스레드는 실행하지 않고, 남은 임시 파일만 정리
+        os.remove(ContactImportJob.objects.get(pk=job["id"]).source_path)
+
+
+class ContactLabelSnapshotTest(APITestCase):
+    """연락처 라벨 스냅샷 일관성 테스트"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.family = Label.objects.create(name="가족", color="#FF0000")
+        self.work = Label.objects.create(name="회사", color="#00FF00")
+        self.hong = Contact.objects.create(name="홍길동")
+        self.kim = Contact.objects.create(name="김철수")
+
+    def snapshot(self, contact):
+        contact.refresh_from_db()
+        return [(label["name"], label["color"]) for label in contact.label_snapshot]
+
+    def test_follows_m2m_changes_both_directions(self):
+        """연락처 쪽/라벨 쪽 add, remove, set, clear 후 스냅샷 테스트"""
+        self.hong.labels.add(self.work, self.family)
+        self.assertEqual(
+            self.snapshot(self.hong), [("가족", "#FF0000"), ("회사", "#00FF00")]
+        )
+        self.hong.labels.remove(self.work)
+        self.assertEqual(self.snapshot(self.hong), [("가족", "#FF0000")])
+
+        self.work.contacts.add(self.hong, self.kim)
+        self.assertEqual(self.snapshot(self.kim), [("회사", "#00FF00")])
+        self.work.contacts.clear()
+        self.assertEqual(self.snapshot(self.kim), [])
+        self.assertEqual(self.snapshot(self.hong), [("가족", "#FF0000")])
+
+        self.hong.labels.set([self.work])
+        self.assertEqual(self.snapshot(self.hong), [("회사", "#00FF00")])
+
+    def test_follows_label_update_and_delete(self):
+        """라벨 이름/색상 수정, 라벨 삭제 후 스냅샷 테스트"""
+        self.hong.labels.add(self.family, self.work)
+        self.kim.labels.add(self.family)
+        self.family.name = "친척"
+        self.family.color = "#0000FF"
+        self.family.save()
+        self.assertEqual(
+            self.snapshot(self.hong), [("친척", "#0000FF"), ("회사", "#00FF00")]
+        )
+        self.work.delete()
+        self.assertEqual(self.snapshot(self.hong), [("친척", "#0000FF")])
+        self.assertEqual(self.snapshot(self.kim), [("친척", "#0000FF")])
+
+    def test_actions_and_stale_instance(self):
+        """add_labels/remove_labels API와 오래된 객체 저장 시 스냅샷 유지 테스트"""
+        stale = Contact.objects.get(pk=self.hong.pk)
+        url = reverse("contact-add-labels", args=[self.hong.pk])
+        response = self.client.post(url, {"label_ids": [self.family.id]}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([l["name"] for l in response.data["labels"]], ["가족"])
+
+        # 라벨 추가 전에 읽어 둔 객체를 저장해도 스냅샷이 지워지지 않음
+        stale.company = "ABC"
+        stale.save()
+        self.assertEqual(self.snapshot(self.hong), [("가족", "#FF0000")])
+
+        url = reverse("contact-remove-labels", args=[self.hong.pk])
+        self.client.post(url, {"label_ids": [self.family.id]}, format="json")
+        self.assertEqual(self.snapshot(self.hong), [])
+
+    def test_list_page_is_single_query(self):
+        """목록 페이지가 라벨 조회 없이 스냅샷으로 라벨을 표시하는지 테스트"""
+        self.hong.labels.add(self.family)
+        cache.clear()
+        self.client.get(reverse("contact-list"))
+        # 개수는 캐시되므로 두 번째 요청은 목록 쿼리 1번
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse("contact-list"))
+        hong = next(c for c in response.data["results"] if c["name"] == "홍길동")
+        self.assertEqual(
+            hong["labels"], [{"id": self.family.id, "name": "가족", "color": "#FF0000"}]
+        )
+
+    def test_label_stats_and_contacts(self):
+        """라벨 통계/라벨별 연락처 API 테스트 (related_name="contacts")"""
+        self.hong.labels.add(self.family)
+        response = self.client.get(reverse("label-stats"))
+        counts = {item["name"]: item["contact_count"] for item in response.data}
+        self.assertEqual(counts, {"가족": 1, "회사": 0})
+        response = self.client.get(reverse("label-contacts", args=[self.family.id]))
+        # 라벨별 연락처 목록은 스트리밍 응답
+        contacts = json.loads(b"".join(response.streaming_content))
+        self.assertEqual([c["name"] for c in contacts], ["홍길동"])
+
+    def test_check_command_repairs_drift(self):
+        """스냅샷 검사 명령이 불일치를 찾아서 수정하는지 테스트"""
+        self.hong.labels.add(self.family)
+        Contact.objects.filter(pk=self.hong.pk).update(label_snapshot=[])
+        Contact.objects.filter(pk=self.kim.pk).update(
+            label_snapshot=[{"id": 0, "name": "없음", "color": "#000000"}]
+        )
+        output = io.StringIO()
+        call_command("check_label_snapshots", "--dry-run", stdout=output)
+        self.assertIn("불일치 2명", output.getvalue())
+        self.assertEqual(self.snapshot(self.hong), [])
+
+        call_command("check_label_snapshots", stdout=io.StringIO())
+        self.assertEqual(self.snapshot(self.hong), [("가족", "#FF0000")])
+        self.assertEqual(self.snapshot(self.kim), [])
+
+
+class LabelRegistryTest(TransactionTestCase):
+    """
+    라벨 레지스트리 테스트
+    레지스트리는 트랜잭션 안에서 읽은 값을 보관하지 않으므로 TransactionTestCase 사용
+    """
+
+    def setUp(self):
+        cache.clear()
+        label_registry.clear()
+        self.client = APIClient()
+        self.family = Label.objects.create(name="가족")
+        self.work = Label.objects.create(name="회사")
+        self.contact = Contact.objects.create(name="홍길동")
+        self.contact.labels.add(self.family)
+
+    def test_warm_requests_run_no_label_queries(self):
+        """캐시가 채워진 뒤의 상세/목록/라벨 필터 요청에 라벨 쿼리가 없는지 테스트"""
+        detail = reverse("contact-detail", args=[self.contact.pk])
+        list_url = reverse("contact-list")
+        params = {"labels": [self.family.id]}
+        self.client.get(detail)
+        self.client.get(list_url, params)
+
+        with CaptureQueriesContext(connection) as queries:
+            detail_response = self.client.get(detail)
+            list_response = self.client.get(list_url, params)
+        self.assertEqual(len(queries), 2)
+        self.assertFalse(any("contract_label" in q["sql"] for q in queries))
+        self.assertEqual([l["name"] for l in detail_response.data["labels"]], ["가족"])
+        self.assertEqual(list_response.data["pagination"]["count"], 1)
+
+    def test_label_change_invalidates_other_workers(self):
+        """한 워커의 라벨 변경이 공유 버전으로 다른 워커의 레지스트리를 무효화하는지 테스트"""
+        other_worker = LabelRegistry()
+        self.assertEqual([l.name for l in other_worker.all()], ["가족", "회사"])
+
+        self.work.name = "직장"
+        self.work.save()
+        Label.objects.create(name="친구")
+        self.assertEqual([l.name for l in other_worker.all()], ["가족", "직장", "친구"])
+        self.family.delete()
+        self.assertEqual([l.name for l in other_worker.all()], ["직장", "친구"])
+
+    def test_unknown_label_filter_rejected(self):
+        """존재하지 않는 라벨 ID로 필터링하면 400 응답인지 테스트"""
+        response = self.client.get(reverse("contact-list"), {"labels": [999]})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            label_registry.get_many(["x", None, self.work.id]), [self.work]
+        )
+
+
+class ContactStatisticsTest(APITestCase):
+    """연락처 통계 행의 증감 관리와 통계 API 테스트"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("contact-statistics")
+        Contact.objects.create(
+            name="홍길동", email="hong@example.com", company="가나상사"
+        )
+        Contact.objects.create(name="김철수", phone="010-1111-2222", company="가나상사")
+        Contact.objects.create(name="이영희", birthday="1990-05-01", company="")
+        ContactStatistics.rebuild()
+
+    def assertStatisticsExact(self):
+        self.assertEqual(
+            ContactStatistics.load().as_dict(), ContactStatistics.compute()
+        )
+
+    def test_statistics_reads_materialized_row(self):
+        """통계 API가 통계 행 하나만 읽고, fresh=true이면 집계 쿼리 하나로 다시 계산하는지 테스트"""
+        expected = {
+            "total_contacts": 3,
+            "with_email": 1,
+            "with_phone": 1,
+            "with_birthday": 1,
+            "companies": 1,
+        }
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(response.data, expected)
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {"fresh": "true"})
+        self.assertEqual(response.data, expected)
+
+    def test_signals_keep_statistics_exact(self):
+        """생성/수정/부분 저장/삭제 후에도 통계 행이 실제 집계와 같은지 테스트"""
+        contact = Contact.objects.create(name="박민수", company="다라전자")
+        contact.email = "park@example.com"
+        contact.company = "가나상사"
+        contact.save()
+        self.assertStatisticsExact()
+
+        # update_fields에 없는 필드의 변경은 저장되지 않으므로 통계에도 반영되지 않아야 함
+        contact.phone = "010-3333-4444"
+        contact.birthday = "1985-01-01"
+        contact.save(update_fields=["birthday"])
+        self.assertStatisticsExact()
+
+        # 불러오지 않은 객체로 저장해도 이전 값을 읽어서 증감
+        Contact(id=contact.id, company="마바물산").save(update_fields=["company"])
+        self.assertStatisticsExact()
+        self.assertEqual(ContactStatistics.load().companies, 2)
+
+        Contact.objects.filter(company="가나상사").delete()
+        self.assertStatisticsExact()
+        self.assertEqual(ContactStatistics.load().companies, 1)
+
+    def test_bulk_paths_keep_statistics_exact(self):
+        """일괄 생성/수정/삭제 후에도 통계 행이 실제 집계와 같은지 테스트"""
+        contact_ids = list(Contact.objects.order_by("id").values_list("id", flat=True))
+        response = self.client.post(
+            reverse("contact-bulk"),
+            {
+                "create": [
+                    {"name": f"신규{i}", "company": f"회사{i % 3}"} for i in range(6)
+                ],
+                "update": [
+                    {"id": contact_ids[0], "email": "", "company": "회사0"},
+                    {"id": contact_ids[2], "phone": "010-5555-6666"},
+                ],
+                "delete": [contact_ids[1]],
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertStatisticsExact()
+        self.assertEqual(ContactStatistics.load().companies, 3)
+
+    def test_reconcile_command_fixes_drift(self):
+        """시그널을 거치지 않은 변경으로 생긴 오차를 재계산 명령이 바로잡는지 테스트"""
+        Contact.objects.update(email="all@example.com", company=None)
+        self.assertEqual(ContactStatistics.load().with_email, 1)
+
+        call_command("reconcile_contact_statistics", "--dry-run", stdout=io.StringIO())
+        self.assertEqual(ContactStatistics.load().with_email, 1)
+
+        output = io.StringIO()
+        call_command("reconcile_contact_statistics", stdout=output)
+        self.assertIn("불일치 2건", output.getvalue())
+        self.assertStatisticsExact()
+
+        # 재계산 후의 증감도 회사별 카운터 기준으로 정확해야 함
+        Contact.objects.filter(name="홍길동").delete()
+        Contact.objects.create(name="최지은", company="라마상사")
+        self.assertEqual(ContactStatistics.load().companies, 1)
+        self.assertStatisticsExact()
+
+
+class LabelContactCountTest(APITestCase):
+    """라벨별 연락처 수(contact_count) 증감 관리 테스트"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.labels = [Label.objects.create(name=f"라벨{i}") for i in range(5)]
+        self.contacts = [Contact.objects.create(name=f"연락처{i}") for i in range(8)]
+
+    def assertCountsExact(self):
+        actual = dict(
+            Label.objects.annotate(actual=Count("contacts")).values_list("id", "actual")
+        )
+        stored = dict(Label.objects.values_list("id", "contact_count"))
+        self.assertEqual(stored, actual)
+
+    def random_mutation(self, rng):
+        """라벨 연결을 바꾸는 여러 경로 중 하나를 무작위로 실행"""
+        labels = list(Label.objects.all())
+        contacts = list(Contact.objects.all())
+        label = rng.choice(labels)
+        contact = rng.choice(contacts)
+        some_labels = rng.sample(labels, rng.randint(0, len(labels)))
+        some_contacts = rng.sample(contacts, rng.randint(0, min(4, len(contacts))))
+        operation = rng.randrange(11)
+
+        if operation == 0:
+            contact.labels.add(*some_labels)
+        elif operation == 1:
+            contact.labels.remove(*some_labels)
+        elif operation == 2:
+            contact.labels.set(some_labels)
+        elif operation == 3:
+            contact.labels.clear()
+        elif operation == 4:
+            label.contacts.add(*some_contacts)
+        elif operation == 5:
+            label.contacts.remove(*some_contacts)
+        elif operation == 6:
+            label.contacts.clear()
+        elif operation == 7:
+            Contact.objects.filter(id__in=[c.id for c in some_contacts]).delete()
+        elif operation == 8:
+            response = self.client.post(
+                reverse("contact-bulk"),
+                {
+                    "create": [
+                        {"name": "새 연락처", "label_ids": [l.id for l in some_labels]}
+                    ],
+                    "update": [
+                        {"id": c.id, "label_ids": [l.id for l in some_labels]}
+                        for c in some_contacts
+                    ],
+                },
+                format="json",
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+        elif operation == 9:
+            self.client.post(
+                reverse("contact-bulk"),
+                {"delete": [c.id for c in some_contacts]},
+                format="json",
+            )
+        elif len(labels) > 2:
+            label.delete()
+            Label.objects.create(name=f"새 라벨{rng.random()}")
+
+        # 연락처가 모두 삭제되지 않도록 보충
+        if Contact.objects.count() < 4:
+            Contact.objects.create(name="보충 연락처").labels.set(some_labels)
+
+    def test_random_mutations_keep_counts_exact(self):
+        """무작위 라벨 연결 변경 순서 후에도 저장된 연락처 수가 실제 연결 수와 같은지 테스트"""
+        for seed in range(5):
+            rng = random.Random(seed)
+            for _ in range(40):
+                self.random_mutation(rng)
+                self.assertCountsExact()
+
+    def test_stats_reads_stored_counts(self):
+        """라벨 통계가 중간 테이블 집계 없이 저장된 값으로 정렬되는지 테스트"""
+        self.contacts[0].labels.add(self.labels[2], self.labels[3])
+        self.labels[3].contacts.add(*self.contacts[1:4])
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("label-stats"))
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn("contracts_contact_labels", queries[0]["sql"])
+        self.assertEqual(
+            [(item["name"], item["contact_count"]) for item in response.data[:2]],
+            [("라벨3", 4), ("라벨2", 1)],
+        )
+
+        # 먼저 읽어 둔 라벨 객체를 저장해도 그 사이 증감된 값을 덮어쓰지 않음
+        stale = Label.objects.get(id=self.labels[3].id)
+        self.contacts[4].labels.add(stale)
+        stale.color = "#000000"
+        stale.save()
+        self.assertCountsExact()
+
+    def test_rebuild_command_fixes_drift(self):
+        """재계산 명령이 틀어진 연락처 수를 바로잡는지 테스트"""
+        self.contacts[0].labels.add(*self.labels)
+        Label.objects.update(contact_count=7)
+
+        output = io.StringIO()
+        call_command("rebuild_label_counts", stdout=output)
+        self.assertIn("불일치 5건", output.getvalue())
+        self.assertCountsExact()
+
+
+class ContactBirthdayTest(APITestCase):
+    """생일 키 컬럼과 생일 조회 API 테스트"""
+
+    def setUp(self):
+        self.client = APIClient()
+        for name, birthday in [
+            ("새해", "1990-01-02"),
+            ("윤일", "1992-02-29"),
+            ("이월말", "1991-02-28"),
+            ("삼월", "1993-03-01"),
+            ("연말", "1985-12-30"),
+        ]:
+            Contact.objects.create(name=name, birthday=birthday)
+
+    def upcoming_names(self, today, days):
+        return [
+            contact.name
+            for contact in birthdays.upcoming(Contact.objects.all(), today, days)
+        ]
+
+    def test_birthday_key_follows_birthday(self):
+        """생일 키가 저장/일괄 수정 시 생일과 함께 갱신되고 월 필터에 사용되는지 테스트"""
+        contact = Contact.objects.get(name="삼월")
+        self.assertEqual(contact.birthday_key, 301)
+        contact.birthday = date(1993, 7, 15)
+        contact.save()
+        self.client.post(
+            reverse("contact-bulk"),
+            {"update": [{"id": contact.id, "birthday": "1993-08-09"}]},
+            format="json",
+        )
+        contact.refresh_from_db()
+        self.assertEqual(contact.birthday_key, 809)
+
+        response = self.client.get(reverse("contact-list"), {"birthday_month": 2})
+        names = {item["name"] for item in response.data["results"]}
+        self.assertEqual(names, {"윤일", "이월말"})
+
+    def test_upcoming_wraps_year_end(self):
+        """12월 -> 1월로 넘어가는 기간을 다음 생일 순서로 조회하는지 테스트"""
+        self.assertEqual(self.upcoming_names(date(2024, 12, 29), 5), ["연말", "새해"])
+        self.assertEqual(self.upcoming_names(date(2024, 12, 31), 2), [])
+
+    def test_upcoming_leap_day(self):
+        """2월 29일생이 평년에는 2월 28일에 생일을 맞는 것으로 계산되는지 테스트"""
+        # 평년: 2월 28일까지의 기간에 포함, 3월 1일부터는 제외
+        self.assertEqual(self.upcoming_names(date(2025, 2, 27), 2), ["이월말", "윤일"])
+        self.assertEqual(self.upcoming_names(date(2025, 3, 1), 1), ["삼월"])
+        # 윤년: 2월 29일 당일에만 포함
+        self.assertEqual(self.upcoming_names(date(2024, 2, 27), 2), ["이월말"])
+        self.assertEqual(self.upcoming_names(date(2024, 2, 29), 1), ["윤일"])
+        self.assertEqual(
+            birthdays.next_birthday(date(1992, 2, 29), date(2025, 1, 1)),
+            date(2025, 2, 28),
+        )
+
+    def test_upcoming_birthdays_api(self):
+        """다가오는 생일 API가 오늘 기준 기간, 남은 일수, 페이지 정보를 반환하는지 테스트"""
+        today = timezone.localdate()
+        Contact.objects.create(name="오늘", birthday=today.replace(year=2000))
+        Contact.objects.create(
+            name="일주일 뒤", birthday=(today + timedelta(days=7)).replace(year=2000)
+        )
+        url = reverse("contact-upcoming-birthdays")
+
+        response = self.client.get(url, {"days": 3})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data["results"]
+        self.assertEqual(results[0]["name"], "오늘")
+        self.assertEqual(results[0]["days_until"], 0)
+        self.assertNotIn("일주일 뒤", [item["name"] for item in results])
+        self.assertIn("pagination", response.data)
+
+        response = self.client.get(url, {"days": 8})
+        days = {item["name"]: item["days_until"] for item in response.data["results"]}
+        self.assertEqual(days["일주일 뒤"], 7)
+
+        for days in ("0", "367", "x"):
+            response = self.client.get(url, {"days": days})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ConditionalGetTest(APITestCase):
+    """ETag / Last-Modified 조건부 GET 테스트"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.label = Label.objects.create(name="가족")
+        self.contact = Contact.objects.create(name="홍길동")
+        self.list_url = reverse("contact-list")
+        self.detail_url = reverse("contact-detail", args=[self.contact.id])
+
+    def revalidate(self, url, response, params=None):
+        return self.client.get(
+            url, params or {}, HTTP_IF_NONE_MATCH=response.headers["ETag"]
+        )
+
+    def test_list_not_modified_without_queries(self):
+        """목록이 바뀌지 않았으면 쿼리 없이 304로 응답하는지 테스트"""
+        response = self.client.get(self.list_url, {"page_size": 5})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("Last-Modified", response.headers)
+        self.assertIn("no-cache", response.headers["Cache-Control"])
+
+        with self.assertNumQueries(0):
+            cached = self.revalidate(self.list_url, response, {"page_size": 5})
+        self.assertEqual(cached.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(cached.headers["ETag"], response.headers["ETag"])
+        self.assertEqual(cached.content, b"")
+
+        # 쿼리 파라미터가 다르면 다른 ETag
+        other = self.client.get(self.list_url, {"page_size": 6})
+        self.assertNotEqual(other.headers["ETag"], response.headers["ETag"])
+
+        # 라벨 연결 변경은 연락처 목록 버전을 바꿈
+        self.contact.labels.add(self.label)
+        changed = self.revalidate(self.list_url, response, {"page_size": 5})
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertEqual(changed.data["results"][0]["labels"][0]["name"], "가족")
+
+    def test_detail_follows_label_changes(self):
+        """라벨 연결/라벨 이름 변경 후에는 상세 응답이 다시 내려오는지 테스트"""
+        response = self.client.get(self.detail_url)
+        with self.assertNumQueries(1):  # 연락처 조회만
+            cached = self.revalidate(self.detail_url, response)
+        self.assertEqual(cached.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.contact.labels.add(self.label)
+        response = self.revalidate(self.detail_url, response)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([l["name"] for l in response.data["labels"]], ["가족"])
+
+        self.label.name = "가족들"
+        self.label.save()
+        response = self.revalidate(self.detail_url, response)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([l["name"] for l in response.data["labels"]], ["가족들"])
+
+    def test_if_modified_since(self):
+        """If-Modified-Since가 Last-Modified 이후이면 304인지 테스트"""
+        response = self.client.get(self.detail_url)
+        cached = self.client.get(
+            self.detail_url, HTTP_IF_MODIFIED_SINCE=response.headers["Last-Modified"]
+        )
+        self.assertEqual(cached.status_code, status.HTTP_304_NOT_MODIFIED)
+        cached = self.client.get(
+            self.detail_url, HTTP_IF_MODIFIED_SINCE="Mon, 01 Jan 2001 00:00:00 GMT"
+        )
+        self.assertEqual(cached.status_code, status.HTTP_200_OK)
+
+    def test_label_list_follows_contact_counts(self):
+        """라벨별 연락처 수가 바뀌면 라벨 목록/상세 ETag가 바뀌는지 테스트"""
+        list_url = reverse("label-list")
+        detail_url = reverse("label-detail", args=[self.label.id])
+        label_list = self.client.get(list_url)
+        label_detail = self.client.get(detail_url)
+        self.assertEqual(
+            self.revalidate(list_url, label_list).status_code,
+            status.HTTP_304_NOT_MODIFIED,
+        )
+
+        self.contact.labels.add(self.label)
+        response = self.revalidate(list_url, label_list)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"][0]["contact_count"], 1)
+        response = self.revalidate(detail_url, label_detail)
+        self.assertEqual(response.data["contact_count"], 1)
+
+
+class ContactFastListTest(APITestCase):
+    """values() 기반 빠른 목록 직렬화가 ContactListSerializer와 같은 응답인지 테스트"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("contact-list")
+        family = Label.objects.create(name="가족", color="#ff0000")
+        work = Label.objects.create(name="회사")
+        for index, (company, position) in enumerate(
+            [
+                ("가나상사", "과장"),
+                ("가나상사", None),
+                (None, "대리"),
+                ("", ""),
+                (None, None),
+            ]
+        ):
+            contact = Contact.objects.create(
+                name=f"홍길동{index}",
+                email=f"hong{index}@example.com" if index % 2 else None,
+                phone="010-1234-567{}".format(index),
+                company=company,
+                position=position,
+                profile_url="https://example.com/p.png" if index == 0 else None,
+                memo="메모",
+            )
+            contact.labels.set([family, work][: index % 3])
+
+    def assertSameAsSerializer(self, params):
+        fast = self.client.get(self.url, params, HTTP_ACCEPT="application/json")
+        with override_settings(CONTACTS_FAST_LIST=False):
+            slow = self.client.get(self.url, params, HTTP_ACCEPT="application/json")
+        self.assertEqual(fast.status_code, status.HTTP_200_OK)
+        self.assertEqual(fast.content, slow.content)
+        return fast
+
+    def test_output_identical_to_serializer(self):
+        """페이지 번호/정렬/검색/커서 페이징에서 응답 바이트가 같은지 테스트"""
+        response = self.assertSameAsSerializer({})
+        self.assertEqual(len(response.data["results"]), 5)
+        self.assertSameAsSerializer({"ordering": "name", "page_size": 2, "page": 2})
+        self.assertSameAsSerializer({"search": "홍길동", "labels": [1]})
+        first = self.assertSameAsSerializer({"cursor": "", "page_size": 2})
+        next_params = parse_qs(urlsplit(first.data["pagination"]["next"]).query)
+        second = self.assertSameAsSerializer(
+            {"cursor": next_params["cursor"][0], "page_size": 2}
+        )
+        self.assertNotEqual(second.data["results"], first.data["results"])
+
+    def test_fast_list_reads_list_columns_only(self):
+        """목록 컬럼만 조회하고 라벨 조회 쿼리가 없는지 테스트"""
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.url, {"count": "skip"})
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn("memo", queries[0]["sql"])
+        self.assertNotIn("contract_label", queries[0]["sql"])
+
+
+class FastJSONRendererTest(APITestCase):
+    """빠른 JSON 렌더러와 배열 스트리밍이 DRF JSONRenderer와 같은 JSON을 만드는지 테스트"""
+
+    data = {
+        "name": "홍길동\u2028",
+        "birthday": date(1990, 2, 28),
+        "utc": datetime(2024, 1, 2, 3, 4, 5, 678, tzinfo=dt_timezone.utc),
+        "seoul": datetime(2024, 1, 2, 3, 4, 5, tzinfo=dt_timezone(timedelta(hours=9))),
+        "naive": datetime(2024, 1, 2, 3, 4, 5),
+        "amount": Decimal("12.50"),
+        "duration": timedelta(minutes=1, seconds=30),
+        "labels": [{"id": 1, "name": "가족"}, None, True, 1.5],
+        1: "정수 키",
+    }
+
+    def test_render_matches_drf_renderer(self):
+        """설치된 인코더와 표준 json 인코더 모두 DRF JSONRenderer와 같은 바이트인지 테스트"""
+        expected = JSONRenderer().render(self.data)
+        for backend in (None, "json"):
+            with self.subTest(backend=backend), override_settings(
+                CONTACTS_JSON_BACKEND=backend
+            ):
+                self.assertEqual(FastJSONRenderer().render(self.data), expected)
+        self.assertEqual(FastJSONRenderer().render(None), b"")
+        # 들여쓰기 요청은 DRF 렌더러로 처리
+        self.assertEqual(
+            FastJSONRenderer().render(self.data, "application/json; indent=2"),
+            JSONRenderer().render(self.data, "application/json; indent=2"),
+        )
+
+    def test_stream_json_array(self):
+        """청크로 나눠 인코딩한 배열이 한 번에 인코딩한 배열과 같은지 테스트"""
+        items = [self.data, {"id": 2}, [], "문자열"]
+        streamed = b"".join(stream_json_array([items[:1], [], items[1:]]))
+        self.assertEqual(streamed, JSONRenderer().render(items))
+        self.assertEqual(b"".join(stream_json_array([])), b"[]")
+        self.assertEqual(b"".join(stream_json_array([[], []])), b"[]")
+
+    def test_label_contacts_streamed(self):
+        """라벨의 연락처 목록이 스트리밍 응답으로 시리얼라이저와 같은 데이터를 반환하는지 테스트"""
+        label = Label.objects.create(name="가족")
+        for index in range(3):
+            contact = Contact.objects.create(
+                name=f"홍길동{index}", company="가나상사", position="과장"
+            )
+            contact.labels.add(label)
+        Contact.objects.create(name="라벨 없음")
+        url = reverse("label-contacts", kwargs={"pk": label.pk})
+        response = self.client.get(url, HTTP_ACCEPT="application/json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/json")
+        expected = ContactListSerializer(label.contacts.all(), many=True).data
+        self.assertEqual(
+            json.loads(b"".join(response.streaming_content)),
+            json.loads(JSONRenderer().render(expected)),
+        )
+        # 브라우저 API 요청은 일반 응답
+        response = self.client.get(url, {"format": "api"})
+        self.assertFalse(response.streaming)
+
+
+class ContactSparseFieldsetTest(APITestCase):
+    """?fields= / ?omit= 부분 필드 응답과 조회 컬럼 테스트"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("contact-list")
+        family = Label.objects.create(name="가족")
+        for index in range(3):
+            contact = Contact.objects.create(
+                name=f"홍길동{index}",
+                phone=f"010-1234-567{index}",
+                company="가나상사",
+                position="과장",
+                memo="긴 메모",
+                address="서울특별시",
+            )
+            contact.labels.add(family)
+        self.contact = contact
+
+    def contact_queries(self, queries):
+        """연락처 테이블을 조회한 SQL들"""
+        return [
+            query["sql"]
+            for query in queries
+            if query["sql"].startswith("SELECT") and "contracts_contact" in query["sql"]
+        ]
+
+    def test_list_fields(self):
+        """목록에서 고른 필드만 응답하고 필요한 컬럼만 조회하는지 테스트"""
+        params = {"fields": "phone,name,id", "count": "skip"}
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, params, HTTP_ACCEPT="application/json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(queries), 1)
+        for column in ("memo", "address", "label_snapshot", "email"):
+            self.assertNotIn(f'"{column}"', queries[0]["sql"])
+        # 필드 순서는 시리얼라이저 필드 순서
+        self.assertEqual(list(response.data["results"][0]), ["id", "name", "phone"])
+        with override_settings(CONTACTS_FAST_LIST=False):
+            with CaptureQueriesContext(connection) as queries:
+                slow = self.client.get(self.url, params, HTTP_ACCEPT="application/json")
+        self.assertEqual(slow.content, response.content)
+        self.assertNotIn("memo", queries[0]["sql"])
+        # 계산 필드는 필요한 컬럼만 읽어서 표시
+        response = self.client.get(self.url, {"fields": "labels,company_with_position"})
+        self.assertEqual(
+            response.data["results"][0],
+            {
+                "labels": self.contact.label_snapshot,
+                "company_with_position": "가나상사 (과장)",
+            },
+        )
+
+    def test_list_omit_with_cursor(self):
+        """?omit= 과 커서 페이지네이션을 함께 사용할 수 있는지 테스트"""
+        for fast in (True, False):
+            with self.subTest(fast=fast), override_settings(CONTACTS_FAST_LIST=fast):
+                response = self.client.get(
+                    self.url,
+                    {"omit": "labels,profile_url", "cursor": "", "page_size": 2},
+                )
+                self.assertEqual(len(response.data["results"]), 2)
+                self.assertNotIn("labels", response.data["results"][0])
+                self.assertIn("company_with_position", response.data["results"][0])
+                next_params = parse_qs(
+                    urlsplit(response.data["pagination"]["next"]).query
+                )
+                response = self.client.get(
+                    self.url,
+                    {
+                        "omit": "labels,profile_url",
+                        "cursor": next_params["cursor"][0],
+                        "page_size": 2,
+                    },
+                )
+                self.assertEqual(
+                    [item["name"] for item in response.data["results"]], ["홍길동0"]
+                )
+
+    def test_detail_fields(self):
+        """상세에서 메모/주소/라벨 스냅샷을 요청하지 않으면 읽지 않는지 테스트"""
+        url = reverse("contact-detail", args=[self.contact.id])
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {"omit": "memo,address"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("memo", response.data)
+        self.assertNotIn("address", response.data)
+        self.assertEqual(response.data["labels"][0]["name"], "가족")
+        [sql] = self.contact_queries(queries)
+        self.assertNotIn('"memo"', sql)
+        self.assertNotIn('"address"', sql)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {"fields": "id,name"})
+        self.assertEqual(response.data, {"id": self.contact.id, "name": "홍길동2"})
+        [sql] = self.contact_queries(queries)
+        self.assertNotIn("label_snapshot", sql)
+        # 고른 필드가 다르면 ETag도 다름
+        full = self.client.get(url)
+        self.assertNotEqual(full["ETag"], response["ETag"])
+        self.assertIn("memo", full.data)
+
+    def test_invalid_fieldset(self):
+        """알 수 없는 필드, 쓰기 전용 필드, 빈 결과는 400 응답인지 테스트"""
+        detail = reverse("contact-detail", args=[self.contact.id])
+        for url, params in [
+            (self.url, {"fields": "id,unknown"}),
+            (self.url, {"fields": "memo"}),  # 목록에 없는 필드
+            (self.url, {"omit": "name,nope"}),
+            (self.url, {"fields": ""}),
+            (self.url, {"fields": "id", "omit": "id"}),
+            (detail, {"fields": "label_ids"}),  # 쓰기 전용 필드
+        ]:
+            with self.subTest(url=url, params=params):
+                response = self.client.get(url, params)
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn("error", response.data)
+
+
+class DatasetCommandTest(APITestCase):
+    """합성 데이터 생성 명령과 API 벤치마크 명령 테스트"""
+
+    def generate(self, **options):
+        call_command(
+            "generate_contacts",
+            count=60,
+            batch_size=25,
+            labels=5,
+            seed=1,
+            stdout=io.StringIO(),
+            **options,
+        )
+
+    def test_generate_contacts_keeps_derived_data_consistent(self):
+        """생성한 연락처의 통계, 라벨별 연락처 수, 라벨 스냅샷, 검색 색인이 맞는지 테스트"""
+        self.generate()
+        self.assertEqual(Contact.objects.count(), 60)
+        self.assertEqual(Label.objects.count(), 5)
+        self.assertEqual(
+            ContactStatistics.load().as_dict(), ContactStatistics.compute()
+        )
+        self.assertEqual(Label.rebuild_contact_counts(), 0)
+        contacts = {contact.id: contact for contact in Contact.objects.all()}
+        for contact_id, snapshot in build_snapshots(list(contacts)).items():
+            self.assertEqual(contacts[contact_id].label_snapshot, snapshot)
+        # 전문 검색 색인도 다시 만들어짐
+        contact = Contact.objects.exclude(phone__isnull=True).first()
+        response = self.client.get(
+            reverse("contact-list"), {"search": contact.phone[-4:]}
+        )
+        self.assertIn(contact.id, [item["id"] for item in response.data["results"]])
+
+        # --clear: 기존 연락처를 지우고 같은 시드로 같은 데이터를 다시 생성
+        names = list(Contact.objects.order_by("id").values_list("name", flat=True))
+        self.generate(clear=True)
+        self.assertEqual(
+            list(Contact.objects.order_by("id").values_list("name", flat=True)), names
+        )
+        self.assertEqual(ContactStatistics.load().total_contacts, 60)
+
+    def test_clear_keeps_other_address_books(self):
+        """--clear가 현재 주소록의 연락처와 라벨 연결만 삭제하고 삭제 기록을 남기는지 테스트"""
+        with use_address_book("acme"):
+            label = Label.objects.create(name="거래처")
+            contact = Contact.objects.create(name="acme 연락처")
+            contact.labels.add(label)
+        self.generate()
+        removed = set(Contact.objects.values_list("id", flat=True))
+        self.generate(clear=True)
+        # 지운 연락처는 동기화 피드의 삭제 기록으로 전달됨
+        self.assertEqual(
+            set(SyncTombstone.objects.values_list("object_id", flat=True)), removed
+        )
+        with use_address_book("acme"):
+            self.assertEqual(list(contact.labels.all()), [label])
+            label.refresh_from_db()
+            self.assertEqual(label.contact_count, 1)
+        self.assertEqual(Contact.objects.count(), 60)
+
+    def test_benchmark_api_compares_with_baseline(self):
+        """벤치마크 결과를 기준 파일로 저장하고 비교할 수 있는지 테스트"""
+        self.generate()
+        baseline = os.path.join(
+            self.enterContext(tempfile.TemporaryDirectory()), "b.json"
+        )
+        options = {"repeat": 2, "warmup": 0, "cases": ["list", "detail", "label_stats"]}
+        out = io.StringIO()
+        call_command("benchmark_api", save_baseline=baseline, stdout=out, **options)
+        results = json.loads(out.getvalue())
+        self.assertEqual(set(results["cases"]), {"list", "detail", "label_stats"})
+        for case in results["cases"].values():
+            self.assertEqual(case["status"], [200])
+            self.assertGreaterEqual(case["queries"], 1)
+            self.assertLessEqual(case["p50_ms"], case["p99_ms"])
+
+        out = io.StringIO()
+        call_command(
+            "benchmark_api", baseline=baseline, tolerance=1000, stdout=out, **options
+        )
+        results = json.loads(out.getvalue())
+        self.assertEqual(results["regressions"], [])
+        self.assertEqual(results["comparison"]["detail"]["queries_delta"], 0)
+
+
+class QueryBudgetTest(TransactionTestCase):
+    """
+    ContactViewSet / LabelViewSet의 모든 액션이 쿼리 예산 안에서 처리되는지 테스트
+    예산은 캐시가 비어 있는 상태(개수/라벨 레지스트리 캐시 없음) 기준이며,
+    목록 계열은 페이지 크기(결과 수)와 관계없이 같은 예산을 지켜야 합니다 (N+1 방지)
+    라벨 레지스트리는 트랜잭션 안에서 읽은 라벨을 보관하지 않으므로 실제 운영과 같도록
+    테스트를 트랜잭션으로 감싸지 않는 TransactionTestCase를 사용합니다
+    """
+
+    client_class = APIClient
+
+    def setUp(self):
+        cache.clear()
+        label_registry.clear()
+        self.family = Label.objects.create(name="가족")
+        self.work = Label.objects.create(name="회사")
+        for index in range(30):
+            contact = Contact.objects.create(
+                name=f"홍길동{index:02d}",
+                phone=f"010-1234-{index:04d}",
+                email=f"hong{index}@example.com",
+                company="가나상사",
+                birthday=timezone.localdate().replace(year=2000),
+            )
+            contact.labels.add(self.family, self.work)
+        self.contact = contact
+        # 마이그레이션으로 만들어지는 통계 행은 TransactionTestCase의 테이블 비우기로 삭제되므로 다시 생성
+        ContactStatistics.rebuild()
+
+    def assertBudget(self, max_queries, method, url, data=None, **params):
+        """캐시를 비운 뒤 요청 하나가 max_queries번 이하의 쿼리로 처리되는지 확인"""
+        cache.clear()
+        label = f"{method.upper()} {url} {params or data or ''}"
+        with query_budget(max_queries, label):
+            if method == "get":
+                response = self.client.get(url, params)
+            else:
+                response = getattr(self.client, method)(url, data, format="json")
+            if response.streaming:
+                b"".join(response.streaming_content)
+        self.assertLess(response.status_code, 400, label)
+        return response
+
+    def test_contact_list_actions(self):
+        """목록/생일/통계/내보내기는 결과 수와 관계없이 같은 예산"""
+        for page_size in (5, 30):
+            self.assertBudget(2, "get", reverse("contact-list"), page_size=page_size)
+            self.assertBudget(
+                1, "get", reverse("contact-list"), page_size=page_size, cursor=""
+            )
+            self.assertBudget(
+                2,
+                "get",
+                reverse("contact-list"),
+                page_size=page_size,
+                fields="id,name,phone",
+            )
+            self.assertBudget(
+                2, "get", reverse("contact-birthdays-this-month"), page_size=page_size
+            )
+            self.assertBudget(
+                2, "get", reverse("contact-upcoming-birthdays"), page_size=page_size
+            )
+        self.assertBudget(2, "get", reverse("contact-list"), search="홍길동")
+        self.assertBudget(1, "get", reverse("contact-statistics"))
+        self.assertBudget(3, "get", reverse("contact-sync"))
+        self.assertBudget(2, "get", reverse("contact-export"), type="csv")
+        self.assertBudget(2, "get", reverse("contact-export"), type="vcard")
+
+    def test_contact_detail_actions(self):
+        """상세 조회/생성/수정/삭제/라벨 추가·제거"""
+        detail = reverse("contact-detail", args=[self.contact.id])
+        self.assertBudget(2, "get", detail)
+        payload = {
+            "name": "김철수",
+            "phone": "010-9999-0000",
+            "label_ids": [self.family.id],
+        }
+        self.assertBudget(11, "post", reverse("contact-list"), payload)
+        self.assertBudget(11, "put", detail, payload)
+        self.assertBudget(9, "patch", detail, {"company": "다라전자"})
+        self.assertBudget(
+            10,
+            "post",
+            reverse("contact-add-labels", args=[self.contact.id]),
+            {"label_ids": [self.work.id]},
+        )
+        self.assertBudget(
+            10,
+            "post",
+            reverse("contact-remove-labels", args=[self.contact.id]),
+            {"label_ids": [self.work.id]},
+        )
+        # 삭제는 동기화 피드의 삭제 기록 INSERT 포함
+        self.assertBudget(11, "delete", detail)
+
+    def test_contact_duplicate_actions(self):
+        """중복 묶음 조회는 묶음 수와 관계없이 같은 예산, 합치기는 합칠 연락처 수와 관계없이 같은 예산"""
+        copies = [
+            Contact.objects.create(
+                name=f"사본{index}", email=f"HONG{index}@example.com"
+            )
+            for index in range(10)
+        ]
+        for page_size in (2, 10):
+            response = self.assertBudget(
+                5, "get", reverse("contact-duplicates"), page_size=page_size
+            )
+            self.assertEqual(len(response.data["results"]), page_size)
+        for merged in (copies[:1], copies[1:5]):
+            # 대상 연락처에 없는 라벨도 합쳐지도록 새 라벨 연결
+            label = Label.objects.create(name=f"친구{len(merged)}")
+            for copy in merged:
+                copy.labels.add(self.family, label)
+            # 라벨 연락처 수는 증감값이 같은 라벨끼리 UPDATE 하나 (여기서는 증감값 2가지)
+            self.assertBudget(
+                16,
+                "post",
+                reverse("contact-merge", args=[self.contact.id]),
+                {"contact_ids": [copy.id for copy in merged]},
+            )
+
+    def test_contact_bulk_action(self):
+        """일괄 처리는 항목 수와 관계없이 같은 예산 (청크 하나 기준)"""
+        ids = list(Contact.objects.values_list("id", flat=True))
+        for size in (2, 20):
+            self.assertBudget(
+                26,
+                "post",
+                reverse("contact-bulk"),
+                {
+                    "create": [
+                        {"name": f"새연락처{i}", "label_ids": [self.family.id]}
+                        for i in range(size)
+                    ],
+                    "update": [{"id": id, "company": "다라전자"} for id in ids[:size]],
+                    "delete": ids[size : size * 2],
+                },
+            )
+
+    def test_label_actions(self):
+        """라벨 목록/상세/생성/수정/삭제/통계/라벨별 연락처"""
+        detail = reverse("label-detail", args=[self.work.id])
+        self.assertBudget(2, "get", reverse("label-list"))
+        self.assertBudget(1, "get", reverse("label-stats"))
+        self.assertBudget(2, "get", reverse("label-contacts", args=[self.family.id]))
+        self.assertBudget(1, "get", detail)
+        # 쓰기는 주소록 이동 확인을 위해 쓰기 트랜잭션(BEGIN IMMEDIATE) 안에서 실행
+        self.assertBudget(3, "post", reverse("label-list"), {"name": "친구"})
+        self.assertBudget(7, "put", detail, {"name": "직장", "color": "#000000"})
+        self.assertBudget(6, "patch", detail, {"color": "#111111"})
+        self.assertBudget(8, "delete", detail)
+
+    def test_admin_changelist_has_no_n_plus_one(self):
+        """관리자 연락처 목록의 라벨 컬럼이 행마다 쿼리를 실행하지 않는지 테스트"""
+        user = User.objects.create_superuser("admin", "admin@example.com", "pw")
+        self.client.force_login(user)
+        url = reverse("admin:contacts_contact_changelist")
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertContains(response, "가족, 회사")
+        # 연락처가 늘어나도 쿼리 수는 같아야 함
+        for index in range(20):
+            Contact.objects.create(name=f"추가{index}").labels.add(self.family)
+        with query_budget(len(queries), "관리자 연락처 목록"):
+            self.client.get(url)
+
+    def test_query_budget_helper(self):
+        """예산을 넘으면 실행된 SQL과 함께 실패하는지 테스트"""
+        with self.assertRaisesMessage(QueryBudgetExceeded, "SQL 2번 실행 (예산 1번)"):
+            with query_budget(1):
+                list(Contact.objects.all()[:1])
+                list(Label.objects.all())
+
+        @query_budget(1)
+        def one_query():
+            return Contact.objects.count()
+
+        self.assertEqual(one_query(), 30)
+
+
+class SQLInstrumentationMiddlewareTest(APITestCase):
+    """요청별 SQL 계측(Server-Timing 헤더, 느린 요청 로그) 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        Contact.objects.create(name="홍길동")
+
+    def test_server_timing_header(self):
+        """SQL 수, DB 시간, 렌더링 시간이 Server-Timing 헤더에 포함되는지 테스트"""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("contact-list"))
+        timing = response["Server-Timing"]
+        self.assertIn(f'desc="{len(queries)} queries"', timing)
+        for metric in ("db;dur=", "db-slowest;dur=", "render;dur=", "total;dur="):
+            self.assertIn(metric, timing)
+        with override_settings(CONTACTS_SERVER_TIMING=False):
+            response = self.client.get(reverse("contact-list"))
+        self.assertNotIn("Server-Timing", response)
+
+    @override_settings(CONTACTS_SLOW_REQUEST_MS=0)
+    def test_slow_request_log(self):
+        """기준 시간을 넘은 요청이 구조화된 로그로 남는지 테스트"""
+        with self.assertLogs("api.contacts.instrumentation", "WARNING") as logs:
+            self.client.get(reverse("contact-list"), {"search": "홍길동"})
+        record = logs.records[0].request_stats
+        self.assertEqual(
+            record["path"], "/api/contacts/?search=%ED%99%8D%EA%B8%B8%EB%8F%99"
+        )
+        self.assertEqual(record["status"], 200)
+        self.assertGreaterEqual(record["queries"], 1)
+        self.assertIn("SELECT", record["slowest_sql"])
+        self.assertEqual(json.loads(logs.records[0].args[0]), record)
+
+
+class AsyncReadViewTest(APITestCase):
+    """ASGI용 비동기 조회 API가 동기 API와 같은 응답을 반환하는지 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        label_registry.clear()
+        self.family = Label.objects.create(name="가족", color="#FF0000")
+        self.work = Label.objects.create(name="회사", color="#0000FF")
+        for index in range(25):
+            contact = Contact.objects.create(
+                name=f"김철수{index:02d}",
+                phone=f"010-1234-{index:04d}",
+                email=f"user{index}@example.com" if index % 3 else None,
+                company="가나상사" if index % 2 else None,
+                memo="메모",
+            )
+            contact.labels.add(self.family if index % 2 else self.work)
+        self.contact = Contact.objects.order_by("id")[3]
+
+    def assertSameResponse(self, sync_url, async_url, params=None):
+        """같은 파라미터로 요청한 동기/비동기 응답의 상태 코드, 본문, ETag가 같은지 확인합니다"""
+        sync_response = self.client.get(sync_url, params or {})
+        async_response = self.client.get(async_url, params or {})
+        self.assertEqual(async_response.status_code, sync_response.status_code)
+        self.assertEqual(async_response.get("ETag"), sync_response.get("ETag"))
+        sync_data, async_data = sync_response.json(), async_response.json()
+        # 페이지 링크는 요청 경로만 다름
+        for data in (sync_data, async_data):
+            if isinstance(data, dict) and "pagination" in data:
+                for link in ("next", "previous"):
+                    if data["pagination"].get(link):
+                        data["pagination"][link] = urlsplit(
+                            data["pagination"][link]
+                        ).query
+        self.assertEqual(async_data, sync_data)
+        return async_response
+
+    def test_contact_list_matches_sync_path(self):
+        """목록의 필터/검색/정렬/페이지네이션/부분 필드가 동기 경로와 같은지 테스트"""
+        for params in [
+            {},
+            {"page": "2", "page_size": "10"},
+            {"page": "last", "count": "exact"},
+            {"count": "skip", "page": "2", "page_size": "10"},
+            {"count": "estimated"},
+            {"search": "김철수"},
+            {"search": "1234-0007"},
+            {"labels": str(self.family.id), "ordering": "name"},
+            {"has_email": "false", "ordering": "-email"},
+            {"company": "가나", "fields": "id,name,labels"},
+            {"cursor": "", "ordering": "name", "page_size": "7"},
+            {"fields": "unknown"},
+            {"page": "99"},
+        ]:
+            with self.subTest(params=params):
+                self.assertSameResponse(
+                    reverse("contact-list"), reverse("async-contact-list"), params
+                )
+
+        # 커서의 다음 페이지 링크도 그대로 사용 가능
+        first = self.client.get(reverse("async-contact-list"), {"cursor": ""}).json()
+        second = self.client.get(first["pagination"]["next"]).json()
+        ids = [item["id"] for item in first["results"] + second["results"]]
+        self.assertEqual(len(ids), 25)
+        self.assertEqual(len(set(ids)), 25)
+
+    def test_detail_statistics_and_labels_match_sync_path(self):
+        """상세, 통계, 라벨 목록/통계 응답이 동기 경로와 같은지 테스트"""
+        pk = self.contact.pk
+        cases = [
+            ("contact-detail", "async-contact-detail", [pk], {}),
+            ("contact-detail", "async-contact-detail", [pk], {"omit": "memo"}),
+            ("contact-detail", "async-contact-detail", [999999], {}),
+            ("contact-detail", "async-contact-detail", ["abc"], {}),
+            ("contact-statistics", "async-contact-statistics", [], {}),
+            ("contact-statistics", "async-contact-statistics", [], {"fresh": "true"}),
+            ("label-list", "async-label-list", [], {}),
+            ("label-list", "async-label-list", [], {"ordering": "-contact_count"}),
+            ("label-stats", "async-label-stats", [], {}),
+        ]
+        for sync_name, async_name, args, params in cases:
+            with self.subTest(url=sync_name, args=args, params=params):
+                self.assertSameResponse(
+                    reverse(sync_name, args=args),
+                    reverse(async_name, args=args),
+                    params,
+                )
+
+    def test_conditional_get(self):
+        """비동기 목록/상세도 ETag가 같으면 304로 응답하는지 테스트"""
+        for url in (
+            reverse("async-contact-list"),
+            reverse("async-contact-detail", args=[self.contact.pk]),
+        ):
+            etag = self.client.get(url)["ETag"]
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # 연락처가 바뀌면 다시 200
+        url = reverse("async-contact-detail", args=[self.contact.pk])
+        etag = self.client.get(url)["ETag"]
+        self.client.patch(
+            reverse("contact-detail", args=[self.contact.pk]),
+            {"memo": "변경"},
+            format="json",
+        )
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["memo"], "변경")
+
+    async def test_async_client_runs_without_thread_hop(self):
+        """비동기 클라이언트(ASGI)로 요청해도 같은 응답과 Server-Timing 헤더를 반환하는지 테스트"""
+        response = await self.async_client.get(
+            reverse("async-contact-list"), {"page_size": "5"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["pagination"]["count"], 25)
+        self.assertEqual(len(data["results"]), 5)
+        # 비동기 요청은 DB 항목 없이 전체 시간만 기록
+        self.assertIn("total;dur=", response["Server-Timing"])
+        self.assertNotIn("db;dur=", response["Server-Timing"])
+
+        response = await self.async_client.get(reverse("async-label-stats"))
+        # 연락처 수가 많은 순 (회사 13명, 가족 12명)
+        self.assertEqual([item["name"] for item in response.json()], ["회사", "가족"])
+
+
+class AsyncBenchmarkCommandTest(TransactionTestCase):
+    """ASGI 동기/비동기 동시 요청 벤치마크 명령 테스트"""
+
+    def test_benchmark_asgi(self):
+        """동시 요청 수별로 두 경로를 모두 측정하는지 테스트"""
+        cache.clear()
+        label_registry.clear()
+        for index in range(10):
+            Contact.objects.create(name=f"김철수{index}")
+        ContactStatistics.rebuild()
+        out = io.StringIO()
+        call_command(
+            "benchmark_asgi",
+            concurrency=[1, 4],
+            requests=8,
+            warmup=1,
+            cases=["list", "detail", "statistics"],
+            stdout=out,
+        )
+        results = json.loads(out.getvalue())
+        self.assertEqual(results["rows"], 10)
+        for case in results["cases"].values():
+            for mode in ("sync", "async"):
+                for level in ("1", "4"):
+                    self.assertEqual(case[mode][level]["status"], [200])
+                    self.assertEqual(case[mode][level]["runs"], 8)
+            self.assertEqual(set(case["speedup"]), {"1", "4"})
+
+
+class ReadReplicaRoutingTest(TransactionTestCase):
+    """
+    읽기 복제본 라우팅 테스트
+    기본 DB(메모리 SQLite)를 임시 SQLite 파일로 복사해서 복제본으로 사용합니다
+    복제본 연결은 테스트 트랜잭션 밖의 데이터를 읽으므로 TransactionTestCase 사용
+    """
+
+    replica = "replica_test"
+
+    def setUp(self):
+        cache.clear()
+        label_registry.clear()
+        replicas.lag_monitor.clear()
+        ContactStatistics.rebuild()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        connections.settings[self.replica] = {
+            **connections.settings["default"],
+            "NAME": os.path.join(directory.name, "replica.sqlite3"),
+        }
+        self.addCleanup(self.remove_replica)
+        replica_settings = override_settings(
+            CONTACTS_READ_REPLICAS=[self.replica],
+            CONTACTS_REPLICA_LAG_CHECK_SECONDS=0,
+        )
+        replica_settings.enable()
+        self.addCleanup(replica_settings.disable)
+        self.list_url = reverse("contact-list")
+        for index in range(3):
+            Contact.objects.create(name=f"김철수{index}")
+
+    def remove_replica(self):
+        connections[self.replica].close()
+        del connections[self.replica]
+        del connections.settings[self.replica]
+
+    def sync_replica(self):
+        """하트비트를 기록하고 기본 DB를 복제본 파일로 복사"""
+        out = io.StringIO()
+        call_command("replica_heartbeat", once=True, copy_sqlite=True, stdout=out)
+        return json.loads(out.getvalue())
+
+    def count(self, client):
+        """목록에서 실제로 읽은 연락처 수 (개수는 DB와 관계없이 공유 캐시에서 올 수 있으므로 행 수로 확인)"""
+        response = client.get(self.list_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(response.data["results"])
+
+    def test_reads_go_to_replica(self):
+        """안전한 조회는 복제본에서, 요청 밖의 조회는 기본 DB에서 읽는지 테스트"""
+        status_line = self.sync_replica()
+        self.assertTrue(status_line["replicas"][self.replica]["fresh"])
+        # 복사 이후의 변경은 기본 DB에만 있음
+        Contact.objects.create(name="복사 후 연락처")
+
+        self.assertEqual(self.count(APIClient()), 3)
+        statistics = APIClient().get(reverse("contact-statistics"))
+        self.assertEqual(statistics.data["total_contacts"], 3)
+        self.assertEqual(Contact.objects.count(), 4)
+
+        # 최신 변경을 받지 못한 복제본에서 센 개수는 캐시하지 않으므로 다시 복사하면 바로 반영
+        response = APIClient().get(self.list_url)
+        self.assertEqual(response.data["pagination"]["count"], 3)
+        self.sync_replica()
+        response = APIClient().get(self.list_url)
+        self.assertEqual(response.data["pagination"]["count"], 4)
+
+    def test_read_your_writes(self):
+        """쓰기를 한 클라이언트는 고정 쿠키로 기본 DB에서 읽는지 테스트"""
+        self.sync_replica()
+        writer = APIClient()
+        response = writer.post(self.list_url, {"name": "새 연락처"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertIn(replicas.PIN_COOKIE, response.cookies)
+
+        self.assertEqual(self.count(writer), 4)
+        detail = writer.get(reverse("contact-detail", args=[response.data["id"]]))
+        self.assertEqual(detail.status_code, status.HTTP_200_OK)
+        # 쓰기를 하지 않은 클라이언트는 복제본에서 읽음
+        self.assertEqual(self.count(APIClient()), 3)
+
+        # 고정 시간이 지난 쿠키, 잘못된 쿠키는 무시
+        writer.cookies[replicas.PIN_COOKIE] = "1.0"
+        self.assertEqual(self.count(writer), 3)
+        writer.cookies[replicas.PIN_COOKIE] = "abc"
+        self.assertEqual(self.count(writer), 3)
+        # 조회만 한 응답에는 고정 쿠키를 붙이지 않음
+        self.assertNotIn(replicas.PIN_COOKIE, writer.get(self.list_url).cookies)
+
+    def test_lag_guard(self):
+        """지연이 최대 지연을 넘거나 하트비트를 읽을 수 없는 복제본은 사용하지 않는지 테스트"""
+        # 복사하지 않은 복제본 (테이블 없음) -> 기본 DB
+        Contact.objects.create(name="복사 전 연락처")
+        self.assertEqual(self.count(APIClient()), 4)
+
+        self.sync_replica()
+        Contact.objects.create(name="복사 후 연락처")
+        self.assertEqual(self.count(APIClient()), 4)
+
+        ReplicaHeartbeat.objects.using(self.replica).update(
+            beat_at=timezone.now() - timedelta(seconds=60)
+        )
+        with override_settings(CONTACTS_REPLICA_MAX_LAG=30):
+            self.assertEqual(self.count(APIClient()), 5)
+            self.assertFalse(replicas.lag_monitor.status()[self.replica]["fresh"])
+        with override_settings(CONTACTS_REPLICA_MAX_LAG=120):
+            self.assertEqual(self.count(APIClient()), 4)
+
+    def test_stale_replica_etag(self):
+        """복제본이 최신 변경을 받으면 예전 ETag로 304가 되지 않는지 테스트"""
+        self.sync_replica()
+        Contact.objects.create(name="복사 후 연락처")
+        client = APIClient()
+        stale = client.get(self.list_url)
+        self.assertEqual(stale.data["pagination"]["count"], 3)
+        response = client.get(self.list_url, HTTP_IF_NONE_MATCH=stale["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.sync_replica()
+        response = client.get(self.list_url, HTTP_IF_NONE_MATCH=stale["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["pagination"]["count"], 4)
+
+    async def test_async_view_reads_replica(self):
+        """비동기 조회 뷰도 복제본에서 읽는지 테스트"""
+        await sync_to_async(self.sync_replica)()
+        await Contact.objects.acreate(name="복사 후 연락처")
+        response = await self.async_client.get(reverse("async-contact-list"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(json.loads(response.content)["pagination"]["count"], 3)
+
+
+class ShardingTest(TransactionTestCase):
+    """
+    주소록 샤딩 테스트
+    임시 SQLite 파일을 두 번째 샤드로 추가해서 주소록별 라우팅과 온라인 이동을 확인합니다
+    샤드 연결은 테스트 트랜잭션 밖의 데이터를 읽으므로 TransactionTestCase 사용
+    """
+
+    shard = "shard_test"
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        connections.settings[self.shard] = {
+            **connections.settings["default"],
+            "NAME": os.path.join(directory.name, "shard.sqlite3"),
+        }
+        self.addCleanup(self.remove_shard)
+        shard_settings = override_settings(CONTACTS_SHARDS=["default", self.shard])
+        shard_settings.enable()
+        self.addCleanup(shard_settings.disable)
+        call_command("migrate", database=self.shard, verbosity=0)
+        cache.clear()
+        label_registry.clear()
+        shards.directory.clear()
+        self.addCleanup(shards.directory.clear)
+        ContactStatistics.rebuild()
+        self.list_url = reverse("contact-list")
+
+    def remove_shard(self):
+        connections[self.shard].close()
+        del connections[self.shard]
+        del connections.settings[self.shard]
+
+    def client_for(self, book):
+        """요청마다 X-Address-Book 헤더를 보내는 클라이언트"""
+        client = APIClient()
+        client.credentials(HTTP_X_ADDRESS_BOOK=book)
+        return client
+
+    def book_contacts(self, alias, book):
+        return Contact._base_manager.using(alias).filter(address_book=book)
+
+    def test_hashed_shard(self):
+        """해시 샤드는 항상 같은 결과이고, 디렉터리 지정이 해시보다 우선하는지 테스트"""
+        candidates = ["default", "shard1", "shard2"]
+        picked = {
+            shards.hashed_shard(f"book{index}", candidates) for index in range(50)
+        }
+        self.assertEqual(picked, set(candidates))
+        self.assertEqual(
+            shards.hashed_shard("acme", candidates),
+            shards.hashed_shard("acme", list(reversed(candidates))),
+        )
+        # 기본 주소록은 지정이 없으면 기본 DB (샤딩 전의 기존 데이터)
+        self.assertEqual(shards.directory.alias_for("default"), "default")
+        shards.directory.assign("acme", self.shard)
+        self.assertEqual(shards.directory.alias_for("acme"), self.shard)
+        shards.directory.assign("acme", "default")
+        self.assertEqual(shards.directory.alias_for("acme"), "default")
+        # 디렉터리는 기본 DB에만 있음
+        self.assertEqual(AddressBookShard.objects.count(), 1)
+
+    def test_requests_are_scoped_to_address_book(self):
+        """요청의 주소록이 지정된 샤드에 저장되고 다른 주소록에는 보이지 않는지 테스트"""
+        shards.directory.assign("acme", self.shard)
+        acme = self.client_for("acme")
+        response = acme.post(self.list_url, {"name": "김철수"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        # 샤드의 ID 범위에서 발급
+        self.assertGreater(response.data["id"], shards.id_floor(self.shard))
+        self.assertEqual(self.book_contacts(self.shard, "acme").count(), 1)
+        self.assertFalse(self.book_contacts("default", "acme").exists())
+
+        self.assertEqual(acme.get(self.list_url).data["pagination"]["count"], 1)
+        self.assertEqual(APIClient().get(self.list_url).data["pagination"]["count"], 0)
+        response = APIClient().get(self.list_url, {"address_book": "acme"})
+        self.assertEqual(response.data["pagination"]["count"], 1)
+        detail = reverse("contact-detail", args=[response.data["results"][0]["id"]])
+        self.assertEqual(APIClient().get(detail).status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(acme.get(detail).status_code, status.HTTP_200_OK)
+        with use_address_book("acme"):
+            self.assertEqual(ContactStatistics.load().total_contacts, 1)
+        self.assertEqual(ContactStatistics.load().total_contacts, 0)
+
+        # 라벨 이름은 주소록 안에서만 고유
+        label_url = reverse("label-list")
+        for client in (APIClient(), acme):
+            response = client.post(label_url, {"name": "가족"}, format="json")
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        response = acme.post(label_url, {"name": "가족"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client_for("bad book!").get(self.list_url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_writes_rejected_while_moving(self):
+        """이동 중(읽기 전용)인 주소록은 조회만 되고 쓰기는 503인지 테스트"""
+        shards.directory.assign("acme", "default", read_only=True)
+        acme = self.client_for("acme")
+        self.assertEqual(acme.get(self.list_url).status_code, status.HTTP_200_OK)
+        response = acme.post(self.list_url, {"name": "김철수"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertFalse(Contact._base_manager.filter(address_book="acme").exists())
+        # 다른 주소록은 영향 없음
+        response = APIClient().post(self.list_url, {"name": "김철수"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def move(self, command="move_address_book"):
+        out = io.StringIO()
+        call_command(command, "acme", target=self.shard, batch_size=2, stdout=out)
+        return json.loads(out.getvalue())
+
+    def create_acme(self):
+        shards.directory.assign("acme", "default")
+        acme = self.client_for("acme")
+        label = acme.post(reverse("label-list"), {"name": "가족"}, format="json")
+        ids = [
+            acme.post(
+                self.list_url,
+                {"name": f"김철수{index}", "label_ids": [label.data["id"]]},
+                format="json",
+            ).data["id"]
+            for index in range(5)
+        ]
+        return acme, ids
+
+    def test_move_address_book(self):
+        """주소록 이동 후 데이터/ID/통계가 대상 샤드로 옮겨지고 원본에서 지워지는지 테스트"""
+        acme, ids = self.create_acme()
+        created_at = self.book_contacts("default", "acme").get(id=ids[0]).created_at
+        Contact.objects.create(name="기본 주소록 연락처")
+
+        result = self.move()
+        self.assertEqual(result["copied"], {"labels": 1, "contacts": 5})
+        self.assertEqual(result["removed_from_source"], 5)
+        self.assertEqual(shards.directory.alias_for("acme"), self.shard)
+        self.assertFalse(shards.directory.is_read_only("acme"))
+
+        moved = self.book_contacts(self.shard, "acme")
+        self.assertEqual(sorted(moved.values_list("id", flat=True)), ids)
+        self.assertEqual(moved.get(id=ids[0]).created_at, created_at)
+        self.assertFalse(self.book_contacts("default", "acme").exists())
+        self.assertEqual(Contact.objects.count(), 1)
+
+        response = acme.get(self.list_url)
+        self.assertEqual(response.data["pagination"]["count"], 5)
+        self.assertEqual(
+            acme.get(reverse("contact-statistics")).data["total_contacts"], 5
+        )
+        labels = acme.get(reverse("label-list")).data
+        self.assertEqual(labels["results"][0]["contact_count"], 5)
+        # 옮긴 뒤의 새 연락처는 대상 샤드의 ID 범위에서 발급
+        response = acme.post(self.list_url, {"name": "이영희"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertGreater(response.data["id"], shards.id_floor(self.shard))
+
+        with self.assertRaises(CommandError):
+            self.move()
+
+    def test_move_applies_concurrent_changes(self):
+        """복사하는 동안 생긴 추가/수정/삭제가 차이 반영 단계에서 대상 샤드에 반영되는지 테스트"""
+        acme, ids = self.create_acme()
+        test = self
+
+        class Command(MoveAddressBookCommand):
+            def copy(self, *args):
+                copied = super().copy(*args)
+                # 복사가 끝난 뒤, 쓰기 중지 전의 요청들
+                test.assertEqual(
+                    acme.patch(
+                        reverse("contact-detail", args=[ids[0]]),
+                        {"name": "바뀐 이름"},
+                        format="json",
+                    ).status_code,
+                    status.HTTP_200_OK,
+                )
+                acme.delete(reverse("contact-detail", args=[ids[1]]))
+                acme.post(test.list_url, {"name": "새 연락처"}, format="json")
+                return copied
+
+        result = self.move(Command())
+        self.assertEqual(result["delta"]["contacts_deleted"], 1)
+        moved = self.book_contacts(self.shard, "acme")
+        self.assertEqual(moved.count(), 5)
+        self.assertEqual(moved.get(id=ids[0]).name, "바뀐 이름")
+        self.assertFalse(moved.filter(id=ids[1]).exists())
+        # 동기화 피드의 삭제 기록도 함께 옮겨짐
+        tombstones = SyncTombstone._base_manager.using(self.shard)
+        self.assertTrue(
+            tombstones.filter(address_book="acme", object_id=ids[1]).exists()
+        )
+        self.assertTrue(moved.filter(name="새 연락처").exists())
+        label = Label._base_manager.using(self.shard).get(address_book="acme")
+        self.assertEqual(label.contact_count, 4)
+        self.assertEqual(acme.get(self.list_url).data["pagination"]["count"], 5)
+        self.assertEqual(
+            acme.get(reverse("contact-statistics")).data["total_contacts"], 5
+        )
+
+    def test_repair_commands_cover_every_address_book(self):
+        """통계/라벨 수/라벨 스냅샷 복구 명령이 모든 샤드의 모든 주소록을 검사하는지 테스트"""
+        shards.directory.assign("acme", self.shard)
+        with use_address_book("acme"):
+            label = Label.objects.create(name="거래처")
+            contacts = [Contact.objects.create(name=f"acme{i}") for i in range(2)]
+            contacts[0].labels.add(label)
+            # 시그널을 거치지 않는 변경으로 생긴 오차
+            ContactStatistics.load()
+            ContactStatistics.objects.update(total_contacts=99)
+            Label.objects.update(contact_count=5)
+            Contact.objects.update(label_snapshot=[])
+
+        out = io.StringIO()
+        call_command("reconcile_contact_statistics", stdout=out)
+        self.assertIn("[shard_test/acme] total_contacts: 99 -> 2", out.getvalue())
+        call_command("rebuild_label_counts", stdout=out)
+        self.assertIn("불일치 1건 수정함", out.getvalue())
+        call_command("check_label_snapshots", "--address-book", "acme", stdout=out)
+        self.assertIn("연락처 2명 검사, 라벨 스냅샷 불일치 1명", out.getvalue())
+
+        with use_address_book("acme"):
+            self.assertEqual(ContactStatistics.load().total_contacts, 2)
+            label.refresh_from_db()
+            self.assertEqual(label.contact_count, 1)
+            self.assertEqual(
+                Contact.objects.get(id=contacts[0].id).label_snapshot[0]["id"],
+                label.id,
+            )
+
+
+class SQLiteProfileTest(TransactionTestCase):
+    """
+    SQLite 운영 프로필 테스트 (연결 PRAGMA, 쓰기 작업의 BEGIN IMMEDIATE)
+    트랜잭션 시작 SQL을 확인해야 하므로 테스트를 트랜잭션으로 감싸지 않는 TransactionTestCase 사용
+    """
+
+    def setUp(self):
+        cache.clear()
+        label_registry.clear()
+        ContactStatistics.rebuild()
+
+    def test_connection_pragmas(self):
+        """연결할 때 설정의 PRAGMA가 적용되는지 테스트"""
+        with connection.cursor() as cursor:
+            values = {}
+            for name in ("busy_timeout", "synchronous", "temp_store", "cache_size"):
+                cursor.execute(f"PRAGMA {name}")
+                values[name] = cursor.fetchone()[0]
+        # synchronous: 1 = NORMAL, temp_store: 2 = MEMORY
+        self.assertEqual(
+            values,
+            {
+                "busy_timeout": 5000,
+                "synchronous": 1,
+                "temp_store": 2,
+                "cache_size": -64 * 1024,
+            },
+        )
+
+    def test_invalid_pragma(self):
+        """PRAGMA 이름/값에 SQL을 넣을 수 없는지 테스트"""
+        with self.assertRaises(ImproperlyConfigured):
+            apply_pragmas(connection.connection, {"journal_mode": "WAL; DROP TABLE x"})
+
+    def test_write_actions_use_immediate_transactions(self):
+        """라벨 추가/제거, 생성, 일괄 처리가 BEGIN IMMEDIATE로 시작하는지 테스트"""
+        label = Label.objects.create(name="친구", color="#FF0000")
+        contact = Contact.objects.create(name="김철수")
+        requests = [
+            (
+                reverse("contact-add-labels", args=[contact.id]),
+                {"label_ids": [label.id]},
+            ),
+            (
+                reverse("contact-remove-labels", args=[contact.id]),
+                {"label_ids": [label.id]},
+            ),
+            (reverse("contact-list"), {"name": "이영희"}),
+            (reverse("contact-bulk"), {"create": [{"name": "박민수"}]}),
+        ]
+        for url, data in requests:
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post(url, data, content_type="application/json")
+            self.assertLess(response.status_code, 300, url)
+            begins = [q["sql"] for q in queries if q["sql"].startswith("BEGIN")]
+            self.assertEqual(begins, ["BEGIN IMMEDIATE"], url)
+
+        # 이미 트랜잭션 안이면 일반 atomic(세이브포인트)으로 동작하고, 기본 방식은 그대로 유지
+        with CaptureQueriesContext(connection) as queries:
+            with transaction.atomic():
+                with immediate_atomic():
+                    Contact.objects.create(name="최지훈")
+        self.assertEqual(queries[0]["sql"], "BEGIN DEFERRED")
+        self.assertEqual(connection.transaction_mode, "DEFERRED")
+
+    def test_benchmark_sqlite(self):
+        """프로필별 동시 읽기/쓰기 결과와 비교 값을 출력하는지 테스트"""
+        for index in range(20):
+            Contact.objects.create(name=f"김철수{index}")
+        out = io.StringIO()
+        call_command("benchmark_sqlite", readers=2, writers=2, duration=0.3, stdout=out)
+        results = json.loads(out.getvalue())
+        self.assertEqual(set(results["profiles"]), {"default", "production"})
+        production = results["profiles"]["production"]
+        self.assertEqual(production["write_transaction"], "IMMEDIATE")
+        self.assertGreater(production["writes"]["runs"], 0)
+        # IMMEDIATE + busy_timeout: 쓰기끼리 부딪혀도 기다렸다가 실행하므로 잠금 오류 없음
+        self.assertEqual(production["writes"]["errors"], 0)
+        self.assertEqual(set(results["comparison"]), {"reads", "writes"})
+
+
+@override_settings(CONTACTS_SYNC_SETTLE_SECONDS=0)
+class ContactSyncFeedTest(APITestCase):
+    """연락처 동기화(변경 피드) 테스트"""
+
+    def setUp(self):
+        self.url = reverse("contact-sync")
+        self.label = Label.objects.create(name="가족")
+        self.contacts = [Contact.objects.create(name=f"김철수{i}") for i in range(5)]
+
+    def sync(self, token=None, **params):
+        if token:
+            params["token"] = token
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def sync_all(self, token=None, batch_size=2):
+        """has_more가 false가 될 때까지 이어서 받은 (연락처, 삭제 기록, 다음 토큰)"""
+        contacts, deleted = [], []
+        while True:
+            data = self.sync(token, batch_size=batch_size)
+            contacts += data["contacts"]
+            deleted += data["deleted"]
+            token = data["next_token"]
+            if not data["has_more"]:
+                return contacts, deleted, token
+
+    def test_initial_and_incremental_sync(self):
+        """처음 동기화는 모든 연락처를, 이후에는 변경/삭제된 연락처만 보내는지 테스트"""
+        contacts, deleted, token = self.sync_all()
+        self.assertEqual(
+            sorted(item["id"] for item in contacts),
+            sorted(contact.id for contact in self.contacts),
+        )
+        self.assertEqual(deleted, [])
+
+        changed, removed, relabeled = self.contacts[:3]
+        self.client.patch(
+            reverse("contact-detail", args=[changed.id]),
+            {"memo": "수정"},
+            format="json",
+        )
+        self.client.delete(reverse("contact-detail", args=[removed.id]))
+        # 라벨 연결만 바뀐 연락처도 수정일이 바뀌어 다시 전달됨
+        self.client.post(
+            reverse("contact-add-labels", args=[relabeled.id]),
+            {"label_ids": [self.label.id]},
+            format="json",
+        )
+        created = Contact.objects.create(name="이영희")
+
+        contacts, deleted, token = self.sync_all(token)
+        by_id = {item["id"]: item for item in contacts}
+        self.assertEqual(set(by_id), {changed.id, relabeled.id, created.id})
+        self.assertEqual(by_id[changed.id]["memo"], "수정")
+        self.assertEqual(
+            [label["id"] for label in by_id[relabeled.id]["labels"]], [self.label.id]
+        )
+        self.assertEqual(
+            [(item["type"], item["id"]) for item in deleted], [("contact", removed.id)]
+        )
+
+        # 변경이 없으면 빈 응답
+        data = self.sync(token)
+        self.assertEqual((data["contacts"], data["deleted"]), ([], []))
+        self.assertFalse(data["has_more"])
+
+    def test_label_delete_tombstone(self):
+        """라벨 삭제는 라벨 삭제 기록과 연결되어 있던 연락처 변경으로 전달되는지 테스트"""
+        contact = self.contacts[0]
+        contact.labels.add(self.label)
+        _, _, token = self.sync_all()
+        self.client.delete(reverse("label-detail", args=[self.label.id]))
+
+        contacts, deleted, _ = self.sync_all(token)
+        self.assertEqual(
+            [(item["id"], item["labels"]) for item in contacts], [(contact.id, [])]
+        )
+        self.assertEqual(
+            [(item["type"], item["id"]) for item in deleted], [("label", self.label.id)]
+        )
+
+    def test_recent_changes_wait_for_next_sync(self):
+        """커밋 중일 수 있는 최근 변경은 다음 동기화에서 보내는지 테스트"""
+        with override_settings(CONTACTS_SYNC_SETTLE_SECONDS=60):
+            data = self.sync()
+            self.assertEqual(data["contacts"], [])
+            self.assertFalse(data["has_more"])
+        contacts, _, _ = self.sync_all(data["next_token"])
+        self.assertEqual(len(contacts), 5)
+
+    def test_invalid_and_expired_tokens(self):
+        """잘못된 토큰/다른 주소록의 토큰은 400, 보관 기간이 지난 토큰은 410(full_resync)인지 테스트"""
+        token = self.sync()["next_token"]
+        response = self.client.get(self.url, {"token": "not-a-token"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(
+            self.url, {"token": token}, HTTP_X_ADDRESS_BOOK="acme"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        with override_settings(CONTACTS_SYNC_TOMBSTONE_DAYS=0):
+            response = self.client.get(self.url, {"token": token})
+        self.assertEqual(response.status_code, status.HTTP_410_GONE)
+        self.assertTrue(response.data["full_resync"])
+
+    def test_compact_tombstones(self):
+        """보관 기간이 지난 삭제 기록만 정리하는지 테스트"""
+        ids = [contact.id for contact in self.contacts[:3]]
+        Contact.objects.filter(id__in=ids[:1]).delete()
+        self.client.post(reverse("contact-bulk"), {"delete": ids[1:]}, format="json")
+        SyncTombstone.objects.filter(object_id=ids[0]).update(
+            deleted_at=timezone.now() - timedelta(days=31)
+        )
+        out = io.StringIO()
+        call_command("compact_sync_tombstones", stdout=out)
+        self.assertIn("1건", out.getvalue())
+        self.assertEqual(
+            sorted(SyncTombstone.objects.values_list("object_id", flat=True)), ids[1:]
+        )
+        self.assertEqual(syncfeed.get_tombstone_retention(), timedelta(days=30))
+
+
+class DuplicateContactsTest(APITestCase):
+    """중복 연락처 찾기/합치기 테스트"""
+
+    def setUp(self):
+        cache.clear()
+        self.url = reverse("contact-duplicates")
+        self.family = Label.objects.create(name="가족")
+        self.work = Label.objects.create(name="회사")
+        # 이메일 대소문자만 다름
+        self.email_a = Contact.objects.create(name="김철수", email="Kim@Example.com")
+        self.email_b = Contact.objects.create(name="철수 김", email="kim@example.com")
+        # 전화번호 표기만 다름
+        self.phone_a = Contact.objects.create(name="이영희", phone="010-1234-5678")
+        self.phone_b = Contact.objects.create(name="영희", phone="01012345678")
+        # 이름+회사가 같음 (회사 접미사/공백 차이 무시)
+        self.name_a = Contact.objects.create(name="박민수", company="(주)가나상사")
+        self.name_b = Contact.objects.create(name="박 민수", company="가나상사")
+        # 이름+회사는 같지만 전화번호가 다름 (다른 사람일 가능성, 기본 점수 기준 미만)
+        Contact.objects.create(name="최지우", company="다라", phone="010-1111-2222")
+        Contact.objects.create(name="최지우", company="다라", phone="010-3333-4444")
+        # 중복 없음
+        Contact.objects.create(name="정우성", email="jung@example.com")
+
+    def clusters(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_clusters_by_blocking_keys(self):
+        """이메일/전화번호/이름+회사 키가 같은 연락처가 점수 순으로 묶이는지 테스트"""
+        data = self.clusters()
+        self.assertEqual(data["pagination"]["count"], 3)
+        results = data["results"]
+        self.assertEqual(
+            [cluster["contact_ids"] for cluster in results],
+            [
+                [self.email_a.id, self.email_b.id],
+                [self.phone_a.id, self.phone_b.id],
+                [self.name_a.id, self.name_b.id],
+            ],
+        )
+        self.assertEqual(
+            [cluster["reasons"] for cluster in results],
+            [["email"], ["phone"], ["name"]],
+        )
+        self.assertEqual(results[0]["score"], 0.9)
+        self.assertEqual(
+            [contact["name"] for contact in results[0]["contacts"]],
+            ["김철수", "철수 김"],
+        )
+
+        # 기준을 낮추면 전화번호가 다른 이름+회사 쌍도 포함
+        data = self.clusters(min_score=0.3)
+        self.assertEqual(data["pagination"]["count"], 4)
+        self.assertEqual(data["results"][-1]["score"], 0.3)
+
+    def test_pagination_and_invalid_min_score(self):
+        """묶음 목록 페이지네이션과 잘못된 min_score 테스트"""
+        data = self.clusters(page_size=2, page=2)
+        self.assertEqual(len(data["results"]), 1)
+        self.assertEqual(data["results"][0]["reasons"], ["name"])
+        for value in ("abc", "0", "1.5"):
+            response = self.client.get(self.url, {"min_score": value})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_clusters_cached_until_contacts_change(self):
+        """묶음 목록이 캐시되고 연락처가 바뀌면 다시 계산되는지 테스트"""
+        self.clusters()
+        with CaptureQueriesContext(connection) as queries:
+            self.clusters()
+        # 캐시된 묶음 목록을 사용하므로 블록을 찾는 GROUP BY 쿼리가 없음
+        self.assertFalse(
+            [query for query in queries.captured_queries if "HAVING" in query["sql"]]
+        )
+        Contact.objects.create(name="김철수2", email="KIM@example.com")
+        results = self.clusters()["results"]
+        self.assertEqual(len(results[0]["contact_ids"]), 3)
+
+    def test_large_blocks_skipped(self):
+        """같은 키를 가진 연락처가 너무 많은 블록은 비교하지 않는지 테스트"""
+        for i in range(3):
+            Contact.objects.create(name=f"직원{i}", phone="02-555-0000")
+        with self.settings(CONTACTS_DUPLICATE_MAX_BLOCK=2):
+            results = self.clusters()["results"]
+        self.assertEqual(len(results), 3)
+        self.assertNotIn(
+            "02-555-0000",
+            [
+                contact["phone"]
+                for cluster in results
+                for contact in cluster["contacts"]
+            ],
+        )
+
+    def test_merge(self):
+        """빈 필드 채우기, 라벨 합집합, 삭제가 한 번에 처리되는지 테스트"""
+        survivor, other = self.email_a, self.email_b
+        survivor.labels.add(self.family)
+        other.labels.add(self.family, self.work)
+        Contact.objects.filter(id=other.id).update(company="마바")
+        extra = self.phone_a
+        extra.labels.add(self.work)
+
+        response = self.client.post(
+            reverse("contact-merge", args=[survivor.id]),
+            {"contact_ids": [other.id, extra.id]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["merged_ids"], [other.id, extra.id])
+        self.assertEqual(response.data["filled_fields"], ["phone", "company"])
+        self.assertEqual(response.data["added_label_ids"], [self.work.id])
+        contact = response.data["contact"]
+        self.assertEqual(contact["phone"], "010-1234-5678")
+        self.assertEqual(contact["company"], "마바")
+        self.assertEqual(
+            sorted(label["id"] for label in contact["labels"]),
+            sorted([self.family.id, self.work.id]),
+        )
+
+        self.assertFalse(Contact.objects.filter(id__in=[other.id, extra.id]).exists())
+        survivor.refresh_from_db()
+        self.assertEqual(survivor.phone_digits, "01012345678")
+        self.assertEqual(
+            {label["id"] for label in survivor.label_snapshot},
+            {self.family.id, self.work.id},
+        )
+        # 라벨 연락처 수, 통계, 동기화 삭제 기록
+        self.family.refresh_from_db()
+        self.work.refresh_from_db()
+        self.assertEqual((self.family.contact_count, self.work.contact_count), (1, 1))
+        self.assertEqual(ContactStatistics.load().total_contacts, 7)
+        self.assertEqual(
+            set(
+                SyncTombstone.objects.filter(kind="contact").values_list(
+                    "object_id", flat=True
+                )
+            ),
+            {other.id, extra.id},
+        )
+
+    def test_merge_validation(self):
+        """잘못된 합치기 요청은 아무것도 바꾸지 않고 400/404를 반환하는지 테스트"""
+        url = reverse("contact-merge", args=[self.email_a.id])
+        for contact_ids in (None, [], ["x"], [self.email_a.id], [self.email_b.id, 0]):
+            response = self.client.post(
+                url, {"contact_ids": contact_ids}, format="json"
+            )
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Contact.objects.count(), 9)
+
+        response = self.client.post(
+            reverse("contact-merge", args=[0]),
+            {"contact_ids": [self.email_b.id]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_find_duplicates_command(self):
+        """관리 명령이 묶음을 계산해서 캐시에 저장하는지 테스트"""
+        out = io.StringIO()
+        call_command("find_duplicates", stdout=out)
+        self.assertIn("중복 묶음 3개", out.getvalue())
+        with CaptureQueriesContext(connection) as queries:
+            self.clusters()
+        self.assertFalse(
+            [query for query in queries.captured_queries if "HAVING" in query["sql"]]
+        )
@@ -0,0 +1,48 @@
+# 컨텍스트 관리자 도구를 가져옵니다
+from contextlib import contextmanager
+
+# Django의 트랜잭션 도구를 가져옵니다
+from django.db import transaction
+
+# 현재 앱의 샤드 도구를 가져옵니다
+from . import shards
+
+
+@contextmanager
+def immediate_atomic(using=None):
+    """
+    시작할 때 바로 쓰기 잠금을 잡는 atomic() (SQLite BEGIN IMMEDIATE)
+    읽은 뒤 쓰는 트랜잭션(라벨 추가, 일괄 처리 등)이 기본 방식(DEFERRED)으로 동시에 실행되면
+    나중에 쓰기 잠금을 얻으려는 쪽이 busy_timeout을 기다리지 않고 바로 "database is locked"로 실패하므로,
+    쓰기 작업은 시작할 때 잠금을 잡고 순서대로 기다리게 합니다
+
+    트랜잭션 시작 방식을 지원하지 않는 백엔드(sqlite_backend가 아닌 DB)나
+    이미 트랜잭션 안이면 일반 atomic()과 같습니다
+
+    using을 지정하지 않으면 현재 주소록의 DB(샤드)를 사용하고, 바깥 트랜잭션을 시작할 때
+    주소록을 옮기는 중인지 확인합니다 (shards.check_writable, 옮기는 중이면 503)
+    """
+    using = using or shards.current_alias()
+    connection = transaction.get_connection(using)
+    mode = getattr(connection, "transaction_mode", None)
+    if connection.in_atomic_block:
+        with transaction.atomic(using=using):
+            yield
+        return
+    # 옮기는 중이면 쓰기 잠금을 기다리지 않고 바로 거절
+    shards.check_writable(using)
+    if mode is None:
+        with transaction.atomic(using=using):
+            yield
+        return
+
+    connection.transaction_mode = "IMMEDIATE"
+    try:
+        with transaction.atomic(using=using):
+            # BEGIN이 실행된 뒤에는 원래 방식으로 되돌려서 다른 트랜잭션에 영향을 주지 않음
+            connection.transaction_mode = mode
+            # 쓰기 잠금을 잡은 뒤 확인해야 이동 명령이 디렉터리를 바꾸는 동안 기다린 쓰기도 거절됨
+            shards.check_writable(using)
+            yield
+    finally:
+        connection.transaction_mode = mode
@@ -5,7 +5,7 @@ from django.urls import path, include  # URL 패턴 정의와 하위 URL 포함
 from rest_framework.routers import DefaultRouter  # ViewSet을 위한 자동 URL 생성기
 
 # 현재 앱의 뷰들을 가져옵니다
-from . import views
+from . import async_views, views
 
 # DRF 라우터 인스턴스 생성
 # DefaultRouter: ViewSet에 대해 자동으로 CRUD URL들을 생성해주는 라우터
@@ -23,6 +23,13 @@ router = DefaultRouter()
 # GET    /labels/{id}/contacts/ -> 특정 라벨의 연락처 목록
 router.register("labels", views.LabelViewSet)
 
+# 연락처 가져오기 작업 ViewSet을 "imports" URL 패턴에 등록
+# (연락처 상세 URL /{id}/ 보다 먼저 등록해야 "imports"가 연락처 ID로 해석되지 않음)
+# POST   /imports/         -> 파일 업로드 후 가져오기 작업 시작
+# GET    /imports/         -> 가져오기 작업 목록
+# GET    /imports/{id}/    -> 가져오기 작업 상태/진행 상황
+router.register("imports", views.ContactImportJobViewSet)
+
 # 연락처 ViewSet을 "contacts" URL 패턴에 등록
 # 자동으로 다음 URL들이 생성됨:
 # GET    /contacts/        -> 연락처 목록 조회 (페이지네이션, 필터링, 검색 지원)
@@ -33,11 +40,41 @@ router.register("labels", views.LabelViewSet)
 # DELETE /contacts/{id}/   -> 특정 연락처 삭제
 # GET    /contacts/birthdays_this_month/  -> 이번 달 생일인 연락처들
 # GET    /contacts/statistics/            -> 연락처 통계 정보
+# GET    /contacts/export/                -> CSV/vCard 내보내기 (스트리밍)
+# POST   /contacts/bulk/                  -> 일괄 생성/수정/삭제
 # POST   /contacts/{id}/add_labels/       -> 연락처에 라벨 추가
 # POST   /contacts/{id}/remove_labels/    -> 연락처에서 라벨 제거
 router.register("", views.ContactViewSet)
 
+# ASGI 서버용 비동기 조회 API (동기 API와 같은 응답, async_views 참고)
+# GET    /async/                 -> 연락처 목록
+# GET    /async/{id}/            -> 연락처 상세
+# GET    /async/statistics/      -> 연락처 통계
+# GET    /async/labels/          -> 라벨 목록
+# GET    /async/labels/stats/    -> 라벨 통계
+async_urlpatterns = [
+    path("", async_views.ContactListView.as_view(), name="async-contact-list"),
+    path(
+        "statistics/",
+        async_views.ContactStatisticsView.as_view(),
+        name="async-contact-statistics",
+    ),
+    path("labels/", async_views.LabelListView.as_view(), name="async-label-list"),
+    path(
+        "labels/stats/", async_views.LabelStatsView.as_view(), name="async-label-stats"
+    ),
+    path(
+        "<str:pk>/",
+        async_views.ContactDetailView.as_view(),
+        name="async-contact-detail",
+    ),
+]
+
 # 어플리케이션의 URL 패턴 리스트
 # router.urls: 위에서 등록한 ViewSet들로 자동 생성된 모든 URL들
 # path("", include(...)): 빈 경로에 라우터 URL들을 포함 (예: /api/contacts/...)
-urlpatterns = [path("", include(router.urls))]
+# (비동기 API를 먼저 등록해야 "async"가 연락처 ID로 해석되지 않음)
+urlpatterns = [
+    path("async/", include(async_urlpatterns)),
+    path("", include(router.urls)),
+]
@@ -1,5 +1,6 @@
 # Django REST Framework의 핵심 컴포넌트들을 가져옵니다
 from rest_framework import viewsets, filters, status  # ViewSet, 필터, HTTP 상태코드
+from rest_framework import mixins  # ViewSet 기능 조합용 믹스인
 from rest_framework.decorators import (
     api_view,
     action,
@@ -7,17 +8,52 @@ from rest_framework.decorators import (
 from rest_framework.response import Response  # API 응답 객체
 from rest_framework.request import Request  # API 요청 객체ª
 from django_filters.rest_framework import DjangoFilterBackend  # 필터링 백엔드
-from django.db.models import Q, Count  # Q: 복잡한 쿼리 조건, Count: 개수 집계 함수
+from django.db.models import Q  # Q: 복잡한 쿼리 조건
+from django.http import StreamingHttpResponse  # 스트리밍 응답 (대용량 내보내기)
+from django.utils import timezone  # 설정된 시간대 기준 날짜/시간
 
 # 현재 앱의 다른 모듈들을 가져옵니다
+from . import addressbooks  # 요청의 주소록 범위
+from . import birthdays  # 생일 키 범위 조회
+from . import bulk  # 일괄 생성/수정/삭제 처리
+from . import caching  # 컬렉션 변경 버전
+from . import duplicates  # 중복 연락처 찾기/합치기
+from . import exporters  # CSV/vCard 내보내기
+from . import fastlist  # values() 기반 빠른 목록 직렬화
+from . import fieldsets  # ?fields= / ?omit= 부분 필드 응답
+from . import importers  # CSV/vCard 가져오기 작업
+from . import syncfeed  # 오프라인 클라이언트용 변경 피드
 from .filters import ContactFilter  # 연락처 필터링 클래스
-from .models import Label, Contact  # 데이터베이스 모델들
-from .pagination import CustomPageNumberPagination  # 커스텀 페이지네이션ª
+from .changes import CONTACTS_NAMESPACE, LABEL_COUNTS_NAMESPACE  # 변경 버전 이름
+from .conditional import ConditionalGetMixin, make_etag  # ETag / Last-Modified
+from .models import (  # 데이터베이스 모델들
+    Label,
+    Contact,
+    ContactStatistics,
+    ContactImportJob,
+)
+from .renderers import (  # 빠른 JSON 렌더러 / 배열 스트리밍
+    STREAM_CHUNK_SIZE,
+    FastJSONRenderer,
+    stream_json_array,
+)
+from .registry import LABELS_NAMESPACE, label_registry  # 프로세스 안에 보관한 라벨 목록
+from .addressbooks import AddressBookMixin  # 요청의 주소록(샤드) 선택
+from .replicas import ReplicaReadMixin  # 안전한 조회를 읽기 복제본으로 분산
+from .transactions import immediate_atomic  # 시작할 때 쓰기 잠금을 잡는 트랜잭션
+from .search import ContactSearchFilter, ContactOrderingFilter  # 전문 검색/정렬
+from .pagination import (  # 커스텀 페이지네이션ª
+    CustomPageNumberPagination,  # 페이지 번호 기반 (기본)
+    ContactCursorPagination,  # 키셋(커서) 기반 스크롤 페이징
+)
 from .serializers import (  # 시리얼라이저들 (데이터 직렬화/역직렬화)
     LabelSerializer,  # 라벨 기본 시리얼라이저
     ContactSerializer,  # 연락처 상세 시리얼라이저
     ContactListSerializer,  # 연락처 목록용 간소화 시리얼라이저
     LabelStatsSerializer,  # 라벨 통계용 시리얼라이저
+    ContactImportJobSerializer,  # 가져오기 작업 조회용 시리얼라이저
+    ContactImportSerializer,  # 가져오기 업로드 요청용 시리얼라이저
+    UpcomingBirthdaySerializer,  # 다가오는 생일 목록용 시리얼라이저
 )
 
 
@@ -42,7 +78,9 @@ def test_api(request: Request) -> Response:
 
 # 라벨 관리를 위한 ViewSet 클래스
 # ModelViewSet: Create, Read, Update, Delete 모든 기능을 자동으로 제공하는 클래스
-class LabelViewSet(viewsets.ModelViewSet):
+class LabelViewSet(
+    AddressBookMixin, ReplicaReadMixin, ConditionalGetMixin, viewsets.ModelViewSet
+):
     """
     라벨 관리 ViewSet
     - GET /labels/: 모든 라벨 조회 (목록)
@@ -51,6 +89,7 @@ class LabelViewSet(viewsets.ModelViewSet):
     - PUT /labels/{id}/: 특정 라벨 전체 수정
     - PATCH /labels/{id}/: 특정 라벨 부분 수정
     - DELETE /labels/{id}/: 특정 라벨 삭제
+    X-Address-Book 헤더 또는 ?address_book= 으로 주소록을 지정합니다 (없으면 기본 주소록)
     """
 
     # 기본 쿼리셋: 모든 라벨을 대상으로 합니다
@@ -66,10 +105,44 @@ class LabelViewSet(viewsets.ModelViewSet):
     ]
     # 검색 가능한 필드들: 라벨명으로만 검색 가능
     search_fields = ["name"]
-    # 정렬 가능한 필드들: 이름과 생성일로 정렬 가능
-    ordering_fields = ["name", "created_at"]
+    # 정렬 가능한 필드들: 이름, 생성일, 연락처 수로 정렬 가능
+    ordering_fields = ["name", "created_at", "contact_count"]
     # 기본 정렬 순서: 라벨명 오름차순
     ordering = ["name"]
+    # 목록 ETag에 사용할 변경 버전: 라벨 생성/수정/삭제, 라벨별 연락처 수 변경
+    conditional_namespaces = (LABELS_NAMESPACE, LABEL_COUNTS_NAMESPACE)
+
+    def get_queryset(self):
+        """
+        현재 주소록의 라벨 (클래스 속성 queryset은 모듈을 불러올 때의 주소록 조건으로 만들어지므로 요청마다 새로 만듦)
+        """
+        return Label.objects.all()
+
+    # 생성/수정/삭제: 라벨 저장과 라벨 스냅샷 갱신을 시작할 때 쓰기 잠금을 잡는 트랜잭션 하나로 실행
+    def perform_create(self, serializer):
+        with immediate_atomic():
+            super().perform_create(serializer)
+
+    def perform_update(self, serializer):
+        with immediate_atomic():
+            super().perform_update(serializer)
+
+    def perform_destroy(self, instance):
+        with immediate_atomic():
+            super().perform_destroy(instance)
+
+    # 라벨 상세의 ETag / Last-Modified
+    def get_object_validators(self, label):
+        """
+        라벨의 수정일과 연락처 수로 ETag를 만듭니다
+        연락처 수는 수정일을 바꾸지 않으므로 Last-Modified는 연락처 수가 마지막으로 바뀐 시각도 반영합니다
+        """
+        etag = make_etag(label.pk, label.updated_at.isoformat(), label.contact_count)
+        last_modified = max(
+            label.updated_at.timestamp(),
+            caching.get_changed_at(LABEL_COUNTS_NAMESPACE),
+        )
+        return etag, last_modified
 
     # 커스텀 액션: 라벨 통계 조회
     # @action 데코레이터: 기본 CRUD 외에 추가 기능을 만들 때 사용
@@ -81,12 +154,9 @@ class LabelViewSet(viewsets.ModelViewSet):
         GET /labels/stats/
         각 라벨별로 연결된 연락처 개수를 포함한 통계 정보를 반환합니다
         """
-        # annotate: 각 라벨에 연결된 연락처 개수를 계산해서 추가
-        # Count("contacts"): contacts 필드(다대다 관계)의 개수를 셈
-        labels_with_counts = Label.objects.annotate(
-            contact_count=Count("contacts")  # contact_count라는 가상 필드 추가
-        ).order_by(
-            "-contact_count"
+        # 라벨에 저장된 연락처 수(contact_count)로 정렬 (중간 테이블 집계 없이 인덱스 순서로 읽음)
+        labels_with_counts = Label.objects.order_by(
+            "-contact_count", "name"
         )  # 연락처 개수가 많은 순으로 정렬
 
         # 통계용 시리얼라이저로 데이터 변환 (many=True: 여러 객체를 한번에 처리)
@@ -107,13 +177,82 @@ class LabelViewSet(viewsets.ModelViewSet):
         # 다대다 관계를 통해 이 라벨과 연결된 모든 연락처 조회
         contacts = label.contacts.all()
 
+        # 빠른 JSON 렌더러로 응답하는 경우: 전체 목록을 한 번에 만들지 않고 청크 단위로 스트리밍
+        if isinstance(request.accepted_renderer, FastJSONRenderer):
+            return StreamingHttpResponse(
+                addressbooks.scoped_iterator(
+                    stream_json_array(
+                        fastlist.iter_represented(contacts, STREAM_CHUNK_SIZE)
+                    )
+                ),
+                content_type="application/json",
+            )
+
         # 목록용 시리얼라이저로 연락처 데이터 변환
         serializer = ContactListSerializer(contacts, many=True)
         return Response(serializer.data)
 
 
+# 연락처 가져오기 작업을 위한 ViewSet 클래스
+# 생성/조회만 필요하므로 ModelViewSet 대신 필요한 믹스인만 조합
+class ContactImportJobViewSet(
+    AddressBookMixin,
+    mixins.CreateModelMixin,
+    mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
+    viewsets.GenericViewSet,
+):
+    """
+    연락처 가져오기 작업 ViewSet
+    - POST /imports/: 파일 업로드 후 가져오기 작업 시작 (file, type, dry_run)
+    - GET /imports/: 가져오기 작업 목록
+    - GET /imports/{id}/: 작업 상태와 진행 상황 (처리/생성/실패/건너뛴 행 수)
+    """
+
+    queryset = ContactImportJob.objects.all()
+    serializer_class = ContactImportJobSerializer
+    pagination_class = CustomPageNumberPagination
+
+    def get_queryset(self):
+        """
+        현재 주소록의 가져오기 작업
+        """
+        return ContactImportJob.objects.all()
+
+    def get_serializer_class(self):
+        """
+        업로드 요청은 ContactImportSerializer로 검증하고, 응답은 작업 시리얼라이저로 표시
+        """
+        if self.action == "create":
+            return ContactImportSerializer
+        return ContactImportJobSerializer
+
+    def create(self, request, *args, **kwargs):
+        """
+        업로드 파일을 임시 파일로 보관하고 가져오기 작업을 시작합니다
+        작업은 백그라운드에서 실행되므로 202 Accepted와 작업 정보를 바로 반환합니다
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload = serializer.validated_data["file"]
+
+        job = ContactImportJob.objects.create(
+            file_name=upload.name,
+            file_type=serializer.validated_data.get("type")
+            or importers.detect_file_type(upload.name),
+            dry_run=serializer.validated_data["dry_run"],
+            source_path=importers.save_upload(upload),
+        )
+        job = importers.start_job(job)
+        return Response(
+            ContactImportJobSerializer(job).data, status=status.HTTP_202_ACCEPTED
+        )
+
+
 # 연락처 관리를 위한 ViewSet 클래스
-class ContactViewSet(viewsets.ModelViewSet):
+class ContactViewSet(
+    AddressBookMixin, ReplicaReadMixin, ConditionalGetMixin, viewsets.ModelViewSet
+):
     """
     연락처 관리 ViewSet
     - GET /contacts/: 모든 연락처 조회 (목록, 페이지네이션)
@@ -122,16 +261,17 @@ class ContactViewSet(viewsets.ModelViewSet):
     - PUT /contacts/{id}/: 특정 연락처 전체 수정
     - PATCH /contacts/{id}/: 특정 연락처 부분 수정
     - DELETE /contacts/{id}/: 특정 연락처 삭제
+    X-Address-Book 헤더 또는 ?address_book= 으로 주소록을 지정합니다 (없으면 기본 주소록)
     """
 
-    # 기본 쿼리셋 - prefetch_related로 라벨 정보도 함께 미리 가져와서 성능 최적화
-    queryset = Contact.objects.prefetch_related("labels")
+    # 기본 쿼리셋 - 라벨은 라벨 스냅샷/라벨 레지스트리에서 읽으므로 prefetch 없이 조회
+    queryset = Contact.objects.all()
 
     # 필터링, 검색, 정렬 기능 설정
     filter_backends = [
         DjangoFilterBackend,  # 필드별 필터링
-        filters.SearchFilter,  # 텍스트 검색
-        filters.OrderingFilter,  # 정렬
+        ContactSearchFilter,  # 텍스트 검색 (FTS5 전문 검색 색인 사용)
+        ContactOrderingFilter,  # 정렬 (검색 시 ordering이 없으면 관련도순)
     ]
     # 간단한 필터링 가능한 필드들
     filterset_fields = ["labels", "company"]
@@ -139,13 +279,139 @@ class ContactViewSet(viewsets.ModelViewSet):
     filterset_class = ContactFilter
     # 페이지네이션: 목록을 페이지별로 나누어 표시
     pagination_class = CustomPageNumberPagination
-    # 검색 가능한 필드들: 이름, 이메일, 전화번호, 회사명에서 검색
-    search_fields = ["name", "email", "phone", "company"]
+    # 스크롤 페이징용 커서 페이지네이션 (?cursor= 파라미터로 선택)
+    cursor_pagination_class = ContactCursorPagination
+    # 전체 개수 캐시의 네임스페이스 (연락처/라벨 연결이 바뀌면 무효화됨)
+    count_cache_namespace = CONTACTS_NAMESPACE
+    # 목록 ETag에 사용할 변경 버전 (연락처 생성/수정/삭제, 라벨 연결 변경, 라벨 수정/삭제 시 증가)
+    conditional_namespaces = (CONTACTS_NAMESPACE,)
+    # 검색 가능한 필드들: 이름, 이메일, 전화번호, 회사명, 직책, 메모, 주소에서 검색
+    # SQLite에서는 FTS5 색인(search.FTS_COLUMNS)을 사용하고, 그 외 DB에서는 LIKE 검색에 사용
+    search_fields = ["name", "email", "phone", "company", "position", "memo", "address"]
     # 정렬 가능한 필드들
     ordering_fields = ["name", "email", "phone", "created_at"]
     # 기본 정렬: 최신 생성순
     ordering = ["-created_at"]
 
+    # 요청에 따라 페이지네이션 방식을 선택하는 프로퍼티
+    @property
+    def paginator(self):
+        """
+        ?cursor 파라미터가 있으면 키셋(커서) 페이지네이션을, 없으면 기본 페이지 번호 방식을 사용
+        - GET /contacts/?cursor=           -> 스크롤 페이징 첫 페이지
+        - GET /contacts/?cursor=<token>    -> 응답의 next/previous 링크로 이어서 조회
+        """
+        if not hasattr(self, "_paginator"):
+            cursor_param = self.cursor_pagination_class.cursor_query_param
+            if cursor_param in self.request.query_params:
+                self._paginator = self.cursor_pagination_class()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
+
+    # 목록 응답 생성 (빠른 직렬화 경로)
+    def list_response(self, request, *args, **kwargs):
+        """
+        settings.CONTACTS_FAST_LIST가 켜져 있으면 목록 컬럼만 values()로 읽어서
+        ContactListSerializer와 같은 형식으로 변환합니다 (모델 객체/필드 직렬화 생략)
+        """
+        if not fastlist.is_enabled():
+            return super().list_response(request, *args, **kwargs)
+        fieldset = self.get_fieldset()
+        queryset = fastlist.list_rows(
+            self.filter_queryset(self.get_queryset()), fieldset
+        )
+        page = self.paginate_queryset(queryset)
+        if page is None:
+            return Response(fastlist.represent(queryset, fieldset))
+        return self.get_paginated_response(fastlist.represent(page, fieldset))
+
+    # ?fields= / ?omit= 로 고른 응답 필드
+    def get_fieldset(self):
+        """
+        목록/상세 조회에서 응답에 포함할 필드 목록 (파라미터가 없거나 다른 액션이면 None)
+        - GET /contacts/?fields=id,name,phone
+        - GET /contacts/{id}/?omit=memo,address
+        알 수 없는 필드를 지정하면 400 응답
+        """
+        if not hasattr(self, "_fieldset"):
+            self._fieldset = None
+            if self.action in ("list", "retrieve"):
+                self._fieldset = fieldsets.parse_fieldset(
+                    self.request.query_params,
+                    fieldsets.readable_fields(self.get_serializer_class()),
+                )
+        return self._fieldset
+
+    def get_serializer_context(self):
+        """
+        시리얼라이저가 고른 필드만 표시하도록 부분 필드 목록을 전달
+        """
+        context = super().get_serializer_context()
+        context["fieldset"] = self.get_fieldset()
+        return context
+
+    def filter_queryset(self, queryset):
+        """
+        필터/검색/정렬을 적용한 뒤, 부분 필드 요청이면 필요한 컬럼만 읽도록 .only()를 적용합니다
+        (메모, 주소 등 요청하지 않은 컬럼은 조회하지 않음)
+        """
+        queryset = super().filter_queryset(queryset)
+        fieldset = self.get_fieldset()
+        if fieldset is None:
+            return queryset
+        columns = fieldsets.columns_for(fieldset)
+        if self.action == "retrieve":
+            # 상세 ETag / Last-Modified 계산에 수정일이 필요
+            columns.append("updated_at")
+        # 커서 페이지네이션의 위치 값을 위한 정렬 컬럼 (검색 관련도 같은 annotate 값은 제외)
+        model_fields = {field.name for field in Contact._meta.concrete_fields}
+        columns += [
+            column
+            for column in fastlist.ordering_columns(queryset, columns)
+            if column in model_fields
+        ]
+        return queryset.only(*columns)
+
+    # 연락처 상세의 ETag / Last-Modified
+    def get_object_validators(self, contact):
+        """
+        연락처의 수정일로 ETag를 만듭니다 (라벨 연결이 바뀌어도 라벨 스냅샷과 함께 수정일이 갱신됨)
+        ?fields= / ?omit= 로 고른 필드 목록도 포함합니다
+        상세의 라벨 정보는 라벨 레지스트리에서 읽으므로 라벨 버전도 포함합니다
+        """
+        etag = make_etag(
+            contact.pk,
+            contact.updated_at.isoformat(),
+            caching.get_version(LABELS_NAMESPACE),
+            # 고른 필드가 다르면 응답 내용이 다르므로 다른 ETag
+            self.get_fieldset(),
+        )
+        last_modified = max(
+            contact.updated_at.timestamp(), caching.get_changed_at(LABELS_NAMESPACE)
+        )
+        return etag, last_modified
+
+    # ?count=estimated 요청에서 사용할 추정 개수
+    def get_estimated_count(self):
+        """
+        필터가 없는 목록의 전체 개수를 통계 카운터에서 COUNT(*) 없이 읽어옵니다
+        """
+        return ContactStatistics.load().total_contacts
+
+    # 생성/수정/삭제: 연락처 저장과 통계/라벨 카운터 갱신을 시작할 때 쓰기 잠금을 잡는 트랜잭션 하나로 실행
+    def perform_create(self, serializer):
+        with immediate_atomic():
+            super().perform_create(serializer)
+
+    def perform_update(self, serializer):
+        with immediate_atomic():
+            super().perform_update(serializer)
+
+    def perform_destroy(self, instance):
+        with immediate_atomic():
+            super().perform_destroy(instance)
+
     # 액션에 따라 다른 시리얼라이저를 사용하는 메소드
     def get_serializer_class(self):
         """
@@ -165,8 +431,10 @@ class ContactViewSet(viewsets.ModelViewSet):
         - has_email: true/false (이메일이 있는/없는 연락처만)
         - has_birthday: true/false (생일이 있는/없는 연락처만)
         """
-        # 기본 쿼리셋 (라벨 정보 미리 로드)
-        queryset = Contact.objects.prefetch_related("labels")
+        # 기본 쿼리셋
+        # 라벨은 목록에서는 라벨 스냅샷 컬럼, 상세에서는 스냅샷 ID + 라벨 레지스트리로 표시하므로
+        # prefetch_related("labels") 쿼리가 필요 없음
+        queryset = Contact.objects.all()
 
         # 이메일 유무로 필터링: ?has_email=true 또는 ?has_email=false
         has_email = self.request.query_params.get("has_email")
@@ -196,23 +464,52 @@ class ContactViewSet(viewsets.ModelViewSet):
         """
         이번 달 생일인 연락처 목록 조회 API
         GET /contacts/birthdays_this_month/
-        현재 달과 같은 월에 생일인 연락처들을 반환합니다
+        현재 달(settings.TIME_ZONE 기준)과 같은 월에 생일인 연락처들을 날짜순으로 반환합니다 (페이지 단위)
         """
-        # datetime 모듈에서 현재 날짜/시간 가져오기
-        from datetime import datetime
-
-        now = datetime.now()  # 현재 날짜와 시간
-        # birthday 필드의 월(month)이 현재 월과 같고, 생일이 NULL이 아닌 연락처들 조회
+        today = timezone.localdate()  # 설정된 시간대(Asia/Seoul)의 오늘 날짜
+        # 생일 키 컬럼(월 * 100 + 일)의 인덱스 범위 검색
+        # (라벨은 목록용 시리얼라이저가 라벨 스냅샷 컬럼에서 읽으므로 prefetch 불필요)
         contacts = Contact.objects.filter(
-            birthday__month=now.month,  # 생일의 월이 현재 월과 같음
-            birthday__isnull=False,  # 생일이 NULL이 아님
-        ).prefetch_related(
-            "labels"
-        )  # 라벨 정보도 함께 조회 (성능 최적화)
+            birthday_key__range=birthdays.month_range(today.month)
+        ).order_by("birthday_key", "name", "id")
+        return self.birthday_page(request, contacts, ContactListSerializer)
 
-        # 목록용 시리얼라이저로 데이터 변환
-        serializer = ContactListSerializer(contacts, many=True)
-        return Response(serializer.data)
+    # 커스텀 액션: 다가오는 생일인 연락처들 조회
+    @action(detail=False, methods=["get"])
+    def upcoming_birthdays(self, request):
+        """
+        다가오는 생일 연락처 목록 조회 API
+        GET /contacts/upcoming_birthdays/?days=30
+        오늘부터 days일(기본 30일, 최대 366일) 안에 생일인 연락처들을 다음 생일이 빠른 순으로 반환합니다
+        - 12월 -> 1월로 넘어가는 기간도 처리
+        - 2월 29일생은 평년에는 2월 28일에 생일을 맞는 것으로 계산
+        """
+        try:
+            days = int(request.query_params.get("days", birthdays.DEFAULT_WINDOW_DAYS))
+        except ValueError:
+            days = 0
+        if not 1 <= days <= birthdays.MAX_WINDOW_DAYS:
+            return Response(
+                {
+                    "error": f"days는 1에서 {birthdays.MAX_WINDOW_DAYS} 사이의 정수여야 합니다."
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        today = timezone.localdate()
+        contacts = birthdays.upcoming(Contact.objects.all(), today, days)
+        return self.birthday_page(
+            request, contacts, UpcomingBirthdaySerializer, {"today": today}
+        )
+
+    def birthday_page(self, request, contacts, serializer_class, context=None):
+        """
+        생일 조회 결과를 페이지 단위로 응답합니다
+        오늘 날짜에 따라 결과가 바뀌므로 필터별 개수 캐시를 쓰지 않고 매번 개수를 셉니다
+        """
+        paginator = CustomPageNumberPagination()
+        page = paginator.paginate_queryset(contacts, request)
+        serializer = serializer_class(page, many=True, context=context or {})
+        return paginator.get_paginated_response(serializer.data)
 
     # 커스텀 액션: 연락처 통계 정보 조회
     @action(detail=False, methods=["get"])
@@ -221,33 +518,177 @@ class ContactViewSet(viewsets.ModelViewSet):
         연락처 통계 정보 조회 API
         GET /contacts/statistics/
         전체 연락처, 이메일/전화번호/생일 보유 연락처 수, 회사 수 등의 통계를 반환합니다
+
+        기본값은 연락처 변경 시 증감시켜 둔 통계 행(ContactStatistics)을 그대로 읽습니다 (O(1))
+        ?fresh=true 이면 연락처 테이블을 한 번 훑어서 정확한 값을 다시 계산합니다
         """
-        # 각종 통계 정보를 딕셔너리로 구성
-        stats = {
-            # 전체 연락처 수
-            "total_contacts": Contact.objects.count(),
-            # 이메일이 있는 연락처 수 (NULL이 아니고 빈 문자열도 아님)
-            "with_email": Contact.objects.filter(email__isnull=False)
-            .exclude(email="")
-            .count(),
-            # 전화번호가 있는 연락처 수
-            "with_phone": Contact.objects.filter(phone__isnull=False)
-            .exclude(phone="")
-            .count(),
-            # 생일이 등록된 연락처 수
-            "with_birthday": Contact.objects.filter(birthday__isnull=False).count(),
-            # 서로 다른 회사 수 (중복 제거)
-            "companies": Contact.objects.filter(company__isnull=False)
-            .exclude(company="")  # 회사가 있는 연락처만
-            .values("company")  # 회사명만 선택
-            .distinct()  # 중복 제거
-            .count(),  # 개수 세기
-        }
+        if request.query_params.get("fresh", "").lower() == "true":
+            # 조건부 COUNT로 모든 통계를 한 쿼리에서 계산
+            stats = ContactStatistics.compute()
+        else:
+            stats = ContactStatistics.load().as_dict()
         return Response(stats)  # JSON으로 통계 정보 반환
 
+    # 커스텀 액션: 연락처 내보내기 (CSV / vCard)
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        """
+        연락처 내보내기 API
+        GET /contacts/export/?type=csv
+        GET /contacts/export/?type=vcard&vcard_version=4.0
+        목록과 같은 필터/검색/정렬 파라미터를 사용할 수 있으며, 페이지 없이 전체를 스트리밍합니다
+        (?format 은 DRF가 응답 형식 선택에 사용하므로 ?type 을 사용)
+        """
+        export_type = request.query_params.get("type", "csv")
+        version = request.query_params.get("vcard_version", "3.0")
+        if export_type not in ("csv", "vcard"):
+            return Response(
+                {"error": "type은 csv 또는 vcard여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if version not in exporters.VCARD_VERSIONS:
+            return Response(
+                {"error": "vcard_version은 3.0 또는 4.0이어야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # 목록 조회와 같은 필터/검색/정렬 적용 (페이지네이션 제외)
+        queryset = self.filter_queryset(self.get_queryset())
+
+        # 스트리밍 내용은 뷰가 끝난 뒤 만들어지므로 현재 주소록 범위를 이어받아 실행
+        if export_type == "csv":
+            response = StreamingHttpResponse(
+                addressbooks.scoped_iterator(exporters.export_csv(queryset)),
+                content_type="text/csv; charset=utf-8",
+            )
+            filename = "contacts.csv"
+        else:
+            response = StreamingHttpResponse(
+                addressbooks.scoped_iterator(exporters.export_vcard(queryset, version)),
+                content_type="text/vcard; charset=utf-8",
+            )
+            filename = "contacts.vcf"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+    # 커스텀 액션: 오프라인 클라이언트용 변경 피드
+    @action(detail=False, methods=["get"])
+    def sync(self, request):
+        """
+        연락처 동기화 API
+        GET /contacts/sync/                      -> 처음 동기화 (모든 연락처를 batch_size개씩)
+        GET /contacts/sync/?token=<next_token>   -> 이전 응답 이후에 생성/수정/삭제된 연락처
+        응답: {"contacts": [...], "deleted": [{"type", "id", "deleted_at"}], "next_token": ..., "has_more": ...}
+        has_more가 true이면 next_token으로 바로 이어서 요청하고, false이면 다음 동기화 때 next_token을 사용합니다
+        토큰이 만료되면 410 응답과 full_resync: true (토큰 없이 처음부터 다시 동기화)
+        """
+        try:
+            feed = syncfeed.read_changes(
+                request.query_params.get(syncfeed.TOKEN_PARAM),
+                syncfeed.get_batch_size(request),
+            )
+        except syncfeed.SyncTokenExpired as exc:
+            return Response(
+                {"error": str(exc), "full_resync": True}, status=status.HTTP_410_GONE
+            )
+        except syncfeed.InvalidSyncToken as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        # 상세와 같은 전체 필드 (라벨은 라벨 스냅샷과 라벨 레지스트리에서 읽으므로 추가 쿼리 없음)
+        serializer = self.get_serializer(feed.pop("contacts"), many=True)
+        return Response({"contacts": serializer.data, **feed})
+
+    # 커스텀 액션: 중복 연락처 묶음 조회
+    @action(detail=False, methods=["get"])
+    def duplicates(self, request):
+        """
+        중복 연락처 조회 API
+        GET /contacts/duplicates/?min_score=0.6
+        이메일/전화번호/이름+회사 키가 같은 연락처끼리만 비교해서 중복으로 보이는 묶음을 점수 높은 순으로 반환합니다
+        응답 results: [{"contact_ids": [...], "score": ..., "reasons": [...], "contacts": [...]}]
+        """
+        try:
+            min_score = duplicates.get_min_score(request)
+        except ValueError:
+            return Response(
+                {"error": "min_score는 0보다 크고 1 이하인 숫자여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # 묶음 목록은 연락처 변경 버전별로 캐시되고, 현재 페이지 묶음의 연락처만 한 번에 조회
+        paginator = CustomPageNumberPagination()
+        page = paginator.paginate_queryset(duplicates.get_clusters(min_score), request)
+        contacts = Contact.objects.in_bulk(
+            [contact_id for cluster in page for contact_id in cluster["contact_ids"]]
+        )
+        serializer = self.get_serializer(list(contacts.values()), many=True)
+        serialized = {item["id"]: item for item in serializer.data}
+        results = [
+            {
+                **cluster,
+                "contacts": [
+                    serialized[contact_id]
+                    for contact_id in cluster["contact_ids"]
+                    if contact_id in serialized
+                ],
+            }
+            for cluster in page
+        ]
+        return paginator.get_paginated_response(results)
+
+    # 커스텀 액션: 중복 연락처 합치기
+    @action(detail=True, methods=["post"])
+    def merge(self, request, pk=None):
+        """
+        연락처 합치기 API
+        POST /contacts/{id}/merge/
+        요청 본문: {"contact_ids": [2, 3]}
+        지정한 연락처들을 {id} 연락처로 합칩니다 (트랜잭션 하나)
+        - 비어 있는 필드는 합칠 연락처 값으로 요청 순서대로 채움
+        - 라벨은 합집합으로 연결
+        - 합친 연락처는 삭제
+        """
+        # URL의 pk로 대상 연락처 확인 (없으면 404)
+        survivor = self.get_object()
+        try:
+            merged_ids = duplicates.parse_merge_ids(
+                survivor.pk, request.data.get("contact_ids")
+            )
+            result = duplicates.merge_contacts(survivor.pk, merged_ids)
+        except duplicates.MergeError as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        serializer = self.get_serializer(result.pop("contact"))
+        return Response({"contact": serializer.data, **result})
+
+    # 커스텀 액션: 연락처 일괄 생성/수정/삭제
+    @action(detail=False, methods=["post"])
+    def bulk(self, request):
+        """
+        연락처 일괄 처리 API
+        POST /contacts/bulk/
+        요청 본문: {"create": [{...}], "update": [{"id": 1, ...}], "delete": [1, 2]}
+        항목별 결과(created/updated/deleted/invalid/not_found)와 요약을 반환합니다
+        한 요청의 최대 항목 수는 settings.CONTACTS_BULK_MAX_ITEMS로 설정합니다
+        """
+        # 요청 본문 형식 확인
+        error = bulk.payload_error(request.data)
+        if error:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+
+        # 요청 크기 제한 확인
+        max_items = bulk.get_max_items()
+        if bulk.count_items(request.data) > max_items:
+            return Response(
+                {"error": f"한 번에 최대 {max_items}개까지 처리할 수 있습니다."},
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            )
+
+        return Response(bulk.process(request.data))
+
     # 커스텀 액션: 연락처에 라벨 추가
     @action(detail=True, methods=["post"])
-    def add_labels(self, request):
+    def add_labels(self, request, pk=None):
         """
         특정 연락처에 라벨 추가 API
         POST /contacts/{id}/add_labels/
@@ -266,10 +707,13 @@ class ContactViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,  # 400 Bad Request
             )
 
-        # 제공된 ID들로 라벨 객체들 조회
-        labels = Label.objects.filter(id__in=label_ids)
+        # 제공된 ID들로 라벨 객체들 조회 (라벨 레지스트리에서 읽으므로 쿼리 없음)
+        labels = label_registry.get_many(label_ids)
         # 다대다 관계에 라벨들 추가 (*labels: 리스트를 개별 인자로 전개)
-        contact.labels.add(*labels)
+        # m2m_changed 시그널에서 라벨 스냅샷도 함께 갱신됨
+        # 기존 연결을 읽은 뒤 쓰므로 시작할 때 쓰기 잠금을 잡는 트랜잭션으로 실행
+        with immediate_atomic():
+            contact.labels.add(*labels)
 
         # 업데이트된 연락처 정보를 시리얼라이저로 변환해서 응답
         serializer = self.get_serializer(contact)
@@ -277,7 +721,7 @@ class ContactViewSet(viewsets.ModelViewSet):
 
     # 커스텀 액션: 연락처에서 라벨 제거
     @action(detail=True, methods=["post"])
-    def remove_labels(self, request):
+    def remove_labels(self, request, pk=None):
         """
         특정 연락처에서 라벨 제거 API
         POST /contacts/{id}/remove_labels/
@@ -295,10 +739,11 @@ class ContactViewSet(viewsets.ModelViewSet):
                 {"error": "label_ids가 필요합니다."}, status=status.HTTP_400_BAD_REQUEST
             )
 
-        # 제공된 ID들로 라벨 객체들 조회
-        labels = Label.objects.filter(id__in=label_ids)
-        # 다대다 관계에서 라벨들 제거
-        contact.labels.remove(*labels)
+        # 제공된 ID들로 라벨 객체들 조회 (라벨 레지스트리에서 읽으므로 쿼리 없음)
+        labels = label_registry.get_many(label_ids)
+        # 다대다 관계에서 라벨들 제거 (라벨 스냅샷도 함께 갱신됨)
+        with immediate_atomic():
+            contact.labels.remove(*labels)
 
         # 업데이트된 연락처 정보를 시리얼라이저로 변환해서 응답
         serializer = self.get_serializer(contact)
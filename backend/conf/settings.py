@@ -10,8 +10,12 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/3.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
+# SQLite 운영 프로필의 PRAGMA (api.contacts.sqlite_backend에 한 곳만 정의)
+from api.contacts.sqlite_backend import PRODUCTION_PRAGMAS
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -53,7 +57,8 @@ REST_FRAMEWORK = {
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 20,  # 한 페이지에 20개씩
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        # orjson/msgspec 기반 JSON 렌더러 (설치되지 않았으면 DRF JSONRenderer와 같게 동작)
+        "api.contacts.renderers.FastJSONRenderer",
         "rest_framework.renderers.BrowsableAPIRenderer",  # DRF 웹 인터페이스
     ],
     "DEFAULT_PARSER_CLASSES": [
@@ -68,7 +73,76 @@ REST_FRAMEWORK = {
     ],
 }
 
+# 캐시 설정: 연락처 개수 캐시, 변경 버전 등에 사용
+# 여러 워커 프로세스로 운영할 때는 Redis/Memcached 같은 공유 캐시로 바꿔야 합니다
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+# 연락처 목록의 기본 개수 계산 방식 (exact / estimated / skip, ?count= 로 변경 가능)
+CONTACTS_COUNT_MODE = "exact"
+# 필터/검색 조건별 정확한 개수를 캐시에 보관하는 시간 (초)
+CONTACTS_COUNT_CACHE_TIMEOUT = 300
+# 연락처 목록을 values() 기반 빠른 직렬화로 응답할지 여부 (False면 ContactListSerializer 사용)
+CONTACTS_FAST_LIST = True
+# JSON 인코더 지정 ("orjson", "msgspec", "json" / None이면 설치된 것 중 빠른 인코더 자동 선택)
+CONTACTS_JSON_BACKEND = None
+# 응답에 Server-Timing 헤더(SQL 수, DB 시간, 렌더링 시간)를 붙일지 여부
+CONTACTS_SERVER_TIMING = True
+# 이 시간(ms) 이상 걸린 요청은 api.contacts.instrumentation 로거에 느린 요청 로그를 남김
+CONTACTS_SLOW_REQUEST_MS = 500
+
+# 연락처 일괄 처리(POST /api/contacts/bulk/) 설정
+# 요청 하나에 담을 수 있는 최대 항목 수 (생성+수정+삭제 합계)
+CONTACTS_BULK_MAX_ITEMS = 50000
+# 트랜잭션 하나로 처리할 항목 수
+CONTACTS_BULK_CHUNK_SIZE = 500
+# 일괄 요청 본문 크기 제한 (기본 2.5MB로는 5만 건을 받을 수 없어서 64MB로 확장)
+DATA_UPLOAD_MAX_MEMORY_SIZE = 64 * 1024 * 1024
+
+# 연락처 내보내기(GET /api/contacts/export/)에서 한 번에 읽어올 연락처 수
+CONTACTS_EXPORT_CHUNK_SIZE = 2000
+
+# 연락처 가져오기(POST /api/contacts/imports/) 설정
+# 트랜잭션 하나로 검증/저장할 행 수
+CONTACTS_IMPORT_CHUNK_SIZE = 500
+# True: 백그라운드 스레드에서 실행, False: 요청 안에서 바로 실행 (테스트용)
+# 스레드는 웹 워커 프로세스 안에서 돌기 때문에 워커가 재시작/종료되면 작업이 대기/진행 중
+# 상태로 남고 임시 파일도 삭제되지 않습니다 (자동으로 다시 실행되지 않음)
+# 서버 시작 시 또는 cron으로 python manage.py recover_import_jobs 를 실행해서 정리하세요
+CONTACTS_IMPORT_BACKGROUND = True
+# recover_import_jobs 가 끝나지 않은 작업을 중단된 것으로 볼 시간(분)
+# 가장 오래 걸리는 가져오기보다 길게 잡아야 실행 중인 작업을 실패로 바꾸지 않습니다
+CONTACTS_IMPORT_STALE_MINUTES = 60
+# 업로드 파일을 작업이 끝날 때까지 보관할 디렉터리 (None이면 시스템 임시 디렉터리)
+CONTACTS_IMPORT_DIR = None
+
+# 연락처 동기화 피드(GET /api/contacts/sync/) 설정
+# 한 번에 보낼 변경/삭제 수 (기본값, ?batch_size= 최대값)
+CONTACTS_SYNC_BATCH_SIZE = 500
+CONTACTS_SYNC_MAX_BATCH_SIZE = 2000
+# 최근 이 시간(초) 안의 변경은 다음 동기화에서 보냄 (커밋 전에 수정일이 정해진 트랜잭션을 건너뛰지 않도록)
+CONTACTS_SYNC_SETTLE_SECONDS = 2
+# 삭제 기록 보관 기간 (일), 이보다 오래된 토큰은 전체 재동기화 (compact_sync_tombstones로 정리)
+CONTACTS_SYNC_TOMBSTONE_DAYS = 30
+
+# 중복 연락처 찾기/합치기(GET /api/contacts/duplicates/, POST /api/contacts/{id}/merge/) 설정
+# 중복으로 볼 최소 점수 (?min_score= 기본값)
+CONTACTS_DUPLICATE_MIN_SCORE = 0.6
+# 이보다 많은 연락처가 같은 키를 가진 블록(대표번호, 공용 이메일 등)은 비교하지 않음
+CONTACTS_DUPLICATE_MAX_BLOCK = 50
+# 중복 묶음 목록 캐시 시간 (초), 연락처가 바뀌면 버전이 바뀌어 다시 계산
+CONTACTS_DUPLICATE_CACHE_TIMEOUT = 600
+# 한 번에 합칠 수 있는 연락처 수
+CONTACTS_DUPLICATE_MAX_MERGE = 100
+
 MIDDLEWARE = [
+    # 요청별 SQL 수/DB 시간/렌더링 시간 측정 (Server-Timing 헤더, 느린 요청 로그)
+    "api.contacts.instrumentation.SQLInstrumentationMiddleware",
+    # 읽기 복제본 라우팅 상태 (쓰기 후 같은 클라이언트를 잠시 기본 DB에 고정)
+    "api.contacts.replicas.ReplicaRoutingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -103,13 +177,72 @@ WSGI_APPLICATION = "conf.wsgi.application"
 # https://docs.djangoproject.com/en/3.2/ref/settings/#databases
 
 # 작업 주의사항 : sqlite가 아닌 MySQL 설정으로 변경해 주세요
+# SQLite 운영 프로필 (api.contacts.sqlite_backend)
+# 연결마다 PRAGMA를 적용해서 스레드 여러 개로 실행하는 WSGI 서버에서도 읽기와 쓰기가 서로 막지 않도록 합니다
+# (WAL, busy_timeout, synchronous=NORMAL, mmap, 페이지 캐시, 메모리 임시 저장소)
+# 쓰기 작업은 transactions.immediate_atomic()으로 BEGIN IMMEDIATE 트랜잭션을 사용합니다
+# 효과 측정: python manage.py benchmark_sqlite
+SQLITE_PRODUCTION_OPTIONS = {
+    # PRAGMA 값은 백엔드 패키지에 한 곳만 정의 (benchmark_sqlite도 같은 값을 사용)
+    "pragmas": dict(PRODUCTION_PRAGMAS),
+    # atomic() 블록의 기본 시작 방식 (쓰기 작업만 immediate_atomic()으로 IMMEDIATE 사용)
+    "transaction_mode": "DEFERRED",
+}
+
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.sqlite3",
+        "ENGINE": "api.contacts.sqlite_backend",
         "NAME": BASE_DIR / "db.sqlite3",
+        "OPTIONS": SQLITE_PRODUCTION_OPTIONS,
     }
 }
 
+# 읽기 전용 복제본 (api.contacts.replicas)
+# 연락처/라벨 API의 안전한 조회(GET)는 아래 별칭의 DB에서 읽고, 쓰기는 default로 보냅니다
+# 운영에서는 MySQL 복제본 등을 DATABASES에 추가하고 별칭을 적어 주세요
+CONTACTS_READ_REPLICAS = []
+# 로컬 확인용: CONTACTS_SQLITE_REPLICAS=2 처럼 개수를 지정하면 SQLite 파일 복사본(db.replica1.sqlite3 ...)을
+# 복제본으로 사용합니다 (python manage.py replica_heartbeat --copy-sqlite 가 주기적으로 복사)
+for _index in range(1, int(os.environ.get("CONTACTS_SQLITE_REPLICAS", "0")) + 1):
+    _alias = f"replica{_index}"
+    DATABASES[_alias] = {
+        "ENGINE": "api.contacts.sqlite_backend",
+        "NAME": BASE_DIR / f"db.{_alias}.sqlite3",
+        "OPTIONS": SQLITE_PRODUCTION_OPTIONS,
+        # 테스트에서는 별도 DB를 만들지 않고 default를 그대로 사용
+        "TEST": {"MIRROR": "default"},
+    }
+    CONTACTS_READ_REPLICAS.append(_alias)
+
+# 주소록 샤드 (api.contacts.shards)
+# 주소록마다 아래 별칭 중 하나의 DB에 저장합니다 (샤드 디렉터리 지정이 없으면 주소록 이름의 해시로 결정)
+# 목록 순서가 샤드별 ID 범위를 정하므로 기존 별칭의 순서는 바꾸지 말고 끝에 추가하세요
+CONTACTS_SHARDS = ["default"]
+# 샤드 하나가 발급하는 ID 범위 크기 (n번째 샤드는 n * 범위 + 1부터 발급)
+CONTACTS_SHARD_ID_RANGE = 2**40
+# 로컬 확인용: CONTACTS_SQLITE_SHARDS=3 처럼 개수를 지정하면 SQLite 파일(db.shard1.sqlite3 ...)을 샤드로 추가합니다
+# (python manage.py migrate --database shard1 로 샤드마다 마이그레이션)
+for _index in range(1, int(os.environ.get("CONTACTS_SQLITE_SHARDS", "1"))):
+    _alias = f"shard{_index}"
+    DATABASES[_alias] = {
+        "ENGINE": "api.contacts.sqlite_backend",
+        "NAME": BASE_DIR / f"db.{_alias}.sqlite3",
+        "OPTIONS": SQLITE_PRODUCTION_OPTIONS,
+    }
+    CONTACTS_SHARDS.append(_alias)
+
+# 복제본을 고른 조회는 ReplicaRouter가, 나머지 조회와 쓰기는 ShardRouter가 주소록의 샤드로 보냄
+DATABASE_ROUTERS = [
+    "api.contacts.replicas.ReplicaRouter",
+    "api.contacts.shards.ShardRouter",
+]
+# 이 시간(초)보다 늦은 복제본은 사용하지 않음 (하트비트 기준, 모든 복제본이 늦으면 default에서 읽음)
+CONTACTS_REPLICA_MAX_LAG = 5
+# 쓰기를 한 클라이언트의 조회를 default에 고정하는 시간 (초, 최대 지연보다 짧으면 최대 지연을 사용)
+CONTACTS_REPLICA_PIN_SECONDS = 5
+# 복제본 하트비트를 다시 읽는 간격 (초)
+CONTACTS_REPLICA_LAG_CHECK_SECONDS = 1
+
 
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators